@@ -14,25 +14,42 @@ Step 2 (grade):
 from __future__ import annotations
 
 import argparse
+import array
+import base64
 import concurrent.futures
 import csv
+import dataclasses
 import datetime as dt
+import gzip
 import hashlib
+import heapq
 import html
+import http.server
+import io
 import json
+import math
 import os
 import pathlib
+import queue
 import random
 import re
 import shutil
+import signal
+import sqlite3
 import statistics
 import sys
+import tempfile
+import threading
 import time
 import urllib.error
 import urllib.request
+import uuid
+import warnings
+import zlib
 from collections import defaultdict
+from collections.abc import Mapping
 from email.utils import parsedate_to_datetime
-from typing import Any
+from typing import IO, Any, BinaryIO, Callable, Iterable, Iterator
 
 
 DEFAULT_RESPONSE_SYSTEM_PROMPT = "You are a helpful assistant."
@@ -207,6 +224,57 @@ JUDGE_RESPONSE_FORMAT_GOOGLE: dict[str, Any] = {
     "type": "json_object",
 }
 
+# First matching pattern wins, so more specific classes come first.
+ROW_ERROR_CLASS_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("source_error", r"Cannot grade response with source error"),
+    ("worker_failure", r"Worker failure"),
+    ("rate_limit", r"HTTP 429\b"),
+    ("server_error", r"HTTP 5\d\d\b"),
+    ("http_error", r"HTTP \d{3}\b"),
+    ("timeout", r"timed out|timeout"),
+    ("empty_response", r"empty response_text|Cannot grade empty"),
+    ("parse_error", r"parse error|Judge JSON|Invalid judge score"),
+    ("connection", r"call failed"),
+)
+
+FSYNC_MODES: tuple[str, ...] = ("never", "batch", "always")
+JSONL_COMPRESSION_SUFFIXES: dict[str, str] = {".gz": "gzip", ".zst": "zstd"}
+JSONL_COMPRESSION_CHOICES: tuple[str, ...] = ("none", "gzip", "zstd")
+JSONL_COMPRESSION_MAGIC: dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+CONSENSUS_METHODS: tuple[str, ...] = (
+    "majority",
+    "mean",
+    "min",
+    "max",
+    "primary_tiebreak",
+    "dawid_skene",
+)
+# Which panel disagreements get a tiebreaker call: all of them, or only those
+# the primary judges' Dawid-Skene posterior cannot settle confidently.
+TIEBREAK_POLICIES: tuple[str, ...] = ("disagreement", "dawid_skene")
+
+ARTIFACT_LAYOUTS: tuple[str, ...] = ("full", "normalized")
+# Per-sample text that normalized grade/aggregate rows leave to responses.jsonl
+# (and questions_snapshot.json); rows keep sample_id plus response_sha256.
+RESPONSE_TEXT_FIELDS: tuple[str, ...] = ("question", "nonsensical_element", "response_text")
+
+ROW_ERROR_CLASSES: tuple[str, ...] = tuple(
+    name for name, _ in ROW_ERROR_CLASS_PATTERNS
+) + ("other",)
+
+
+BATCH_API_DEFAULT_ENDPOINT = "https://api.openai.com/v1"
+BATCH_CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+# OpenAI's per-batch request limit; larger task sets are split across batches.
+BATCH_MAX_REQUESTS = 50000
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+BATCH_POLL_MAX_SECONDS = 600.0
+
 
 COLLECT_DEFAULTS: dict[str, Any] = {
     "questions": "questions.json",
@@ -215,9 +283,12 @@ COLLECT_DEFAULTS: dict[str, Any] = {
     "output_dir": "runs",
     "run_id": "",
     "num_runs": 1,
+    "n_sampling": False,
     "parallelism": 4,
     "limit": 0,
     "techniques": "",
+    "sample_fraction": 0.0,
+    "sample_per_technique": 0,
     "temperature": None,
     "max_tokens": 0,
     "pause_seconds": 0.0,
@@ -234,10 +305,23 @@ COLLECT_DEFAULTS: dict[str, Any] = {
     "dry_run": False,
     "resume": False,
     "fail_on_error": True,
+    "fsync": "never",
+    "drain_seconds": 30.0,
+    "max_memory_mb": 256.0,
+    "store_db": "",
+    "jsonl_compression": "none",
     "config": "config.json",
     "collect_endpoint": "",
     "collect_api_key": "",
     "ollama_mode": False,
+    "reuse_from": "",
+    "retry_errors": False,
+    "retry_models": "",
+    "retry_error_classes": "",
+    "batch_api": False,
+    "batch_endpoint": BATCH_API_DEFAULT_ENDPOINT,
+    "batch_api_key": "",
+    "batch_poll_seconds": 30.0,
 }
 
 GRADE_DEFAULTS: dict[str, Any] = {
@@ -256,9 +340,28 @@ GRADE_DEFAULTS: dict[str, Any] = {
     "judge_system_prompt": DEFAULT_JUDGE_SYSTEM_PROMPT,
     "judge_user_template_file": "",
     "judge_no_hint": False,
+    "judge_logprobs": False,
+    "judge_endpoint": "",
+    "judge_api_key": "",
+    "local_prejudge": "",
+    "local_prejudge_accept": None,
     "dry_run": False,
     "resume": False,
     "fail_on_error": True,
+    "fsync": "never",
+    "drain_seconds": 30.0,
+    "max_memory_mb": 256.0,
+    "artifact_layout": "full",
+    "store_db": "",
+    "jsonl_compression": "none",
+    "reuse_from": "",
+    "retry_errors": False,
+    "retry_models": "",
+    "retry_error_classes": "",
+    "batch_api": False,
+    "batch_endpoint": BATCH_API_DEFAULT_ENDPOINT,
+    "batch_api_key": "",
+    "batch_poll_seconds": 30.0,
     "config": "config.json",
 }
 
@@ -266,6 +369,13 @@ GRADE_PANEL_DEFAULTS: dict[str, Any] = {
     "responses_file": "",
     "judge_models": "",
     "tiebreaker_model": "",
+    "tiebreak_policy": "disagreement",
+    "tiebreak_confidence": 0.9,
+    "tiebreak_calibration_fraction": 0.2,
+    "cascade_judge": "",
+    "cascade_confidence": 0.9,
+    "cascade_calibration_file": "",
+    "cascade_target_agreement": 0.95,
     "output_dir": "",
     "panel_id": "",
     "parallelism": 4,
@@ -280,9 +390,21 @@ GRADE_PANEL_DEFAULTS: dict[str, Any] = {
     "judge_system_prompt": DEFAULT_JUDGE_SYSTEM_PROMPT,
     "judge_user_template_file": "",
     "judge_no_hint": False,
+    "judge_endpoint": "",
+    "judge_api_key": "",
     "dry_run": False,
     "resume": False,
     "fail_on_error": True,
+    "fsync": "never",
+    "drain_seconds": 30.0,
+    "max_memory_mb": 256.0,
+    "artifact_layout": "full",
+    "store_db": "",
+    "jsonl_compression": "none",
+    "reuse_from": "",
+    "bootstrap_samples": 0,
+    "bootstrap_seed": 0,
+    "bootstrap_workers": 1,
     "config": "config.json",
 }
 
@@ -292,6 +414,13 @@ AGGREGATE_DEFAULTS: dict[str, Any] = {
     "output_dir": "",
     "aggregate_id": "",
     "fail_on_error": True,
+    "fsync": "never",
+    "artifact_layout": "full",
+    "store_db": "",
+    "jsonl_compression": "none",
+    "bootstrap_samples": 0,
+    "bootstrap_seed": 0,
+    "bootstrap_workers": 1,
     "config": "config.json",
 }
 
@@ -300,6 +429,7 @@ REPORT_DEFAULTS: dict[str, Any] = {
     "grade_dirs": "",
     "aggregate_dir": "",
     "output_file": "report.html",
+    "store_db": "",
     "config": "config.json",
 }
 
@@ -386,6 +516,13 @@ def parse_args() -> argparse.Namespace:
         default=1,
         help="Number of independent repeats per model x question.",
     )
+    collect.add_argument(
+        "--n-sampling",
+        action="store_true",
+        help="Request a model x question's --num-runs completions in one call (`n`) and "
+             "map the choices onto per-run rows; models whose provider ignores or rejects "
+             "`n` fall back to one call per run.",
+    )
     collect.add_argument(
         "--parallelism",
         type=int,
@@ -394,6 +531,20 @@ def parse_args() -> argparse.Namespace:
     )
     collect.add_argument("--limit", type=int, default=0)
     collect.add_argument("--techniques", default="")
+    collect.add_argument(
+        "--sample-fraction",
+        type=float,
+        default=0.0,
+        help="Quick-estimate mode: collect a stratified sample of this fraction of "
+             "questions per technique (0 = all questions).",
+    )
+    collect.add_argument(
+        "--sample-per-technique",
+        type=int,
+        default=0,
+        help="Quick-estimate mode: collect a stratified sample of this many questions "
+             "per technique, balanced across domains (0 = all questions).",
+    )
     collect.add_argument("--temperature", type=float, default=None)
     collect.add_argument("--max-tokens", type=int, default=0,
                          help="Max response tokens. 0 = no limit (omit from API call).")
@@ -465,6 +616,39 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Do not fail process exit code when collection has row-level errors.",
     )
+    collect.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="never",
+        help="Durability of checkpoint/event appends: never (OS cache), batch "
+             "(fsync per group commit) or always (fsync per row).",
+    )
+    collect.add_argument(
+        "--drain-seconds",
+        type=float,
+        default=30.0,
+        help="After SIGINT/SIGTERM, how long to wait for in-flight requests "
+             "before abandoning them (a second signal abandons immediately).",
+    )
+    collect.add_argument(
+        "--max-memory-mb",
+        type=float,
+        default=256.0,
+        help="Approximate raw-JSON chunk size for the external sort that "
+             "writes the final artifacts from the checkpoint file.",
+    )
+    collect.add_argument(
+        "--store-db",
+        default="",
+        help="Optional SQLite artifact store: finished rows are mirrored into it "
+             "and read back from it in place of the JSONL files.",
+    )
+    collect.add_argument(
+        "--jsonl-compression",
+        choices=JSONL_COMPRESSION_CHOICES,
+        default="none",
+        help="Compress the final responses.jsonl (.gz / .zst; zstd needs Python 3.14+).",
+    )
     collect.add_argument(
         "--collect-endpoint",
         default="",
@@ -485,6 +669,54 @@ def parse_args() -> argparse.Namespace:
         help="Ollama mode: run one model at a time, unload between models, "
              "parallelism defaults to 1. Requires --collect-endpoint.",
     )
+    collect.add_argument(
+        "--retry-errors",
+        action="store_true",
+        help="Re-run only rows of an existing run whose error is non-empty and replace "
+             "them in place (requires --run-id; implies --resume).",
+    )
+    collect.add_argument(
+        "--retry-models",
+        default="",
+        help="With --retry-errors: only retry rows for these comma-separated models "
+             "(model label or model id).",
+    )
+    collect.add_argument(
+        "--retry-error-classes",
+        default="",
+        help="With --retry-errors: only retry these comma-separated error classes ("
+             + ", ".join(ROW_ERROR_CLASSES) + ").",
+    )
+    collect.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit the collect requests as OpenAI-style batch jobs (/files + /batches) instead of "
+             "interactive calls, poll until they finish and map the results back onto "
+             "rows. --resume picks up batches already submitted.",
+    )
+    collect.add_argument(
+        "--batch-endpoint",
+        default=BATCH_API_DEFAULT_ENDPOINT,
+        help="Base URL of the batch API (e.g. a local `mock-server`).",
+    )
+    collect.add_argument(
+        "--batch-api-key",
+        default="",
+        help="API key for --batch-endpoint. Falls back to BATCH_API_KEY env var.",
+    )
+    collect.add_argument(
+        "--batch-poll-seconds",
+        type=float,
+        default=30.0,
+        help="First batch status poll interval; later polls back off up to 10 minutes.",
+    )
+    collect.add_argument(
+        "--reuse-from",
+        default="",
+        help="Comma-separated responses.jsonl files or directories (e.g. data/latest, runs) "
+             "whose successful rows are copied for unchanged (model, reasoning effort, "
+             "question, run index, generation params); only missing rows hit the API.",
+    )
 
     grade = subparsers.add_parser(
         "grade",
@@ -536,6 +768,18 @@ def parse_args() -> argparse.Namespace:
         help="Max attempts per judge API call (bounded; default: 3).",
     )
     grade.add_argument("--timeout-seconds", type=int, default=120)
+    grade.add_argument(
+        "--judge-endpoint",
+        default="",
+        help="Base URL for an OpenAI-compatible judge endpoint. "
+             "Default: OpenRouter. Example for the load-test server: http://127.0.0.1:8765/v1",
+    )
+    grade.add_argument(
+        "--judge-api-key",
+        default="",
+        help="API key for the judge endpoint. Falls back to JUDGE_API_KEY env var. "
+             "Ignored when using OpenRouter (uses OPENROUTER_API_KEY).",
+    )
     grade.add_argument(
         "--judge-system-prompt",
         default=DEFAULT_JUDGE_SYSTEM_PROMPT,
@@ -552,6 +796,25 @@ def parse_args() -> argparse.Namespace:
              "Judge must determine on its own whether the question is nonsensical. "
              "Score 3 can still appear if the judge determines a prompt is legitimate.",
     )
+    grade.add_argument(
+        "--judge-logprobs",
+        action="store_true",
+        help="Request token logprobs and record the probability of the judge's score "
+             "as judge_score_confidence.",
+    )
+    grade.add_argument(
+        "--local-prejudge",
+        default="",
+        help="Local judge model from train-local-judge. Every row gets local_judge_score "
+             "and local_judge_probabilities, and the summary reports agreement and outliers.",
+    )
+    grade.add_argument(
+        "--local-prejudge-accept",
+        type=float,
+        default=None,
+        help="Accept the local score without an API call when its probability is at "
+             "least this (0 grades everything locally, e.g. for a preview leaderboard).",
+    )
     grade.add_argument(
         "--dry-run",
         action="store_true",
@@ -575,6 +838,93 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Do not fail process exit code when grading has row-level errors.",
     )
+    grade.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="never",
+        help="Durability of checkpoint/event appends: never (OS cache), batch "
+             "(fsync per group commit) or always (fsync per row).",
+    )
+    grade.add_argument(
+        "--drain-seconds",
+        type=float,
+        default=30.0,
+        help="After SIGINT/SIGTERM, how long to wait for in-flight requests "
+             "before abandoning them (a second signal abandons immediately).",
+    )
+    grade.add_argument(
+        "--max-memory-mb",
+        type=float,
+        default=256.0,
+        help="Approximate raw-JSON chunk size for the external sort that "
+             "writes the final artifacts from the checkpoint file.",
+    )
+    grade.add_argument(
+        "--artifact-layout",
+        choices=ARTIFACT_LAYOUTS,
+        default="full",
+        help="normalized: grade/aggregate rows omit question and response text "
+             "(joined from responses.jsonl by sample_id when needed).",
+    )
+    grade.add_argument(
+        "--store-db",
+        default="",
+        help="Optional SQLite artifact store: finished rows are mirrored into it "
+             "and read back from it in place of the JSONL files.",
+    )
+    grade.add_argument(
+        "--jsonl-compression",
+        choices=JSONL_COMPRESSION_CHOICES,
+        default="none",
+        help="Compress the final grades.jsonl (.gz / .zst; zstd needs Python 3.14+).",
+    )
+    grade.add_argument(
+        "--retry-errors",
+        action="store_true",
+        help="Re-run only rows of an existing grade run whose error is non-empty and replace "
+             "them in place (requires --grade-id; implies --resume).",
+    )
+    grade.add_argument(
+        "--retry-models",
+        default="",
+        help="With --retry-errors: only retry rows for these comma-separated models "
+             "(model label or model id).",
+    )
+    grade.add_argument(
+        "--retry-error-classes",
+        default="",
+        help="With --retry-errors: only retry these comma-separated error classes ("
+             + ", ".join(ROW_ERROR_CLASSES) + ").",
+    )
+    grade.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit the judge requests as OpenAI-style batch jobs (/files + /batches) instead of "
+             "interactive calls, poll until they finish and map the results back onto "
+             "rows. --resume picks up batches already submitted.",
+    )
+    grade.add_argument(
+        "--batch-endpoint",
+        default=BATCH_API_DEFAULT_ENDPOINT,
+        help="Base URL of the batch API (e.g. a local `mock-server`).",
+    )
+    grade.add_argument(
+        "--batch-api-key",
+        default="",
+        help="API key for --batch-endpoint. Falls back to BATCH_API_KEY env var.",
+    )
+    grade.add_argument(
+        "--batch-poll-seconds",
+        type=float,
+        default=30.0,
+        help="First batch status poll interval; later polls back off up to 10 minutes.",
+    )
+    grade.add_argument(
+        "--reuse-from",
+        default="",
+        help="Comma-separated grades.jsonl files or directories whose successful grades "
+             "are reused for identical (judge, judge params, question, response) rows.",
+    )
 
     grade_panel = subparsers.add_parser(
         "grade-panel",
@@ -595,6 +945,56 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional tiebreaker judge model for disagreement rows only.",
     )
+    grade_panel.add_argument(
+        "--tiebreak-policy",
+        choices=TIEBREAK_POLICIES,
+        default="disagreement",
+        help="disagreement: every primary disagreement goes to the tiebreaker. "
+             "dawid_skene: the tiebreaker grades a calibration sample of disagreements, "
+             "a Dawid-Skene model is fitted on all three judges, and only the remaining "
+             "disagreements with posterior below --tiebreak-confidence go to the "
+             "tiebreaker; the rest take the more likely primary score, provided EM "
+             "converged and a leave-one-out check on the calibration grades meets "
+             "the threshold.",
+    )
+    grade_panel.add_argument(
+        "--tiebreak-confidence",
+        type=float,
+        default=0.9,
+        help="Posterior threshold for --tiebreak-policy dawid_skene.",
+    )
+    grade_panel.add_argument(
+        "--tiebreak-calibration-fraction",
+        type=float,
+        default=0.2,
+        help="Share of disagreements the tiebreaker grades up front to fit the "
+             "Dawid-Skene model (--tiebreak-policy dawid_skene).",
+    )
+    grade_panel.add_argument(
+        "--cascade-judge",
+        default="",
+        help="Cheap judge that grades every row first; only rows where its score "
+             "confidence is below --cascade-confidence go to the primary judges.",
+    )
+    grade_panel.add_argument(
+        "--cascade-confidence",
+        type=float,
+        default=0.9,
+        help="Score probability (from token logprobs) at which a cascade verdict is accepted.",
+    )
+    grade_panel.add_argument(
+        "--cascade-calibration-file",
+        default="",
+        help="Existing full-layout aggregate.jsonl; the cascade judge grades its rows and "
+             "--cascade-confidence is replaced by the lowest threshold meeting "
+             "--cascade-target-agreement with that panel's consensus.",
+    )
+    grade_panel.add_argument(
+        "--cascade-target-agreement",
+        type=float,
+        default=0.95,
+        help="Agreement with panel consensus required when calibrating the cascade threshold.",
+    )
     grade_panel.add_argument("--config", default="config.json")
     grade_panel.add_argument("--output-dir", default="")
     grade_panel.add_argument(
@@ -647,6 +1047,18 @@ def parse_args() -> argparse.Namespace:
         help="Max attempts per judge API call (bounded; default: 3).",
     )
     grade_panel.add_argument("--timeout-seconds", type=int, default=120)
+    grade_panel.add_argument(
+        "--judge-endpoint",
+        default="",
+        help="Base URL for an OpenAI-compatible judge endpoint. "
+             "Default: OpenRouter. Example for the load-test server: http://127.0.0.1:8765/v1",
+    )
+    grade_panel.add_argument(
+        "--judge-api-key",
+        default="",
+        help="API key for the judge endpoint. Falls back to JUDGE_API_KEY env var. "
+             "Ignored when using OpenRouter (uses OPENROUTER_API_KEY).",
+    )
     grade_panel.add_argument(
         "--judge-system-prompt",
         default=DEFAULT_JUDGE_SYSTEM_PROMPT,
@@ -684,6 +1096,68 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Do not fail process exit code when panel flow has row-level errors.",
     )
+    grade_panel.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="never",
+        help="Durability of checkpoint/event appends: never (OS cache), batch "
+             "(fsync per group commit) or always (fsync per row).",
+    )
+    grade_panel.add_argument(
+        "--drain-seconds",
+        type=float,
+        default=30.0,
+        help="After SIGINT/SIGTERM, how long to wait for in-flight requests "
+             "before abandoning them (a second signal abandons immediately).",
+    )
+    grade_panel.add_argument(
+        "--max-memory-mb",
+        type=float,
+        default=256.0,
+        help="Approximate raw-JSON chunk size for the external sort that "
+             "writes the final artifacts from the checkpoint file.",
+    )
+    grade_panel.add_argument(
+        "--artifact-layout",
+        choices=ARTIFACT_LAYOUTS,
+        default="full",
+        help="normalized: grade/aggregate rows omit question and response text "
+             "(joined from responses.jsonl by sample_id when needed).",
+    )
+    grade_panel.add_argument(
+        "--store-db",
+        default="",
+        help="Optional SQLite artifact store: finished rows are mirrored into it "
+             "and read back from it in place of the JSONL files.",
+    )
+    grade_panel.add_argument(
+        "--jsonl-compression",
+        choices=JSONL_COMPRESSION_CHOICES,
+        default="none",
+        help="Compress the final grades.jsonl and aggregate.jsonl "
+             "(.gz / .zst; zstd needs Python 3.14+).",
+    )
+    grade_panel.add_argument(
+        "--reuse-from",
+        default="",
+        help="Comma-separated grades.jsonl / aggregate.jsonl files or directories "
+             "(e.g. a previous run dir or data/latest) whose grades are reused by "
+             "every judge in the panel.",
+    )
+    grade_panel.add_argument(
+        "--bootstrap-samples",
+        type=int,
+        default=0,
+        help="Question-clustered bootstrap resamples for leaderboard CIs, rank and "
+             "pairwise probabilities in aggregate_summary.json (0 = off; needs numpy).",
+    )
+    grade_panel.add_argument("--bootstrap-seed", type=int, default=0)
+    grade_panel.add_argument(
+        "--bootstrap-workers",
+        type=int,
+        default=1,
+        help="Processes to spread bootstrap resamples across (results do not depend on it).",
+    )
 
     aggregate = subparsers.add_parser(
         "aggregate",
@@ -692,7 +1166,7 @@ def parse_args() -> argparse.Namespace:
     aggregate.add_argument("--grade-dirs", default="")
     aggregate.add_argument(
         "--consensus-method",
-        choices=["majority", "mean", "min", "max", "primary_tiebreak"],
+        choices=CONSENSUS_METHODS,
         default="majority",
     )
     aggregate.add_argument("--output-dir", default="")
@@ -711,6 +1185,46 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Do not fail process exit code when aggregate has row-level errors.",
     )
+    aggregate.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="never",
+        help="Durability of checkpoint/event appends: never (OS cache), batch "
+             "(fsync per group commit) or always (fsync per row).",
+    )
+    aggregate.add_argument(
+        "--artifact-layout",
+        choices=ARTIFACT_LAYOUTS,
+        default="full",
+        help="normalized: aggregate rows omit question and response text "
+             "(joined from responses.jsonl by sample_id when needed).",
+    )
+    aggregate.add_argument(
+        "--store-db",
+        default="",
+        help="Optional SQLite artifact store: finished rows are mirrored into it "
+             "and read back from it in place of the JSONL files.",
+    )
+    aggregate.add_argument(
+        "--jsonl-compression",
+        choices=JSONL_COMPRESSION_CHOICES,
+        default="none",
+        help="Compress the final aggregate.jsonl (.gz / .zst; zstd needs Python 3.14+).",
+    )
+    aggregate.add_argument(
+        "--bootstrap-samples",
+        type=int,
+        default=0,
+        help="Question-clustered bootstrap resamples for leaderboard CIs, rank and "
+             "pairwise probabilities in aggregate_summary.json (0 = off; needs numpy).",
+    )
+    aggregate.add_argument("--bootstrap-seed", type=int, default=0)
+    aggregate.add_argument(
+        "--bootstrap-workers",
+        type=int,
+        default=1,
+        help="Processes to spread bootstrap resamples across (results do not depend on it).",
+    )
 
     report = subparsers.add_parser(
         "report",
@@ -721,6 +1235,12 @@ def parse_args() -> argparse.Namespace:
     report.add_argument("--aggregate-dir", default="")
     report.add_argument("--output-file", default="report.html")
     report.add_argument("--config", default="config.json")
+    report.add_argument(
+        "--store-db",
+        default="",
+        help="Optional SQLite artifact store to read responses, grades and "
+             "aggregate rows from.",
+    )
 
     regen = subparsers.add_parser(
         "regenerate-summary",
@@ -736,6 +1256,205 @@ def parse_args() -> argparse.Namespace:
         required=True,
         help="Path to write aggregate_summary.json.",
     )
+    regen.add_argument(
+        "--bootstrap-samples",
+        type=int,
+        default=0,
+        help="Question-clustered bootstrap resamples for leaderboard CIs, rank and "
+             "pairwise probabilities in aggregate_summary.json (0 = off; needs numpy).",
+    )
+    regen.add_argument("--bootstrap-seed", type=int, default=0)
+    regen.add_argument(
+        "--bootstrap-workers",
+        type=int,
+        default=1,
+        help="Processes to spread bootstrap resamples across (results do not depend on it).",
+    )
+
+    regrade_offline = subparsers.add_parser(
+        "regrade-offline",
+        help="Re-parse and re-score stored judge_raw_text in a grade dir without API calls.",
+    )
+    regrade_offline.add_argument("--grade-dir", required=True, help="Grade directory to rewrite.")
+    regrade_offline.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, min(8, os.cpu_count() or 1)),
+        help="Processes to re-parse rows across.",
+    )
+    regrade_offline.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without rewriting the grade dir.",
+    )
+    regrade_offline.add_argument(
+        "--store-db",
+        default="",
+        help="SQLite artifact store to refresh with the rewritten grades.",
+    )
+
+    bench_judge_parser = subparsers.add_parser(
+        "bench-judge-parser",
+        help="Time judge-output parsing (fast path vs candidate chain) on stored judge_raw_text.",
+    )
+    bench_judge_parser.add_argument(
+        "--grades-files",
+        required=True,
+        help="Comma-separated grade dirs or grades.jsonl files to take judge outputs from.",
+    )
+    bench_judge_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed passes over the corpus per parser; the fastest pass is reported.",
+    )
+
+    train_local_judge = subparsers.add_parser(
+        "train-local-judge",
+        help="Train an offline hashed n-gram judge on consensus-labelled aggregate rows.",
+    )
+    train_local_judge.add_argument(
+        "--aggregate-files",
+        required=True,
+        help="Comma-separated full-layout aggregate.jsonl files (e.g. data/latest/aggregate.jsonl).",
+    )
+    train_local_judge.add_argument(
+        "--output-file", required=True, help="Path to write the model JSON."
+    )
+    train_local_judge.add_argument(
+        "--num-features",
+        type=int,
+        default=65536,
+        help="Hashed feature buckets (power of two).",
+    )
+    train_local_judge.add_argument(
+        "--max-words",
+        type=int,
+        default=512,
+        help="Response words used per row (from the start).",
+    )
+    train_local_judge.add_argument("--epochs", type=int, default=300)
+    train_local_judge.add_argument("--learning-rate", type=float, default=0.1)
+    train_local_judge.add_argument("--l2", type=float, default=1e-4)
+    train_local_judge.add_argument(
+        "--validation-fraction",
+        type=float,
+        default=0.2,
+        help="Share of questions held out for metrics and probability calibration.",
+    )
+
+    mock_server = subparsers.add_parser(
+        "mock-server",
+        help="Run a local OpenAI-compatible stand-in (chat completions with injected "
+             "latency/errors/stalls/truncation, batch API) for offline load and soak tests "
+             "of collect (--collect-endpoint) and grading (--judge-endpoint).",
+    )
+    mock_server.add_argument("--host", default="127.0.0.1")
+    mock_server.add_argument(
+        "--port", type=int, default=8765, help="Port to listen on (0 = any free port)."
+    )
+    mock_server.add_argument(
+        "--batch-seconds",
+        type=float,
+        default=5.0,
+        help="How long a submitted batch takes to complete.",
+    )
+    mock_server.add_argument(
+        "--latency-ms",
+        type=float,
+        default=200.0,
+        help="Median chat completion latency (log-normal).",
+    )
+    mock_server.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=0.5,
+        help="Log-normal sigma of the latency (0 = constant).",
+    )
+    mock_server.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of requests answered with an error."
+    )
+    mock_server.add_argument(
+        "--error-statuses",
+        default="429,500,502,503",
+        help="Comma-separated HTTP statuses errors are drawn from.",
+    )
+    mock_server.add_argument(
+        "--retry-after-seconds",
+        type=float,
+        default=1.0,
+        help="Retry-After header sent with errors.",
+    )
+    mock_server.add_argument(
+        "--stall-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests answered only after --stall-seconds.",
+    )
+    mock_server.add_argument(
+        "--stall-seconds", type=float, default=300.0, help="How long a stalled request hangs."
+    )
+    mock_server.add_argument(
+        "--truncation-rate",
+        type=float,
+        default=0.0,
+        help="Share of answers cut in half with finish_reason=length.",
+    )
+    mock_server.add_argument(
+        "--model-profiles",
+        default="",
+        help="JSON object of per-model overrides, e.g. "
+             '\'{"openai/gpt-5.2": {"latency_ms": 2000, "error_rate": 0.1}}\'.',
+    )
+    mock_server.add_argument(
+        "--seed", type=int, default=0, help="Seed for latency and outcome draws."
+    )
+
+    fetch_raw = subparsers.add_parser(
+        "fetch-raw",
+        help="Print the raw provider payload stored for one sample_id.",
+    )
+    fetch_raw.add_argument(
+        "--rows-file",
+        required=True,
+        help="Path to responses.jsonl or grades.jsonl (or their .partial.jsonl).",
+    )
+    fetch_raw.add_argument(
+        "--sample-id",
+        required=True,
+        help="sample_id of the row whose raw payload to print.",
+    )
+
+    export_store = subparsers.add_parser(
+        "export-store",
+        help="List, query or export artifacts held in a SQLite artifact store.",
+    )
+    export_store.add_argument("--store-db", required=True, help="Path to the SQLite store.")
+    export_store.add_argument(
+        "--artifact",
+        default="",
+        help="Artifact to export: a responses.jsonl path, grade dir or aggregate dir. "
+             "Omit to list stored artifacts.",
+    )
+    export_store.add_argument(
+        "--kind",
+        choices=ARTIFACT_STORE_KINDS,
+        default="",
+        help="Row table to read (default: the artifact's own kind; required for "
+             "queries across artifacts).",
+    )
+    export_store.add_argument(
+        "--where",
+        default="",
+        help="Comma-separated column=value filters on sample_id, model, question_id, "
+             "technique or judge_model.",
+    )
+    export_store.add_argument(
+        "--output-file",
+        default="",
+        help="Write rows as JSONL here, gzip/zstd-compressed for .gz/.zst "
+             "(default: stdout).",
+    )
 
     parsed = parser.parse_args()
     setattr(parsed, "_raw_argv", list(sys.argv[1:]))
@@ -856,19 +1575,6 @@ def stable_short_hash(value: str, length: int = 12) -> str:
     return digest[:length]
 
 
-def build_sample_id(
-    *,
-    run_id: str,
-    question_id: str,
-    model_label: str,
-    run_index: int,
-) -> str:
-    run_slug = to_slug(run_id) or "run"
-    model_slug = to_slug(model_label) or "model"
-    model_key = f"{model_slug}_{stable_short_hash(model_label, length=10)}"
-    return f"{run_slug}__{question_id}__{model_key}__run{run_index}"
-
-
 def resolve_new_artifact_dir(
     base_dir: pathlib.Path,
     preferred_id: str,
@@ -982,6 +1688,7 @@ def sample_id_from_row(row: dict[str, Any], *, context: str) -> str:
 def load_checkpoint_rows(path: pathlib.Path, *, context: str) -> tuple[list[dict[str, Any]], set[str]]:
     if not path.exists():
         return [], set()
+    repair_jsonl_tail(path)
     rows = read_jsonl(path)
     seen_ids: set[str] = set()
     duplicate_ids: set[str] = set()
@@ -998,6 +1705,255 @@ def load_checkpoint_rows(path: pathlib.Path, *, context: str) -> tuple[list[dict
     return rows, seen_ids
 
 
+def repair_jsonl_tail(path: pathlib.Path) -> int:
+    """Drop a torn final record left behind by a crash mid-append.
+
+    Returns the number of bytes truncated. A complete JSON object that only
+    lost its trailing newline is kept and the newline restored.
+    """
+    if not path.exists() or jsonl_compression(path) is not None:
+        # Compressed JSONL is only ever written whole (finals), never appended.
+        return 0
+    size = path.stat().st_size
+    if size == 0:
+        return 0
+    with path.open("rb+") as handle:
+        handle.seek(size - 1)
+        if handle.read(1) == b"\n":
+            return 0
+        tail_start = 0
+        position = size
+        while position > 0:
+            chunk_start = max(0, position - 65536)
+            handle.seek(chunk_start)
+            newline_at = handle.read(position - chunk_start).rfind(b"\n")
+            if newline_at >= 0:
+                tail_start = chunk_start + newline_at + 1
+                break
+            position = chunk_start
+        handle.seek(tail_start)
+        fragment = handle.read()
+        try:
+            parsed = json.loads(fragment.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            parsed = None
+        if isinstance(parsed, dict):
+            handle.seek(size)
+            handle.write(b"\n")
+            return 0
+        handle.truncate(tail_start)
+    print(
+        f"Warning: truncated torn trailing record ({size - tail_start} bytes) from {path}",
+        file=sys.stderr,
+        flush=True,
+    )
+    return size - tail_start
+
+
+SAMPLE_ID_PREFIX_PATTERN = re.compile(rb'^\{"sample_id":\s*"((?:[^"\\]|\\.)*)"')
+
+
+def checkpoint_index_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(path.name + ".idx")
+
+
+def _sample_id_from_jsonl_line(line: bytes, *, context: str) -> str:
+    # Checkpoint rows always start with sample_id, so the id can usually be
+    # read without decoding the whole (possibly very large) row.
+    match = SAMPLE_ID_PREFIX_PATTERN.match(line)
+    if match and b"\\" not in match.group(1):
+        sample_id = match.group(1).decode("utf-8").strip()
+        if sample_id:
+            return sample_id
+    try:
+        parsed = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid JSONL in {context}: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise ValueError(f"Expected object JSON in {context}")
+    return sample_id_from_row(parsed, context=context)
+
+
+def _scan_jsonl_offsets(
+    path: pathlib.Path,
+    start: int,
+    *,
+    context: str,
+) -> list[tuple[str, int, int]]:
+    entries: list[tuple[str, int, int]] = []
+    with path.open("rb") as handle:
+        handle.seek(start)
+        offset = start
+        for line in handle:
+            length = len(line)
+            if line.strip():
+                entries.append((_sample_id_from_jsonl_line(line, context=context), offset, length))
+            offset += length
+    return entries
+
+
+def rebuild_checkpoint_index(path: pathlib.Path) -> None:
+    index_path = checkpoint_index_path(path)
+    entries = (
+        _scan_jsonl_offsets(path, 0, context=str(path)) if path.exists() else []
+    )
+    write_jsonl_atomic(
+        index_path,
+        [
+            {"sample_id": sample_id, "offset": offset, "length": length}
+            for sample_id, offset, length in entries
+        ],
+    )
+
+
+def load_checkpoint_offset_index(
+    path: pathlib.Path,
+    *,
+    context: str,
+) -> tuple[dict[str, tuple[int, int]], int]:
+    """Return sample_id -> (offset, length) for a checkpoint and its high-water mark.
+
+    The sidecar index is trusted up to its high-water mark (verified against
+    the last indexed record); anything appended after that is scanned and
+    added to the index, and a stale or unreadable index is rebuilt.
+    """
+    if not path.exists():
+        return {}, 0
+    repair_jsonl_tail(path)
+    file_size = path.stat().st_size
+    index_path = checkpoint_index_path(path)
+
+    indexed: list[tuple[str, int, int]] = []
+    if index_path.exists():
+        repair_jsonl_tail(index_path)
+        try:
+            indexed = [
+                (str(row["sample_id"]), int(row["offset"]), int(row["length"]))
+                for row in read_jsonl(index_path)
+            ]
+        except (KeyError, TypeError, ValueError):
+            indexed = []
+    high_water = indexed[-1][1] + indexed[-1][2] if indexed else 0
+    if indexed:
+        last_id, last_offset, last_length = indexed[-1]
+        if high_water > file_size:
+            indexed = []
+        else:
+            with path.open("rb") as handle:
+                handle.seek(last_offset)
+                last_line = handle.read(last_length)
+            try:
+                matches = _sample_id_from_jsonl_line(last_line, context=context) == last_id
+            except ValueError:
+                matches = False
+            if not matches:
+                indexed = []
+        if not indexed:
+            print(f"Rebuilding stale checkpoint index {index_path}", flush=True)
+            high_water = 0
+            index_path.write_text("", encoding="utf-8")
+    elif index_path.exists():
+        index_path.write_text("", encoding="utf-8")
+
+    if high_water < file_size:
+        tail_entries = _scan_jsonl_offsets(path, high_water, context=context)
+        with index_path.open("a", encoding="utf-8") as handle:
+            for sample_id, offset, length in tail_entries:
+                handle.write(
+                    json.dumps(
+                        {"sample_id": sample_id, "offset": offset, "length": length},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                )
+        indexed.extend(tail_entries)
+        high_water = file_size
+
+    offsets: dict[str, tuple[int, int]] = {}
+    duplicate_ids: set[str] = set()
+    for sample_id, offset, length in indexed:
+        if sample_id in offsets:
+            duplicate_ids.add(sample_id)
+        offsets[sample_id] = (offset, length)
+    if duplicate_ids:
+        raise RuntimeError(
+            f"{context} contains duplicate sample_id values. "
+            f"duplicates={len(duplicate_ids)} sample={_sample_ids_summary(duplicate_ids)}"
+        )
+    return offsets, high_water
+
+
+def read_jsonl_range(path: pathlib.Path, start: int, end: int) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    with path.open("rb") as handle:
+        handle.seek(start)
+        remaining = end - start
+        offset = start
+        while remaining > 0:
+            line = handle.readline(remaining)
+            if not line:
+                break
+            remaining -= len(line)
+            stripped = line.strip()
+            if stripped:
+                try:
+                    parsed = json_loads_row(stripped)
+                except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                    raise ValueError(f"Invalid JSONL at {path} byte {offset}: {exc}") from exc
+                if not isinstance(parsed, dict):
+                    raise ValueError(f"Expected object JSON at {path} byte {offset}")
+                rows.append(parsed)
+            offset += len(line)
+    return rows
+
+
+def classify_row_error(error: Any) -> str:
+    text = str(error or "")
+    if not text:
+        return ""
+    for name, pattern in ROW_ERROR_CLASS_PATTERNS:
+        if re.search(pattern, text, flags=re.IGNORECASE):
+            return name
+    return "other"
+
+
+def select_retry_sample_ids(
+    rows: list[dict[str, Any]],
+    *,
+    models: list[str],
+    error_classes: list[str],
+) -> dict[str, str]:
+    unknown_classes = set(error_classes) - set(ROW_ERROR_CLASSES)
+    if unknown_classes:
+        raise ValueError(
+            "--retry-error-classes contains unknown class(es): "
+            f"{', '.join(sorted(unknown_classes))}. Allowed: {', '.join(ROW_ERROR_CLASSES)}"
+        )
+    allowed_models = set(models)
+    allowed_classes = set(error_classes)
+    selected: dict[str, str] = {}
+    for row in rows:
+        error_class = classify_row_error(row.get("error"))
+        if not error_class:
+            continue
+        if allowed_classes and error_class not in allowed_classes:
+            continue
+        if allowed_models and not (
+            str(row.get("model", "")) in allowed_models
+            or str(row.get("model_id", "")) in allowed_models
+        ):
+            continue
+        selected[sample_id_from_row(row, context="Retry checkpoint")] = error_class
+    return selected
+
+
+def _retry_class_counts(selected: dict[str, str]) -> dict[str, int]:
+    counts: dict[str, int] = defaultdict(int)
+    for error_class in selected.values():
+        counts[error_class] += 1
+    return dict(sorted(counts.items()))
+
+
 def _sample_ids_summary(ids: set[str], limit: int = 5) -> str:
     if not ids:
         return ""
@@ -1007,41 +1963,38 @@ def _sample_ids_summary(ids: set[str], limit: int = 5) -> str:
 
 
 def validate_collect_integrity(
-    tasks: list[dict[str, Any]],
-    records: list[dict[str, Any]],
+    tasks: CollectTaskSpace,
+    output_sample_ids: list[str],
 ) -> None:
-    expected_id_counts: dict[str, int] = defaultdict(int)
-    for task in tasks:
-        expected_id_counts[str(task.get("sample_id", "")).strip()] += 1
-    duplicate_task_ids = {sample_id for sample_id, count in expected_id_counts.items() if count > 1}
-
-    expected_ids = {str(task.get("sample_id", "")).strip() for task in tasks}
-    if "" in expected_ids:
-        raise RuntimeError("Collect task list contains empty sample_id.")
-    if duplicate_task_ids:
-        details = [
-            "Collect task list contains duplicate sample_id values.",
-            f"duplicates={len(duplicate_task_ids)}",
-            f"sample={_sample_ids_summary(duplicate_task_ids)}",
-        ]
-        raise RuntimeError(" | ".join(details))
-
+    # Duplicate task ids are rejected when the task space is built, so only
+    # the output side needs checking here; each id is located in the matrix
+    # instead of materializing the expected id set.
     seen_ids: set[str] = set()
     duplicate_ids: set[str] = set()
-    for row in records:
-        sample_id = str(row.get("sample_id", "")).strip()
+    unexpected_ids: set[str] = set()
+    for sample_id in output_sample_ids:
         if not sample_id:
             raise RuntimeError("Collect output contains a row with empty sample_id.")
         if sample_id in seen_ids:
             duplicate_ids.add(sample_id)
         seen_ids.add(sample_id)
+        if tasks.locate(sample_id) is None:
+            unexpected_ids.add(sample_id)
 
-    missing_ids = expected_ids - seen_ids
-    unexpected_ids = seen_ids - expected_ids
-    if duplicate_ids or missing_ids or unexpected_ids or len(records) != len(tasks):
+    missing_count = len(tasks) - (len(seen_ids) - len(unexpected_ids))
+    if duplicate_ids or missing_count or unexpected_ids or len(output_sample_ids) != len(tasks):
+        missing_ids = (
+            {
+                sample_id
+                for sample_id in map(tasks.sample_id, range(len(tasks)))
+                if sample_id not in seen_ids
+            }
+            if missing_count
+            else set()
+        )
         details: list[str] = [
             "Collect integrity check failed:",
-            f"expected_rows={len(tasks)} actual_rows={len(records)}",
+            f"expected_rows={len(tasks)} actual_rows={len(output_sample_ids)}",
             f"duplicate_sample_ids={len(duplicate_ids)}",
             f"missing_sample_ids={len(missing_ids)}",
             f"unexpected_sample_ids={len(unexpected_ids)}",
@@ -1057,7 +2010,7 @@ def validate_collect_integrity(
 
 def validate_grade_integrity(
     source_rows: list[dict[str, Any]],
-    grade_rows: list[dict[str, Any]],
+    output_sample_ids: list[str],
 ) -> None:
     expected_id_counts: dict[str, int] = defaultdict(int)
     for row in source_rows:
@@ -1077,8 +2030,7 @@ def validate_grade_integrity(
 
     seen_ids: set[str] = set()
     duplicate_ids: set[str] = set()
-    for row in grade_rows:
-        sample_id = str(row.get("sample_id", "")).strip()
+    for sample_id in output_sample_ids:
         if not sample_id:
             raise RuntimeError("Grade output contains a row with empty sample_id.")
         if sample_id in seen_ids:
@@ -1087,10 +2039,10 @@ def validate_grade_integrity(
 
     missing_ids = expected_ids - seen_ids
     unexpected_ids = seen_ids - expected_ids
-    if duplicate_ids or missing_ids or unexpected_ids or len(grade_rows) != len(source_rows):
+    if duplicate_ids or missing_ids or unexpected_ids or len(output_sample_ids) != len(source_rows):
         details: list[str] = [
             "Grade integrity check failed:",
-            f"expected_rows={len(source_rows)} actual_rows={len(grade_rows)}",
+            f"expected_rows={len(source_rows)} actual_rows={len(output_sample_ids)}",
             f"duplicate_sample_ids={len(duplicate_ids)}",
             f"missing_sample_ids={len(missing_ids)}",
             f"unexpected_sample_ids={len(unexpected_ids)}",
@@ -1178,45 +2130,466 @@ def load_questions(path: str, techniques_filter: list[str], limit: int) -> list[
     return selected
 
 
+SAMPLING_FIELDS: tuple[str, ...] = ("sampling_stratum", "sampling_stratum_size")
+
+
+def sampling_fields(source: Mapping[str, Any]) -> dict[str, Any]:
+    """Stratified-sampling fields of `source`; empty outside quick-estimate runs."""
+    if source.get("sampling_stratum") is None:
+        return {}
+    return {field: source.get(field) for field in SAMPLING_FIELDS}
+
+
+def stratified_sample_questions(
+    questions: list[dict[str, Any]],
+    *,
+    fraction: float,
+    per_technique: int,
+    seed: int,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+    if fraction < 0 or fraction > 1:
+        raise ValueError("--sample-fraction must be between 0 and 1.")
+    if per_technique < 0:
+        raise ValueError("--sample-per-technique must be >= 0")
+    if fraction > 0 and per_technique > 0:
+        raise ValueError("Use either --sample-fraction or --sample-per-technique, not both.")
+    if fraction in (0, 1) and per_technique == 0:
+        return questions, None
+
+    strata: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for question in questions:
+        strata[str(question["technique"])].append(question)
+
+    rng = random.Random(seed)
+    sampled_ids: set[str] = set()
+    strata_meta: dict[str, dict[str, int]] = {}
+    for technique, members in sorted(strata.items()):
+        population = len(members)
+        if per_technique > 0:
+            take = min(per_technique, population)
+        else:
+            take = min(population, max(1, math.ceil(fraction * population)))
+
+        # Round-robin across shuffled domains so a small per-technique sample
+        # still covers as many domains as possible.
+        by_domain: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for question in members:
+            by_domain[str(question.get("domain", ""))].append(question)
+        domain_queues = [by_domain[domain] for domain in sorted(by_domain)]
+        for queue in domain_queues:
+            rng.shuffle(queue)
+        rng.shuffle(domain_queues)
+        picked: list[dict[str, Any]] = []
+        while len(picked) < take:
+            for queue in domain_queues:
+                if queue and len(picked) < take:
+                    picked.append(queue.pop())
+        sampled_ids.update(str(question["id"]) for question in picked)
+        strata_meta[technique] = {"population": population, "sampled": len(picked)}
+
+    selected: list[dict[str, Any]] = []
+    for question in questions:
+        if str(question["id"]) not in sampled_ids:
+            continue
+        technique = str(question["technique"])
+        selected.append(
+            {
+                **question,
+                "sampling_stratum": technique,
+                "sampling_stratum_size": strata_meta[technique]["population"],
+            }
+        )
+    sampling_meta = {
+        "method": "stratified",
+        "stratify_by": "technique",
+        "balance_by": "domain",
+        "sample_fraction": fraction or None,
+        "sample_per_technique": per_technique or None,
+        "seed": seed,
+        "population_question_count": len(questions),
+        "sampled_question_count": len(selected),
+        "strata": strata_meta,
+    }
+    print(
+        f"Stratified sample: {len(selected)}/{len(questions)} question(s) "
+        f"across {len(strata_meta)} technique strata.",
+        flush=True,
+    )
+    return selected, sampling_meta
+
+
 def write_json(path: pathlib.Path, payload: Any) -> None:
     with path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2)
         handle.write("\n")
 
 
-def write_jsonl(path: pathlib.Path, rows: list[dict[str, Any]]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
+JSON_CODECS: tuple[str, ...] = ("auto", "orjson", "msgspec", "stdlib")
+
+
+def _select_json_codec(
+    requested: str,
+) -> tuple[str, Callable[[bytes | str], Any], Callable[[bytes | str], Any], Callable[[Any], bytes]]:
+    """Pick (name, loads, loads_row, dumps) for BENCHMARK_JSON_CODEC.
+
+    "auto" prefers orjson, then msgspec, then the stdlib. The accelerated
+    decoders return the same Python values as json.loads; anything they
+    reject (NaN literals, >64-bit ints, ...) is retried with json.loads so
+    accepted inputs and error types are unchanged.
+    """
+    if requested not in JSON_CODECS:
+        raise ValueError(f"BENCHMARK_JSON_CODEC must be one of: {', '.join(JSON_CODECS)}")
+    if requested in ("auto", "orjson"):
+        try:
+            import orjson  # type: ignore[import-not-found]
+        except ImportError:
+            if requested == "orjson":
+                raise RuntimeError("BENCHMARK_JSON_CODEC=orjson but orjson is not installed.")
+        else:
+            return "orjson", orjson.loads, orjson.loads, orjson.dumps
+    if requested in ("auto", "msgspec"):
+        try:
+            import msgspec  # type: ignore[import-not-found]
+        except ImportError:
+            if requested == "msgspec":
+                raise RuntimeError("BENCHMARK_JSON_CODEC=msgspec but msgspec is not installed.")
+        else:
+            # A typed decoder builds row dicts directly and rejects non-objects
+            # without materialising them.
+            row_decoder = msgspec.json.Decoder(dict[str, Any])
+            return "msgspec", msgspec.json.decode, row_decoder.decode, msgspec.json.encode
+
+    def stdlib_dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return "stdlib", json.loads, json.loads, stdlib_dumps
+
+
+(
+    JSON_CODEC,
+    _fast_json_loads,
+    _fast_json_loads_row,
+    _fast_json_dumps,
+) = _select_json_codec(os.getenv("BENCHMARK_JSON_CODEC", "auto").strip().lower() or "auto")
+
+
+def json_loads(data: bytes | str) -> Any:
+    if JSON_CODEC == "stdlib":
+        return json.loads(data)
+    try:
+        return _fast_json_loads(data)
+    except Exception:  # pylint: disable=broad-except
+        return json.loads(data)
+
+
+def json_loads_row(data: bytes | str) -> Any:
+    """Decode one JSONL row; non-objects come back as-is for the caller to reject."""
+    if JSON_CODEC == "stdlib":
+        return json.loads(data)
+    try:
+        return _fast_json_loads_row(data)
+    except Exception:  # pylint: disable=broad-except
+        return json.loads(data)
+
+
+def json_dumps_compact(value: Any) -> bytes:
+    """Compact UTF-8 JSON for request bodies, spill files and embedded payloads.
+
+    Published JSONL artifacts keep json.dumps(..., ensure_ascii=False) so
+    their bytes do not depend on which codec is installed.
+    """
+    if JSON_CODEC == "stdlib":
+        return _fast_json_dumps(value)
+    try:
+        return _fast_json_dumps(value)
+    except Exception:  # pylint: disable=broad-except
+        # e.g. non-string dict keys or NaN, which orjson/msgspec refuse.
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+NUMERIC_ENGINES: tuple[str, ...] = ("auto", "numpy", "python")
+
+
+def _select_numeric_engine(requested: str) -> tuple[str, Any]:
+    """Pick (name, numpy module or None) for BENCHMARK_NUMERIC_ENGINE.
+
+    "auto" uses NumPy when it is installed. Both engines add scores in row
+    order (np.bincount accumulates sequentially), so summaries are identical.
+    """
+    if requested not in NUMERIC_ENGINES:
+        raise ValueError(
+            f"BENCHMARK_NUMERIC_ENGINE must be one of: {', '.join(NUMERIC_ENGINES)}"
+        )
+    if requested in ("auto", "numpy"):
+        try:
+            import numpy  # type: ignore[import-not-found]
+        except ImportError:
+            if requested == "numpy":
+                raise RuntimeError("BENCHMARK_NUMERIC_ENGINE=numpy but numpy is not installed.")
+        else:
+            return "numpy", numpy
+    return "python", None
+
+
+NUMERIC_ENGINE, _np = _select_numeric_engine(
+    os.getenv("BENCHMARK_NUMERIC_ENGINE", "auto").strip().lower() or "auto"
+)
+
+
+def _zstd_module() -> Any:
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError as exc:
+        raise RuntimeError(
+            "Reading or writing .zst JSONL needs the compression.zstd stdlib module "
+            "(Python 3.14+); use .gz on this interpreter."
+        ) from exc
+    return zstd
+
+
+def jsonl_compression(path: pathlib.Path, *, sniff: bool = True) -> str | None:
+    """Return "gzip", "zstd" or None for a JSONL path.
+
+    The extension decides first; otherwise (for reads) the magic bytes of an
+    existing file do, so renamed or extension-less archives still open.
+    """
+    codec = JSONL_COMPRESSION_SUFFIXES.get(path.suffix.lower())
+    if codec is not None or not sniff:
+        return codec
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(4)
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    for magic, magic_codec in JSONL_COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return magic_codec
+    return None
+
+
+def open_jsonl(
+    path: pathlib.Path, mode: str = "r", *, compression: str | None = None
+) -> IO[Any]:
+    """Open a plain, gzip or zstd JSONL file; text unless `mode` contains "b".
+
+    Writes and appends pick the codec from the extension (or `compression`).
+    Each append opens a new gzip member / zstd frame, which readers see as
+    one concatenated stream, so a crash mid-append can only tear the last
+    member and never the rows before it.
+    """
+    binary = "b" in mode
+    base_mode = mode.replace("b", "").replace("t", "")
+    if base_mode not in ("r", "w", "a"):
+        raise ValueError(f"Unsupported JSONL open mode: {mode}")
+    if compression is None:
+        compression = jsonl_compression(path, sniff=base_mode == "r")
+    if compression is None:
+        if binary:
+            return path.open(base_mode + "b")
+        return path.open(base_mode, encoding="utf-8")
+    if compression == "gzip":
+        raw: IO[bytes] = gzip.GzipFile(
+            filename=str(path), mode=base_mode + "b", compresslevel=6, mtime=0
+        )
+    elif compression == "zstd":
+        raw = _zstd_module().ZstdFile(path, base_mode + "b")
+    else:
+        raise ValueError(f"Unsupported JSONL compression: {compression}")
+    return raw if binary else io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def resolve_jsonl_path(path: pathlib.Path) -> pathlib.Path:
+    """Return `path`, or its existing .gz/.zst sibling when only that exists."""
+    if path.exists():
+        return path
+    for suffix in JSONL_COMPRESSION_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def jsonl_output_compression(args: argparse.Namespace) -> str | None:
+    """Codec for final JSONL artifacts from --jsonl-compression (None = plain)."""
+    choice = str(getattr(args, "jsonl_compression", "none") or "none")
+    if choice not in JSONL_COMPRESSION_CHOICES:
+        raise ValueError(
+            f"--jsonl-compression must be one of: {', '.join(JSONL_COMPRESSION_CHOICES)}"
+        )
+    if choice == "zstd":
+        _zstd_module()  # fail before any API call rather than at finalize
+    return None if choice == "none" else choice
+
+
+def final_jsonl_path(directory: pathlib.Path, filename: str, compression: str | None) -> pathlib.Path:
+    suffixes = {codec: suffix for suffix, codec in JSONL_COMPRESSION_SUFFIXES.items()}
+    return directory / (filename + suffixes.get(compression or "", ""))
+
+
+def remove_stale_jsonl_variants(path: pathlib.Path) -> None:
+    """Drop copies of a final artifact written under another codec.
+
+    resolve_jsonl_path prefers the plain file, so a stale responses.jsonl
+    would otherwise shadow a freshly written responses.jsonl.gz.
+    """
+    name = path.name
+    for suffix in JSONL_COMPRESSION_SUFFIXES:
+        name = name.removesuffix(suffix)
+    for candidate in [name, *(name + suffix for suffix in JSONL_COMPRESSION_SUFFIXES)]:
+        other = path.with_name(candidate)
+        if other != path and other.exists():
+            other.unlink()
+
+
+def write_jsonl(
+    path: pathlib.Path,
+    rows: Iterable[dict[str, Any]],
+    *,
+    compression: str | None = None,
+) -> None:
+    with open_jsonl(path, "w", compression=compression) as handle:
         for row in rows:
             handle.write(json.dumps(row, ensure_ascii=False) + "\n")
 
 
+def write_jsonl_atomic(path: pathlib.Path, rows: Iterable[dict[str, Any]]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    write_jsonl(tmp_path, rows, compression=jsonl_compression(path, sniff=False))
+    os.replace(tmp_path, path)
+
+
+def collect_row_sort_key(row: dict[str, Any]) -> tuple[str, str, int, str]:
+    return (
+        str(row.get("model", "")),
+        str(row.get("response_reasoning_effort", "")),
+        int(row.get("run_index", 0) or 0),
+        str(row.get("question_id", "")),
+    )
+
+
+def grade_row_sort_key(row: dict[str, Any]) -> tuple[str, int, str]:
+    return (
+        str(row.get("model", "")),
+        int(row.get("run_index", 0) or 0),
+        str(row.get("question_id", "")),
+    )
+
+
+def _decode_jsonl_row(line: bytes, *, context: str) -> dict[str, Any]:
+    try:
+        parsed = json_loads_row(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid JSONL in {context}: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise ValueError(f"Expected object JSON in {context}")
+    return parsed
+
+
+def _iter_sort_run(path: pathlib.Path) -> Iterator[tuple[tuple[Any, ...], bytes]]:
+    with path.open("rb") as handle:
+        for line in handle:
+            key_text, _, row_line = line.partition(b"\t")
+            yield tuple(json_loads(key_text)), row_line
+
+
+def iter_sorted_jsonl(
+    path: pathlib.Path,
+    *,
+    sort_key: Callable[[dict[str, Any]], tuple[Any, ...]],
+    max_memory_mb: float,
+) -> Iterator[tuple[dict[str, Any], bytes]]:
+    """Yield (row, raw line) from a JSONL file in `sort_key` order.
+
+    An external merge sort: rows are sorted in chunks of roughly
+    `max_memory_mb` of raw JSON, spilled to temporary run files next to
+    `path` and k-way merged, so only one chunk is ever held in memory.
+    Rows with equal keys keep their file order.
+    """
+    if not path.exists():
+        return
+    chunk_limit = max(1, int(max_memory_mb * 1024 * 1024))
+    context = str(path)
+    with tempfile.TemporaryDirectory(dir=path.parent, prefix=".sort-") as tmp_dir:
+        run_paths: list[pathlib.Path] = []
+        chunk: list[tuple[tuple[Any, ...], bytes]] = []
+        chunk_bytes = 0
+        sequence = 0
+
+        def spill() -> None:
+            nonlocal chunk_bytes
+            chunk.sort(key=lambda item: item[0])
+            run_path = pathlib.Path(tmp_dir) / f"run{len(run_paths):05d}.jsonl"
+            with run_path.open("wb") as handle:
+                for key, line in chunk:
+                    handle.write(json_dumps_compact(key) + b"\t" + line)
+            run_paths.append(run_path)
+            chunk.clear()
+            chunk_bytes = 0
+
+        with path.open("rb") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                row = _decode_jsonl_row(line, context=context)
+                chunk.append(((*sort_key(row), sequence), line))
+                sequence += 1
+                chunk_bytes += len(line)
+                if chunk_bytes >= chunk_limit:
+                    spill()
+
+        if not run_paths:
+            chunk.sort(key=lambda item: item[0])
+            merged: Iterable[tuple[tuple[Any, ...], bytes]] = chunk
+        else:
+            if chunk:
+                spill()
+            merged = heapq.merge(
+                *(_iter_sort_run(run_path) for run_path in run_paths),
+                key=lambda item: item[0],
+            )
+        for _, line in merged:
+            yield _decode_jsonl_row(line, context=context), line
+
+
+def iter_jsonl(path: pathlib.Path) -> Iterator[dict[str, Any]]:
+    with open_jsonl(path) as handle:
+        lineno = 0
+        try:
+            for lineno, line in enumerate(handle, start=1):
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    parsed = json_loads_row(stripped)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSONL at {path}:{lineno}: {exc}") from exc
+                if not isinstance(parsed, dict):
+                    raise ValueError(f"Expected object JSON at {path}:{lineno}")
+                yield parsed
+        except (EOFError, OSError) as exc:
+            raise ValueError(
+                f"Truncated or corrupt compressed JSONL at {path} after line {lineno}: {exc}"
+            ) from exc
+
+
 def read_jsonl(path: pathlib.Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for lineno, line in enumerate(handle, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Invalid JSONL at {path}:{lineno}: {exc}") from exc
-            if not isinstance(parsed, dict):
-                raise ValueError(f"Expected object JSON at {path}:{lineno}")
-            rows.append(parsed)
-    return rows
+    return list(iter_jsonl(path))
 
 
 def append_jsonl(path: pathlib.Path, row: dict[str, Any]) -> None:
-    with path.open("a", encoding="utf-8") as handle:
+    with open_jsonl(path, "a") as handle:
         handle.write(json.dumps(row, ensure_ascii=False) + "\n")
 
 
-def write_collect_review_csv(path: pathlib.Path, rows: list[dict[str, Any]]) -> None:
-    fieldnames = [
-        "status",
-        "error",
-        "sample_id",
+_ROW_FIELD_MISSING: Any = object()
+_ROW_KEY_ORDERS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+# Low-cardinality string values shared by many rows; interned on load so a
+# 100k-row archive holds one copy of each model/technique/question text.
+INTERNED_ROW_FIELDS: frozenset[str] = frozenset(
+    {
         "model",
         "model_id",
         "model_org",
@@ -1224,141 +2597,942 @@ def write_collect_review_csv(path: pathlib.Path, rows: list[dict[str, Any]]) ->
         "model_reasoning_level",
         "model_row",
         "response_reasoning_effort",
-        "run_index",
         "question_id",
         "technique",
-        "is_control",
+        "domain",
+        "question",
+        "nonsensical_element",
+        "sampling_stratum",
+        "response_finish_reason",
+        "generation_params_hash",
+        "judge_model",
+        "judge_parse_mode",
+        "judge_finish_reason",
+        "judge_params_hash",
+        "consensus_method",
+        "status",
+    }
+)
+INTERNED_ROW_FIELD_SUFFIXES: tuple[str, ...] = ("_model", "_grade_id", "_grade_dir", "_status")
+
+
+class RowRecord(Mapping):
+    """Read-only, slot-backed stand-in for a loaded response/grade/aggregate row.
+
+    Subclasses are slots dataclasses over the row's usual keys; anything else
+    (e.g. aggregate judge_N_* columns) lives in `extra`. Absent keys stay
+    absent, the original key order is kept (shared between rows) and records
+    behave like the dicts they replace for `get`, `in`, `[]` and `dict(row)`.
+    Convert back with `to_dict()` before writing.
+    """
+
+    __slots__ = ("_key_order", "extra")
+    FIELDS: tuple[str, ...] = ()
+    _field_set: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_dict(cls, row: dict[str, Any]) -> RowRecord:
+        known = cls._field_set
+        values: dict[str, Any] = {}
+        extra: dict[str, Any] | None = None
+        for key, value in row.items():
+            if isinstance(value, str) and (
+                key in INTERNED_ROW_FIELDS or key.endswith(INTERNED_ROW_FIELD_SUFFIXES)
+            ):
+                value = sys.intern(value)
+            if key in known:
+                values[key] = value
+            else:
+                if extra is None:
+                    extra = {}
+                extra[sys.intern(key)] = value
+        record = cls(**values)
+        key_order = tuple(row)
+        record._key_order = _ROW_KEY_ORDERS.setdefault(key_order, key_order)
+        record.extra = extra
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: self[key] for key in self._key_order}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._field_set:
+            value = getattr(self, key)
+            return default if value is _ROW_FIELD_MISSING else value
+        if self.extra is None:
+            return default
+        return self.extra.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _ROW_FIELD_MISSING)
+        if value is _ROW_FIELD_MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _ROW_FIELD_MISSING) is not _ROW_FIELD_MISSING  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_order)
+
+    def __len__(self) -> int:
+        return len(self._key_order)
+
+    def keys(self) -> tuple[str, ...]:  # type: ignore[override]
+        return self._key_order
+
+
+def _row_record_type(name: str, fields: tuple[str, ...]) -> type[RowRecord]:
+    record_type = dataclasses.make_dataclass(
+        name,
+        [(field, Any, dataclasses.field(default=_ROW_FIELD_MISSING)) for field in fields],
+        bases=(RowRecord,),
+        slots=True,
+        repr=False,
+        eq=False,
+    )
+    record_type.__module__ = __name__
+    record_type.FIELDS = fields
+    record_type._field_set = frozenset(fields)
+    return record_type
+
+
+_ROW_IDENTITY_FIELDS: tuple[str, ...] = (
+    "sample_id",
+    "run_index",
+    "model",
+    "model_id",
+    "model_org",
+    "model_name",
+    "model_reasoning_level",
+    "model_row",
+    "response_reasoning_effort",
+    "question_id",
+    "technique",
+    "is_control",
+    "domain",
+    "question",
+    "nonsensical_element",
+    "sampling_stratum",
+    "sampling_stratum_size",
+    "response_text",
+    "error",
+    "status",
+)
+ResponseRow = _row_record_type(
+    "ResponseRow",
+    _ROW_IDENTITY_FIELDS
+    + (
+        "stateless_request",
+        "request_messages",
+        "response_id",
+        "response_usage",
         "response_latency_ms",
+        "response_created",
         "response_finish_reason",
         "warnings",
-        "response_text",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "status": "error" if row.get("error") else "ok",
-                    "error": row.get("error", ""),
-                    "sample_id": row.get("sample_id", ""),
-                    "model": row.get("model", ""),
-                    "model_id": row.get("model_id", ""),
-                    "model_org": row.get("model_org", ""),
-                    "model_name": row.get("model_name", ""),
-                    "model_reasoning_level": row.get("model_reasoning_level", ""),
-                    "model_row": row.get("model_row", ""),
-                    "response_reasoning_effort": row.get(
-                        "response_reasoning_effort", ""
-                    ),
-                    "run_index": row.get("run_index", ""),
-                    "question_id": row.get("question_id", ""),
-                    "technique": row.get("technique", ""),
-                    "is_control": bool(row.get("is_control", False)),
-                    "response_latency_ms": row.get("response_latency_ms", ""),
-                    "response_finish_reason": row.get("response_finish_reason", ""),
-                    "warnings": "; ".join(str(x) for x in row.get("warnings", [])),
-                    "response_text": row.get("response_text", ""),
-                }
-            )
-
-
-def write_grade_review_csv(path: pathlib.Path, rows: list[dict[str, Any]]) -> None:
-    fieldnames = [
-        "status",
-        "error",
-        "sample_id",
-        "model",
-        "model_id",
-        "model_org",
-        "model_name",
-        "model_reasoning_level",
-        "model_row",
-        "response_reasoning_effort",
-        "run_index",
-        "question_id",
-        "technique",
-        "is_control",
+        "response_raw",
+        "response_raw_ref",
+        "started_at_utc",
+        "finished_at_utc",
+        "generation_params_hash",
+    ),
+)
+GradeRow = _row_record_type(
+    "GradeRow",
+    _ROW_IDENTITY_FIELDS
+    + (
+        "response_sha256",
+        "source_response_error",
+        "judge_model",
         "judge_score",
         "judge_justification",
-        "source_response_error",
-        "response_text",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "status": "error" if row.get("error") else "ok",
-                    "error": row.get("error", ""),
-                    "sample_id": row.get("sample_id", ""),
-                    "model": row.get("model", ""),
-                    "model_id": row.get("model_id", ""),
-                    "model_org": row.get("model_org", ""),
-                    "model_name": row.get("model_name", ""),
-                    "model_reasoning_level": row.get("model_reasoning_level", ""),
-                    "model_row": row.get("model_row", ""),
-                    "response_reasoning_effort": row.get(
-                        "response_reasoning_effort", ""
-                    ),
-                    "run_index": row.get("run_index", ""),
-                    "question_id": row.get("question_id", ""),
-                    "technique": row.get("technique", ""),
-                    "is_control": bool(row.get("is_control", False)),
-                    "judge_score": row.get("judge_score", ""),
-                    "judge_justification": row.get("judge_justification", ""),
-                    "source_response_error": row.get("source_response_error", ""),
-                    "response_text": row.get("response_text", ""),
-                }
-            )
+        "judge_raw_text",
+        "judge_parse_mode",
+        "judge_response_id",
+        "judge_response_created",
+        "judge_finish_reason",
+        "judge_warnings",
+        "judge_usage",
+        "judge_response_raw",
+        "judge_response_raw_ref",
+        "judge_latency_ms",
+        "judge_started_at_utc",
+        "judge_finished_at_utc",
+        "judge_params_hash",
+        "judge_score_confidence",
+    ),
+)
+AggregateRow = _row_record_type(
+    "AggregateRow",
+    _ROW_IDENTITY_FIELDS
+    + (
+        "response_sha256",
+        "row_identity_mismatch",
+        "row_errors",
+        "consensus_score",
+        "consensus_method",
+        "consensus_error",
+        "judge_valid_scores",
+    ),
+)
 
 
-def render_grade_review_markdown(rows: list[dict[str, Any]]) -> str:
-    def excerpt(value: Any, max_len: int = 140) -> str:
-        text = " ".join(str(value or "").split())
-        if len(text) <= max_len:
-            return text
-        return text[: max_len - 3].rstrip() + "..."
+def read_row_records(
+    path: pathlib.Path, record_type: type[RowRecord]
+) -> list[RowRecord]:
+    return [record_type.from_dict(row) for row in iter_jsonl(path)]
+
+
+class JsonlAppendWriter:
+    """Group-commit writer for append-only JSONL checkpoints and event logs.
+
+    Rows are serialized on the caller's thread and handed to a background
+    thread that keeps each file open, writes whatever has queued up as one
+    batch, then flushes (and optionally fsyncs) once per touched file.
+    `fsync` is one of FSYNC_MODES: "never" relies on the OS page cache,
+    "batch" fsyncs after every group commit, "always" after every row.
+
+    Paths registered with `track_offsets` also get a `<path>.idx` sidecar
+    with the byte offset of every row, written after the rows themselves
+    are flushed so the index never points past durable data.
+    """
+
+    def __init__(self, *, fsync: str = "never", max_batch_rows: int = 1024) -> None:
+        if fsync not in FSYNC_MODES:
+            raise ValueError(f"fsync must be one of: {', '.join(FSYNC_MODES)}")
+        self.fsync = fsync
+        self.max_batch_rows = max(1, max_batch_rows)
+        self._queue: queue.Queue[
+            tuple[pathlib.Path, bytes, str | None] | threading.Event | None
+        ] = queue.Queue()
+        self._handles: dict[pathlib.Path, BinaryIO] = {}
+        self._tracked: set[pathlib.Path] = set()
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="jsonl-append-writer", daemon=True
+        )
+        self._thread.start()
 
-    ordered = sorted(
-        rows,
-        key=lambda row: (
-            0 if row.get("error") else 1,
-            str(row.get("model", "")),
-            int(row.get("run_index", 0) or 0),
-            str(row.get("question_id", "")),
-        ),
-    )
-    lines: list[str] = []
-    lines.append("# Grade Review")
-    lines.append("")
-    lines.append(
-        "| Status | Model | Run | QID | Technique | Control | Score | Justification | Response Excerpt | Error |"
-    )
-    lines.append("|---|---|---:|---|---|---:|---:|---|---|---|")
-    for row in ordered:
-        status = "error" if row.get("error") else "ok"
-        score = row.get("judge_score")
-        score_text = str(score) if score is not None else ""
-        lines.append(
-            "| "
-            + " | ".join(
-                [
-                    status,
-                    f"`{row.get('model', '')}`",
-                    str(row.get("run_index", "")),
-                    f"`{row.get('question_id', '')}`",
-                    f"`{row.get('technique', '')}`",
-                    "1" if row.get("is_control") else "0",
-                    score_text,
-                    excerpt(row.get("judge_justification", "")),
-                    excerpt(row.get("response_text", "")),
-                    excerpt(row.get("error", "")),
+    def __enter__(self) -> JsonlAppendWriter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def append(self, path: pathlib.Path, row: dict[str, Any]) -> None:
+        if self._closed:
+            raise RuntimeError("JsonlAppendWriter is closed.")
+        self._raise_if_failed()
+        sample_id = str(row.get("sample_id", "")) if path in self._tracked else None
+        self._queue.put(
+            (path, (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"), sample_id)
+        )
+
+    def track_offsets(self, path: pathlib.Path) -> None:
+        """Maintain a byte-offset index sidecar for rows appended to `path`."""
+        self._tracked.add(path)
+
+    def flush(self) -> None:
+        """Block until every row appended so far has been written."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"JSONL writer failed: {self._error}") from self._error
+
+    def _handle(self, path: pathlib.Path) -> BinaryIO:
+        handle = self._handles.get(path)
+        if handle is None:
+            handle = path.open("ab")
+            handle.seek(0, os.SEEK_END)
+            self._handles[path] = handle
+        return handle
+
+    def _write_batch(self, lines: list[tuple[pathlib.Path, bytes, str | None]]) -> None:
+        touched: dict[pathlib.Path, BinaryIO] = {}
+        index_lines: dict[pathlib.Path, list[bytes]] = {}
+        for path, line, sample_id in lines:
+            handle = self._handle(path)
+            offset = handle.tell()
+            handle.write(line)
+            touched[path] = handle
+            if sample_id is not None:
+                entry = {"sample_id": sample_id, "offset": offset, "length": len(line)}
+                index_lines.setdefault(checkpoint_index_path(path), []).append(
+                    (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+                )
+            if self.fsync == "always":
+                handle.flush()
+                os.fsync(handle.fileno())
+        for handle in touched.values():
+            handle.flush()
+            if self.fsync == "batch":
+                os.fsync(handle.fileno())
+        for index_path, entries in index_lines.items():
+            index_handle = self._handle(index_path)
+            index_handle.write(b"".join(entries))
+            index_handle.flush()
+            if self.fsync != "never":
+                os.fsync(index_handle.fileno())
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch_rows:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines: list[tuple[pathlib.Path, bytes, str | None]] = []
+            waiters: list[threading.Event] = []
+            for item in batch:
+                if item is None:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(item)
+            if lines and self._error is None:
+                try:
+                    self._write_batch(lines)
+                except Exception as exc:  # pylint: disable=broad-except
+                    self._error = exc
+            for waiter in waiters:
+                waiter.set()
+        for handle in self._handles.values():
+            try:
+                handle.close()
+            except Exception as exc:  # pylint: disable=broad-except
+                if self._error is None:
+                    self._error = exc
+        self._handles.clear()
+
+
+class RawPayloadStore:
+    """Append-only sidecar for raw provider payloads.
+
+    Each payload is gzip-compressed on its own and appended to the blob file,
+    so it can be fetched by offset without touching the rest of the file. The
+    row keeps only a `<field>_ref` ({file, offset, length, sha256}, with
+    `file` relative to the row's artifact directory) and `<field>` is None.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self._handle: BinaryIO | None = None
+
+    def externalize(
+        self,
+        row: dict[str, Any],
+        field: str,
+        *,
+        source_dir: pathlib.Path | None = None,
+    ) -> None:
+        payload = row.get(field)
+        if payload is None:
+            # Rows reused from another run point into that run's sidecar;
+            # copy the payload over so the reference stays local.
+            ref = row.get(f"{field}_ref")
+            if not isinstance(ref, dict) or source_dir is None:
+                return
+            payload = read_raw_payload_ref(source_dir, ref)
+        encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        blob = gzip.compress(encoded, mtime=0)
+        if self._handle is None:
+            self._handle = self.path.open("ab")
+            self._handle.seek(0, os.SEEK_END)
+        offset = self._handle.tell()
+        self._handle.write(blob)
+        # Flush before the row referencing this blob reaches the checkpoint.
+        self._handle.flush()
+        row[field] = None
+        row[f"{field}_ref"] = {
+            "file": self.path.name,
+            "offset": offset,
+            "length": len(blob),
+            "sha256": hashlib.sha256(encoded).hexdigest(),
+        }
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def read_raw_payload_ref(base_dir: pathlib.Path, ref: dict[str, Any]) -> Any:
+    blob_path = base_dir / str(ref["file"])
+    with blob_path.open("rb") as handle:
+        handle.seek(int(ref["offset"]))
+        blob = handle.read(int(ref["length"]))
+    try:
+        encoded = gzip.decompress(blob)
+    except (OSError, EOFError) as exc:
+        raise ValueError(f"Corrupt raw payload at {blob_path} offset {ref['offset']}: {exc}") from exc
+    expected_hash = str(ref.get("sha256", ""))
+    if expected_hash and hashlib.sha256(encoded).hexdigest() != expected_hash:
+        raise ValueError(f"Raw payload hash mismatch at {blob_path} offset {ref['offset']}")
+    return json_loads(encoded)
+
+
+def fetch_raw_payload(rows_path: pathlib.Path, sample_id: str) -> Any:
+    """Return the raw provider payload stored for `sample_id` in a JSONL artifact.
+
+    Works for responses and grades files, whether the payload is inline
+    (older artifacts) or in the raw sidecar next to `rows_path`.
+    """
+    target = sample_id.strip()
+    with open_jsonl(rows_path, "rb") as handle:
+        for lineno, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            context = f"{rows_path}:{lineno}"
+            if _sample_id_from_jsonl_line(line, context=context) != target:
+                continue
+            row = _decode_jsonl_row(line, context=context)
+            for field in ("judge_response_raw", "response_raw"):
+                if row.get(field) is not None:
+                    return row[field]
+                ref = row.get(f"{field}_ref")
+                if isinstance(ref, dict):
+                    return read_raw_payload_ref(rows_path.parent, ref)
+            raise ValueError(f"No raw payload stored for sample_id={target} in {rows_path}")
+    raise ValueError(f"sample_id={target} not found in {rows_path}")
+
+
+ARTIFACT_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    meta_json TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    updated_at_utc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS responses (
+    artifact TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    sample_id TEXT NOT NULL,
+    model TEXT,
+    question_id TEXT,
+    technique TEXT,
+    row_json TEXT NOT NULL,
+    PRIMARY KEY (artifact, sample_id)
+);
+CREATE TABLE IF NOT EXISTS grades (
+    artifact TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    sample_id TEXT NOT NULL,
+    judge_model TEXT,
+    model TEXT,
+    question_id TEXT,
+    technique TEXT,
+    row_json TEXT NOT NULL,
+    PRIMARY KEY (artifact, sample_id)
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    artifact TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    sample_id TEXT NOT NULL,
+    model TEXT,
+    question_id TEXT,
+    technique TEXT,
+    row_json TEXT NOT NULL,
+    PRIMARY KEY (artifact, sample_id)
+);
+CREATE INDEX IF NOT EXISTS responses_sample_id ON responses (sample_id);
+CREATE INDEX IF NOT EXISTS responses_model ON responses (model);
+CREATE INDEX IF NOT EXISTS responses_question_id ON responses (question_id);
+CREATE INDEX IF NOT EXISTS responses_technique ON responses (technique);
+CREATE INDEX IF NOT EXISTS grades_sample_id ON grades (sample_id);
+CREATE INDEX IF NOT EXISTS grades_judge_model ON grades (judge_model);
+CREATE INDEX IF NOT EXISTS grades_model ON grades (model);
+CREATE INDEX IF NOT EXISTS grades_question_id ON grades (question_id);
+CREATE INDEX IF NOT EXISTS grades_technique ON grades (technique);
+CREATE INDEX IF NOT EXISTS aggregates_sample_id ON aggregates (sample_id);
+CREATE INDEX IF NOT EXISTS aggregates_model ON aggregates (model);
+CREATE INDEX IF NOT EXISTS aggregates_question_id ON aggregates (question_id);
+CREATE INDEX IF NOT EXISTS aggregates_technique ON aggregates (technique);
+"""
+
+ARTIFACT_STORE_KINDS: tuple[str, ...] = ("responses", "grades", "aggregates")
+
+
+class ArtifactStore:
+    """Optional SQLite mirror of responses, grades and aggregate rows.
+
+    Each JSONL artifact is keyed by its resolved path (responses.jsonl file,
+    grade dir or aggregate dir) so rows can be read back in place of the
+    files and exported to the same layout. Rows are stored verbatim as JSON
+    next to indexed sample_id/model/question_id/technique/judge_model columns.
+    WAL mode lets concurrent phases share one database file.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=60.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(ARTIFACT_STORE_SCHEMA)
+
+    def __enter__(self) -> ArtifactStore:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def artifact_key(path: pathlib.Path | str) -> str:
+        return _normalize_path_text(str(path))
+
+    def has_artifact(self, kind: str, path: pathlib.Path | str) -> bool:
+        found = self._conn.execute(
+            "SELECT 1 FROM artifacts WHERE path = ? AND kind = ?",
+            (self.artifact_key(path), kind),
+        ).fetchone()
+        return found is not None
+
+    def artifact_kind(self, path: pathlib.Path | str) -> str | None:
+        found = self._conn.execute(
+            "SELECT kind FROM artifacts WHERE path = ?", (self.artifact_key(path),)
+        ).fetchone()
+        return str(found[0]) if found else None
+
+    def artifact_updated_at(self, path: pathlib.Path | str) -> dt.datetime | None:
+        found = self._conn.execute(
+            "SELECT updated_at_utc FROM artifacts WHERE path = ?", (self.artifact_key(path),)
+        ).fetchone()
+        return dt.datetime.fromisoformat(found[0]) if found else None
+
+    def artifact_meta(self, path: pathlib.Path | str) -> dict[str, Any] | None:
+        found = self._conn.execute(
+            "SELECT meta_json FROM artifacts WHERE path = ?", (self.artifact_key(path),)
+        ).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def list_artifacts(self) -> list[dict[str, Any]]:
+        return [
+            {"path": path, "kind": kind, "row_count": row_count, "updated_at_utc": updated}
+            for path, kind, row_count, updated in self._conn.execute(
+                "SELECT path, kind, row_count, updated_at_utc FROM artifacts ORDER BY path"
+            )
+        ]
+
+    def put_artifact(
+        self,
+        kind: str,
+        path: pathlib.Path | str,
+        *,
+        meta: dict[str, Any],
+        rows: Iterable[dict[str, Any]],
+    ) -> int:
+        """Replace the stored rows of one artifact in a single transaction."""
+        if kind not in ARTIFACT_STORE_KINDS:
+            raise ValueError(f"Unknown artifact store kind: {kind}")
+        key = self.artifact_key(path)
+
+        def records() -> Iterator[tuple[Any, ...]]:
+            for seq, row in enumerate(rows):
+                indexed = [
+                    key,
+                    seq,
+                    str(row.get("sample_id", "")),
+                    row.get("model"),
+                    row.get("question_id"),
+                    row.get("technique"),
                 ]
+                if kind == "grades":
+                    indexed.insert(3, row.get("judge_model"))
+                yield (*indexed, json_dumps_compact(row).decode("utf-8"))
+
+        columns = "artifact, seq, sample_id, model, question_id, technique, row_json"
+        if kind == "grades":
+            columns = "artifact, seq, sample_id, judge_model, model, question_id, technique, row_json"
+        placeholders = ", ".join("?" for _ in columns.split(","))
+        with self._conn:
+            self._conn.execute(f"DELETE FROM {kind} WHERE artifact = ?", (key,))
+            cursor = self._conn.executemany(
+                f"INSERT INTO {kind} ({columns}) VALUES ({placeholders})", records()
             )
-            + " |"
+            row_count = cursor.rowcount
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts (path, kind, meta_json, row_count, updated_at_utc) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, kind, json.dumps(meta, ensure_ascii=False), row_count, utc_now_iso()),
+            )
+        return row_count
+
+    def iter_rows(
+        self,
+        kind: str,
+        path: pathlib.Path | str | None = None,
+        **filters: str,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield stored rows in artifact order, filtered on indexed columns."""
+        if kind not in ARTIFACT_STORE_KINDS:
+            raise ValueError(f"Unknown artifact store kind: {kind}")
+        allowed = {"sample_id", "model", "question_id", "technique"}
+        if kind == "grades":
+            allowed.add("judge_model")
+        clauses: list[str] = []
+        params: list[Any] = []
+        if path is not None:
+            clauses.append("artifact = ?")
+            params.append(self.artifact_key(path))
+        for column, value in filters.items():
+            if column not in allowed:
+                raise ValueError(f"Cannot filter {kind} on {column}")
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        for (row_json,) in self._conn.execute(
+            f"SELECT row_json FROM {kind}{where} ORDER BY artifact, seq", params
+        ):
+            yield json_loads_row(row_json)
+
+
+def open_artifact_store(args: argparse.Namespace) -> ArtifactStore | None:
+    store_db = str(getattr(args, "store_db", "") or "").strip()
+    return ArtifactStore(pathlib.Path(store_db)) if store_db else None
+
+
+def store_jsonl_artifact(
+    store_db: str,
+    kind: str,
+    path: pathlib.Path,
+    *,
+    rows_path: pathlib.Path,
+    meta: dict[str, Any],
+) -> None:
+    """Mirror a finished JSONL artifact into the SQLite store, if configured."""
+    if not store_db.strip():
+        return
+    with ArtifactStore(pathlib.Path(store_db)) as store:
+
+        def rows() -> Iterator[dict[str, Any]]:
+            with open_jsonl(rows_path, "rb") as handle:
+                for lineno, line in enumerate(handle, start=1):
+                    if line.strip():
+                        yield _decode_jsonl_row(line, context=f"{rows_path}:{lineno}")
+
+        row_count = store.put_artifact(kind, path, meta=meta, rows=rows())
+    print(f"Stored {row_count} {kind} row(s) in {store_db}", flush=True)
+
+
+def store_artifact_is_current(
+    store: ArtifactStore | None,
+    kind: str,
+    path: pathlib.Path,
+    *,
+    rows_path: pathlib.Path,
+) -> bool:
+    """Whether to read an artifact from the store rather than its JSONL.
+
+    A JSONL rewritten after the artifact was stored (a later run without
+    --store-db: --resume, --retry-errors, regrade-offline) wins, with a
+    warning, so stale stored rows are never read silently.
+    """
+    if store is None or not store.has_artifact(kind, path):
+        return False
+    updated_at = store.artifact_updated_at(path)
+    if updated_at is None or not rows_path.exists():
+        return True
+    if rows_path.stat().st_mtime <= updated_at.timestamp():
+        return True
+    print(
+        f"Warning: {rows_path} is newer than its copy in {store.path} "
+        f"(stored {updated_at.isoformat()}); reading the JSONL.",
+        file=sys.stderr,
+    )
+    return False
+
+
+def read_artifact_rows(
+    store: ArtifactStore | None,
+    kind: str,
+    path: pathlib.Path,
+    *,
+    rows_path: pathlib.Path,
+    record_type: type[RowRecord] | None = None,
+) -> list[Any]:
+    """Read an artifact's rows from the store when it has a current copy, else from JSONL.
+
+    With `record_type`, rows come back as compact RowRecord instances.
+    """
+    if store_artifact_is_current(store, kind, path, rows_path=rows_path):
+        rows: Iterable[dict[str, Any]] = store.iter_rows(kind, path)  # type: ignore[union-attr]
+    else:
+        rows = iter_jsonl(rows_path)
+    if record_type is None:
+        return list(rows)
+    return [record_type.from_dict(row) for row in rows]
+
+
+DRAIN_POLL_SECONDS = 0.5
+
+
+class RunInterrupted(RuntimeError):
+    """Raised by a worker loop after a SIGINT/SIGTERM drain has finished."""
+
+    def __init__(self, message: str, *, outstanding_sample_ids: list[str]) -> None:
+        super().__init__(message)
+        self.outstanding_sample_ids = outstanding_sample_ids
+
+
+class InterruptState:
+    """Process-wide SIGINT/SIGTERM state polled by the collect/grade loops.
+
+    The first signal asks loops to stop submitting work and drain what is in
+    flight; a second signal asks them to abandon in-flight requests at once.
+    Only while a loop is armed: outside them (finalize, grade-panel's
+    aggregate and bootstrap) nothing polls the flags, so signals act as the
+    default handlers would.
+    """
+
+    def __init__(self) -> None:
+        self.stop_requested = threading.Event()
+        self.abort_requested = threading.Event()
+        self.signal_name = ""
+        self._armed = 0
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self._handle_signal)
+
+    def arm(self) -> None:
+        with self._lock:
+            self._armed += 1
+
+    def disarm(self) -> None:
+        with self._lock:
+            self._armed = max(0, self._armed - 1)
+
+    def _handle_signal(self, signum: int, frame: Any) -> None:
+        if not self._armed:
+            if signum == signal.SIGINT:
+                signal.default_int_handler(signum, frame)
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+            return
+        name = signal.Signals(signum).name
+        if self.stop_requested.is_set():
+            self.abort_requested.set()
+            print(f"\nReceived {name} again; abandoning in-flight requests.", file=sys.stderr, flush=True)
+            return
+        self.signal_name = name
+        self.stop_requested.set()
+        print(
+            f"\nReceived {name}; not submitting new requests and waiting for in-flight "
+            "ones to finish. Send again to abort immediately.",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+RUN_INTERRUPT = InterruptState()
+
+
+class InFlightDrain:
+    """Tracks the drain deadline for one worker pool after an interrupt."""
+
+    def __init__(self, drain_seconds: float) -> None:
+        self.drain_seconds = max(0.0, float(drain_seconds))
+        self.deadline: float | None = None
+
+    @property
+    def stopping(self) -> bool:
+        return RUN_INTERRUPT.stop_requested.is_set()
+
+    def should_abandon(self) -> bool:
+        if RUN_INTERRUPT.abort_requested.is_set():
+            return True
+        if not self.stopping:
+            return False
+        if self.deadline is None:
+            self.deadline = time.monotonic() + self.drain_seconds
+        return time.monotonic() >= self.deadline
+
+    def wait(
+        self, in_flight: dict[concurrent.futures.Future[Any], Any]
+    ) -> set[concurrent.futures.Future[Any]]:
+        # Poll instead of blocking indefinitely so interrupts are noticed even
+        # while every request is still waiting on the network.
+        done, _ = concurrent.futures.wait(
+            in_flight,
+            timeout=DRAIN_POLL_SECONDS,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        return done
+
+
+COLLECT_REVIEW_FIELDNAMES = [
+    "status",
+    "error",
+    "sample_id",
+    "model",
+    "model_id",
+    "model_org",
+    "model_name",
+    "model_reasoning_level",
+    "model_row",
+    "response_reasoning_effort",
+    "run_index",
+    "question_id",
+    "technique",
+    "is_control",
+    "response_latency_ms",
+    "response_finish_reason",
+    "warnings",
+    "response_text",
+]
+
+
+def collect_review_csv_row(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "status": "error" if row.get("error") else "ok",
+        "error": row.get("error", ""),
+        "sample_id": row.get("sample_id", ""),
+        "model": row.get("model", ""),
+        "model_id": row.get("model_id", ""),
+        "model_org": row.get("model_org", ""),
+        "model_name": row.get("model_name", ""),
+        "model_reasoning_level": row.get("model_reasoning_level", ""),
+        "model_row": row.get("model_row", ""),
+        "response_reasoning_effort": row.get("response_reasoning_effort", ""),
+        "run_index": row.get("run_index", ""),
+        "question_id": row.get("question_id", ""),
+        "technique": row.get("technique", ""),
+        "is_control": bool(row.get("is_control", False)),
+        "response_latency_ms": row.get("response_latency_ms", ""),
+        "response_finish_reason": row.get("response_finish_reason", ""),
+        "warnings": "; ".join(str(x) for x in row.get("warnings", [])),
+        "response_text": row.get("response_text", ""),
+    }
+
+
+GRADE_REVIEW_FIELDNAMES = [
+    "status",
+    "error",
+    "sample_id",
+    "model",
+    "model_id",
+    "model_org",
+    "model_name",
+    "model_reasoning_level",
+    "model_row",
+    "response_reasoning_effort",
+    "run_index",
+    "question_id",
+    "technique",
+    "is_control",
+    "judge_score",
+    "judge_justification",
+    "source_response_error",
+    "response_text",
+]
+
+
+def grade_review_csv_row(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "status": "error" if row.get("error") else "ok",
+        "error": row.get("error", ""),
+        "sample_id": row.get("sample_id", ""),
+        "model": row.get("model", ""),
+        "model_id": row.get("model_id", ""),
+        "model_org": row.get("model_org", ""),
+        "model_name": row.get("model_name", ""),
+        "model_reasoning_level": row.get("model_reasoning_level", ""),
+        "model_row": row.get("model_row", ""),
+        "response_reasoning_effort": row.get("response_reasoning_effort", ""),
+        "run_index": row.get("run_index", ""),
+        "question_id": row.get("question_id", ""),
+        "technique": row.get("technique", ""),
+        "is_control": bool(row.get("is_control", False)),
+        "judge_score": row.get("judge_score", ""),
+        "judge_justification": row.get("judge_justification", ""),
+        "source_response_error": row.get("source_response_error", ""),
+        "response_text": row.get("response_text", ""),
+    }
+
+
+def write_grade_review_csv(path: pathlib.Path, rows: Iterable[dict[str, Any]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=GRADE_REVIEW_FIELDNAMES)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(grade_review_csv_row(row))
+
+
+GRADE_REVIEW_MARKDOWN_HEADER = [
+    "# Grade Review",
+    "",
+    "| Status | Model | Run | QID | Technique | Control | Score | Justification | Response Excerpt | Error |",
+    "|---|---|---:|---|---|---:|---:|---|---|---|",
+]
+
+
+def grade_review_markdown_line(row: dict[str, Any]) -> str:
+    def excerpt(value: Any, max_len: int = 140) -> str:
+        text = " ".join(str(value or "").split())
+        if len(text) <= max_len:
+            return text
+        return text[: max_len - 3].rstrip() + "..."
+
+    status = "error" if row.get("error") else "ok"
+    score = row.get("judge_score")
+    score_text = str(score) if score is not None else ""
+    return (
+        "| "
+        + " | ".join(
+            [
+                status,
+                f"`{row.get('model', '')}`",
+                str(row.get("run_index", "")),
+                f"`{row.get('question_id', '')}`",
+                f"`{row.get('technique', '')}`",
+                "1" if row.get("is_control") else "0",
+                score_text,
+                excerpt(row.get("judge_justification", "")),
+                excerpt(row.get("response_text", "")),
+                excerpt(row.get("error", "")),
+            ]
         )
+        + " |"
+    )
+
+
+def render_grade_review_markdown(rows: list[dict[str, Any]]) -> str:
+    ordered = sorted(
+        rows,
+        key=lambda row: (
+            0 if row.get("error") else 1,
+            str(row.get("model", "")),
+            int(row.get("run_index", 0) or 0),
+            str(row.get("question_id", "")),
+        ),
+    )
+    lines: list[str] = list(GRADE_REVIEW_MARKDOWN_HEADER)
+    for row in ordered:
+        lines.append(grade_review_markdown_line(row))
     lines.append("")
     return "\n".join(lines) + "\n"
 
@@ -1377,6 +3551,27 @@ def normalize_message_content(content: Any) -> str:
     return str(content).strip()
 
 
+def chat_request_body(
+    *,
+    model: str,
+    messages: list[dict[str, str]],
+    temperature: float | None,
+    max_tokens: int,
+    extra_payload: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+    }
+    if temperature is not None:
+        payload["temperature"] = temperature
+    if max_tokens > 0:
+        payload["max_tokens"] = max_tokens
+    if extra_payload:
+        payload.update(extra_payload)
+    return payload
+
+
 class OpenRouterClient:
     def __init__(
         self,
@@ -1412,17 +3607,15 @@ class OpenRouterClient:
         retries: int,
         extra_payload: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-        }
-        if temperature is not None:
-            payload["temperature"] = temperature
-        if max_tokens > 0:
-            payload["max_tokens"] = max_tokens
-        if extra_payload:
-            payload.update(extra_payload)
-        encoded = json.dumps(payload).encode("utf-8")
+        encoded = json_dumps_compact(
+            chat_request_body(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                extra_payload=extra_payload,
+            )
+        )
 
         headers: dict[str, str] = {
             "Content-Type": "application/json",
@@ -1448,8 +3641,8 @@ class OpenRouterClient:
             )
             try:
                 with urllib.request.urlopen(request, timeout=self.timeout_seconds) as resp:
-                    raw = resp.read().decode("utf-8")
-                parsed = json.loads(raw)
+                    raw = resp.read()
+                parsed = json_loads(raw)
                 if not isinstance(parsed, dict):
                     raise RuntimeError(f"{self.api_label} returned non-object JSON.")
                 return parsed
@@ -1532,82 +3725,768 @@ def extract_finish_reason(api_response: dict[str, Any]) -> str | None:
     return str(finish_reason) if finish_reason is not None else None
 
 
-def utc_now_iso() -> str:
-    return dt.datetime.now(dt.UTC).isoformat()
+def extract_score_probability(api_response: dict[str, Any], score: int) -> float | None:
+    """Probability of the judge's `score` digit from the response token logprobs.
+
+    Takes the first token after the `"score"` key that spells the score. None
+    when the provider returned no logprobs.
+    """
+    choices = api_response.get("choices", [])
+    if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+        return None
+    logprobs = choices[0].get("logprobs")
+    content = logprobs.get("content") if isinstance(logprobs, dict) else None
+    if not isinstance(content, list):
+        return None
+    seen_text = ""
+    for entry in content:
+        if not isinstance(entry, dict):
+            continue
+        token = str(entry.get("token", ""))
+        if '"score"' in seen_text and token.strip(' ":,}\n') == str(score):
+            logprob = entry.get("logprob")
+            if isinstance(logprob, (int, float)):
+                return math.exp(logprob)
+            return None
+        seen_text += token
+    return None
 
 
-def build_collect_tasks(
-    model_variants: list[dict[str, Any]],
-    questions: list[dict[str, Any]],
-    num_runs: int,
-    run_id: str,
-) -> list[dict[str, Any]]:
-    tasks: list[dict[str, Any]] = []
-    for run_index in range(1, num_runs + 1):
-        for variant in model_variants:
-            model_id = str(variant["model_id"])
-            model_org = str(variant.get("model_org", "unknown"))
-            model_name = str(variant.get("model_name", model_id))
-            model_reasoning_level = str(variant.get("model_reasoning_level", "default"))
-            model_row = str(
-                variant.get("model_row", f"{model_name}@reasoning={model_reasoning_level}")
-            )
-            model_label = str(variant["model_label"])
-            effort = variant.get("response_reasoning_effort")
-            for question in questions:
-                sample_id = build_sample_id(
-                    run_id=run_id,
-                    question_id=str(question["id"]),
-                    model_label=model_label,
-                    run_index=run_index,
+def openai_batch_body(body: dict[str, Any]) -> dict[str, Any]:
+    """Rewrite an OpenRouter-style chat body for an OpenAI-style batch line.
+
+    OpenRouter's `provider` routing block is dropped and `reasoning.effort`
+    becomes `reasoning_effort`.
+    """
+    converted = {key: value for key, value in body.items() if key not in ("provider", "reasoning")}
+    reasoning = body.get("reasoning")
+    if isinstance(reasoning, dict) and reasoning.get("effort"):
+        converted["reasoning_effort"] = reasoning["effort"]
+    return converted
+
+
+class BatchApiClient:
+    """Client for OpenAI-style `/files` and `/batches` endpoints (stdlib only)."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        *,
+        timeout_seconds: int,
+        retries: int,
+    ) -> None:
+        if timeout_seconds < 1:
+            raise ValueError("timeout_seconds must be >= 1")
+        if retries < 1:
+            raise ValueError("retries must be >= 1")
+        self.api_key = api_key
+        self.base_url = (base_url.strip() or BATCH_API_DEFAULT_ENDPOINT).rstrip("/")
+        self.timeout_seconds = timeout_seconds
+        self.retries = retries
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        data: bytes | None = None,
+        content_type: str = "application/json",
+    ) -> bytes:
+        headers: dict[str, str] = {}
+        if data is not None:
+            headers["Content-Type"] = content_type
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        url = f"{self.base_url}{path}"
+        last_error: Exception | None = None
+        for attempt in range(1, self.retries + 1):
+            retry_after_header: str | None = None
+            request = urllib.request.Request(url, data=data, headers=headers, method=method)
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout_seconds) as resp:
+                    return resp.read()
+            except urllib.error.HTTPError as exc:
+                detail = exc.read().decode("utf-8", errors="ignore")
+                retry_after_header = exc.headers.get("Retry-After") if exc.headers else None
+                retryable = is_retryable_http_status(exc.code)
+                last_error = RuntimeError(
+                    f"HTTP {exc.code} from {method} {url} (attempt {attempt}/{self.retries})"
+                    f"{' [retryable]' if retryable else ' [non-retryable]'}: {detail}"
                 )
-                tasks.append(
-                    {
-                        "sample_id": sample_id,
-                        "run_index": run_index,
-                        "model": model_label,
-                        "model_id": model_id,
-                        "model_org": model_org,
-                        "model_name": model_name,
-                        "model_reasoning_level": model_reasoning_level,
-                        "model_row": model_row,
-                        "response_reasoning_effort": effort,
-                        "question": question,
-                    }
+                if not retryable:
+                    raise last_error from exc
+            except Exception as exc:  # pylint: disable=broad-except
+                last_error = RuntimeError(
+                    f"{method} {url} failed (attempt {attempt}/{self.retries}): {exc}"
                 )
-    return tasks
+            if attempt < self.retries:
+                time.sleep(compute_retry_delay_seconds(attempt, retry_after_header))
+        assert last_error is not None
+        raise last_error
+
+    def _request_json(self, method: str, path: str, payload: Any = None) -> dict[str, Any]:
+        data = json_dumps_compact(payload) if payload is not None else None
+        parsed = json_loads(self._request(method, path, data=data))
+        if not isinstance(parsed, dict):
+            raise RuntimeError(f"{method} {self.base_url}{path} returned non-object JSON.")
+        return parsed
+
+    def upload_batch_file(self, filename: str, content: bytes) -> str:
+        boundary = f"----bsbench{stable_short_hash(filename + str(len(content)), length=16)}"
+        body = b"".join(
+            [
+                f'--{boundary}\r\nContent-Disposition: form-data; name="purpose"\r\n\r\n'
+                "batch\r\n".encode("utf-8"),
+                f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+                f'filename="{filename}"\r\nContent-Type: application/jsonl\r\n\r\n'.encode("utf-8"),
+                content,
+                f"\r\n--{boundary}--\r\n".encode("utf-8"),
+            ]
+        )
+        parsed = json_loads(
+            self._request(
+                "POST",
+                "/files",
+                data=body,
+                content_type=f"multipart/form-data; boundary={boundary}",
+            )
+        )
+        file_id = parsed.get("id") if isinstance(parsed, dict) else None
+        if not file_id:
+            raise RuntimeError(f"Batch file upload returned no file id: {parsed!r}")
+        return str(file_id)
+
+    def create_batch(self, input_file_id: str, *, metadata: dict[str, str]) -> dict[str, Any]:
+        return self._request_json(
+            "POST",
+            "/batches",
+            {
+                "input_file_id": input_file_id,
+                "endpoint": BATCH_CHAT_COMPLETIONS_URL,
+                "completion_window": BATCH_COMPLETION_WINDOW,
+                "metadata": metadata,
+            },
+        )
 
+    def retrieve_batch(self, batch_id: str) -> dict[str, Any]:
+        return self._request_json("GET", f"/batches/{batch_id}")
 
-def collect_one(
-    task: dict[str, Any],
+    def file_content(self, file_id: str) -> bytes:
+        return self._request("GET", f"/files/{file_id}/content")
+
+
+def parse_batch_output(content: bytes) -> dict[str, tuple[dict[str, Any] | None, str]]:
+    """Map a batch output/error file to custom_id -> (completion payload, error)."""
+    results: dict[str, tuple[dict[str, Any] | None, str]] = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        entry = json_loads(line)
+        if not isinstance(entry, dict) or not entry.get("custom_id"):
+            continue
+        custom_id = str(entry["custom_id"])
+        response = entry.get("response") if isinstance(entry.get("response"), dict) else {}
+        body = response.get("body")
+        status_code = response.get("status_code")
+        if entry.get("error"):
+            results[custom_id] = (
+                None,
+                f"Batch request failed: {json.dumps(entry['error'], ensure_ascii=False)}",
+            )
+        elif status_code == 200 and isinstance(body, dict):
+            results[custom_id] = (body, "")
+        else:
+            detail = json.dumps(body, ensure_ascii=False) if body is not None else ""
+            results[custom_id] = (None, f"Batch request failed: HTTP {status_code}: {detail}")
+    return results
+
+
+def _write_batch_state(path: pathlib.Path, state: dict[str, Any]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    write_json(tmp_path, state)
+    os.replace(tmp_path, path)
+
+
+def run_batch_jobs(
+    client: BatchApiClient,
+    requests: list[tuple[str, dict[str, Any]]],
     *,
-    client: OpenRouterClient | None,
-    system_prompt: str,
-    omit_system_prompt: bool,
+    state_path: pathlib.Path,
+    label: str,
+    poll_seconds: float,
+    on_results: Callable[[str, dict[str, tuple[dict[str, Any] | None, str]]], None],
+    on_event: Callable[[dict[str, Any]], None],
+) -> None:
+    """Submit `requests` (custom_id, chat body) as batch jobs and hand back results.
+
+    Batch ids are recorded in `state_path` before polling, so a resumed run
+    first collects the results of batches it already submitted and only
+    submits what they did not cover. `on_results(batch_id, results)` gets
+    each finished batch's results (custom_id -> (payload, error)); requests
+    a finished batch returned nothing for get an error result. Polling backs
+    off from `poll_seconds` up to BATCH_POLL_MAX_SECONDS; an interrupt
+    stops it and leaves the batches running for `--resume`.
+    """
+    state: dict[str, Any] = {"batches": []}
+    if state_path.exists():
+        with state_path.open("r", encoding="utf-8") as handle:
+            state = json.load(handle)
+    pending_ids = {custom_id for custom_id, _ in requests}
+    batch_request_ids: dict[str, set[str]] = {}
+
+    def _consume(batch: dict[str, Any], remote: dict[str, Any]) -> None:
+        results: dict[str, tuple[dict[str, Any] | None, str]] = {}
+        for file_key in ("output_file_id", "error_file_id"):
+            file_id = remote.get(file_key)
+            if file_id:
+                results.update(parse_batch_output(client.file_content(str(file_id))))
+        status = str(remote.get("status", ""))
+        for custom_id in batch_request_ids.get(batch["batch_id"], set()) - set(results):
+            errors = remote.get("errors") or {}
+            results[custom_id] = (
+                None,
+                f"Batch {batch['batch_id']} ended with status={status} and returned no result"
+                + (f": {json.dumps(errors, ensure_ascii=False)}" if errors else "."),
+            )
+        results = {key: value for key, value in results.items() if key in pending_ids}
+        on_results(batch["batch_id"], results)
+        pending_ids.difference_update(results)
+        batch["status"] = status
+        batch["request_counts"] = remote.get("request_counts")
+        batch["consumed"] = True
+        _write_batch_state(state_path, state)
+        on_event(
+            {
+                "event": "batch_consumed",
+                "batch_id": batch["batch_id"],
+                "batch_status": status,
+                "result_rows": len(results),
+            }
+        )
+
+    def _poll(batches: list[dict[str, Any]]) -> None:
+        round_index = 0
+        while True:
+            open_batches = [batch for batch in batches if not batch.get("consumed")]
+            if not open_batches:
+                return
+            for batch in open_batches:
+                remote = client.retrieve_batch(batch["batch_id"])
+                status = str(remote.get("status", ""))
+                counts = remote.get("request_counts") or {}
+                print(
+                    f"[{label} batch {batch['batch_id']}] status={status} "
+                    f"completed={counts.get('completed', 0)} failed={counts.get('failed', 0)} "
+                    f"total={counts.get('total', batch.get('request_count', 0))}",
+                    flush=True,
+                )
+                if status in BATCH_TERMINAL_STATUSES:
+                    _consume(batch, remote)
+            if all(batch.get("consumed") for batch in batches):
+                return
+            delay = min(BATCH_POLL_MAX_SECONDS, poll_seconds * (1.5**round_index))
+            round_index += 1
+            deadline = time.monotonic() + delay
+            while time.monotonic() < deadline:
+                if RUN_INTERRUPT.stop_requested.is_set():
+                    raise RunInterrupted(
+                        f"{label} batch polling interrupted by "
+                        f"{RUN_INTERRUPT.signal_name or 'signal'}; submitted batches keep "
+                        "running, rerun with --resume to collect their results",
+                        outstanding_sample_ids=sorted(pending_ids),
+                    )
+                time.sleep(min(DRAIN_POLL_SECONDS, max(0.0, deadline - time.monotonic())))
+
+    recorded = [batch for batch in state["batches"] if not batch.get("consumed")]
+    if recorded:
+        print(f"Resuming {len(recorded)} submitted {label} batch(es).", flush=True)
+        _poll(recorded)
+
+    remaining = [(custom_id, body) for custom_id, body in requests if custom_id in pending_ids]
+    submitted: list[dict[str, Any]] = []
+    for chunk_start in range(0, len(remaining), BATCH_MAX_REQUESTS):
+        chunk = remaining[chunk_start : chunk_start + BATCH_MAX_REQUESTS]
+        content = b"".join(
+            json_dumps_compact(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": BATCH_CHAT_COMPLETIONS_URL,
+                    "body": openai_batch_body(body),
+                }
+            )
+            + b"\n"
+            for custom_id, body in chunk
+        )
+        input_file_id = client.upload_batch_file(
+            f"{label}_{len(state['batches']) + 1}.jsonl", content
+        )
+        remote = client.create_batch(input_file_id, metadata={"source": f"bullshit-benchmark {label}"})
+        batch_id = str(remote.get("id", "")).strip()
+        if not batch_id:
+            raise RuntimeError(f"Batch creation returned no batch id: {remote!r}")
+        batch = {
+            "batch_id": batch_id,
+            "input_file_id": input_file_id,
+            "request_count": len(chunk),
+            "submitted_at_utc": utc_now_iso(),
+            "status": str(remote.get("status", "")),
+            "consumed": False,
+        }
+        state["batches"].append(batch)
+        _write_batch_state(state_path, state)
+        batch_request_ids[batch_id] = {custom_id for custom_id, _ in chunk}
+        submitted.append(batch)
+        on_event({"event": "batch_submitted", "batch_id": batch_id, "request_count": len(chunk)})
+        print(f"Submitted {label} batch {batch_id} with {len(chunk)} request(s).", flush=True)
+    _poll(submitted)
+
+
+def batch_api_client(args: argparse.Namespace) -> BatchApiClient:
+    """Validate the --batch-* options and build the client for them."""
+    if args.dry_run:
+        raise ValueError(
+            "--batch-api cannot be combined with --dry-run; point --batch-endpoint at "
+            "`mock-server` to exercise it offline."
+        )
+    if args.batch_poll_seconds <= 0:
+        raise ValueError("--batch-poll-seconds must be > 0")
+    return BatchApiClient(
+        api_key=str(getattr(args, "batch_api_key", "") or "").strip()
+        or os.getenv("BATCH_API_KEY", "").strip(),
+        base_url=str(args.batch_endpoint),
+        timeout_seconds=args.timeout_seconds,
+        retries=args.retries,
+    )
+
+
+def utc_now_iso() -> str:
+    return dt.datetime.now(dt.UTC).isoformat()
+
+
+def stable_params_hash(params: dict[str, Any]) -> str:
+    return stable_short_hash(json.dumps(params, sort_keys=True, ensure_ascii=False), length=16)
+
+
+def collect_generation_params_hash(
+    *,
+    collect_endpoint: str,
+    system_prompt: str | None,
     temperature: float | None,
     max_tokens: int,
-    retries: int,
-    pause_seconds: float,
     dry_run: bool,
-    store_request_messages: bool,
-    store_response_raw: bool,
-) -> dict[str, Any]:
-    question = task["question"]
-    started_at = utc_now_iso()
-    t0 = time.perf_counter()
-    request_messages: list[dict[str, str]] = []
-    if not omit_system_prompt and system_prompt.strip():
-        request_messages.append({"role": "system", "content": system_prompt})
-    request_messages.append({"role": "user", "content": question["question"]})
+    batch_endpoint: str = "",
+) -> str:
+    params: dict[str, Any] = {
+        "collect_endpoint": collect_endpoint,
+        "system_prompt": system_prompt,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "dry_run": dry_run,
+    }
+    # Batch requests go elsewhere with different bodies; only batch runs
+    # carry the key, so existing hashes are unchanged.
+    if batch_endpoint:
+        params["batch_endpoint"] = batch_endpoint
+    return stable_params_hash(params)
 
-    reasoning_effort = task.get("response_reasoning_effort")
-    effort_value = (
-        str(reasoning_effort).strip()
-        if isinstance(reasoning_effort, str) and reasoning_effort.strip()
-        else None
-    )
-    model_reasoning_level = str(
-        task.get("model_reasoning_level", effort_value if effort_value is not None else "default")
+
+def collect_reuse_key(
+    *,
+    model_id: Any,
+    reasoning_effort: Any,
+    question_id: Any,
+    question_text: Any,
+    run_index: Any,
+    generation_params_hash: str,
+) -> tuple[str, str, str, str, int, str]:
+    return (
+        str(model_id),
+        str(reasoning_effort or ""),
+        str(question_id),
+        stable_short_hash(str(question_text or ""), length=16),
+        int(run_index or 0),
+        generation_params_hash,
+    )
+
+
+def resolve_reuse_files(path_text: str, filename: str) -> list[pathlib.Path]:
+    files: list[pathlib.Path] = []
+    for part in split_csv(path_text):
+        path = pathlib.Path(part)
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            direct = resolve_jsonl_path(path / filename)
+            if direct.exists():
+                files.append(direct)
+            else:
+                patterns = [filename] + [filename + suffix for suffix in JSONL_COMPRESSION_SUFFIXES]
+                for pattern in patterns:
+                    files.extend(sorted(path.rglob(pattern)))
+        else:
+            raise FileNotFoundError(f"--reuse-from path not found: {path}")
+    return files
+
+
+def _legacy_collect_params_hash(responses_path: pathlib.Path) -> str | None:
+    # Rows written before generation_params_hash existed can still be matched
+    # when the originating collection_meta.json sits next to them.
+    meta_path = responses_path.parent / "collection_meta.json"
+    if not meta_path.exists():
+        return None
+    with meta_path.open("r", encoding="utf-8") as handle:
+        meta = json.load(handle)
+    if not isinstance(meta, dict):
+        return None
+    endpoint = str(meta.get("collect_endpoint") or "https://openrouter.ai/api/v1")
+    return collect_generation_params_hash(
+        collect_endpoint=endpoint,
+        system_prompt=meta.get("response_system_prompt"),
+        temperature=meta.get("temperature"),
+        max_tokens=int(meta.get("max_tokens", 0) or 0),
+        dry_run=bool(meta.get("dry_run", False)),
+        batch_endpoint=str(meta.get("batch_endpoint") or "") if meta.get("batch_api") else "",
+    )
+
+
+def load_collect_reuse_index(
+    path_text: str,
+) -> dict[tuple[str, str, str, str, int, str], tuple[dict[str, Any], str]]:
+    index: dict[tuple[str, str, str, str, int, str], tuple[dict[str, Any], str]] = {}
+    paths = resolve_reuse_files(path_text, "responses.jsonl")
+    for path in paths:
+        legacy_hash = _legacy_collect_params_hash(path)
+        skipped_without_params = 0
+        for row in read_jsonl(path):
+            if row.get("error") or not str(row.get("response_text", "")).strip():
+                continue
+            params_hash = row.get("generation_params_hash") or legacy_hash
+            if not params_hash:
+                skipped_without_params += 1
+                continue
+            key = collect_reuse_key(
+                model_id=row.get("model_id", row.get("model")),
+                reasoning_effort=row.get("response_reasoning_effort"),
+                question_id=row.get("question_id"),
+                question_text=row.get("question"),
+                run_index=row.get("run_index"),
+                generation_params_hash=str(params_hash),
+            )
+            index[key] = (row, str(path.resolve()))
+        if skipped_without_params:
+            print(
+                f"Warning: {skipped_without_params} row(s) in {path} have no generation "
+                "params (no generation_params_hash and no collection_meta.json); not reusable.",
+                file=sys.stderr,
+                flush=True,
+            )
+    _warn_empty_reuse_index(path_text, "responses.jsonl", files=paths, index=index)
+    return index
+
+
+def _warn_empty_reuse_index(
+    path_text: str, filenames: str, *, files: list[pathlib.Path], index: Mapping[Any, Any]
+) -> None:
+    if index:
+        return
+    reason = f"has no {filenames} files" if not files else f"has no reusable rows in {len(files)} file(s)"
+    print(
+        f"Warning: --reuse-from {path_text} {reason}; nothing will be reused.",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def build_reused_collect_record(
+    prior: dict[str, Any],
+    task: dict[str, Any],
+    *,
+    source_file: str,
+) -> dict[str, Any]:
+    question = task["question"]
+    record = dict(prior)
+    for field in SAMPLING_FIELDS:
+        record.pop(field, None)
+    record.update(
+        {
+            "sample_id": task["sample_id"],
+            "run_index": task["run_index"],
+            "model": task["model"],
+            "model_id": task.get("model_id", task["model"]),
+            "model_org": task.get("model_org", "unknown"),
+            "model_name": task.get("model_name", task.get("model_id", task["model"])),
+            "model_reasoning_level": task.get("model_reasoning_level", "default"),
+            "model_row": task.get("model_row", task["model"]),
+            "technique": question["technique"],
+            "is_control": bool(question.get("is_control", False)),
+            "domain": question["domain"],
+            "nonsensical_element": question["nonsensical_element"],
+            **sampling_fields(question),
+            "reused_from_sample_id": prior.get("sample_id"),
+            "reused_from_file": source_file,
+            "reused_at_utc": utc_now_iso(),
+            "error": "",
+        }
+    )
+    return record
+
+
+class FeistelPermutation:
+    """Seeded bijection on range(size), evaluated one index at a time.
+
+    A balanced Feistel network over the smallest even-bit power-of-two
+    domain covering `size`, with cycle-walking back into range, so a
+    shuffled order is available without materializing a list.
+    """
+
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, size: int, seed: int, *, rounds: int = 4) -> None:
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        bits += bits % 2
+        self.half_bits = bits // 2
+        self.half_mask = (1 << self.half_bits) - 1
+        rng = random.Random(seed)
+        self.round_keys = [rng.getrandbits(64) for _ in range(rounds)]
+
+    def _round(self, value: int, key: int) -> int:
+        # splitmix64 finalizer keyed per round.
+        mixed = ((value ^ key) * 0x9E3779B97F4A7C15) & self._MASK64
+        mixed ^= mixed >> 30
+        mixed = (mixed * 0xBF58476D1CE4E5B9) & self._MASK64
+        mixed ^= mixed >> 27
+        return mixed & self.half_mask
+
+    def __call__(self, index: int) -> int:
+        value = index
+        while True:
+            left, right = value >> self.half_bits, value & self.half_mask
+            for key in self.round_keys:
+                left, right = right, left ^ self._round(right, key)
+            value = (left << self.half_bits) | right
+            if value < self.size:
+                return value
+
+
+class CollectTaskSpace:
+    """The (run x model variant x question) collect matrix, addressed lazily.
+
+    Tasks are identified by their flat index in the original nested order
+    (run, then variant, then question) and only turned into task dicts when
+    dispatched, so startup cost and memory stay proportional to the number
+    of variants plus questions rather than to the size of the matrix.
+    With `shuffle_seed`, `iter_indices` walks a seeded FeistelPermutation.
+    """
+
+    def __init__(
+        self,
+        model_variants: list[dict[str, Any]],
+        questions: list[dict[str, Any]],
+        num_runs: int,
+        run_id: str,
+        *,
+        shuffle_seed: int | None = None,
+    ) -> None:
+        self.questions = questions
+        self.num_runs = num_runs
+        self.run_slug = to_slug(run_id) or "run"
+        self.variants: list[dict[str, Any]] = []
+        self.model_keys: list[str] = []
+        for variant in model_variants:
+            model_id = str(variant["model_id"])
+            model_name = str(variant.get("model_name", model_id))
+            model_reasoning_level = str(variant.get("model_reasoning_level", "default"))
+            model_label = str(variant["model_label"])
+            self.variants.append(
+                {
+                    "model": model_label,
+                    "model_id": model_id,
+                    "model_org": str(variant.get("model_org", "unknown")),
+                    "model_name": model_name,
+                    "model_reasoning_level": model_reasoning_level,
+                    "model_row": str(
+                        variant.get(
+                            "model_row", f"{model_name}@reasoning={model_reasoning_level}"
+                        )
+                    ),
+                    "response_reasoning_effort": variant.get("response_reasoning_effort"),
+                }
+            )
+            model_slug = to_slug(model_label) or "model"
+            self.model_keys.append(f"{model_slug}_{stable_short_hash(model_label, length=10)}")
+        self.question_ids = [str(question["id"]) for question in questions]
+        self._variant_by_key = self._position_index(self.model_keys, "model variant")
+        self._question_by_id = self._position_index(self.question_ids, "question id")
+        self._sample_id_pattern = re.compile(
+            rf"^{re.escape(self.run_slug)}__(.+)__run([0-9]+)$", re.DOTALL
+        )
+        self.permutation = (
+            FeistelPermutation(len(self), shuffle_seed)
+            if shuffle_seed is not None and len(self) > 1
+            else None
+        )
+
+    @staticmethod
+    def _position_index(values: list[str], label: str) -> dict[str, int]:
+        positions: dict[str, int] = {}
+        for position, value in enumerate(values):
+            if value in positions:
+                raise RuntimeError(
+                    f"Collect task list contains duplicate sample_id values: duplicate {label} "
+                    f"{value!r}."
+                )
+            positions[value] = position
+        return positions
+
+    def __len__(self) -> int:
+        return self.num_runs * len(self.variants) * len(self.questions)
+
+    def decode(self, index: int) -> tuple[int, int, int]:
+        """Return (run_index, variant position, question position) for `index`."""
+        run_offset, rest = divmod(index, len(self.variants) * len(self.questions))
+        variant_pos, question_pos = divmod(rest, len(self.questions))
+        return run_offset + 1, variant_pos, question_pos
+
+    def sample_id(self, index: int) -> str:
+        run_index, variant_pos, question_pos = self.decode(index)
+        # <run slug>__<question id>__<model slug>_<label hash>__run<N>; the
+        # per-variant model key is precomputed in __init__.
+        return (
+            f"{self.run_slug}__{self.question_ids[question_pos]}__"
+            f"{self.model_keys[variant_pos]}__run{run_index}"
+        )
+
+    def locate(self, sample_id: str) -> int | None:
+        """Return the flat index of `sample_id`, or None if it is not in the matrix."""
+        match = self._sample_id_pattern.match(sample_id)
+        if match is None:
+            return None
+        middle, run_text = match.group(1), match.group(2)
+        run_index = int(run_text)
+        if not 1 <= run_index <= self.num_runs or run_text != str(run_index):
+            return None
+        split_at = middle.find("__")
+        while split_at >= 0:
+            question_pos = self._question_by_id.get(middle[:split_at])
+            variant_pos = self._variant_by_key.get(middle[split_at + 2 :])
+            if question_pos is not None and variant_pos is not None:
+                return (
+                    (run_index - 1) * len(self.variants) + variant_pos
+                ) * len(self.questions) + question_pos
+            split_at = middle.find("__", split_at + 1)
+        return None
+
+    def task(self, index: int) -> dict[str, Any]:
+        run_index, variant_pos, question_pos = self.decode(index)
+        return {
+            "sample_id": self.sample_id(index),
+            "run_index": run_index,
+            **self.variants[variant_pos],
+            "question": self.questions[question_pos],
+        }
+
+    def iter_indices(self) -> Iterator[int]:
+        if self.permutation is None:
+            return iter(range(len(self)))
+        return map(self.permutation, range(len(self)))
+
+    def iter_tasks(
+        self,
+        *,
+        skip_sample_ids: set[str] | frozenset[str] = frozenset(),
+        variant_positions: set[int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield task dicts in dispatch order, skipping finished sample ids."""
+        variant_span = len(self.questions)
+        variant_count = len(self.variants)
+        for index in self.iter_indices():
+            if (
+                variant_positions is not None
+                and (index // variant_span) % variant_count not in variant_positions
+            ):
+                continue
+            if skip_sample_ids and self.sample_id(index) in skip_sample_ids:
+                continue
+            yield self.task(index)
+
+    def iter_task_groups(
+        self,
+        *,
+        skip_sample_ids: set[str] | frozenset[str] = frozenset(),
+        variant_positions: set[int] | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the pending runs of each model variant x question together.
+
+        Groups follow the dispatch order of their run-1 task in `iter_tasks`;
+        runs within a group are in run order.
+        """
+        pair_count = len(self.variants) * len(self.questions)
+        for index in self.iter_indices():
+            if index >= pair_count:
+                # Run 1 of every pair comes first in the flat index, so pairs
+                # are walked through their run-1 index only.
+                continue
+            if (
+                variant_positions is not None
+                and index // len(self.questions) not in variant_positions
+            ):
+                continue
+            group = [
+                self.task(run_offset * pair_count + index)
+                for run_offset in range(self.num_runs)
+                if not (
+                    skip_sample_ids
+                    and self.sample_id(run_offset * pair_count + index) in skip_sample_ids
+                )
+            ]
+            if group:
+                yield group
+
+
+def collect_request_messages(
+    question: dict[str, Any], *, system_prompt: str, omit_system_prompt: bool
+) -> list[dict[str, str]]:
+    request_messages: list[dict[str, str]] = []
+    if not omit_system_prompt and system_prompt.strip():
+        request_messages.append({"role": "system", "content": system_prompt})
+    request_messages.append({"role": "user", "content": question["question"]})
+    return request_messages
+
+
+def collect_reasoning_effort(task: dict[str, Any]) -> str | None:
+    reasoning_effort = task.get("response_reasoning_effort")
+    return (
+        str(reasoning_effort).strip()
+        if isinstance(reasoning_effort, str) and reasoning_effort.strip()
+        else None
+    )
+
+
+def collect_extra_payload(
+    client: OpenRouterClient, effort_value: str | None
+) -> dict[str, Any] | None:
+    if effort_value is not None and client.is_openrouter:
+        return {
+            "reasoning": {"effort": effort_value},
+            "provider": {"require_parameters": True},
+        }
+    return None
+
+
+def new_collect_record(
+    task: dict[str, Any],
+    *,
+    request_messages: list[dict[str, str]],
+    store_request_messages: bool,
+    started_at: str | None,
+) -> dict[str, Any]:
+    question = task["question"]
+    effort_value = collect_reasoning_effort(task)
+    model_reasoning_level = str(
+        task.get("model_reasoning_level", effort_value if effort_value is not None else "default")
     )
     model_row = str(
         task.get(
@@ -1616,8 +4495,7 @@ def collect_one(
             f"@reasoning={model_reasoning_level}",
         )
     )
-
-    record: dict[str, Any] = {
+    return {
         "sample_id": task["sample_id"],
         "run_index": task["run_index"],
         "model": task["model"],
@@ -1633,6 +4511,7 @@ def collect_one(
         "domain": question["domain"],
         "question": question["question"],
         "nonsensical_element": question["nonsensical_element"],
+        **sampling_fields(question),
         "stateless_request": True,
         "request_messages": request_messages if store_request_messages else [],
         "response_text": "",
@@ -1648,54 +4527,89 @@ def collect_one(
         "error": "",
     }
 
+
+def apply_collect_payload(
+    record: dict[str, Any], payload: dict[str, Any], *, store_response_raw: bool
+) -> None:
+    """Fill `record` from a completion payload's first choice; raise on empty text."""
+    if store_response_raw:
+        record["response_raw"] = payload
+    response_text = extract_model_text(payload)
+    if not response_text.strip():
+        finish_reason = extract_finish_reason(payload)
+        raise RuntimeError(
+            f"API returned empty response_text (finish_reason={finish_reason})."
+        )
+    record["response_text"] = response_text
+    record["response_id"] = str(payload.get("id", ""))
+    record["response_created"] = payload.get("created")
+    record["response_usage"] = payload.get("usage", {})
+    record["response_finish_reason"] = extract_finish_reason(payload)
+    if record["response_finish_reason"] == "length":
+        record["warnings"].append("response_finish_reason=length (possible truncation)")
+
+
+def collect_one(
+    task: dict[str, Any],
+    *,
+    client: OpenRouterClient | None,
+    system_prompt: str,
+    omit_system_prompt: bool,
+    temperature: float | None,
+    max_tokens: int,
+    retries: int,
+    pause_seconds: float,
+    dry_run: bool,
+    store_request_messages: bool,
+    store_response_raw: bool,
+) -> dict[str, Any]:
+    question = task["question"]
+    started_at = utc_now_iso()
+    t0 = time.perf_counter()
+    request_messages = collect_request_messages(
+        question, system_prompt=system_prompt, omit_system_prompt=omit_system_prompt
+    )
+    record = new_collect_record(
+        task,
+        request_messages=request_messages,
+        store_request_messages=store_request_messages,
+        started_at=started_at,
+    )
+
     try:
         if pause_seconds > 0:
             time.sleep(pause_seconds)
 
         if dry_run:
-            response_text = (
-                f"DRY RUN response for question={question['id']} model={task['model']}"
-            )
             payload: dict[str, Any] = {
                 "id": "dry-run",
                 "created": None,
                 "usage": {},
-                "choices": [{"finish_reason": "stop"}],
+                "choices": [
+                    {
+                        "finish_reason": "stop",
+                        "message": {
+                            "content": (
+                                f"DRY RUN response for question={question['id']} "
+                                f"model={task['model']}"
+                            ),
+                        },
+                    }
+                ],
             }
         else:
             assert client is not None
-            extra_payload: dict[str, Any] | None = None
-            if effort_value is not None and client.is_openrouter:
-                extra_payload = {
-                    "reasoning": {"effort": effort_value},
-                    "provider": {"require_parameters": True},
-                }
             payload = client.chat(
                 model=task.get("model_id", task["model"]),
                 messages=request_messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 retries=retries,
-                extra_payload=extra_payload,
+                extra_payload=collect_extra_payload(
+                    client, record["response_reasoning_effort"]
+                ),
             )
-            if store_response_raw:
-                record["response_raw"] = payload
-            response_text = extract_model_text(payload)
-            if not response_text.strip():
-                finish_reason = extract_finish_reason(payload)
-                raise RuntimeError(
-                    f"API returned empty response_text (finish_reason={finish_reason})."
-                )
-
-        record["response_text"] = response_text
-        record["response_id"] = str(payload.get("id", ""))
-        record["response_created"] = payload.get("created")
-        record["response_usage"] = payload.get("usage", {})
-        record["response_finish_reason"] = extract_finish_reason(payload)
-        if record["response_finish_reason"] == "length":
-            record["warnings"].append("response_finish_reason=length (possible truncation)")
-        if store_response_raw and record["response_raw"] is None:
-            record["response_raw"] = payload
+        apply_collect_payload(record, payload, store_response_raw=store_response_raw)
     except Exception as exc:  # pylint: disable=broad-except
         record["error"] = str(exc)
     finally:
@@ -1705,6 +4619,138 @@ def collect_one(
     return record
 
 
+def collect_n_sampled(
+    tasks: list[dict[str, Any]],
+    *,
+    client: OpenRouterClient,
+    system_prompt: str,
+    omit_system_prompt: bool,
+    temperature: float | None,
+    max_tokens: int,
+    retries: int,
+    pause_seconds: float,
+    store_request_messages: bool,
+    store_response_raw: bool,
+) -> list[dict[str, Any]]:
+    """Collect several runs of one model x question with a single `n` request.
+
+    Choices are mapped onto `tasks` in choice-index order, so the result is
+    shorter than `tasks` when the provider returned fewer choices (it ignored
+    `n`). The request's usage is recorded on the first row only. Raises when
+    the request itself fails.
+    """
+    question = tasks[0]["question"]
+    started_at = utc_now_iso()
+    t0 = time.perf_counter()
+    request_messages = collect_request_messages(
+        question, system_prompt=system_prompt, omit_system_prompt=omit_system_prompt
+    )
+    if pause_seconds > 0:
+        time.sleep(pause_seconds)
+    extra_payload = collect_extra_payload(client, collect_reasoning_effort(tasks[0])) or {}
+    payload = client.chat(
+        model=tasks[0].get("model_id", tasks[0]["model"]),
+        messages=request_messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        retries=retries,
+        extra_payload={**extra_payload, "n": len(tasks)},
+    )
+    if payload.get("error"):
+        extract_model_text(payload)  # raises with the provider's error payload
+    choices = payload.get("choices")
+    if not isinstance(choices, list):
+        choices = []
+    choices = sorted(
+        (choice for choice in choices if isinstance(choice, dict)),
+        key=lambda choice: int(choice.get("index", 0) or 0),
+    )
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+    finished_at = utc_now_iso()
+    sampled_count = min(len(tasks), len(choices))
+
+    records: list[dict[str, Any]] = []
+    for choice_index, (task, choice) in enumerate(zip(tasks, choices)):
+        record = new_collect_record(
+            task,
+            request_messages=request_messages,
+            store_request_messages=store_request_messages,
+            started_at=started_at,
+        )
+        choice_payload = {
+            **payload,
+            "usage": payload.get("usage", {}) if choice_index == 0 else {},
+            "choices": [choice],
+        }
+        try:
+            apply_collect_payload(record, choice_payload, store_response_raw=store_response_raw)
+        except Exception as exc:  # pylint: disable=broad-except
+            record["error"] = str(exc)
+        record["response_n_sampled"] = sampled_count
+        record["response_choice_index"] = choice_index
+        record["response_latency_ms"] = latency_ms
+        record["finished_at_utc"] = finished_at
+        records.append(record)
+    return records
+
+
+def collect_task_group(
+    tasks: list[dict[str, Any]],
+    *,
+    client: OpenRouterClient | None,
+    n_sampling: bool,
+    n_sampling_fallback_models: set[str],
+    system_prompt: str,
+    omit_system_prompt: bool,
+    temperature: float | None,
+    max_tokens: int,
+    retries: int,
+    pause_seconds: float,
+    dry_run: bool,
+    store_request_messages: bool,
+    store_response_raw: bool,
+) -> list[dict[str, Any]]:
+    """Collect the pending runs of one model x question.
+
+    With `n_sampling`, the runs are requested together (`n`); models that
+    returned fewer choices than asked, or rejected the request outright, are
+    added to `n_sampling_fallback_models` and collected one call per run from
+    then on. Runs the `n` request did not cover always fall back to their
+    own calls.
+    """
+    call_kwargs = {
+        "system_prompt": system_prompt,
+        "omit_system_prompt": omit_system_prompt,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "retries": retries,
+        "pause_seconds": pause_seconds,
+        "store_request_messages": store_request_messages,
+        "store_response_raw": store_response_raw,
+    }
+    model_id = str(tasks[0].get("model_id", tasks[0]["model"]))
+    records: list[dict[str, Any]] = []
+    if (
+        n_sampling
+        and len(tasks) > 1
+        and not dry_run
+        and client is not None
+        and model_id not in n_sampling_fallback_models
+    ):
+        try:
+            records = collect_n_sampled(tasks, client=client, **call_kwargs)
+        except Exception as exc:  # pylint: disable=broad-except
+            if "[non-retryable]" in str(exc):
+                n_sampling_fallback_models.add(model_id)
+        else:
+            if len(records) < len(tasks):
+                n_sampling_fallback_models.add(model_id)
+    return records + [
+        collect_one(task, client=client, dry_run=dry_run, **call_kwargs)
+        for task in tasks[len(records) :]
+    ]
+
+
 def run_collect(args: argparse.Namespace) -> int:
     config = load_config(args.config)
     collect_config = config.get("collect", {}) if isinstance(config, dict) else {}
@@ -1713,6 +4759,11 @@ def run_collect(args: argparse.Namespace) -> int:
     if not bool(getattr(args, "_skip_config_defaults", False)):
         apply_config_defaults(args, collect_config, COLLECT_DEFAULTS)
 
+    retry_errors = bool(getattr(args, "retry_errors", False))
+    if retry_errors:
+        if not args.run_id.strip():
+            raise ValueError("--retry-errors for collect requires --run-id.")
+        args.resume = True
     if args.resume and not args.run_id.strip():
         raise ValueError("--resume for collect requires --run-id.")
     if args.num_runs < 1:
@@ -1720,6 +4771,7 @@ def run_collect(args: argparse.Namespace) -> int:
     if args.parallelism < 1:
         raise ValueError("--parallelism must be >= 1")
     validate_retry_and_timeout(args.retries, args.timeout_seconds)
+    output_compression = jsonl_output_compression(args)
 
     models = load_models(args.models, args.models_file)
 
@@ -1736,6 +4788,11 @@ def run_collect(args: argparse.Namespace) -> int:
             return 2
         if not cli_option_was_provided(args, "parallelism"):
             args.parallelism = 1
+    batch_client: BatchApiClient | None = None
+    if bool(getattr(args, "batch_api", False)):
+        if ollama_mode or bool(getattr(args, "n_sampling", False)):
+            raise ValueError("--batch-api cannot be combined with --ollama-mode or --n-sampling.")
+        batch_client = batch_api_client(args)
 
     base_reasoning_effort = normalize_reasoning_effort(
         args.response_reasoning_effort, field_name="--response-reasoning-effort"
@@ -1773,6 +4830,12 @@ def run_collect(args: argparse.Namespace) -> int:
     ).strip()
     techniques_filter = split_csv(args.techniques)
     questions = load_questions(args.questions, techniques_filter, args.limit)
+    questions, sampling_meta = stratified_sample_questions(
+        questions,
+        fraction=float(args.sample_fraction),
+        per_technique=int(args.sample_per_technique),
+        seed=args.seed,
+    )
 
     timestamp = dt.datetime.now(dt.UTC)
     run_seed_id = args.run_id.strip() or timestamp.strftime("%Y%m%d_%H%M%S")
@@ -1784,46 +4847,124 @@ def run_collect(args: argparse.Namespace) -> int:
         resume=bool(args.resume),
     )
 
-    tasks = build_collect_tasks(
+    tasks = CollectTaskSpace(
         model_variants,
         questions,
         args.num_runs,
         run_id=run_id,
+        shuffle_seed=args.seed if args.shuffle_tasks else None,
     )
-    if args.shuffle_tasks:
-        rng = random.Random(args.seed)
-        rng.shuffle(tasks)
-
-    task_ids = {sample_id_from_row(task, context="Collect task list") for task in tasks}
     partial_responses_path = run_dir / "responses.partial.jsonl"
-    final_responses_path = run_dir / "responses.jsonl"
+    final_responses_path = final_jsonl_path(run_dir, "responses.jsonl", output_compression)
 
     checkpoint_records: list[dict[str, Any]] = []
     checkpoint_ids: set[str] = set()
+    retry_selection: dict[str, str] = {}
     if args.resume:
         checkpoint_source = partial_responses_path
-        if not checkpoint_source.exists() and final_responses_path.exists():
-            checkpoint_source = final_responses_path
-        checkpoint_records, checkpoint_ids = load_checkpoint_rows(
-            checkpoint_source,
-            context=f"Collect checkpoint {checkpoint_source}",
-        )
-        unexpected_checkpoint_ids = checkpoint_ids - task_ids
+        if not checkpoint_source.exists():
+            previous_final = resolve_jsonl_path(run_dir / "responses.jsonl")
+            if previous_final.exists():
+                checkpoint_source = previous_final
+        if checkpoint_source == partial_responses_path and not retry_errors:
+            # Only sample ids are needed to skip finished work; the rows
+            # themselves are streamed from the checkpoint at finalize.
+            checkpoint_offsets, _ = load_checkpoint_offset_index(
+                checkpoint_source,
+                context=f"Collect checkpoint {checkpoint_source}",
+            )
+            checkpoint_ids = set(checkpoint_offsets)
+        else:
+            checkpoint_records, checkpoint_ids = load_checkpoint_rows(
+                checkpoint_source,
+                context=f"Collect checkpoint {checkpoint_source}",
+            )
+        unexpected_checkpoint_ids = {
+            sample_id for sample_id in checkpoint_ids if tasks.locate(sample_id) is None
+        }
         if unexpected_checkpoint_ids:
             raise RuntimeError(
                 "Collect resume checkpoint contains sample_id values that are not in the "
                 "current task set. This usually means config/model/question changes since "
                 f"the original run. sample={_sample_ids_summary(unexpected_checkpoint_ids)}"
             )
-        if checkpoint_records and checkpoint_source != partial_responses_path:
-            # Keep all incremental progress in one append-only file after resume.
-            write_jsonl(partial_responses_path, checkpoint_records)
-
-    tasks_to_run = [
-        task
-        for task in tasks
-        if sample_id_from_row(task, context="Collect task list") not in checkpoint_ids
-    ]
+        if retry_errors:
+            retry_selection = select_retry_sample_ids(
+                checkpoint_records,
+                models=split_csv(args.retry_models),
+                error_classes=split_csv(args.retry_error_classes),
+            )
+            checkpoint_records = [
+                row for row in checkpoint_records
+                if str(row.get("sample_id", "")).strip() not in retry_selection
+            ]
+            checkpoint_ids -= set(retry_selection)
+            print(
+                f"Retrying {len(retry_selection)} errored row(s): "
+                f"{json.dumps(_retry_class_counts(retry_selection))}",
+                flush=True,
+            )
+        if retry_selection or (
+            checkpoint_records and checkpoint_source != partial_responses_path
+        ):
+            # Keep all incremental progress in one append-only file after resume;
+            # rows selected for retry are dropped first so the file stays
+            # duplicate-free while they are re-dispatched.
+            write_jsonl_atomic(partial_responses_path, checkpoint_records)
+            rebuild_checkpoint_index(partial_responses_path)
+        elif checkpoint_records:
+            load_checkpoint_offset_index(
+                partial_responses_path,
+                context=f"Collect checkpoint {partial_responses_path}",
+            )
+
+    # Finished work is skipped lazily while dispatching; only the checkpoint
+    # (and reused) sample ids are held in memory.
+    skip_sample_ids = set(checkpoint_ids)
+
+    n_sampling = bool(getattr(args, "n_sampling", False)) and args.num_runs > 1
+    # Models whose provider returned fewer choices than `n` (or rejected it);
+    # shared by the worker threads, which only ever add to it.
+    n_sampling_fallback_models: set[str] = set()
+
+    generation_params_hash = collect_generation_params_hash(
+        collect_endpoint=collect_endpoint or "https://openrouter.ai/api/v1",
+        system_prompt=None if omit_system_prompt else args.response_system_prompt,
+        temperature=args.temperature,
+        max_tokens=args.max_tokens,
+        dry_run=bool(args.dry_run),
+        batch_endpoint=batch_client.base_url if batch_client is not None else "",
+    )
+    reuse_from = str(getattr(args, "reuse_from", "") or "").strip()
+    reused_records: list[dict[str, Any]] = []
+    if reuse_from and len(tasks) > len(skip_sample_ids):
+        reuse_index = load_collect_reuse_index(reuse_from)
+        for task in tasks.iter_tasks(skip_sample_ids=checkpoint_ids):
+            question = task["question"]
+            match = reuse_index.get(
+                collect_reuse_key(
+                    model_id=task.get("model_id", task["model"]),
+                    reasoning_effort=task.get("response_reasoning_effort"),
+                    question_id=question["id"],
+                    question_text=question["question"],
+                    run_index=task["run_index"],
+                    generation_params_hash=generation_params_hash,
+                )
+            )
+            if match is None:
+                continue
+            prior, source_file = match
+            record = build_reused_collect_record(prior, task, source_file=source_file)
+            record["generation_params_hash"] = generation_params_hash
+            record["status"] = "ok"
+            reused_records.append(record)
+            skip_sample_ids.add(task["sample_id"])
+        print(
+            f"Reused {len(reused_records)} row(s) from {reuse_from}; "
+            f"{len(tasks) - len(skip_sample_ids)} row(s) left to collect.",
+            flush=True,
+        )
+    pending_count = len(tasks) - len(skip_sample_ids)
 
     collection_meta = {
         "phase": "collect",
@@ -1833,12 +4974,22 @@ def run_collect(args: argparse.Namespace) -> int:
         "collect_is_openrouter": collect_is_openrouter,
         "ollama_mode": ollama_mode,
         "resumed": bool(args.resume),
-        "resumed_completed_rows": len(checkpoint_records),
+        "resumed_completed_rows": len(checkpoint_ids),
+        "retry_errors": retry_errors,
+        "retried_rows": len(retry_selection),
+        "retried_error_classes": _retry_class_counts(retry_selection),
+        "reuse_from": reuse_from or None,
+        "reused_rows": len(reused_records),
+        "generation_params_hash": generation_params_hash,
+        "jsonl_compression": output_compression or "none",
         "questions_path": str(pathlib.Path(args.questions).resolve()),
         "question_count": len(questions),
         "models": models,
         "model_variants": model_variants,
         "num_runs": args.num_runs,
+        "n_sampling": n_sampling,
+        "batch_api": batch_client is not None,
+        "batch_endpoint": batch_client.base_url if batch_client is not None else None,
         "task_count": len(tasks),
         "parallelism": args.parallelism,
         "temperature": args.temperature,
@@ -1854,6 +5005,7 @@ def run_collect(args: argparse.Namespace) -> int:
         "retries": args.retries,
         "timeout_seconds": args.timeout_seconds,
         "techniques_filter": techniques_filter,
+        "sampling": sampling_meta,
         "shuffle_tasks": bool(args.shuffle_tasks),
         "seed": args.seed,
         "dry_run": bool(args.dry_run),
@@ -1868,206 +5020,387 @@ def run_collect(args: argparse.Namespace) -> int:
         collect_events_path.write_text("", encoding="utf-8")
     elif not collect_events_path.exists():
         collect_events_path.write_text("", encoding="utf-8")
-    append_jsonl(
-        collect_events_path,
-        {
-            "timestamp_utc": utc_now_iso(),
-            "phase": "collect",
-            "event": "resume_start" if args.resume else "start",
-            "run_id": run_id,
-            "checkpoint_rows": len(checkpoint_records),
-            "remaining_rows": len(tasks_to_run),
-        },
-    )
+    writer = JsonlAppendWriter(fsync=getattr(args, "fsync", "never"))
+    writer.track_offsets(partial_responses_path)
+    raw_store = RawPayloadStore(run_dir / "responses.raw.blob")
+    RUN_INTERRUPT.arm()
+    try:
+        writer.append(
+            collect_events_path,
+            {
+                "timestamp_utc": utc_now_iso(),
+                "phase": "collect",
+                "event": "retry_errors_start"
+                if retry_errors
+                else ("resume_start" if args.resume else "start"),
+                "run_id": run_id,
+                "checkpoint_rows": len(checkpoint_ids),
+                "retry_rows": len(retry_selection),
+                "reused_rows": len(reused_records),
+                "remaining_rows": pending_count,
+            },
+        )
+        for record in reused_records:
+            raw_store.externalize(
+                record,
+                "response_raw",
+                source_dir=pathlib.Path(str(record["reused_from_file"])).parent,
+            )
+            writer.append(partial_responses_path, record)
+            writer.append(
+                collect_events_path,
+                {
+                    "timestamp_utc": utc_now_iso(),
+                    "phase": "collect",
+                    "event": "task_reused",
+                    "status": "ok",
+                    "sample_id": record.get("sample_id"),
+                    "model": record.get("model"),
+                    "question_id": record.get("question_id"),
+                    "run_index": record.get("run_index"),
+                    "reused_from_sample_id": record.get("reused_from_sample_id"),
+                    "reused_from_file": record.get("reused_from_file"),
+                },
+            )
 
-    client: OpenRouterClient | None = None
-    if not args.dry_run:
-        if collect_is_openrouter:
-            api_key = os.getenv("OPENROUTER_API_KEY", "").strip()
-            if not api_key:
-                raise RuntimeError(
-                    "OPENROUTER_API_KEY is required unless --dry-run is set."
+        client: OpenRouterClient | None = None
+        if not args.dry_run and batch_client is None:
+            if collect_is_openrouter:
+                api_key = os.getenv("OPENROUTER_API_KEY", "").strip()
+                if not api_key:
+                    raise RuntimeError(
+                        "OPENROUTER_API_KEY is required unless --dry-run is set."
+                    )
+            else:
+                api_key = (
+                    getattr(args, "collect_api_key", "").strip()
+                    or os.getenv("COLLECT_API_KEY", "").strip()
                 )
-        else:
-            api_key = (
-                getattr(args, "collect_api_key", "").strip()
-                or os.getenv("COLLECT_API_KEY", "").strip()
+            client = OpenRouterClient(
+                api_key=api_key,
+                timeout_seconds=args.timeout_seconds,
+                base_url=collect_endpoint,
             )
-        client = OpenRouterClient(
-            api_key=api_key,
-            timeout_seconds=args.timeout_seconds,
-            base_url=collect_endpoint,
-        )
 
-    started = time.perf_counter()
-    records: list[dict[str, Any]] = list(checkpoint_records)
-    total = len(tasks)
-    completed = len(checkpoint_records)
+        started = time.perf_counter()
+        total = len(tasks)
+        completed = len(checkpoint_ids) + len(reused_records)
+
+        drain = InFlightDrain(getattr(args, "drain_seconds", 30.0))
+
+        def _finish_collect_record(record: dict[str, Any]) -> None:
+            nonlocal completed
+            completed += 1
+            record["generation_params_hash"] = generation_params_hash
+            record["status"] = "error" if record.get("error") else "ok"
+            raw_store.externalize(record, "response_raw")
+            writer.append(partial_responses_path, record)
+            status = record["status"]
+            writer.append(
+                collect_events_path,
+                {
+                    "timestamp_utc": utc_now_iso(),
+                    "phase": "collect",
+                    "event": "task_complete",
+                    "status": status,
+                    "sample_id": record.get("sample_id"),
+                    "model": record.get("model"),
+                    "question_id": record.get("question_id"),
+                    "run_index": record.get("run_index"),
+                    "error": record.get("error", ""),
+                },
+            )
+            error_suffix = f" error={record.get('error')}" if status == "error" else ""
+            print(
+                f"[collect {completed}/{total}] {status} "
+                f"model={record['model']} question={record['question_id']} run={record['run_index']}"
+                f"{error_suffix}",
+                flush=True,
+            )
 
-    def _run_task_batch(batch: list[dict[str, Any]]) -> None:
-        nonlocal completed
-        with concurrent.futures.ThreadPoolExecutor(max_workers=args.parallelism) as pool:
-            in_flight: dict[concurrent.futures.Future[dict[str, Any]], dict[str, Any]] = {}
-            task_iter = iter(batch)
+        def _run_task_batch(batch: Iterable[list[dict[str, Any]]]) -> None:
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=args.parallelism)
+            in_flight: dict[
+                concurrent.futures.Future[list[dict[str, Any]]], list[dict[str, Any]]
+            ] = {}
+            abandoned = False
+            try:
+                task_iter = iter(batch)
+
+                def submit_collect_task(group: list[dict[str, Any]]) -> None:
+                    future = pool.submit(
+                        collect_task_group,
+                        group,
+                        client=client,
+                        n_sampling=n_sampling,
+                        n_sampling_fallback_models=n_sampling_fallback_models,
+                        system_prompt=args.response_system_prompt,
+                        omit_system_prompt=omit_system_prompt,
+                        temperature=args.temperature,
+                        max_tokens=args.max_tokens,
+                        retries=args.retries,
+                        pause_seconds=args.pause_seconds,
+                        dry_run=args.dry_run,
+                        store_request_messages=bool(args.store_request_messages),
+                        store_response_raw=bool(args.store_response_raw),
+                    )
+                    in_flight[future] = group
 
-            def submit_collect_task(task: dict[str, Any]) -> None:
-                future = pool.submit(
-                    collect_one,
-                    task,
-                    client=client,
-                    system_prompt=args.response_system_prompt,
-                    omit_system_prompt=omit_system_prompt,
-                    temperature=args.temperature,
-                    max_tokens=args.max_tokens,
-                    retries=args.retries,
-                    pause_seconds=args.pause_seconds,
-                    dry_run=args.dry_run,
-                    store_request_messages=bool(args.store_request_messages),
-                    store_response_raw=bool(args.store_response_raw),
+                for _ in range(args.parallelism):
+                    if drain.stopping:
+                        break
+                    try:
+                        submit_collect_task(next(task_iter))
+                    except StopIteration:
+                        break
+
+                while in_flight:
+                    if drain.should_abandon():
+                        abandoned = True
+                        break
+                    for future in drain.wait(in_flight):
+                        group = in_flight.pop(future)
+                        try:
+                            records = future.result()
+                        except Exception as exc:  # pylint: disable=broad-except
+                            records = []
+                            for task in group:
+                                record = new_collect_record(
+                                    task,
+                                    request_messages=[],
+                                    store_request_messages=False,
+                                    started_at=None,
+                                )
+                                record["finished_at_utc"] = utc_now_iso()
+                                record["error"] = f"Worker failure: {exc}"
+                                records.append(record)
+                        for record in records:
+                            _finish_collect_record(record)
+
+                        if drain.stopping:
+                            continue
+                        try:
+                            submit_collect_task(next(task_iter))
+                        except StopIteration:
+                            pass
+            finally:
+                # Abandoned requests are left running in their worker threads;
+                # the process exits without waiting for them.
+                pool.shutdown(wait=not abandoned, cancel_futures=True)
+            if drain.stopping:
+                raise RunInterrupted(
+                    f"collect interrupted by {RUN_INTERRUPT.signal_name or 'signal'}",
+                    outstanding_sample_ids=sorted(
+                        str(task["sample_id"]) for group in in_flight.values() for task in group
+                    ),
                 )
-                in_flight[future] = task
 
-            for _ in range(min(args.parallelism, len(batch))):
-                try:
-                    submit_collect_task(next(task_iter))
-                except StopIteration:
-                    break
+        def _task_groups(
+            variant_positions: set[int] | None = None,
+        ) -> Iterator[list[dict[str, Any]]]:
+            if n_sampling:
+                return tasks.iter_task_groups(
+                    skip_sample_ids=skip_sample_ids, variant_positions=variant_positions
+                )
+            return (
+                [task]
+                for task in tasks.iter_tasks(
+                    skip_sample_ids=skip_sample_ids, variant_positions=variant_positions
+                )
+            )
 
-            while in_flight:
-                done, _ = concurrent.futures.wait(
-                    in_flight,
-                    return_when=concurrent.futures.FIRST_COMPLETED,
+        def _collect_batch_results(
+            batch_id: str, results: dict[str, tuple[dict[str, Any] | None, str]]
+        ) -> None:
+            for sample_id in sorted(results):
+                index = tasks.locate(sample_id)
+                if index is None:
+                    continue
+                task = tasks.task(index)
+                payload, error = results[sample_id]
+                record = new_collect_record(
+                    task,
+                    request_messages=collect_request_messages(
+                        task["question"],
+                        system_prompt=args.response_system_prompt,
+                        omit_system_prompt=omit_system_prompt,
+                    ),
+                    store_request_messages=bool(args.store_request_messages),
+                    started_at=None,
                 )
-                for future in done:
-                    task = in_flight.pop(future)
-                    completed += 1
+                record["batch_id"] = batch_id
+                if payload is None:
+                    record["error"] = error
+                else:
                     try:
-                        record = future.result()
+                        apply_collect_payload(
+                            record, payload, store_response_raw=bool(args.store_response_raw)
+                        )
                     except Exception as exc:  # pylint: disable=broad-except
-                        question = task["question"]
-                        record = {
-                            "sample_id": task["sample_id"],
-                            "run_index": task["run_index"],
-                            "model": task["model"],
-                            "model_id": task.get("model_id", task["model"]),
-                            "model_org": task.get("model_org", "unknown"),
-                            "model_name": task.get(
-                                "model_name", task.get("model_id", task["model"])
-                            ),
-                            "model_reasoning_level": task.get(
-                                "model_reasoning_level", "default"
-                            ),
-                            "model_row": task.get("model_row", task["model"]),
-                            "response_reasoning_effort": task.get(
-                                "response_reasoning_effort"
+                        record["error"] = str(exc)
+                record["finished_at_utc"] = utc_now_iso()
+                _finish_collect_record(record)
+
+        if pending_count and batch_client is not None:
+            batch_requests: list[tuple[str, dict[str, Any]]] = []
+            for task in tasks.iter_tasks(skip_sample_ids=skip_sample_ids):
+                effort_value = collect_reasoning_effort(task)
+                batch_requests.append(
+                    (
+                        task["sample_id"],
+                        chat_request_body(
+                            model=task.get("model_id", task["model"]),
+                            messages=collect_request_messages(
+                                task["question"],
+                                system_prompt=args.response_system_prompt,
+                                omit_system_prompt=omit_system_prompt,
                             ),
-                            "question_id": question["id"],
-                            "technique": question["technique"],
-                            "is_control": bool(question.get("is_control", False)),
-                            "domain": question["domain"],
-                            "question": question["question"],
-                            "nonsensical_element": question["nonsensical_element"],
-                            "stateless_request": True,
-                            "request_messages": [],
-                            "response_text": "",
-                            "response_id": "",
-                            "response_usage": {},
-                            "response_latency_ms": None,
-                            "response_created": None,
-                            "response_finish_reason": None,
-                            "warnings": [],
-                            "response_raw": None,
-                            "started_at_utc": None,
-                            "finished_at_utc": utc_now_iso(),
-                            "error": f"Worker failure: {exc}",
-                        }
-                    record["status"] = "error" if record.get("error") else "ok"
-                    records.append(record)
-                    append_jsonl(partial_responses_path, record)
-                    status = record["status"]
-                    append_jsonl(
-                        collect_events_path,
-                        {
-                            "timestamp_utc": utc_now_iso(),
-                            "phase": "collect",
-                            "event": "task_complete",
-                            "status": status,
-                            "sample_id": record.get("sample_id"),
-                            "model": record.get("model"),
-                            "question_id": record.get("question_id"),
-                            "run_index": record.get("run_index"),
-                            "error": record.get("error", ""),
-                        },
+                            temperature=args.temperature,
+                            max_tokens=args.max_tokens,
+                            extra_payload={"reasoning": {"effort": effort_value}}
+                            if effort_value is not None
+                            else None,
+                        ),
+                    )
+                )
+            run_batch_jobs(
+                batch_client,
+                batch_requests,
+                state_path=run_dir / "batch_jobs.json",
+                label="collect",
+                poll_seconds=args.batch_poll_seconds,
+                on_results=_collect_batch_results,
+                on_event=lambda event: writer.append(
+                    collect_events_path,
+                    {"timestamp_utc": utc_now_iso(), "phase": "collect", "run_id": run_id, **event},
+                ),
+            )
+        elif pending_count:
+            if ollama_mode:
+                # Group tasks by model_id, in order of first appearance.
+                variants_by_model: dict[str, set[int]] = {}
+                for variant_pos, variant in enumerate(tasks.variants):
+                    variants_by_model.setdefault(variant["model_id"], set()).add(variant_pos)
+                pending_by_variant = [
+                    len(tasks.questions) * tasks.num_runs for _ in tasks.variants
+                ]
+                for sample_id in skip_sample_ids:
+                    index = tasks.locate(sample_id)
+                    if index is not None:
+                        pending_by_variant[tasks.decode(index)[1]] -= 1
+                model_order: list[str] = []
+                for index in tasks.iter_indices():
+                    model_id = tasks.variants[tasks.decode(index)[1]]["model_id"]
+                    if model_id not in model_order:
+                        model_order.append(model_id)
+                        if len(model_order) == len(variants_by_model):
+                            break
+                model_order = [
+                    model_id
+                    for model_id in model_order
+                    if sum(pending_by_variant[pos] for pos in variants_by_model[model_id])
+                ]
+                for model_idx, model_id in enumerate(model_order, start=1):
+                    model_task_count = sum(
+                        pending_by_variant[pos] for pos in variants_by_model[model_id]
                     )
-                    error_suffix = f" error={record.get('error')}" if status == "error" else ""
                     print(
-                        f"[collect {completed}/{total}] {status} "
-                        f"model={record['model']} question={record['question_id']} run={record['run_index']}"
-                        f"{error_suffix}",
+                        f"\n==> Ollama model {model_idx}/{len(model_order)}: "
+                        f"{model_id} ({model_task_count} tasks)",
                         flush=True,
                     )
-
-                    try:
-                        submit_collect_task(next(task_iter))
-                    except StopIteration:
-                        pass
-
-    if tasks_to_run:
-        if ollama_mode:
-            # Group tasks by model_id, preserving order of first appearance.
-            model_order: list[str] = []
-            tasks_by_model: dict[str, list[dict[str, Any]]] = {}
-            for task in tasks_to_run:
-                mid = task.get("model_id", task["model"])
-                if mid not in tasks_by_model:
-                    model_order.append(mid)
-                    tasks_by_model[mid] = []
-                tasks_by_model[mid].append(task)
-            for model_idx, model_id in enumerate(model_order, start=1):
-                model_tasks = tasks_by_model[model_id]
-                print(
-                    f"\n==> Ollama model {model_idx}/{len(model_order)}: "
-                    f"{model_id} ({len(model_tasks)} tasks)",
-                    flush=True,
-                )
-                _run_task_batch(model_tasks)
-                if not args.dry_run:
-                    assert client is not None
-                    ollama_unload_model(client.base_url, model_id)
-        else:
-            _run_task_batch(tasks_to_run)
-
-    validate_collect_integrity(tasks, records)
-
-    records.sort(
-        key=lambda row: (
-            str(row.get("model", "")),
-            str(row.get("response_reasoning_effort", "")),
-            int(row.get("run_index", 0) or 0),
-            str(row.get("question_id", "")),
+                    _run_task_batch(
+                        _task_groups(variant_positions=variants_by_model[model_id])
+                    )
+                    if not args.dry_run:
+                        assert client is not None
+                        ollama_unload_model(client.base_url, model_id)
+            else:
+                _run_task_batch(_task_groups())
+    except RunInterrupted as exc:
+        writer.append(
+            collect_events_path,
+            {
+                "timestamp_utc": utc_now_iso(),
+                "phase": "collect",
+                "event": "interrupted",
+                "run_id": run_id,
+                "signal": RUN_INTERRUPT.signal_name,
+                "completed_rows": completed,
+                "remaining_rows": total - completed,
+                "outstanding_sample_ids": exc.outstanding_sample_ids,
+            },
         )
-    )
-    write_jsonl(final_responses_path, records)
+        raise
+    finally:
+        RUN_INTERRUPT.disarm()
+        # Drain queued checkpoint/event rows even when the run is aborted.
+        writer.close()
+        raw_store.close()
+
+    # The partial file holds every row (checkpoint, reused and new), so the
+    # final artifacts are streamed from it in sorted order rather than built
+    # from rows kept in memory.
+    output_sample_ids: list[str] = []
+    error_count = 0
+    tmp_responses_path = final_responses_path.with_name(final_responses_path.name + ".tmp")
+    tmp_review_path = run_dir / "responses_review.csv.tmp"
+    with open_jsonl(
+        tmp_responses_path, "wb", compression=output_compression
+    ) as responses_handle, tmp_review_path.open(
+        "w", encoding="utf-8", newline=""
+    ) as review_handle:
+        review_writer = csv.DictWriter(review_handle, fieldnames=COLLECT_REVIEW_FIELDNAMES)
+        review_writer.writeheader()
+        for row, line in iter_sorted_jsonl(
+            partial_responses_path,
+            sort_key=collect_row_sort_key,
+            max_memory_mb=getattr(args, "max_memory_mb", 256.0),
+        ):
+            responses_handle.write(line)
+            review_writer.writerow(collect_review_csv_row(row))
+            output_sample_ids.append(str(row.get("sample_id", "")).strip())
+            if row.get("error"):
+                error_count += 1
+    try:
+        validate_collect_integrity(tasks, output_sample_ids)
+    except RuntimeError:
+        tmp_responses_path.unlink()
+        tmp_review_path.unlink()
+        raise
+    os.replace(tmp_responses_path, final_responses_path)
+    remove_stale_jsonl_variants(final_responses_path)
 
     elapsed = round(time.perf_counter() - started, 3)
     collection_stats = {
         "elapsed_seconds": elapsed,
-        "total_records": len(records),
-        "error_count": sum(1 for row in records if row.get("error")),
-        "success_count": sum(1 for row in records if not row.get("error")),
+        "total_records": len(output_sample_ids),
+        "error_count": error_count,
+        "success_count": len(output_sample_ids) - error_count,
         "resumed": bool(args.resume),
-        "checkpoint_rows_at_start": len(checkpoint_records),
-        "new_rows_processed": len(tasks_to_run),
+        "checkpoint_rows_at_start": len(checkpoint_ids),
+        "retried_rows": len(retry_selection),
+        "reused_rows": len(reused_records),
+        "new_rows_processed": pending_count,
     }
+    if n_sampling:
+        collection_stats["n_sampling_fallback_models"] = sorted(n_sampling_fallback_models)
     write_json(run_dir / "collection_stats.json", collection_stats)
-    write_collect_review_csv(run_dir / "responses_review.csv", records)
+    os.replace(tmp_review_path, run_dir / "responses_review.csv")
+    store_jsonl_artifact(
+        str(getattr(args, "store_db", "") or ""),
+        "responses",
+        final_responses_path,
+        rows_path=final_responses_path,
+        meta=collection_meta,
+    )
 
     print("", flush=True)
     print(f"Collection complete in {elapsed}s", flush=True)
     print(f"Artifacts: {run_dir}", flush=True)
     print(f"- {run_dir / 'collection_meta.json'}", flush=True)
     print(f"- {run_dir / 'questions_snapshot.json'}", flush=True)
-    print(f"- {run_dir / 'responses.jsonl'}", flush=True)
+    print(f"- {final_responses_path}", flush=True)
     print(f"- {partial_responses_path}", flush=True)
     print(f"- {run_dir / 'collection_stats.json'}", flush=True)
     print(f"- {run_dir / 'responses_review.csv'}", flush=True)
@@ -2084,66 +5417,132 @@ def run_collect(args: argparse.Namespace) -> int:
     return 0
 
 
-def find_first_json_object(text: str) -> str | None:
-    in_string = False
-    escaped = False
+_JSON_SCAN_TOKEN_RE = re.compile(r'[{}"]')
+# Rest of a JSON-style string after its opening quote, through the closing quote.
+_JSON_STRING_TAIL_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_JUDGE_FENCE_LANG_RE = re.compile(r"json", flags=re.IGNORECASE)
+_JUDGE_JSON_DECODER = json.JSONDecoder()
+
+
+def _scan_json_object(text: str, *, start_only: bool) -> tuple[int, int]:
+    """Find the first balanced `{...}` outside double-quoted strings.
+
+    Jumps between braces and quotes with regexes rather than stepping
+    through every character. Returns (start, end) offsets; end is -1 when
+    `start_only` is set or the object never closes, start is -1 when no
+    object opens.
+    """
     depth = 0
     start = -1
-    for index, ch in enumerate(text):
-        if in_string:
-            if escaped:
-                escaped = False
-                continue
-            if ch == "\\":
-                escaped = True
-                continue
-            if ch == '"':
-                in_string = False
-            continue
-
+    index = 0
+    search = _JSON_SCAN_TOKEN_RE.search
+    string_tail = _JSON_STRING_TAIL_RE.match
+    while True:
+        match = search(text, index)
+        if match is None:
+            return start, -1
+        index = match.end()
+        ch = match.group()
         if ch == '"':
-            in_string = True
+            tail = string_tail(text, index)
+            if tail is None:
+                return start, -1
+            index = tail.end()
             continue
-
         if ch == "{":
             if depth == 0:
-                start = index
+                start = index - 1
+                if start_only:
+                    return start, -1
             depth += 1
             continue
+        if depth == 0:
+            continue
+        depth -= 1
+        if depth == 0:
+            return start, index
 
-        if ch == "}":
-            if depth == 0:
-                continue
-            depth -= 1
-            if depth == 0 and start >= 0:
-                return text[start : index + 1]
-    return None
 
+def find_first_json_object(text: str) -> str | None:
+    start, end = _scan_json_object(text, start_only=False)
+    if end < 0:
+        return None
+    return text[start:end]
 
-def parse_judge_output(text: str) -> tuple[int, str, str]:
-    stripped = text.strip()
-    if not stripped:
-        raise ValueError(
-            "Judge output parse error. Expected strict JSON object with "
-            "`score` and `justification`, got empty output."
-        )
 
-    candidates: list[tuple[str, str]] = [("direct", stripped)]
-    fence_match = re.search(r"```(?:json)?\s*(.*?)\s*```", stripped, flags=re.IGNORECASE | re.DOTALL)
-    if fence_match:
-        fenced = fence_match.group(1).strip()
-        if fenced:
-            candidates.append(("markdown_fence", fenced))
+def _judge_fence_body(text: str) -> str | None:
+    """Stripped body of the first ```/```json fence, or None without one."""
+    open_at = text.find("```")
+    if open_at < 0:
+        return None
+    body_at = open_at + 3
+    lang = _JUDGE_FENCE_LANG_RE.match(text, body_at)
+    if lang is not None:
+        body_at = lang.end()
+    close_at = text.find("```", body_at)
+    if close_at < 0:
+        return None
+    return text[body_at:close_at].strip()
+
+
+def _judge_output_candidates(stripped: str) -> Iterator[tuple[str, str]]:
+    yield "direct", stripped
+    fenced = _judge_fence_body(stripped)
+    if fenced:
+        yield "markdown_fence", fenced
     first_object = find_first_json_object(stripped)
     if first_object:
-        candidates.append(("first_object", first_object))
+        yield "first_object", first_object
+
+
+def _parse_judge_output_fast(stripped: str) -> tuple[dict[str, Any], str] | None:
+    """Decode the judge's JSON object in place for the common output shapes.
+
+    Only returns what the candidate chain would: a whole-text object is
+    `direct`, otherwise the object inside the first markdown fence, or the
+    first balanced object when there is no fence. Returns None whenever the
+    chain has to decide (quoted/double-encoded output, anything that fails
+    to decode, a fence that holds more than one object).
+    """
+    decode = _JUDGE_JSON_DECODER.raw_decode
+    first = stripped[0]
+    if first == '"':
+        return None
+    if first == "{":
+        try:
+            loaded, end = decode(stripped)
+        except json.JSONDecodeError:
+            loaded, end = None, 0
+        if end == len(stripped) and isinstance(loaded, dict):
+            return loaded, "direct"
+    if "```" in stripped:
+        fenced = _judge_fence_body(stripped)
+        if fenced is None or not fenced.startswith("{"):
+            return None
+        try:
+            loaded, end = decode(fenced)
+        except json.JSONDecodeError:
+            return None
+        if end == len(fenced) and isinstance(loaded, dict):
+            return loaded, "markdown_fence"
+        return None
+    start, _ = _scan_json_object(stripped, start_only=True)
+    if start < 0:
+        return None
+    try:
+        loaded, _ = decode(stripped, start)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(loaded, dict):
+        return loaded, "first_object"
+    return None
+
 
+def _parse_judge_output_chain(stripped: str) -> tuple[dict[str, Any], str]:
     seen_candidates: set[str] = set()
     parse_failures: list[str] = []
-    parsed: dict[str, Any] | None = None
-    parse_mode = "direct"
 
-    for mode, candidate in candidates:
+    for mode, candidate in _judge_output_candidates(stripped):
         if candidate in seen_candidates:
             continue
         seen_candidates.add(candidate)
@@ -2163,17 +5562,29 @@ def parse_judge_output(text: str) -> tuple[int, str, str]:
         if not isinstance(loaded, dict):
             parse_failures.append(f"{mode}:not_object")
             continue
-        parsed = loaded
-        parse_mode = mode
-        break
+        return loaded, mode
 
-    if parsed is None:
-        suffix = f" Candidates failed: {', '.join(parse_failures)}." if parse_failures else ""
+    suffix = f" Candidates failed: {', '.join(parse_failures)}." if parse_failures else ""
+    raise ValueError(
+        "Judge output parse error. Expected strict JSON object with "
+        f"`score` and `justification`.{suffix}"
+    )
+
+
+def parse_judge_output(text: str, *, fast_path: bool = True) -> tuple[int, str, str]:
+    stripped = text.strip()
+    if not stripped:
         raise ValueError(
             "Judge output parse error. Expected strict JSON object with "
-            f"`score` and `justification`.{suffix}"
+            "`score` and `justification`, got empty output."
         )
 
+    fast = _parse_judge_output_fast(stripped) if fast_path else None
+    if fast is None:
+        parsed, parse_mode = _parse_judge_output_chain(stripped)
+    else:
+        parsed, parse_mode = fast
+
     score = parsed.get("score")
     if not isinstance(score, int) or score not in (0, 1, 2, 3):
         raise ValueError("Judge JSON `score` must be integer in {0,1,2,3}.")
@@ -2194,27 +5605,715 @@ def pick_judge_response_format(judge_model: str, *, allow_score_3: bool = True)
     return JUDGE_RESPONSE_FORMAT
 
 
-def grade_one(
-    response_row: dict[str, Any],
+LOCAL_JUDGE_FORMAT = "local-judge/1"
+_LOCAL_JUDGE_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def allowed_judge_scores(is_control: bool, *, judge_no_hint: bool) -> set[int]:
+    if is_control:
+        return {0, 1, 2, 3} if judge_no_hint else {0, 3}
+    return {0, 1, 2}
+
+
+def local_judge_features(
+    row: Mapping[str, Any], *, num_features: int, max_words: int
+) -> tuple[list[int], list[float]]:
+    """Hashed, L2-normalised bag of response unigrams and bigrams.
+
+    Also hashes the technique, the control flag and a log2 length bucket.
+    `num_features` must be a power of two. Words are crc32-hashed once (stable
+    across processes) and bigram buckets mix the two word hashes.
+    """
+    words = _LOCAL_JUDGE_TOKEN_RE.findall(str(row.get("response_text", "")).lower())[:max_words]
+    is_control = bool(row.get("is_control", False) or row.get("technique") == "control_legitimate")
+    mask = num_features - 1
+    counts: dict[int, float] = {}
+    for token in (
+        f"t:{row.get('technique', '')}",
+        f"c:{int(is_control)}",
+        f"n:{int(math.log2(len(words) + 1))}",
+    ):
+        index = zlib.crc32(token.encode("utf-8")) & mask
+        counts[index] = counts.get(index, 0.0) + 1.0
+    word_hashes: dict[str, int] = {}
+    previous = 0x9E3779B1
+    for word in words:
+        word_hash = word_hashes.get(word)
+        if word_hash is None:
+            word_hash = word_hashes[word] = zlib.crc32(word.encode("utf-8"))
+        index = word_hash & mask
+        counts[index] = counts.get(index, 0.0) + 1.0
+        index = ((previous * 0x01000193) ^ word_hash) & mask
+        counts[index] = counts.get(index, 0.0) + 1.0
+        previous = word_hash
+    norm = math.sqrt(sum(value * value for value in counts.values()))
+    return list(counts), [value / norm for value in counts.values()]
+
+
+class LocalJudge:
+    """Offline multinomial logistic regression over hashed response n-grams.
+
+    Scoring is pure Python over an `array.array` of float32 weights stored
+    feature-major, so a prediction costs one pass over the row's tokens.
+    """
+
+    def __init__(self, model: Mapping[str, Any], *, path: str = "") -> None:
+        if model.get("format") != LOCAL_JUDGE_FORMAT:
+            raise ValueError(f"Not a {LOCAL_JUDGE_FORMAT} model: {path or '<memory>'}")
+        self.path = path
+        self.classes: list[int] = [int(value) for value in model["classes"]]
+        self.num_features = int(model["num_features"])
+        self.max_words = int(model["max_words"])
+        self.temperature = float(model["temperature"])
+        self.bias: list[float] = [float(value) for value in model["bias"]]
+        self.weights = array.array("f")
+        self.weights.frombytes(base64.b64decode(model["weights"]))
+        if sys.byteorder != "little":
+            self.weights.byteswap()
+        if len(self.weights) != self.num_features * len(self.classes):
+            raise ValueError(f"Local judge weights have the wrong size: {path or '<memory>'}")
+        self._weight_matrix = (
+            _np.frombuffer(self.weights, dtype=_np.float32).reshape(self.num_features, -1)
+            if _np is not None
+            else None
+        )
+        self.training: dict[str, Any] = dict(model.get("training", {}))
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> LocalJudge:
+        with path.open("r", encoding="utf-8") as handle:
+            return cls(json.load(handle), path=str(path.resolve()))
+
+    def probabilities(
+        self, row: Mapping[str, Any], *, allowed_scores: set[int] | None = None
+    ) -> dict[int, float]:
+        indices, values = local_judge_features(
+            row, num_features=self.num_features, max_words=self.max_words
+        )
+        width = len(self.classes)
+        if self._weight_matrix is not None:
+            logits = (
+                _np.asarray(values) @ self._weight_matrix[_np.asarray(indices)] + self.bias
+            ).tolist()
+        else:
+            logits = list(self.bias)
+            weights = self.weights
+            for index, value in zip(indices, values):
+                offset = index * width
+                for position in range(width):
+                    logits[position] += value * weights[offset + position]
+        scored = [
+            (score, logit / self.temperature)
+            for score, logit in zip(self.classes, logits)
+            if allowed_scores is None or score in allowed_scores
+        ]
+        if not scored:
+            return {}
+        peak = max(logit for _, logit in scored)
+        exps = [(score, math.exp(logit - peak)) for score, logit in scored]
+        total = sum(value for _, value in exps)
+        return {score: value / total for score, value in exps}
+
+    def predict(
+        self, row: Mapping[str, Any], *, judge_no_hint: bool = False
+    ) -> tuple[int | None, dict[int, float]]:
+        is_control = bool(
+            row.get("is_control", False) or row.get("technique") == "control_legitimate"
+        )
+        probabilities = self.probabilities(
+            row, allowed_scores=allowed_judge_scores(is_control, judge_no_hint=judge_no_hint)
+        )
+        if not probabilities:
+            return None, {}
+        return max(probabilities, key=probabilities.__getitem__), probabilities
+
+
+def annotate_local_prediction(
+    grade_row: dict[str, Any], prediction: tuple[int | None, Mapping[int, float]]
+) -> None:
+    score, probabilities = prediction
+    grade_row["local_judge_score"] = score
+    grade_row["local_judge_probabilities"] = {
+        str(key): round(value, 4) for key, value in probabilities.items()
+    }
+
+
+class LocalPrejudgeCheck:
+    """Agreement between the local pre-judge and the API judge on graded rows.
+
+    Rows whose judge score the local model gave less than
+    `outlier_probability` are listed as outliers worth a second look.
+    """
+
+    outlier_probability = 0.05
+    max_listed_outliers = 50
+
+    def __init__(self) -> None:
+        self.accepted_rows = 0
+        self.compared_rows = 0
+        self.agreed_rows = 0
+        self.outlier_count = 0
+        self.outlier_sample_ids: list[str] = []
+
+    def observe(self, row: Mapping[str, Any]) -> None:
+        if row.get("judge_parse_mode") == "local_prejudge":
+            self.accepted_rows += 1
+            return
+        score = row.get("judge_score")
+        probabilities = row.get("local_judge_probabilities")
+        if row.get("error") or not isinstance(score, int) or not isinstance(probabilities, Mapping):
+            return
+        self.compared_rows += 1
+        self.agreed_rows += row.get("local_judge_score") == score
+        if float(probabilities.get(str(score), 0.0)) < self.outlier_probability:
+            self.outlier_count += 1
+            if len(self.outlier_sample_ids) < self.max_listed_outliers:
+                self.outlier_sample_ids.append(str(row.get("sample_id", "")))
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "accepted_rows": self.accepted_rows,
+            "compared_rows": self.compared_rows,
+            "agreement": round(self.agreed_rows / self.compared_rows, 4)
+            if self.compared_rows
+            else None,
+            "outlier_probability": self.outlier_probability,
+            "outlier_count": self.outlier_count,
+            "outlier_sample_ids": self.outlier_sample_ids,
+        }
+
+
+def local_prejudge_grade_row(
+    response_row: Mapping[str, Any],
     *,
-    client: OpenRouterClient | None,
     judge_model: str,
+    local_judge: LocalJudge,
+    score: int,
+    probabilities: Mapping[int, float],
+) -> dict[str, Any]:
+    """Grade row for a response the local judge accepted without an API call."""
+    now = utc_now_iso()
+    grade_row = blank_grade_row(response_row, judge_model=judge_model, started_at=now)
+    grade_row["judge_score"] = score
+    grade_row["judge_justification"] = (
+        f"Local pre-judge ({pathlib.Path(local_judge.path).name or 'model'}): "
+        f"p={probabilities[score]:.4f}."
+    )
+    grade_row["judge_parse_mode"] = "local_prejudge"
+    grade_row["judge_response_id"] = "local-prejudge"
+    grade_row["judge_latency_ms"] = 0
+    grade_row["judge_finished_at_utc"] = now
+    return grade_row
+
+
+def _local_judge_metrics(probabilities: Any, labels: Any) -> dict[str, Any]:
+    picked = probabilities[_np.arange(len(labels)), labels]
+    confidence = probabilities.max(axis=1)
+    correct = probabilities.argmax(axis=1) == labels
+    bins = _np.minimum((confidence * 10).astype(int), 9)
+    calibration_error = sum(
+        abs(correct[bins == b].mean() - confidence[bins == b].mean()) * (bins == b).mean()
+        for b in range(10)
+        if (bins == b).any()
+    )
+    return {
+        "rows": int(len(labels)),
+        "accuracy": round(float(correct.mean()), 4),
+        "log_loss": round(float(-_np.log(_np.clip(picked, 1e-12, None)).mean()), 4),
+        "expected_calibration_error": round(float(calibration_error), 4),
+    }
+
+
+def train_local_judge(
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    num_features: int = 65536,
+    max_words: int = 512,
+    epochs: int = 300,
+    learning_rate: float = 0.1,
+    l2: float = 1e-4,
+    validation_fraction: float = 0.2,
+) -> dict[str, Any]:
+    """Fit a LocalJudge on consensus-labelled rows and return the model dict.
+
+    Full-batch Adam on the multinomial log loss. Questions hashed into the
+    validation share are held out (so repeated responses to one question do
+    not leak). A softmax temperature >= 1 is fitted on half of the held-out
+    questions and the validation metrics are measured on the other half, so
+    they are not scored on the rows that chose the temperature. Needs numpy.
+    """
+    if _np is None:
+        raise RuntimeError(
+            "train-local-judge needs numpy "
+            "(pip install numpy, or unset BENCHMARK_NUMERIC_ENGINE=python)."
+        )
+    if num_features < 2 or num_features & (num_features - 1):
+        raise ValueError("--num-features must be a power of two.")
+    indptr = [0]
+    indices: list[int] = []
+    values: list[float] = []
+    labels: list[int] = []
+    question_positions: list[float] = []
+    for row in rows:
+        score = row.get("consensus_score")
+        if not isinstance(score, int) or not str(row.get("response_text", "")).strip():
+            continue
+        row_indices, row_values = local_judge_features(
+            row, num_features=num_features, max_words=max_words
+        )
+        indices.extend(row_indices)
+        values.extend(row_values)
+        indptr.append(len(indices))
+        labels.append(score)
+        question_hash = hashlib.sha256(str(row.get("question_id", "")).encode("utf-8")).digest()
+        question_positions.append(int.from_bytes(question_hash[:8], "big") / 2**64)
+    if not labels:
+        raise ValueError("No rows with consensus_score and response_text to train on.")
+    classes = sorted(set(labels))
+    class_position = {score: position for position, score in enumerate(classes)}
+    width = len(classes)
+
+    feature_index = _np.asarray(indices, dtype=_np.int64)
+    feature_value = _np.asarray(values, dtype=_np.float64)
+    row_of_value = _np.repeat(_np.arange(len(labels)), _np.diff(_np.asarray(indptr)))
+    label_codes = _np.asarray([class_position[score] for score in labels], dtype=_np.int64)
+    question_position = _np.asarray(question_positions)
+    validation_mask = question_position < validation_fraction
+    if validation_mask.all():
+        validation_mask[:] = False
+    # Temperature is fitted on one half of the held-out questions and the
+    # reported metrics come from the other; with too few questions to split
+    # both use the whole held-out share and the metrics are marked in-sample.
+    temperature_mask = validation_mask & (question_position < validation_fraction / 2)
+    report_mask = validation_mask & ~temperature_mask
+    if not temperature_mask.any() or not report_mask.any():
+        temperature_mask = report_mask = validation_mask
+
+    def logits_for(weights: Any, bias: Any) -> Any:
+        contributions = weights[feature_index] * feature_value[:, None]
+        out = _np.zeros((len(labels), width))
+        for position in range(width):
+            out[:, position] = _np.bincount(
+                row_of_value, weights=contributions[:, position], minlength=len(labels)
+            )
+        return out + bias
+
+    def softmax(logits: Any) -> Any:
+        shifted = _np.exp(logits - logits.max(axis=1, keepdims=True))
+        return shifted / shifted.sum(axis=1, keepdims=True)
+
+    train_mask = ~validation_mask
+    train_rows = float(train_mask.sum())
+    targets = _np.eye(width)[label_codes]
+    weights = _np.zeros((num_features, width))
+    bias = _np.zeros(width)
+    moments = [_np.zeros_like(weights), _np.zeros_like(weights), _np.zeros(width), _np.zeros(width)]
+    beta1, beta2 = 0.9, 0.999
+    for step in range(1, epochs + 1):
+        residual = (softmax(logits_for(weights, bias)) - targets) * train_mask[:, None] / train_rows
+        grad_weights = _np.zeros_like(weights)
+        for position in range(width):
+            grad_weights[:, position] = _np.bincount(
+                feature_index,
+                weights=feature_value * residual[row_of_value, position],
+                minlength=num_features,
+            )
+        grad_weights += l2 * weights
+        grad_bias = residual.sum(axis=0)
+        for param, grad, first, second in (
+            (weights, grad_weights, moments[0], moments[1]),
+            (bias, grad_bias, moments[2], moments[3]),
+        ):
+            first *= beta1
+            first += (1 - beta1) * grad
+            second *= beta2
+            second += (1 - beta2) * grad * grad
+            param -= (
+                learning_rate
+                * (first / (1 - beta1**step))
+                / (_np.sqrt(second / (1 - beta2**step)) + 1e-8)
+            )
+
+    logits = logits_for(weights, bias)
+    temperature = 1.0
+    validation: dict[str, Any] | None = None
+    if validation_mask.any():
+        fit_logits = logits[temperature_mask]
+        fit_labels = label_codes[temperature_mask]
+        val_logits = logits[report_mask]
+        val_labels = label_codes[report_mask]
+
+        def nll(log_temperature: float) -> float:
+            probs = softmax(fit_logits / math.exp(log_temperature))
+            picked = probs[_np.arange(len(fit_labels)), fit_labels]
+            return float(-_np.log(_np.clip(picked, 1e-12, None)).mean())
+
+        # Golden-section search for the temperature on a log scale. It only
+        # softens (T >= 1): sharpening a few held-out rows is overfitting.
+        low, high = 0.0, math.log(20.0)
+        ratio = (math.sqrt(5) - 1) / 2
+        for _ in range(60):
+            left = high - ratio * (high - low)
+            right = low + ratio * (high - low)
+            if nll(left) <= nll(right):
+                high = right
+            else:
+                low = left
+        temperature = math.exp((low + high) / 2)
+        validation = {
+            "temperature_rows": int(temperature_mask.sum()),
+            "in_sample": bool((temperature_mask == report_mask).all()),
+            "uncalibrated": _local_judge_metrics(softmax(val_logits), val_labels),
+            "calibrated": _local_judge_metrics(softmax(val_logits / temperature), val_labels),
+        }
+
+    packed = array.array("f", weights.astype(_np.float32).ravel().tolist())
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return {
+        "format": LOCAL_JUDGE_FORMAT,
+        "classes": classes,
+        "num_features": num_features,
+        "max_words": max_words,
+        "temperature": round(temperature, 6),
+        "bias": [float(value) for value in bias],
+        "training": {
+            "rows": len(labels),
+            "train_rows": int(train_rows),
+            "validation_rows": int(validation_mask.sum()),
+            "class_counts": {str(score): labels.count(score) for score in classes},
+            "epochs": epochs,
+            "learning_rate": learning_rate,
+            "l2": l2,
+            "train": _local_judge_metrics(
+                softmax(logits[train_mask] / temperature), label_codes[train_mask]
+            ),
+            "validation": validation,
+        },
+        "weights": base64.b64encode(packed.tobytes()).decode("ascii"),
+    }
+
+
+def judge_params_hash(
+    *,
     judge_system_prompt: str,
     judge_user_template: str,
     judge_user_template_control: str,
-    judge_no_hint: bool,
     judge_temperature: float | None,
     judge_reasoning_effort: str,
     judge_max_tokens: int,
-    store_judge_response_raw: bool,
-    retries: int,
-    pause_seconds: float,
+    judge_no_hint: bool,
     dry_run: bool,
+    judge_endpoint: str = "",
+    batch_endpoint: str = "",
+) -> str:
+    params: dict[str, Any] = {
+        "judge_system_prompt": judge_system_prompt,
+        "judge_user_template": judge_user_template,
+        "judge_user_template_control": judge_user_template_control,
+        "judge_temperature": judge_temperature,
+        "judge_reasoning_effort": judge_reasoning_effort,
+        "judge_max_tokens": judge_max_tokens,
+        "judge_no_hint": judge_no_hint,
+        "dry_run": dry_run,
+    }
+    # Only non-OpenRouter and batch endpoints enter the hash, so grades from
+    # existing OpenRouter runs stay reusable while mock/self-hosted/batch
+    # grades are never taken for them.
+    if judge_endpoint:
+        params["judge_endpoint"] = judge_endpoint
+    if batch_endpoint:
+        params["batch_endpoint"] = batch_endpoint
+    return stable_params_hash(params)
+
+
+def grade_reuse_key(
+    row: dict[str, Any],
+    *,
+    judge_model: str,
+    params_hash: str,
+) -> tuple[str, str, str]:
+    content = json.dumps(
+        [
+            row.get("question"),
+            row.get("nonsensical_element"),
+            row.get("response_text", ""),
+            bool(row.get("is_control", False) or row.get("technique") == "control_legitimate"),
+        ],
+        ensure_ascii=False,
+    )
+    return (judge_model, params_hash, stable_short_hash(content, length=16))
+
+
+def _legacy_judge_params_hash(grades_path: pathlib.Path) -> str | None:
+    meta_path = grades_path.parent / "grade_meta.json"
+    if not meta_path.exists():
+        return None
+    with meta_path.open("r", encoding="utf-8") as handle:
+        meta = json.load(handle)
+    if not isinstance(meta, dict) or meta.get("synthetic_tiebreaker_full"):
+        return None
+    judge_no_hint = bool(meta.get("judge_no_hint", False))
+    template_file = meta.get("judge_user_template_file")
+    if template_file:
+        template_path = pathlib.Path(str(template_file))
+        if not template_path.exists():
+            return None
+        judge_template = template_path.read_text(encoding="utf-8")
+    elif judge_no_hint:
+        judge_template = DEFAULT_JUDGE_USER_TEMPLATE_NO_HINT
+    else:
+        judge_template = DEFAULT_JUDGE_USER_TEMPLATE
+    judge_endpoint = str(meta.get("judge_endpoint") or "")
+    if "openrouter.ai" in judge_endpoint:
+        judge_endpoint = ""
+    return judge_params_hash(
+        judge_system_prompt=str(meta.get("judge_system_prompt", "")),
+        judge_user_template=judge_template,
+        judge_user_template_control="" if judge_no_hint else DEFAULT_JUDGE_USER_TEMPLATE_CONTROL_HINT,
+        judge_temperature=meta.get("judge_temperature"),
+        judge_reasoning_effort=str(meta.get("judge_reasoning_effort", "off")),
+        judge_max_tokens=int(meta.get("judge_max_tokens", 0) or 0),
+        judge_no_hint=judge_no_hint,
+        dry_run=bool(meta.get("dry_run", False)),
+        judge_endpoint=judge_endpoint,
+        batch_endpoint=str(meta.get("batch_endpoint") or "") if meta.get("batch_api") else "",
+    )
+
+
+def _aggregate_source_text_index(aggregate_path: pathlib.Path) -> dict[str, dict[str, Any]]:
+    # Normalized aggregates: the source responses sit beside a published copy
+    # or are named in the aggregate_meta.json of a run dir.
+    responses_file = resolve_jsonl_path(aggregate_path.parent / "responses.jsonl")
+    meta_path = aggregate_path.parent / "aggregate_meta.json"
+    if not responses_file.is_file() and meta_path.exists():
+        with meta_path.open("r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+        if isinstance(meta, dict):
+            responses_file = pathlib.Path(str(meta.get("responses_file", "")).strip())
+    if not responses_file.is_file():
+        return {}
+    return load_response_text_index(responses_file)
+
+
+def aggregate_reuse_grade_rows(row: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+    """Per-judge grade rows recoverable from one aggregate row.
+
+    Only judge cells carrying `judge_N_params_hash` qualify: cascade copies,
+    local pre-judge predictions, synthetic tiebreak rows and aggregates written before the hash was
+    carried over have none.
+    """
+    if row.get("row_identity_mismatch"):
+        return
+    base = {field: row.get(field) for field in _ROW_IDENTITY_FIELDS if field in row}
+    for field in ("response_sha256", *RESPONSE_TEXT_FIELDS):
+        if field in row:
+            base[field] = row[field]
+    idx = 1
+    while f"judge_{idx}_model" in row:
+        params_hash = row.get(f"judge_{idx}_params_hash")
+        score = row.get(f"judge_{idx}_score")
+        if params_hash and not row.get(f"judge_{idx}_error") and isinstance(score, int):
+            yield {
+                **base,
+                "judge_model": row[f"judge_{idx}_model"],
+                "judge_score": score,
+                "judge_justification": row.get(f"judge_{idx}_justification", ""),
+                "judge_params_hash": params_hash,
+                "error": "",
+                "status": "ok",
+            }
+        idx += 1
+
+
+def load_grade_reuse_index(
+    path_text: str,
+) -> dict[tuple[str, str, str], tuple[dict[str, Any], str]]:
+    """Reusable grades from grade dirs, or from aggregates (e.g. data/latest).
+
+    Aggregates are read first so a real grades.jsonl row wins over the same
+    grade recovered from an aggregate's judge columns.
+    """
+    index: dict[tuple[str, str, str], tuple[dict[str, Any], str]] = {}
+    paths = list(
+        dict.fromkeys(
+            resolve_reuse_files(path_text, "aggregate.jsonl")
+            + resolve_reuse_files(path_text, "grades.jsonl")
+        )
+    )
+    for path in paths:
+        legacy_hash: str | None = None
+        source_text: dict[str, dict[str, Any]] | None = None
+        for source_row in read_jsonl(path):
+            is_aggregate = "judge_1_model" in source_row
+            if "response_text" not in source_row:
+                if source_text is None:
+                    source_text = (
+                        _aggregate_source_text_index(path)
+                        if is_aggregate
+                        else _grades_source_text_index(path)
+                    )
+                source_row = join_response_text(source_row, source_text)
+            if is_aggregate:
+                candidates: Iterable[dict[str, Any]] = aggregate_reuse_grade_rows(source_row)
+            else:
+                if legacy_hash is None:
+                    legacy_hash = _legacy_judge_params_hash(path) or ""
+                candidates = (source_row,)
+            for row in candidates:
+                if (
+                    row.get("error")
+                    or row.get("synthetic_tiebreaker_row")
+                    or row.get("judge_cascade_model")
+                    or row.get("judge_parse_mode") == "local_prejudge"
+                ):
+                    continue
+                if not isinstance(row.get("judge_score"), int):
+                    continue
+                params_hash = row.get("judge_params_hash") or legacy_hash
+                if not params_hash:
+                    continue
+                key = grade_reuse_key(
+                    row,
+                    judge_model=str(row.get("judge_model", "")),
+                    params_hash=str(params_hash),
+                )
+                index[key] = (row, str(path.resolve()))
+    _warn_empty_reuse_index(path_text, "grades.jsonl or aggregate.jsonl", files=paths, index=index)
+    return index
+
+
+def build_reused_grade_row(
+    prior: dict[str, Any],
+    response_row: dict[str, Any],
+    *,
+    source_file: str,
 ) -> dict[str, Any]:
-    started_at = utc_now_iso()
-    t0 = time.perf_counter()
+    grade_row = dict(prior)
+    for field in SAMPLING_FIELDS:
+        grade_row.pop(field, None)
+    grade_row.update(
+        {
+            "sample_id": response_row.get("sample_id"),
+            "run_index": response_row.get("run_index"),
+            "model": response_row.get("model"),
+            "model_id": response_row.get("model_id", response_row.get("model")),
+            "model_org": response_row.get("model_org", "unknown"),
+            "model_name": response_row.get(
+                "model_name", response_row.get("model_id", response_row.get("model"))
+            ),
+            "model_reasoning_level": response_row.get("model_reasoning_level", "default"),
+            "model_row": response_row.get("model_row", response_row.get("model")),
+            "response_reasoning_effort": response_row.get("response_reasoning_effort"),
+            "question_id": response_row.get("question_id"),
+            "technique": response_row.get("technique"),
+            "domain": response_row.get("domain"),
+            **sampling_fields(response_row),
+            "source_response_error": response_row.get("error", ""),
+            "reused_from_sample_id": prior.get("sample_id"),
+            "reused_from_file": source_file,
+            "reused_at_utc": utc_now_iso(),
+        }
+    )
+    if "response_text" not in prior:
+        # Normalized prior rows carry no text; fill it from the current source.
+        for field in RESPONSE_TEXT_FIELDS:
+            grade_row[field] = response_row.get(field, "" if field == "response_text" else None)
+    grade_row["response_sha256"] = response_text_sha256(response_row.get("response_text", ""))
+    return grade_row
+
+
+def response_text_sha256(text: Any) -> str:
+    return hashlib.sha256(str(text or "").encode("utf-8")).hexdigest()
+
+
+def row_response_sha256(row: Mapping[str, Any]) -> str | None:
+    value = row.get("response_sha256")
+    if isinstance(value, str) and value:
+        return value
+    if "response_text" in row:
+        return response_text_sha256(row.get("response_text", ""))
+    return None
+
+
+def normalize_artifact_row(row: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in row.items() if key not in RESPONSE_TEXT_FIELDS}
+
+
+def join_response_text(
+    row: dict[str, Any],
+    responses_by_sample: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Return `row` with question/response text filled in from its source response."""
+    if all(field in row for field in RESPONSE_TEXT_FIELDS):
+        return row
+    source = responses_by_sample.get(str(row.get("sample_id", "")).strip(), {})
+    joined = dict(row)
+    for field in RESPONSE_TEXT_FIELDS:
+        if field not in joined:
+            joined[field] = source.get(field, "" if field == "response_text" else None)
+    return joined
+
+
+def load_response_text_index(responses_file: pathlib.Path) -> dict[str, dict[str, Any]]:
+    index: dict[str, dict[str, Any]] = {}
+    for row in read_jsonl(responses_file):
+        sample_id = str(row.get("sample_id", "")).strip()
+        index[sample_id] = {field: row.get(field) for field in RESPONSE_TEXT_FIELDS}
+    return index
+
+
+def _grades_source_text_index(grades_path: pathlib.Path) -> dict[str, dict[str, Any]]:
+    meta_path = grades_path.parent / "grade_meta.json"
+    if not meta_path.exists():
+        return {}
+    with meta_path.open("r", encoding="utf-8") as handle:
+        meta = json.load(handle)
+    if not isinstance(meta, dict):
+        return {}
+    responses_file = pathlib.Path(str(meta.get("responses_file", "")).strip())
+    if not responses_file.is_file():
+        return {}
+    return load_response_text_index(responses_file)
+
+
+def score_judge_text(grade_row: dict[str, Any], *, judge_no_hint: bool) -> tuple[int, str]:
+    """Parse `judge_raw_text` and check the score is allowed for the row.
+
+    Records the parse mode (and a warning when recovery was needed) on
+    `grade_row`; raises ValueError/RuntimeError like the judge call would.
+    """
+    score, justification, parse_mode = parse_judge_output(str(grade_row["judge_raw_text"]))
+    grade_row["judge_parse_mode"] = parse_mode
+    if parse_mode != "direct":
+        grade_row["judge_warnings"].append(f"judge_output_parse_recovered_via={parse_mode}")
+    allowed_scores = allowed_judge_scores(bool(grade_row["is_control"]), judge_no_hint=judge_no_hint)
+    if score not in allowed_scores:
+        allowed_str = ",".join(str(x) for x in sorted(allowed_scores))
+        raise RuntimeError(
+            f"Invalid judge score {score} for this row; allowed scores: {allowed_str}"
+        )
+    return score, justification
+
+
+def judge_error_text(exc: Exception, grade_row: Mapping[str, Any]) -> str:
+    error_text = str(exc)
+    raw_text = str(grade_row.get("judge_raw_text", ""))
+    raw_preview = raw_text[:280].replace("\n", "\\n")
+    finish_reason = grade_row.get("judge_finish_reason")
+    if raw_text or finish_reason:
+        error_text = (
+            f"{error_text} "
+            f"(judge_finish_reason={finish_reason}, judge_raw_len={len(raw_text)}, "
+            f"judge_raw_preview={raw_preview})"
+        )
+    return error_text
 
-    grade_row: dict[str, Any] = {
+
+def blank_grade_row(
+    response_row: Mapping[str, Any], *, judge_model: str, started_at: str | None
+) -> dict[str, Any]:
+    return {
         "sample_id": response_row.get("sample_id"),
         "run_index": response_row.get("run_index"),
         "model": response_row.get("model"),
@@ -2235,7 +6334,11 @@ def grade_one(
         "domain": response_row.get("domain"),
         "question": response_row.get("question"),
         "nonsensical_element": response_row.get("nonsensical_element"),
+        **sampling_fields(response_row),
         "response_text": response_row.get("response_text", ""),
+        "response_sha256": response_text_sha256(
+            response_row.get("response_text", "")
+        ),
         "source_response_error": response_row.get("error", ""),
         "judge_model": judge_model,
         "judge_score": None,
@@ -2254,33 +6357,131 @@ def grade_one(
         "error": "",
     }
 
+
+def judge_request_messages(
+    grade_row: Mapping[str, Any],
+    *,
+    judge_system_prompt: str,
+    judge_user_template: str,
+    judge_user_template_control: str,
+) -> list[dict[str, str]]:
+    """Build the judge prompt for a grade row; raise if the row cannot be graded."""
+    if grade_row["source_response_error"]:
+        raise RuntimeError(
+            f"Cannot grade response with source error: {grade_row['source_response_error']}"
+        )
+    response_text = str(grade_row["response_text"]).strip()
+    if not response_text:
+        raise RuntimeError("Cannot grade empty response_text.")
+
+    # Pick the right template: control questions get a separate template
+    # so the judge isn't told a legitimate question is nonsensical.
+    is_control = grade_row["is_control"]
+    if is_control and judge_user_template_control:
+        active_template = judge_user_template_control
+    else:
+        active_template = judge_user_template
+
+    # Explicit replacement instead of .format() to avoid KeyError when
+    # template doesn't use all keys or text contains literal curly braces
+    judge_prompt = active_template
+    judge_prompt = judge_prompt.replace("{question}", grade_row["question"])
+    judge_prompt = judge_prompt.replace("{nonsensical_element}", grade_row["nonsensical_element"])
+    judge_prompt = judge_prompt.replace("{response}", response_text)
+    return [
+        {"role": "system", "content": judge_system_prompt},
+        {"role": "user", "content": judge_prompt},
+    ]
+
+
+def judge_extra_payload(
+    grade_row: Mapping[str, Any],
+    *,
+    judge_model: str,
+    judge_reasoning_effort: str,
+    judge_logprobs: bool,
+) -> dict[str, Any]:
+    extra_payload: dict[str, Any] = {
+        "response_format": pick_judge_response_format(
+            judge_model,
+            allow_score_3=bool(grade_row["is_control"]),
+        ),
+        "provider": {"require_parameters": True},
+    }
+    if judge_reasoning_effort != "off":
+        extra_payload["reasoning"] = {"effort": judge_reasoning_effort}
+    if judge_logprobs:
+        extra_payload["logprobs"] = True
+    return extra_payload
+
+
+def apply_judge_payload(
+    grade_row: dict[str, Any],
+    api_payload: dict[str, Any],
+    *,
+    judge_no_hint: bool,
+    judge_logprobs: bool,
+    store_judge_response_raw: bool,
+) -> None:
+    """Fill `grade_row` from a judge completion and score it; raise on bad output."""
+    if store_judge_response_raw:
+        grade_row["judge_response_raw"] = api_payload
+    grade_row["judge_response_id"] = str(api_payload.get("id", ""))
+    grade_row["judge_response_created"] = api_payload.get("created")
+    grade_row["judge_finish_reason"] = extract_finish_reason(api_payload)
+    if grade_row["judge_finish_reason"] == "length":
+        grade_row["judge_warnings"].append(
+            "judge_finish_reason=length (possible truncation)"
+        )
+    judge_raw_text = extract_model_text(api_payload)
+    grade_row["judge_raw_text"] = judge_raw_text
+    if not judge_raw_text.strip():
+        grade_row["judge_warnings"].append("judge_raw_text_empty")
+
+    score, justification = score_judge_text(grade_row, judge_no_hint=judge_no_hint)
+    grade_row["judge_score"] = score
+    grade_row["judge_justification"] = justification
+    grade_row["judge_usage"] = api_payload.get("usage", {})
+    if judge_logprobs:
+        grade_row["judge_score_confidence"] = extract_score_probability(api_payload, score)
+
+
+def grade_one(
+    response_row: dict[str, Any],
+    *,
+    client: OpenRouterClient | None,
+    judge_model: str,
+    judge_system_prompt: str,
+    judge_user_template: str,
+    judge_user_template_control: str,
+    judge_no_hint: bool,
+    judge_temperature: float | None,
+    judge_reasoning_effort: str,
+    judge_max_tokens: int,
+    store_judge_response_raw: bool,
+    retries: int,
+    pause_seconds: float,
+    dry_run: bool,
+    judge_logprobs: bool = False,
+) -> dict[str, Any]:
+    started_at = utc_now_iso()
+    t0 = time.perf_counter()
+
+    grade_row = blank_grade_row(response_row, judge_model=judge_model, started_at=started_at)
+    if judge_logprobs:
+        grade_row["judge_score_confidence"] = None
+
     try:
-        if grade_row["source_response_error"]:
-            raise RuntimeError(
-                f"Cannot grade response with source error: {grade_row['source_response_error']}"
-            )
-        response_text = str(grade_row["response_text"]).strip()
-        if not response_text:
-            raise RuntimeError("Cannot grade empty response_text.")
+        messages = judge_request_messages(
+            grade_row,
+            judge_system_prompt=judge_system_prompt,
+            judge_user_template=judge_user_template,
+            judge_user_template_control=judge_user_template_control,
+        )
 
         if pause_seconds > 0:
             time.sleep(pause_seconds)
 
-        # Pick the right template: control questions get a separate template
-        # so the judge isn't told a legitimate question is nonsensical.
-        is_control = grade_row["is_control"]
-        if is_control and judge_user_template_control:
-            active_template = judge_user_template_control
-        else:
-            active_template = judge_user_template
-
-        # Explicit replacement instead of .format() to avoid KeyError when
-        # template doesn't use all keys or text contains literal curly braces
-        judge_prompt = active_template
-        judge_prompt = judge_prompt.replace("{question}", grade_row["question"])
-        judge_prompt = judge_prompt.replace("{nonsensical_element}", grade_row["nonsensical_element"])
-        judge_prompt = judge_prompt.replace("{response}", response_text)
-
         if dry_run:
             if grade_row["is_control"] and not judge_no_hint:
                 judge_raw_text = json.dumps(
@@ -2290,150 +6491,409 @@ def grade_one(
                 judge_raw_text = json.dumps(
                     {"justification": "Dry run placeholder grade.", "score": 1}
                 )
-            usage: dict[str, Any] = {}
             grade_row["judge_response_id"] = "dry-run"
             grade_row["judge_finish_reason"] = "stop"
+            grade_row["judge_raw_text"] = judge_raw_text
+            score, justification = score_judge_text(grade_row, judge_no_hint=judge_no_hint)
+            grade_row["judge_score"] = score
+            grade_row["judge_justification"] = justification
         else:
             assert client is not None
-            judge_response_format = pick_judge_response_format(
-                judge_model,
-                allow_score_3=bool(grade_row["is_control"]),
-            )
-            extra_payload: dict[str, Any] = {
-                "response_format": judge_response_format,
-                "provider": {"require_parameters": True},
-            }
-            if judge_reasoning_effort != "off":
-                extra_payload["reasoning"] = {"effort": judge_reasoning_effort}
             api_payload = client.chat(
                 model=judge_model,
-                messages=[
-                    {"role": "system", "content": judge_system_prompt},
-                    {"role": "user", "content": judge_prompt},
-                ],
+                messages=messages,
                 temperature=judge_temperature,
                 max_tokens=judge_max_tokens,
                 retries=retries,
-                extra_payload=extra_payload,
-            )
-            if store_judge_response_raw:
-                grade_row["judge_response_raw"] = api_payload
-            grade_row["judge_response_id"] = str(api_payload.get("id", ""))
-            grade_row["judge_response_created"] = api_payload.get("created")
-            grade_row["judge_finish_reason"] = extract_finish_reason(api_payload)
-            if grade_row["judge_finish_reason"] == "length":
-                grade_row["judge_warnings"].append(
-                    "judge_finish_reason=length (possible truncation)"
-                )
-            judge_raw_text = extract_model_text(api_payload)
-            usage = api_payload.get("usage", {})
-        grade_row["judge_raw_text"] = judge_raw_text
-        if not judge_raw_text.strip():
-            grade_row["judge_warnings"].append("judge_raw_text_empty")
-
-        score, justification, parse_mode = parse_judge_output(judge_raw_text)
-        grade_row["judge_parse_mode"] = parse_mode
-        if parse_mode != "direct":
-            grade_row["judge_warnings"].append(
-                f"judge_output_parse_recovered_via={parse_mode}"
+                extra_payload=judge_extra_payload(
+                    grade_row,
+                    judge_model=judge_model,
+                    judge_reasoning_effort=judge_reasoning_effort,
+                    judge_logprobs=judge_logprobs,
+                ),
             )
-        if grade_row["is_control"]:
-            allowed_scores = {0, 1, 2, 3} if judge_no_hint else {0, 3}
-        else:
-            allowed_scores = {0, 1, 2}
-        if score not in allowed_scores:
-            allowed_str = ",".join(str(x) for x in sorted(allowed_scores))
-            raise RuntimeError(
-                f"Invalid judge score {score} for this row; allowed scores: {allowed_str}"
+            apply_judge_payload(
+                grade_row,
+                api_payload,
+                judge_no_hint=judge_no_hint,
+                judge_logprobs=judge_logprobs,
+                store_judge_response_raw=store_judge_response_raw,
             )
-        grade_row["judge_score"] = score
-        grade_row["judge_justification"] = justification
-        grade_row["judge_usage"] = usage
     except Exception as exc:  # pylint: disable=broad-except
-        error_text = str(exc)
-        raw_text = str(grade_row.get("judge_raw_text", ""))
-        raw_preview = raw_text[:280].replace("\n", "\\n")
-        finish_reason = grade_row.get("judge_finish_reason")
-        if raw_text or finish_reason:
-            error_text = (
-                f"{error_text} "
-                f"(judge_finish_reason={finish_reason}, judge_raw_len={len(raw_text)}, "
-                f"judge_raw_preview={raw_preview})"
-            )
-        grade_row["error"] = error_text
+        grade_row["error"] = judge_error_text(exc, grade_row)
     finally:
         grade_row["judge_latency_ms"] = int((time.perf_counter() - t0) * 1000)
         grade_row["judge_finished_at_utc"] = utc_now_iso()
 
-    return grade_row
+    return grade_row
+
+
+@dataclasses.dataclass(slots=True)
+class SummaryColumns:
+    """Summary inputs as parallel columns with categorical codes.
+
+    Each code column indexes the matching first-appearance-ordered label
+    list (`model` -> `models`, ...), with -1 for missing. Unscored rows have
+    a NaN `score` and a -1 `bucket`. Columns are compact `array.array`s so
+    the NumPy engine can view them without copying.
+    """
+
+    models: list[str]
+    techniques: list[str]
+    questions: list[str]
+    strata: list[str]
+    run_indexes: list[int]
+    model: array.array
+    technique: array.array
+    question: array.array
+    stratum: array.array
+    run: array.array
+    score: array.array
+    bucket: array.array
+    is_control: array.array
+    is_error: array.array
+    stratum_sizes: dict[str, int]
+
+    def __len__(self) -> int:
+        return len(self.model)
+
+    @classmethod
+    def from_lists(
+        cls,
+        codes: dict[str, dict[Any, int]],
+        values: dict[str, list[Any]],
+        *,
+        stratum_sizes: dict[str, int] | None = None,
+    ) -> SummaryColumns:
+        """Freeze builder output: `codes` maps column -> label -> code."""
+        size = len(values["model"])
+        missing = array.array("q", [-1]) * size
+        code_columns = {
+            column: array.array("q", values[column]) if column in values else missing
+            for column in ("model", "technique", "question", "stratum", "run")
+        }
+        return cls(
+            models=list(codes.get("model", ())),
+            techniques=list(codes.get("technique", ())),
+            questions=list(codes.get("question", ())),
+            strata=list(codes.get("stratum", ())),
+            run_indexes=list(codes.get("run", ())),
+            **code_columns,
+            score=array.array("d", values["score"]),
+            bucket=array.array("b", values["bucket"]),
+            is_control=array.array("b", values["is_control"]),
+            is_error=array.array("b", values["is_error"]),
+            stratum_sizes=stratum_sizes or {},
+        )
 
 
-def summarize_grades(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    by_model: dict[str, dict[str, Any]] = {}
-    by_model_technique: dict[str, dict[str, list[int]]] = defaultdict(
-        lambda: defaultdict(list)
+def grade_summary_columns(rows: Iterable[Mapping[str, Any]]) -> SummaryColumns:
+    """Columns for one judge's grade rows; the score bucket is the judge score."""
+    codes: dict[str, dict[Any, int]] = {"model": {}, "technique": {}, "question": {}, "run": {}}
+    values: dict[str, list[Any]] = {
+        column: []
+        for column in (
+            "model", "technique", "question", "run", "score", "bucket", "is_control", "is_error"
+        )
+    }
+    # Bound methods keep the per-row cost to C calls; this loop is the
+    # whole Python-level cost of a summary.
+    model_codes, technique_codes, question_codes, run_codes = (
+        codes["model"], codes["technique"], codes["question"], codes["run"]
     )
-    by_model_run: dict[str, dict[int, list[int]]] = defaultdict(
-        lambda: defaultdict(list)
+    add_model, add_technique, add_question, add_run = (
+        values["model"].append,
+        values["technique"].append,
+        values["question"].append,
+        values["run"].append,
     )
+    add_score, add_bucket, add_control, add_error = (
+        values["score"].append,
+        values["bucket"].append,
+        values["is_control"].append,
+        values["is_error"].append,
+    )
+    nan = math.nan
+    for row in rows:
+        get = row.get
+        score = get("judge_score")
+        technique = get("technique", "")
+        run_index = get("run_index")
+        model = str(get("model", ""))
+        add_model(model_codes.setdefault(model, len(model_codes)))
+        technique_label = str(technique)
+        add_technique(technique_codes.setdefault(technique_label, len(technique_codes)))
+        question = str(get("question_id", ""))
+        add_question(question_codes.setdefault(question, len(question_codes)))
+        add_run(
+            run_codes.setdefault(run_index, len(run_codes))
+            if isinstance(run_index, int)
+            else -1
+        )
+        if score in (0, 1, 2, 3):
+            add_score(float(int(score)))
+            add_bucket(int(score))
+        else:
+            add_score(nan)
+            add_bucket(-1)
+        add_control(1 if get("is_control", False) or technique == "control_legitimate" else 0)
+        add_error(1 if get("error") else 0)
+    return SummaryColumns.from_lists(codes, values)
+
 
+def aggregate_summary_columns(rows: Iterable[Mapping[str, Any]]) -> SummaryColumns:
+    """Columns for consensus rows; scores are bucketed with bucket_consensus_score."""
+    codes: dict[str, dict[Any, int]] = {
+        "model": {}, "technique": {}, "question": {}, "stratum": {}, "run": {}
+    }
+    values: dict[str, list[Any]] = {
+        column: []
+        for column in (
+            "model",
+            "technique",
+            "question",
+            "stratum",
+            "run",
+            "score",
+            "bucket",
+            "is_control",
+            "is_error",
+        )
+    }
+    model_codes, technique_codes, question_codes, stratum_codes, run_codes = (
+        codes["model"], codes["technique"], codes["question"], codes["stratum"], codes["run"]
+    )
+    add_model, add_technique, add_question, add_stratum, add_run = (
+        values["model"].append,
+        values["technique"].append,
+        values["question"].append,
+        values["stratum"].append,
+        values["run"].append,
+    )
+    add_score, add_bucket, add_control, add_error = (
+        values["score"].append,
+        values["bucket"].append,
+        values["is_control"].append,
+        values["is_error"].append,
+    )
+    stratum_sizes: dict[str, int] = {}
+    nan = math.nan
     for row in rows:
-        model = str(row.get("model", ""))
-        if model not in by_model:
-            by_model[model] = {
-                "model": model,
-                "count": 0,
-                "scored_count": 0,
-                "nonsense_count": 0,
-                "control_count": 0,
-                # Scores split by question type to avoid cross-contamination.
-                "nonsense_score_0": 0,
-                "nonsense_score_1": 0,
-                "nonsense_score_2": 0,
-                "nonsense_score_3": 0,  # judge error: nonsense Q scored as legitimate
-                "control_score_0": 0,   # judge error or model wrongly rejected
-                "control_score_1": 0,
-                "control_score_2": 0,
-                "control_score_3": 0,
-                # Global totals for the leaderboard table.
-                "score_0": 0,
-                "score_1": 0,
-                "score_2": 0,
-                "score_3": 0,
+        get = row.get
+        score = get("consensus_score")
+        scored = is_valid_numeric_score(score)
+        is_control = bool(get("is_control"))
+        stratum = get("sampling_stratum")
+        if stratum:
+            stratum = str(stratum)
+            add_stratum(stratum_codes.setdefault(stratum, len(stratum_codes)))
+            if scored and not is_control:
+                stratum_size = get("sampling_stratum_size")
+                if isinstance(stratum_size, int):
+                    stratum_sizes[stratum] = int(stratum_size)
+        else:
+            add_stratum(-1)
+        run_index = get("run_index")
+        model = str(get("model", ""))
+        add_model(model_codes.setdefault(model, len(model_codes)))
+        technique = str(get("technique", ""))
+        add_technique(technique_codes.setdefault(technique, len(technique_codes)))
+        question = str(get("question_id", ""))
+        add_question(question_codes.setdefault(question, len(question_codes)))
+        add_run(
+            run_codes.setdefault(run_index, len(run_codes))
+            if isinstance(run_index, int)
+            else -1
+        )
+        if scored:
+            add_score(float(score))
+            add_bucket(bucket_consensus_score(score))
+        else:
+            add_score(nan)
+            add_bucket(-1)
+        add_control(1 if is_control else 0)
+        add_error(1 if get("status") == "error" else 0)
+    return SummaryColumns.from_lists(codes, values, stratum_sizes=stratum_sizes)
+
+
+def summary_totals(columns: SummaryColumns) -> dict[str, list[Any]]:
+    """Grouped counts and score sums per model (and model x technique / run).
+
+    Technique sums cover every scored row; `nonsense_*` and run sums cover
+    scored non-control rows, `control_buckets` scored control rows.
+    """
+    num_models = len(columns.models)
+    num_techniques = len(columns.techniques)
+    num_runs = len(columns.run_indexes)
+    if _np is not None and len(columns):
+        np = _np
+        model = np.frombuffer(columns.model, dtype=np.int64)
+        technique = np.frombuffer(columns.technique, dtype=np.int64)
+        run = np.frombuffer(columns.run, dtype=np.int64)
+        score = np.frombuffer(columns.score, dtype=np.float64)
+        bucket = np.frombuffer(columns.bucket, dtype=np.int8).astype(np.int64)
+        is_control = np.frombuffer(columns.is_control, dtype=np.int8) != 0
+        is_error = np.frombuffer(columns.is_error, dtype=np.int8) != 0
+        scored = bucket >= 0
+        nonsense = scored & ~is_control
+        control = scored & is_control
+        in_run = nonsense & (run >= 0)
+
+        def counts(mask: Any, keys: Any, size: int) -> Any:
+            return np.bincount(keys[mask], minlength=size)
+
+        def sums(mask: Any, keys: Any, size: int) -> Any:
+            return np.bincount(keys[mask], weights=score[mask], minlength=size)
+
+        technique_keys = model * max(num_techniques, 1) + technique
+        run_keys = model * max(num_runs, 1) + run
+        bucket_keys = model * 4 + bucket
+        return {
+            "count": np.bincount(model, minlength=num_models).tolist(),
+            "error_count": counts(is_error, model, num_models).tolist(),
+            "scored_count": counts(scored, model, num_models).tolist(),
+            "nonsense_count": counts(nonsense, model, num_models).tolist(),
+            "control_count": counts(control, model, num_models).tolist(),
+            "nonsense_sum": sums(nonsense, model, num_models).tolist(),
+            "nonsense_buckets": counts(nonsense, bucket_keys, num_models * 4)
+            .reshape(num_models, 4)
+            .tolist(),
+            "control_buckets": counts(control, bucket_keys, num_models * 4)
+            .reshape(num_models, 4)
+            .tolist(),
+            "technique_count": counts(scored, technique_keys, num_models * num_techniques)
+            .reshape(num_models, num_techniques)
+            .tolist(),
+            "technique_sum": sums(scored, technique_keys, num_models * num_techniques)
+            .reshape(num_models, num_techniques)
+            .tolist(),
+            "run_count": counts(in_run, run_keys, num_models * num_runs)
+            .reshape(num_models, num_runs)
+            .tolist(),
+            "run_sum": sums(in_run, run_keys, num_models * num_runs)
+            .reshape(num_models, num_runs)
+            .tolist(),
+        }
+
+    totals: dict[str, list[Any]] = {
+        key: [0] * num_models
+        for key in ("count", "error_count", "scored_count", "nonsense_count", "control_count")
+    }
+    totals["nonsense_sum"] = [0.0] * num_models
+    totals["nonsense_buckets"] = [[0] * 4 for _ in range(num_models)]
+    totals["control_buckets"] = [[0] * 4 for _ in range(num_models)]
+    totals["technique_count"] = [[0] * num_techniques for _ in range(num_models)]
+    totals["technique_sum"] = [[0.0] * num_techniques for _ in range(num_models)]
+    totals["run_count"] = [[0] * num_runs for _ in range(num_models)]
+    totals["run_sum"] = [[0.0] * num_runs for _ in range(num_models)]
+    for model, technique, run, score, bucket, is_control, is_error in zip(
+        columns.model,
+        columns.technique,
+        columns.run,
+        columns.score,
+        columns.bucket,
+        columns.is_control,
+        columns.is_error,
+    ):
+        totals["count"][model] += 1
+        if is_error:
+            totals["error_count"][model] += 1
+        if bucket < 0:
+            continue
+        totals["scored_count"][model] += 1
+        totals["technique_count"][model][technique] += 1
+        totals["technique_sum"][model][technique] += score
+        if is_control:
+            totals["control_count"][model] += 1
+            totals["control_buckets"][model][bucket] += 1
+            continue
+        totals["nonsense_count"][model] += 1
+        totals["nonsense_sum"][model] += score
+        totals["nonsense_buckets"][model][bucket] += 1
+        if run >= 0:
+            totals["run_count"][model][run] += 1
+            totals["run_sum"][model][run] += score
+    return totals
+
+
+def _summary_breakdowns(
+    columns: SummaryColumns, totals: dict[str, list[Any]], model_code: int
+) -> dict[str, Any]:
+    """technique_breakdown / run_average_scores / run_average_stddev for one model."""
+    technique_counts = totals["technique_count"][model_code]
+    technique_sums = totals["technique_sum"][model_code]
+    technique_breakdown = {
+        technique: round(technique_sums[code] / technique_counts[code], 4)
+        for code, technique in sorted(
+            enumerate(columns.techniques), key=lambda item: item[1]
+        )
+        if technique_counts[code]
+    }
+    run_counts = totals["run_count"][model_code]
+    run_sums = totals["run_sum"][model_code]
+    run_averages: dict[str, float] = {}
+    for code, run_index in sorted(enumerate(columns.run_indexes), key=lambda item: item[1]):
+        if run_counts[code]:
+            run_averages[str(run_index)] = round(run_sums[code] / run_counts[code], 4)
+    return {
+        "technique_breakdown": technique_breakdown,
+        "run_average_scores": run_averages,
+        "run_average_stddev": (
+            round(statistics.pstdev(list(run_averages.values())), 4)
+            if len(run_averages) >= 2
+            else None
+        ),
+    }
+
+
+def sort_leaderboard(leaderboard: list[dict[str, Any]]) -> None:
+    leaderboard.sort(
+        key=lambda item: (
+            item["avg_score"] if isinstance(item["avg_score"], (int, float)) else -1,
+            item["detection_rate_score_2"]
+            if isinstance(item["detection_rate_score_2"], (int, float))
+            else -1,
+        ),
+        reverse=True,
+    )
+
+
+def summarize_grades(rows: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+    # Single pass over `rows` so finalize can feed it a stream.
+    columns = grade_summary_columns(rows)
+    totals = summary_totals(columns)
+
+    leaderboard: list[dict[str, Any]] = []
+    for code, model in enumerate(columns.models):
+        nonsense_buckets = totals["nonsense_buckets"][code]
+        control_buckets = totals["control_buckets"][code]
+        stats: dict[str, Any] = {
+            "model": model,
+            "count": totals["count"][code],
+            "scored_count": totals["scored_count"][code],
+            "nonsense_count": totals["nonsense_count"][code],
+            "control_count": totals["control_count"][code],
+        }
+        # Scores split by question type to avoid cross-contamination:
+        # nonsense_score_3 is a judge error (nonsense Q scored as legitimate),
+        # control_score_0 a judge error or a model wrongly rejecting.
+        for score_int in range(4):
+            stats[f"nonsense_score_{score_int}"] = nonsense_buckets[score_int]
+        for score_int in range(4):
+            stats[f"control_score_{score_int}"] = control_buckets[score_int]
+        # Global totals for the leaderboard table.
+        for score_int in range(4):
+            stats[f"score_{score_int}"] = nonsense_buckets[score_int] + control_buckets[score_int]
+        stats.update(
+            {
                 "avg_score": None,
                 "detection_rate_score_2": None,
                 "full_engagement_rate_score_0": None,
                 "control_correct_rate_score_3": None,
-                "error_count": 0,
+                "error_count": totals["error_count"][code],
             }
-
-        stats = by_model[model]
-        stats["count"] += 1
-        if row.get("error"):
-            stats["error_count"] += 1
-
-        score = row.get("judge_score")
-        if score in (0, 1, 2, 3):
-            score_int = int(score)
-            stats["scored_count"] += 1
-            stats[f"score_{score_int}"] += 1
-            is_control = bool(row.get("is_control", False) or row.get("technique") == "control_legitimate")
-            if is_control:
-                stats["control_count"] += 1
-                stats[f"control_score_{score_int}"] += 1
-            else:
-                stats["nonsense_count"] += 1
-                stats[f"nonsense_score_{score_int}"] += 1
-            technique = str(row.get("technique", ""))
-            by_model_technique[model][technique].append(score_int)
-            run_index_raw = row.get("run_index")
-            if isinstance(run_index_raw, int) and not is_control:
-                by_model_run[model][run_index_raw].append(score_int)
-
-    leaderboard: list[dict[str, Any]] = []
-    for model, stats in by_model.items():
-        scored_count = stats["scored_count"]
-        if scored_count > 0:
+        )
+        if stats["scored_count"] > 0:
             # Primary benchmark metric: only nonsensical questions, using
             # type-specific counters to avoid cross-contamination.
             nonsense_scored = stats["nonsense_count"]
@@ -2455,45 +6915,15 @@ def summarize_grades(rows: list[dict[str, Any]]) -> dict[str, Any]:
                 stats["control_correct_rate_score_3"] = round(
                     stats["control_score_3"] / control_total, 4
                 )
-
-        technique_scores = by_model_technique[model]
-        stats["technique_breakdown"] = {
-            technique: round(sum(scores) / len(scores), 4)
-            for technique, scores in sorted(technique_scores.items())
-            if scores
-        }
-
-        run_scores = by_model_run[model]
-        run_averages: dict[str, float] = {}
-        for run_index, scores in sorted(run_scores.items()):
-            if scores:
-                run_averages[str(run_index)] = round(sum(scores) / len(scores), 4)
-        stats["run_average_scores"] = run_averages
-        if len(run_averages) >= 2:
-            values = list(run_averages.values())
-            stats["run_average_stddev"] = round(statistics.pstdev(values), 4)
-        else:
-            stats["run_average_stddev"] = None
-
+        stats.update(_summary_breakdowns(columns, totals, code))
         leaderboard.append(stats)
 
-    leaderboard.sort(
-        key=lambda item: (
-            item["avg_score"] if isinstance(item["avg_score"], (int, float)) else -1,
-            item["detection_rate_score_2"]
-            if isinstance(item["detection_rate_score_2"], (int, float))
-            else -1,
-        ),
-        reverse=True,
-    )
-
+    sort_leaderboard(leaderboard)
     return {
         "leaderboard": leaderboard,
-        "total_records": len(rows),
-        "total_scored_records": sum(
-            1 for row in rows if row.get("judge_score") in (0, 1, 2, 3)
-        ),
-        "total_error_records": sum(1 for row in rows if row.get("error")),
+        "total_records": len(columns),
+        "total_scored_records": sum(totals["scored_count"]),
+        "total_error_records": sum(totals["error_count"]),
     }
 
 
@@ -2559,6 +6989,21 @@ def render_markdown_summary(grade_meta: dict[str, Any], summary: dict[str, Any])
         lines.append(f"- run avg stddev: {fmt_num(row.get('run_average_stddev'))}")
         lines.append("")
 
+    local_check = summary.get("local_prejudge")
+    if local_check:
+        lines.append("## Local Pre-Judge")
+        lines.append("")
+        lines.append(f"- Accepted locally: `{local_check['accepted_rows']}`")
+        lines.append(f"- Judge rows compared: `{local_check['compared_rows']}`")
+        lines.append(f"- Agreement with judge: {fmt_num(local_check['agreement'])}")
+        lines.append(
+            f"- Outliers (judge score at local p < {local_check['outlier_probability']}): "
+            f"`{local_check['outlier_count']}`"
+        )
+        for sample_id in local_check["outlier_sample_ids"]:
+            lines.append(f"  - `{sample_id}`")
+        lines.append("")
+
     return "\n".join(lines) + "\n"
 
 
@@ -2577,6 +7022,16 @@ def run_grade(args: argparse.Namespace) -> int:
         elif isinstance(configured_many, list) and len(configured_many) == 1:
             args.judge_model = str(configured_many[0]).strip()
 
+    artifact_layout = getattr(args, "artifact_layout", "full")
+    if artifact_layout not in ARTIFACT_LAYOUTS:
+        raise ValueError(f"--artifact-layout must be one of: {', '.join(ARTIFACT_LAYOUTS)}")
+    normalized_layout = artifact_layout == "normalized"
+    output_compression = jsonl_output_compression(args)
+    retry_errors = bool(getattr(args, "retry_errors", False))
+    if retry_errors:
+        if not args.grade_id.strip():
+            raise ValueError("--retry-errors for grade requires --grade-id.")
+        args.resume = True
     if args.resume and not args.grade_id.strip():
         raise ValueError("--resume for grade requires --grade-id.")
     if args.parallelism < 1:
@@ -2586,12 +7041,19 @@ def run_grade(args: argparse.Namespace) -> int:
         raise ValueError("--responses-file is required (or set grade.responses_file in config).")
     if not args.judge_model:
         raise ValueError("--judge-model is required (or set grade.judge_model in config).")
+    batch_client = batch_api_client(args) if bool(getattr(args, "batch_api", False)) else None
 
     responses_file = pathlib.Path(args.responses_file)
-    if not responses_file.exists():
-        raise FileNotFoundError(f"responses file not found: {responses_file}")
-
-    rows = read_jsonl(responses_file)
+    store = open_artifact_store(args)
+    try:
+        if not responses_file.exists() and not (
+            store is not None and store.has_artifact("responses", responses_file)
+        ):
+            raise FileNotFoundError(f"responses file not found: {responses_file}")
+        rows = read_artifact_rows(store, "responses", responses_file, rows_path=responses_file)
+    finally:
+        if store is not None:
+            store.close()
     if not rows:
         raise ValueError("responses file is empty.")
     has_control_rows = any(
@@ -2639,18 +7101,37 @@ def run_grade(args: argparse.Namespace) -> int:
 
     source_sample_ids = {sample_id_from_row(row, context="Grade source rows") for row in rows}
     partial_grades_path = grade_dir / "grades.partial.jsonl"
-    final_grades_path = grade_dir / "grades.jsonl"
+    final_grades_path = final_jsonl_path(grade_dir, "grades.jsonl", output_compression)
 
     checkpoint_rows: list[dict[str, Any]] = []
     checkpoint_ids: set[str] = set()
+    retry_selection: dict[str, str] = {}
     if args.resume:
         checkpoint_source = partial_grades_path
-        if not checkpoint_source.exists() and final_grades_path.exists():
-            checkpoint_source = final_grades_path
-        checkpoint_rows, checkpoint_ids = load_checkpoint_rows(
-            checkpoint_source,
-            context=f"Grade checkpoint {checkpoint_source}",
-        )
+        if not checkpoint_source.exists():
+            previous_final = resolve_jsonl_path(grade_dir / "grades.jsonl")
+            if previous_final.exists():
+                checkpoint_source = previous_final
+        if checkpoint_source == partial_grades_path and not retry_errors:
+            checkpoint_offsets, _ = load_checkpoint_offset_index(
+                checkpoint_source,
+                context=f"Grade checkpoint {checkpoint_source}",
+            )
+            checkpoint_ids = set(checkpoint_offsets)
+            judge_check_rows: list[dict[str, Any]] = []
+            if checkpoint_offsets:
+                # A checkpoint is written by one judge; its first row is enough
+                # to catch a --judge-model mismatch.
+                first_offset, first_length = min(checkpoint_offsets.values())
+                judge_check_rows = read_jsonl_range(
+                    checkpoint_source, first_offset, first_offset + first_length
+                )
+        else:
+            checkpoint_rows, checkpoint_ids = load_checkpoint_rows(
+                checkpoint_source,
+                context=f"Grade checkpoint {checkpoint_source}",
+            )
+            judge_check_rows = checkpoint_rows
         unexpected_checkpoint_ids = checkpoint_ids - source_sample_ids
         if unexpected_checkpoint_ids:
             raise RuntimeError(
@@ -2658,15 +7139,39 @@ def run_grade(args: argparse.Namespace) -> int:
                 "current responses file. This usually means source responses changed since "
                 f"the original grading run. sample={_sample_ids_summary(unexpected_checkpoint_ids)}"
             )
-        for checkpoint_row in checkpoint_rows:
+        for checkpoint_row in judge_check_rows:
             checkpoint_judge_model = str(checkpoint_row.get("judge_model", "")).strip()
             if checkpoint_judge_model and checkpoint_judge_model != args.judge_model:
                 raise RuntimeError(
                     "Grade resume checkpoint judge model does not match current --judge-model. "
                     f"checkpoint={checkpoint_judge_model} current={args.judge_model}"
                 )
-        if checkpoint_rows and checkpoint_source != partial_grades_path:
-            write_jsonl(partial_grades_path, checkpoint_rows)
+        if retry_errors:
+            retry_selection = select_retry_sample_ids(
+                checkpoint_rows,
+                models=split_csv(args.retry_models),
+                error_classes=split_csv(args.retry_error_classes),
+            )
+            checkpoint_rows = [
+                row for row in checkpoint_rows
+                if str(row.get("sample_id", "")).strip() not in retry_selection
+            ]
+            checkpoint_ids -= set(retry_selection)
+            print(
+                f"Retrying {len(retry_selection)} errored grade row(s): "
+                f"{json.dumps(_retry_class_counts(retry_selection))}",
+                flush=True,
+            )
+        if retry_selection or (
+            checkpoint_rows and checkpoint_source != partial_grades_path
+        ):
+            write_jsonl_atomic(partial_grades_path, checkpoint_rows)
+            rebuild_checkpoint_index(partial_grades_path)
+        elif checkpoint_rows:
+            load_checkpoint_offset_index(
+                partial_grades_path,
+                context=f"Grade checkpoint {partial_grades_path}",
+            )
 
     rows_to_grade = [
         row
@@ -2674,12 +7179,113 @@ def run_grade(args: argparse.Namespace) -> int:
         if sample_id_from_row(row, context="Grade source rows") not in checkpoint_ids
     ]
 
+    judge_endpoint = str(getattr(args, "judge_endpoint", "") or "").strip()
+    judge_is_openrouter = not judge_endpoint or "openrouter.ai" in judge_endpoint
+    current_judge_params_hash = judge_params_hash(
+        judge_system_prompt=judge_system,
+        judge_user_template=judge_template,
+        judge_user_template_control=judge_template_control,
+        judge_temperature=args.judge_temperature,
+        judge_reasoning_effort=args.judge_reasoning_effort,
+        judge_max_tokens=args.judge_max_tokens,
+        judge_no_hint=bool(args.judge_no_hint),
+        dry_run=bool(args.dry_run),
+        judge_endpoint="" if judge_is_openrouter else judge_endpoint,
+        batch_endpoint=batch_client.base_url if batch_client is not None else "",
+    )
+    reuse_from = str(getattr(args, "reuse_from", "") or "").strip()
+    reused_grade_rows: list[dict[str, Any]] = []
+    if reuse_from and rows_to_grade:
+        reuse_index = load_grade_reuse_index(reuse_from)
+        remaining_rows: list[dict[str, Any]] = []
+        for row in rows_to_grade:
+            match = reuse_index.get(
+                grade_reuse_key(
+                    row,
+                    judge_model=args.judge_model,
+                    params_hash=current_judge_params_hash,
+                )
+            )
+            if match is None or row.get("error"):
+                remaining_rows.append(row)
+                continue
+            prior, source_file = match
+            grade_row = build_reused_grade_row(prior, row, source_file=source_file)
+            grade_row["judge_params_hash"] = current_judge_params_hash
+            grade_row["status"] = "ok"
+            reused_grade_rows.append(grade_row)
+        rows_to_grade = remaining_rows
+        print(
+            f"Reused {len(reused_grade_rows)} grade(s) for judge={args.judge_model} "
+            f"from {reuse_from}; {len(rows_to_grade)} row(s) left to grade.",
+            flush=True,
+        )
+
+    local_prejudge = str(getattr(args, "local_prejudge", "") or "").strip()
+    local_prejudge_accept = getattr(args, "local_prejudge_accept", None)
+    local_predictions: dict[str, tuple[int | None, dict[int, float]]] = {}
+    local_grade_rows: list[dict[str, Any]] = []
+    if local_prejudge_accept is not None and not local_prejudge:
+        raise ValueError("--local-prejudge-accept requires --local-prejudge.")
+    if local_prejudge:
+        local_judge = LocalJudge.load(pathlib.Path(local_prejudge))
+        # Accepted rows are the local model's predictions, not the API
+        # judge's, so they never share its params hash.
+        local_params_hash = stable_params_hash(
+            {
+                "judge_params_hash": current_judge_params_hash,
+                "local_prejudge_sha256": hashlib.sha256(
+                    pathlib.Path(local_prejudge).read_bytes()
+                ).hexdigest(),
+            }
+        )
+        remaining_rows = []
+        for row in rows_to_grade:
+            score, probabilities = local_judge.predict(row, judge_no_hint=bool(args.judge_no_hint))
+            local_predictions[str(row.get("sample_id", "")).strip()] = (score, probabilities)
+            if (
+                local_prejudge_accept is not None
+                and score is not None
+                and probabilities[score] >= local_prejudge_accept
+                and not row.get("error")
+                and str(row.get("response_text", "")).strip()
+            ):
+                grade_row = local_prejudge_grade_row(
+                    row,
+                    judge_model=args.judge_model,
+                    local_judge=local_judge,
+                    score=score,
+                    probabilities=probabilities,
+                )
+                grade_row["judge_params_hash"] = local_params_hash
+                grade_row["status"] = "ok"
+                local_grade_rows.append(grade_row)
+            else:
+                remaining_rows.append(row)
+        rows_to_grade = remaining_rows
+        print(
+            f"Local pre-judge scored {len(local_predictions)} row(s) and accepted "
+            f"{len(local_grade_rows)}; {len(rows_to_grade)} row(s) left for {args.judge_model}.",
+            flush=True,
+        )
+
     grade_meta = {
         "phase": "grade",
         "grade_id": grade_id,
         "timestamp_utc": timestamp.isoformat(),
         "resumed": bool(args.resume),
-        "resumed_completed_rows": len(checkpoint_rows),
+        "resumed_completed_rows": len(checkpoint_ids),
+        "retry_errors": retry_errors,
+        "retried_rows": len(retry_selection),
+        "retried_error_classes": _retry_class_counts(retry_selection),
+        "reuse_from": reuse_from or None,
+        "reused_rows": len(reused_grade_rows),
+        "local_prejudge": str(pathlib.Path(local_prejudge).resolve()) if local_prejudge else None,
+        "local_prejudge_accept": local_prejudge_accept,
+        "local_prejudge_rows": len(local_grade_rows),
+        "judge_params_hash": current_judge_params_hash,
+        "artifact_layout": artifact_layout,
+        "jsonl_compression": output_compression or "none",
         "responses_file": str(responses_file.resolve()),
         "response_record_count": len(rows),
         "judge_model": args.judge_model,
@@ -2698,6 +7304,10 @@ def run_grade(args: argparse.Namespace) -> int:
         "timeout_seconds": args.timeout_seconds,
         "dry_run": bool(args.dry_run),
         "judge_no_hint": bool(args.judge_no_hint),
+        "judge_logprobs": bool(getattr(args, "judge_logprobs", False)),
+        "judge_endpoint": judge_endpoint or "https://openrouter.ai/api/v1",
+        "batch_api": batch_client is not None,
+        "batch_endpoint": batch_client.base_url if batch_client is not None else None,
         "source_has_control_rows": bool(has_control_rows),
         "fail_on_error": bool(args.fail_on_error),
         "config_path": str(pathlib.Path(args.config).resolve()),
@@ -2708,181 +7318,400 @@ def run_grade(args: argparse.Namespace) -> int:
         grade_events_path.write_text("", encoding="utf-8")
     elif not grade_events_path.exists():
         grade_events_path.write_text("", encoding="utf-8")
-    append_jsonl(
-        grade_events_path,
-        {
-            "timestamp_utc": utc_now_iso(),
-            "phase": "grade",
-            "event": "resume_start" if args.resume else "start",
-            "grade_id": grade_id,
-            "checkpoint_rows": len(checkpoint_rows),
-            "remaining_rows": len(rows_to_grade),
-        },
-    )
-
-    client: OpenRouterClient | None = None
-    if not args.dry_run:
-        api_key = os.getenv("OPENROUTER_API_KEY", "").strip()
-        if not api_key:
-            raise RuntimeError("OPENROUTER_API_KEY is required unless --dry-run is set.")
-        client = OpenRouterClient(api_key=api_key, timeout_seconds=args.timeout_seconds)
-
-    started = time.perf_counter()
-    grade_rows: list[dict[str, Any]] = list(checkpoint_rows)
-    total = len(rows)
-    completed = len(checkpoint_rows)
+    writer = JsonlAppendWriter(fsync=getattr(args, "fsync", "never"))
+    writer.track_offsets(partial_grades_path)
+    raw_store = RawPayloadStore(grade_dir / "grades.raw.blob")
+    RUN_INTERRUPT.arm()
+    try:
+        writer.append(
+            grade_events_path,
+            {
+                "timestamp_utc": utc_now_iso(),
+                "phase": "grade",
+                "event": "retry_errors_start"
+                if retry_errors
+                else ("resume_start" if args.resume else "start"),
+                "grade_id": grade_id,
+                "checkpoint_rows": len(checkpoint_ids),
+                "retry_rows": len(retry_selection),
+                "reused_rows": len(reused_grade_rows),
+                "remaining_rows": len(rows_to_grade),
+            },
+        )
+        for grade_row in reused_grade_rows:
+            raw_store.externalize(
+                grade_row,
+                "judge_response_raw",
+                source_dir=pathlib.Path(str(grade_row["reused_from_file"])).parent,
+            )
+            writer.append(
+                partial_grades_path,
+                normalize_artifact_row(grade_row) if normalized_layout else grade_row,
+            )
+            writer.append(
+                grade_events_path,
+                {
+                    "timestamp_utc": utc_now_iso(),
+                    "phase": "grade",
+                    "event": "task_reused",
+                    "status": "ok",
+                    "sample_id": grade_row.get("sample_id"),
+                    "model": grade_row.get("model"),
+                    "question_id": grade_row.get("question_id"),
+                    "run_index": grade_row.get("run_index"),
+                    "judge_score": grade_row.get("judge_score"),
+                    "reused_from_sample_id": grade_row.get("reused_from_sample_id"),
+                    "reused_from_file": grade_row.get("reused_from_file"),
+                },
+            )
+        for grade_row in local_grade_rows:
+            annotate_local_prediction(
+                grade_row, local_predictions[str(grade_row.get("sample_id", "")).strip()]
+            )
+            writer.append(
+                partial_grades_path,
+                normalize_artifact_row(grade_row) if normalized_layout else grade_row,
+            )
+            writer.append(
+                grade_events_path,
+                {
+                    "timestamp_utc": utc_now_iso(),
+                    "phase": "grade",
+                    "event": "task_local_prejudge",
+                    "status": "ok",
+                    "sample_id": grade_row.get("sample_id"),
+                    "model": grade_row.get("model"),
+                    "question_id": grade_row.get("question_id"),
+                    "run_index": grade_row.get("run_index"),
+                    "judge_score": grade_row.get("judge_score"),
+                },
+            )
 
-    if rows_to_grade:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=args.parallelism) as pool:
-            in_flight: dict[concurrent.futures.Future[dict[str, Any]], dict[str, Any]] = {}
-            row_iter = iter(rows_to_grade)
+        client: OpenRouterClient | None = None
+        # Rows with a source error or no text fail before any request is made.
+        if not args.dry_run and batch_client is None and any(
+            not row.get("error") and str(row.get("response_text", "")).strip()
+            for row in rows_to_grade
+        ):
+            if judge_is_openrouter:
+                api_key = os.getenv("OPENROUTER_API_KEY", "").strip()
+                if not api_key:
+                    raise RuntimeError("OPENROUTER_API_KEY is required unless --dry-run is set.")
+            else:
+                api_key = (
+                    str(getattr(args, "judge_api_key", "") or "").strip()
+                    or os.getenv("JUDGE_API_KEY", "").strip()
+                )
+            client = OpenRouterClient(
+                api_key=api_key,
+                timeout_seconds=args.timeout_seconds,
+                base_url=judge_endpoint,
+            )
 
-            def submit_grade_row(row: dict[str, Any]) -> None:
-                future = pool.submit(
-                    grade_one,
-                    row,
-                    client=client,
-                    judge_model=args.judge_model,
-                    judge_system_prompt=judge_system,
-                    judge_user_template=judge_template,
-                    judge_user_template_control=judge_template_control,
-                    judge_no_hint=args.judge_no_hint,
-                    judge_temperature=args.judge_temperature,
-                    judge_reasoning_effort=args.judge_reasoning_effort,
-                    judge_max_tokens=args.judge_max_tokens,
-                    store_judge_response_raw=bool(args.store_judge_response_raw),
-                    retries=args.retries,
-                    pause_seconds=args.pause_seconds,
-                    dry_run=args.dry_run,
+        started = time.perf_counter()
+        total = len(rows)
+        completed = len(checkpoint_ids) + len(reused_grade_rows) + len(local_grade_rows)
+
+        def _finish_grade_row(grade_row: dict[str, Any], source_row: Mapping[str, Any]) -> None:
+            nonlocal completed
+            completed += 1
+            grade_row["judge_params_hash"] = current_judge_params_hash
+            grade_row["status"] = "error" if grade_row.get("error") else "ok"
+            if local_predictions:
+                annotate_local_prediction(
+                    grade_row,
+                    local_predictions[str(source_row.get("sample_id", "")).strip()],
                 )
-                in_flight[future] = row
+            raw_store.externalize(grade_row, "judge_response_raw")
+            writer.append(
+                partial_grades_path,
+                normalize_artifact_row(grade_row) if normalized_layout else grade_row,
+            )
+            status = grade_row["status"]
+            writer.append(
+                grade_events_path,
+                {
+                    "timestamp_utc": utc_now_iso(),
+                    "phase": "grade",
+                    "event": "task_complete",
+                    "status": status,
+                    "sample_id": grade_row.get("sample_id"),
+                    "model": grade_row.get("model"),
+                    "question_id": grade_row.get("question_id"),
+                    "run_index": grade_row.get("run_index"),
+                    "judge_score": grade_row.get("judge_score"),
+                    "judge_finish_reason": grade_row.get("judge_finish_reason"),
+                    "judge_raw_text_chars": len(str(grade_row.get("judge_raw_text", ""))),
+                    "judge_parse_mode": grade_row.get("judge_parse_mode", ""),
+                    "judge_warnings": grade_row.get("judge_warnings", []),
+                    "error": grade_row.get("error", ""),
+                },
+            )
+            error_suffix = f" error={grade_row.get('error')}" if status == "error" else ""
+            print(
+                f"[grade {completed}/{total}] {status} "
+                f"model={grade_row['model']} question={grade_row['question_id']} run={grade_row['run_index']}"
+                f"{error_suffix}",
+                flush=True,
+            )
 
-            for _ in range(min(args.parallelism, len(rows_to_grade))):
+        judge_logprobs = bool(getattr(args, "judge_logprobs", False))
+        drain = InFlightDrain(getattr(args, "drain_seconds", 30.0))
+        if rows_to_grade and batch_client is not None:
+            source_rows_by_id = {str(row.get("sample_id", "")).strip(): row for row in rows_to_grade}
+
+            def _grade_batch_results(
+                batch_id: str, results: dict[str, tuple[dict[str, Any] | None, str]]
+            ) -> None:
+                for sample_id in sorted(results):
+                    source_row = source_rows_by_id.get(sample_id)
+                    if source_row is None:
+                        continue
+                    payload, error = results[sample_id]
+                    grade_row = blank_grade_row(
+                        source_row, judge_model=args.judge_model, started_at=None
+                    )
+                    if judge_logprobs:
+                        grade_row["judge_score_confidence"] = None
+                    grade_row["batch_id"] = batch_id
+                    if payload is None:
+                        grade_row["error"] = error
+                    else:
+                        try:
+                            apply_judge_payload(
+                                grade_row,
+                                payload,
+                                judge_no_hint=bool(args.judge_no_hint),
+                                judge_logprobs=judge_logprobs,
+                                store_judge_response_raw=bool(args.store_judge_response_raw),
+                            )
+                        except Exception as exc:  # pylint: disable=broad-except
+                            grade_row["error"] = judge_error_text(exc, grade_row)
+                    grade_row["judge_finished_at_utc"] = utc_now_iso()
+                    _finish_grade_row(grade_row, source_row)
+
+            batch_requests: list[tuple[str, dict[str, Any]]] = []
+            for row in rows_to_grade:
+                grade_row = blank_grade_row(row, judge_model=args.judge_model, started_at=None)
                 try:
-                    submit_grade_row(next(row_iter))
-                except StopIteration:
-                    break
-
-            while in_flight:
-                done, _ = concurrent.futures.wait(
-                    in_flight,
-                    return_when=concurrent.futures.FIRST_COMPLETED,
-                )
-                for future in done:
-                    source_row = in_flight.pop(future)
-                    completed += 1
-                    try:
-                        grade_row = future.result()
-                    except Exception as exc:  # pylint: disable=broad-except
-                        grade_row = {
-                            "sample_id": source_row.get("sample_id"),
-                            "run_index": source_row.get("run_index"),
-                            "model": source_row.get("model"),
-                            "model_id": source_row.get("model_id", source_row.get("model")),
-                            "model_org": source_row.get("model_org", "unknown"),
-                            "model_name": source_row.get(
-                                "model_name",
-                                source_row.get("model_id", source_row.get("model")),
-                            ),
-                            "model_reasoning_level": source_row.get(
-                                "model_reasoning_level", "default"
-                            ),
-                            "model_row": source_row.get("model_row", source_row.get("model")),
-                            "response_reasoning_effort": source_row.get(
-                                "response_reasoning_effort"
-                            ),
-                            "question_id": source_row.get("question_id"),
-                            "technique": source_row.get("technique"),
-                            "is_control": bool(
-                                source_row.get("is_control", False)
-                                or source_row.get("technique") == "control_legitimate"
+                    messages = judge_request_messages(
+                        grade_row,
+                        judge_system_prompt=judge_system,
+                        judge_user_template=judge_template,
+                        judge_user_template_control=judge_template_control,
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Ungradeable rows fail here, as they would before a judge call.
+                    grade_row["error"] = judge_error_text(exc, grade_row)
+                    grade_row["judge_finished_at_utc"] = utc_now_iso()
+                    _finish_grade_row(grade_row, row)
+                    continue
+                batch_requests.append(
+                    (
+                        str(row.get("sample_id", "")).strip(),
+                        chat_request_body(
+                            model=args.judge_model,
+                            messages=messages,
+                            temperature=args.judge_temperature,
+                            max_tokens=args.judge_max_tokens,
+                            extra_payload=judge_extra_payload(
+                                grade_row,
+                                judge_model=args.judge_model,
+                                judge_reasoning_effort=args.judge_reasoning_effort,
+                                judge_logprobs=judge_logprobs,
                             ),
-                            "domain": source_row.get("domain"),
-                            "question": source_row.get("question"),
-                            "nonsensical_element": source_row.get("nonsensical_element"),
-                            "response_text": source_row.get("response_text", ""),
-                            "source_response_error": source_row.get("error", ""),
-                            "judge_model": args.judge_model,
-                            "judge_score": None,
-                            "judge_justification": "",
-                            "judge_raw_text": "",
-                            "judge_parse_mode": "",
-                            "judge_response_id": "",
-                            "judge_response_created": None,
-                            "judge_finish_reason": None,
-                            "judge_warnings": [],
-                            "judge_usage": {},
-                            "judge_response_raw": None,
-                            "judge_latency_ms": None,
-                            "judge_started_at_utc": None,
-                            "judge_finished_at_utc": utc_now_iso(),
-                            "error": f"Worker failure: {exc}",
-                        }
-                    grade_row["status"] = "error" if grade_row.get("error") else "ok"
-                    grade_rows.append(grade_row)
-                    append_jsonl(partial_grades_path, grade_row)
-                    status = grade_row["status"]
-                    append_jsonl(
-                        grade_events_path,
-                        {
-                            "timestamp_utc": utc_now_iso(),
-                            "phase": "grade",
-                            "event": "task_complete",
-                            "status": status,
-                            "sample_id": grade_row.get("sample_id"),
-                            "model": grade_row.get("model"),
-                            "question_id": grade_row.get("question_id"),
-                            "run_index": grade_row.get("run_index"),
-                            "judge_score": grade_row.get("judge_score"),
-                            "judge_finish_reason": grade_row.get("judge_finish_reason"),
-                            "judge_raw_text_chars": len(str(grade_row.get("judge_raw_text", ""))),
-                            "judge_parse_mode": grade_row.get("judge_parse_mode", ""),
-                            "judge_warnings": grade_row.get("judge_warnings", []),
-                            "error": grade_row.get("error", ""),
-                        },
+                        ),
                     )
-                    error_suffix = f" error={grade_row.get('error')}" if status == "error" else ""
-                    print(
-                        f"[grade {completed}/{total}] {status} "
-                        f"model={grade_row['model']} question={grade_row['question_id']} run={grade_row['run_index']}"
-                        f"{error_suffix}",
-                        flush=True,
+                )
+            run_batch_jobs(
+                batch_client,
+                batch_requests,
+                state_path=grade_dir / "batch_jobs.json",
+                label="grade",
+                poll_seconds=args.batch_poll_seconds,
+                on_results=_grade_batch_results,
+                on_event=lambda event: writer.append(
+                    grade_events_path,
+                    {"timestamp_utc": utc_now_iso(), "phase": "grade", "grade_id": grade_id, **event},
+                ),
+            )
+        elif rows_to_grade:
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=args.parallelism)
+            in_flight: dict[concurrent.futures.Future[dict[str, Any]], dict[str, Any]] = {}
+            abandoned = False
+            try:
+                row_iter = iter(rows_to_grade)
+
+                def submit_grade_row(row: dict[str, Any]) -> None:
+                    future = pool.submit(
+                        grade_one,
+                        row,
+                        client=client,
+                        judge_model=args.judge_model,
+                        judge_system_prompt=judge_system,
+                        judge_user_template=judge_template,
+                        judge_user_template_control=judge_template_control,
+                        judge_no_hint=args.judge_no_hint,
+                        judge_temperature=args.judge_temperature,
+                        judge_reasoning_effort=args.judge_reasoning_effort,
+                        judge_max_tokens=args.judge_max_tokens,
+                        store_judge_response_raw=bool(args.store_judge_response_raw),
+                        retries=args.retries,
+                        pause_seconds=args.pause_seconds,
+                        dry_run=args.dry_run,
+                        judge_logprobs=judge_logprobs,
                     )
+                    in_flight[future] = row
 
+                for _ in range(min(args.parallelism, len(rows_to_grade))):
+                    if drain.stopping:
+                        break
                     try:
                         submit_grade_row(next(row_iter))
                     except StopIteration:
-                        pass
-
-    validate_grade_integrity(rows, grade_rows)
-
-    grade_rows.sort(
-        key=lambda row: (
-            str(row.get("model", "")),
-            int(row.get("run_index", 0) or 0),
-            str(row.get("question_id", "")),
+                        break
+
+                while in_flight:
+                    if drain.should_abandon():
+                        abandoned = True
+                        break
+                    for future in drain.wait(in_flight):
+                        source_row = in_flight.pop(future)
+                        try:
+                            grade_row = future.result()
+                        except Exception as exc:  # pylint: disable=broad-except
+                            grade_row = blank_grade_row(
+                                source_row, judge_model=args.judge_model, started_at=None
+                            )
+                            grade_row["judge_finished_at_utc"] = utc_now_iso()
+                            grade_row["error"] = f"Worker failure: {exc}"
+                        _finish_grade_row(grade_row, source_row)
+
+                        if drain.stopping:
+                            continue
+                        try:
+                            submit_grade_row(next(row_iter))
+                        except StopIteration:
+                            pass
+            finally:
+                pool.shutdown(wait=not abandoned, cancel_futures=True)
+            if drain.stopping:
+                raise RunInterrupted(
+                    f"grade interrupted by {RUN_INTERRUPT.signal_name or 'signal'}",
+                    outstanding_sample_ids=sorted(
+                        str(row.get("sample_id", "")) for row in in_flight.values()
+                    ),
+                )
+    except RunInterrupted as exc:
+        writer.append(
+            grade_events_path,
+            {
+                "timestamp_utc": utc_now_iso(),
+                "phase": "grade",
+                "event": "interrupted",
+                "grade_id": grade_id,
+                "signal": RUN_INTERRUPT.signal_name,
+                "completed_rows": completed,
+                "remaining_rows": total - completed,
+                "outstanding_sample_ids": exc.outstanding_sample_ids,
+            },
         )
-    )
-    write_jsonl(final_grades_path, grade_rows)
+        raise
+    finally:
+        RUN_INTERRUPT.disarm()
+        # Drain queued checkpoint/event rows even when the run is aborted.
+        writer.close()
+        raw_store.close()
+
+    # Stream the sorted partial file once: grades.jsonl, review.csv, the
+    # review.md body and summary stats are all produced in the same pass.
+    output_sample_ids: list[str] = []
+    source_rows_by_sample = {str(row.get("sample_id", "")).strip(): row for row in rows}
+    error_review_lines: list[str] = []
+    tmp_grades_path = final_grades_path.with_name(final_grades_path.name + ".tmp")
+    tmp_review_path = grade_dir / "review.csv.tmp"
+    with open_jsonl(
+        tmp_grades_path, "wb", compression=output_compression
+    ) as grades_handle, tmp_review_path.open(
+        "w", encoding="utf-8", newline=""
+    ) as review_handle, tempfile.TemporaryFile(
+        "w+", encoding="utf-8", dir=grade_dir
+    ) as ok_review_lines:
+        review_writer = csv.DictWriter(review_handle, fieldnames=GRADE_REVIEW_FIELDNAMES)
+        review_writer.writeheader()
+
+        def _finalized_rows() -> Iterator[dict[str, Any]]:
+            for row, line in iter_sorted_jsonl(
+                partial_grades_path,
+                sort_key=grade_row_sort_key,
+                max_memory_mb=getattr(args, "max_memory_mb", 256.0),
+            ):
+                # Checkpoint rows written under the other layout (e.g. an
+                # earlier run resumed with a different --artifact-layout) are
+                # re-encoded; everything else is copied through verbatim.
+                has_text = "response_text" in row
+                row = join_response_text(row, source_rows_by_sample)
+                if normalized_layout and has_text:
+                    line = (
+                        json.dumps(normalize_artifact_row(row), ensure_ascii=False) + "\n"
+                    ).encode("utf-8")
+                elif not normalized_layout and not has_text:
+                    line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+                grades_handle.write(line)
+                review_writer.writerow(grade_review_csv_row(row))
+                output_sample_ids.append(str(row.get("sample_id", "")).strip())
+                if local_prejudge:
+                    local_check.observe(row)
+                # review.md lists errors first; spill ok rows to disk meanwhile.
+                if row.get("error"):
+                    error_review_lines.append(grade_review_markdown_line(row))
+                else:
+                    ok_review_lines.write(grade_review_markdown_line(row) + "\n")
+                yield row
+
+        local_check = LocalPrejudgeCheck()
+        summary = summarize_grades(_finalized_rows())
+        if local_prejudge:
+            summary["local_prejudge"] = local_check.summary()
+        try:
+            validate_grade_integrity(rows, output_sample_ids)
+        except RuntimeError:
+            tmp_grades_path.unlink()
+            tmp_review_path.unlink()
+            raise
+        ok_review_lines.seek(0)
+        with (grade_dir / "review.md").open("w", encoding="utf-8") as review_md:
+            review_md.write("\n".join(GRADE_REVIEW_MARKDOWN_HEADER) + "\n")
+            for review_line in error_review_lines:
+                review_md.write(review_line + "\n")
+            shutil.copyfileobj(ok_review_lines, review_md)
+            review_md.write("\n")
+    os.replace(tmp_grades_path, final_grades_path)
+    remove_stale_jsonl_variants(final_grades_path)
+    os.replace(tmp_review_path, grade_dir / "review.csv")
 
-    summary = summarize_grades(grade_rows)
     summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
     summary["resumed"] = bool(args.resume)
-    summary["checkpoint_rows_at_start"] = len(checkpoint_rows)
+    summary["checkpoint_rows_at_start"] = len(checkpoint_ids)
+    summary["retried_rows"] = len(retry_selection)
+    summary["reused_rows"] = len(reused_grade_rows)
     summary["new_rows_processed"] = len(rows_to_grade)
     write_json(grade_dir / "summary.json", summary)
     summary_markdown = render_markdown_summary(grade_meta, summary)
     (grade_dir / "summary.md").write_text(summary_markdown, encoding="utf-8")
-    write_grade_review_csv(grade_dir / "review.csv", grade_rows)
-    (grade_dir / "review.md").write_text(
-        render_grade_review_markdown(grade_rows), encoding="utf-8"
+    store_jsonl_artifact(
+        str(getattr(args, "store_db", "") or ""),
+        "grades",
+        grade_dir,
+        rows_path=final_grades_path,
+        meta=grade_meta,
     )
 
     print("", flush=True)
     print(f"Grading complete in {summary['elapsed_seconds']}s", flush=True)
     print(f"Artifacts: {grade_dir}", flush=True)
     print(f"- {grade_dir / 'grade_meta.json'}", flush=True)
-    print(f"- {grade_dir / 'grades.jsonl'}", flush=True)
+    print(f"- {final_grades_path}", flush=True)
     print(f"- {partial_grades_path}", flush=True)
     print(f"- {grade_dir / 'summary.json'}", flush=True)
     print(f"- {grade_dir / 'summary.md'}", flush=True)
@@ -2908,6 +7737,7 @@ def _build_grade_args(
     judge_model: str,
     output_dir: pathlib.Path,
     grade_id: str,
+    judge_logprobs: bool = False,
 ) -> argparse.Namespace:
     return argparse.Namespace(
         command="grade",
@@ -2927,9 +7757,19 @@ def _build_grade_args(
         judge_system_prompt=panel_args.judge_system_prompt,
         judge_user_template_file=panel_args.judge_user_template_file,
         judge_no_hint=panel_args.judge_no_hint,
+        judge_logprobs=judge_logprobs,
+        judge_endpoint=getattr(panel_args, "judge_endpoint", ""),
+        judge_api_key=getattr(panel_args, "judge_api_key", ""),
         dry_run=panel_args.dry_run,
         resume=panel_args.resume,
         fail_on_error=panel_args.fail_on_error,
+        reuse_from=getattr(panel_args, "reuse_from", ""),
+        fsync=getattr(panel_args, "fsync", "never"),
+        drain_seconds=getattr(panel_args, "drain_seconds", 30.0),
+        max_memory_mb=getattr(panel_args, "max_memory_mb", 256.0),
+        artifact_layout=getattr(panel_args, "artifact_layout", "full"),
+        store_db=getattr(panel_args, "store_db", ""),
+        jsonl_compression=getattr(panel_args, "jsonl_compression", "none"),
         _skip_config_defaults=True,
         _raw_argv=getattr(panel_args, "_raw_argv", []),
     )
@@ -2942,6 +7782,7 @@ def _run_grade_for_panel(
     judge_model: str,
     output_dir: pathlib.Path,
     grade_id: str,
+    judge_logprobs: bool = False,
 ) -> pathlib.Path:
     # Only resume if the grade directory actually exists; otherwise fall back
     # to a fresh run (e.g. tiebreaker dir that was never created).
@@ -2954,6 +7795,7 @@ def _run_grade_for_panel(
         judge_model=judge_model,
         output_dir=output_dir,
         grade_id=grade_id,
+        judge_logprobs=judge_logprobs,
     )
     grade_args.resume = effective_resume
     exit_code = run_grade(grade_args)
@@ -2971,9 +7813,10 @@ def _run_primary_judges_for_panel(
     panel_dir: pathlib.Path,
     panel_id: str,
     primary_judges: list[str],
+    grade_id_suffix: str = "",
 ) -> list[pathlib.Path]:
     judge_specs = [
-        (idx, judge, f"{panel_id}__judge{idx}_{to_slug(judge)}")
+        (idx, judge, f"{panel_id}__judge{idx}_{to_slug(judge)}{grade_id_suffix}")
         for idx, judge in enumerate(primary_judges, start=1)
     ]
     if not bool(panel_args.parallel_primary_judges):
@@ -3016,8 +7859,8 @@ def _run_primary_judges_for_panel(
     return [ordered_dirs_by_idx[idx] for idx, _, _ in judge_specs]
 
 
-def _valid_judge_score(row: dict[str, Any] | None) -> int | None:
-    if not isinstance(row, dict):
+def _valid_judge_score(row: Mapping[str, Any] | None) -> int | None:
+    if not isinstance(row, Mapping):
         return None
     if row.get("error"):
         return None
@@ -3028,8 +7871,8 @@ def _valid_judge_score(row: dict[str, Any] | None) -> int | None:
 
 
 def _identify_disagreement_sample_ids(
-    first_rows_by_sample: dict[str, dict[str, Any]],
-    second_rows_by_sample: dict[str, dict[str, Any]],
+    first_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    second_rows_by_sample: Mapping[str, Mapping[str, Any]],
 ) -> set[str]:
     disagreements: set[str] = set()
     all_ids = set(first_rows_by_sample.keys()) | set(second_rows_by_sample.keys())
@@ -3044,13 +7887,220 @@ def _identify_disagreement_sample_ids(
     return disagreements
 
 
+def _select_tiebreak_calibration_ids(
+    disagreement_sample_ids: set[str], fraction: float
+) -> set[str]:
+    """Deterministic calibration sample of disagreements (stable across --resume)."""
+    if not disagreement_sample_ids or fraction <= 0:
+        return set()
+    count = min(
+        len(disagreement_sample_ids),
+        max(1, math.ceil(len(disagreement_sample_ids) * fraction)),
+    )
+    ranked = sorted(
+        disagreement_sample_ids,
+        key=lambda sample_id: hashlib.sha256(sample_id.encode("utf-8")).hexdigest(),
+    )
+    return set(ranked[:count])
+
+
+def _independent_judge_score(row: Mapping[str, Any] | None) -> int | None:
+    """Valid score of a row the judge actually graded (not a cascade copy)."""
+    if isinstance(row, Mapping) and row.get("judge_cascade_model"):
+        return None
+    return _valid_judge_score(row)
+
+
+def _resolve_disagreements_with_dawid_skene(
+    first_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    second_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    calibration_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    disagreement_sample_ids: set[str],
+    *,
+    confidence: float,
+) -> tuple[dict[str, tuple[int, float]], dict[str, Any]]:
+    """Disagreements the panel's Dawid-Skene posterior settles without a tiebreaker call.
+
+    With two judges alone the model cannot tell which one is wrong, so the
+    fit also takes the tiebreaker's scores on the calibration sample; the
+    agreeing rows still inform each primary's confusion pattern. The
+    threshold is checked first: each calibration grade is hidden in turn,
+    the model refitted, and the rows it would have settled must match the
+    tiebreaker at a rate >= `confidence`. Nothing is settled if the fit
+    does not converge or that check fails.
+
+    Returns (sample_id -> (score, posterior probability), validation) for
+    uncalibrated disagreements with both scores valid and a posterior >=
+    `confidence`; the settled score is always one of the two primaries'.
+    """
+    validation: dict[str, Any] = {
+        "converged": None,
+        "calibration_rows": 0,
+        "would_settle": 0,
+        "agreement": None,
+        "passed": False,
+    }
+    all_ids = sorted(set(first_rows_by_sample) | set(second_rows_by_sample))
+    units = {
+        sample_id: (
+            _independent_judge_score(first_rows_by_sample.get(sample_id)),
+            _independent_judge_score(second_rows_by_sample.get(sample_id)),
+            _valid_judge_score(calibration_rows_by_sample.get(sample_id)),
+        )
+        for sample_id in all_ids
+    }
+    calibration_ids = [
+        sample_id
+        for sample_id in sorted(disagreement_sample_ids & set(calibration_rows_by_sample))
+        if sample_id in units and None not in units[sample_id]
+    ]
+    validation["calibration_rows"] = len(calibration_ids)
+    if not calibration_ids:
+        return {}, validation
+    fit = fit_dawid_skene(units.values())
+    if fit is None:
+        return {}, validation
+    validation["converged"] = fit.converged
+    if not fit.converged:
+        return {}, validation
+
+    would_settle = 0
+    agreed = 0
+    for sample_id in calibration_ids:
+        unit = units[sample_id]
+        held_out = (unit[0], unit[1], None)
+        held_out_fit = fit_dawid_skene(
+            held_out if other_id == sample_id else other
+            for other_id, other in units.items()
+        )
+        if held_out_fit is None or not held_out_fit.converged:
+            continue
+        score, probability, _ = held_out_fit.consensus(held_out)
+        if score is None or probability is None or probability < confidence:
+            continue
+        would_settle += 1
+        agreed += score == unit[2]
+    validation["would_settle"] = would_settle
+    if would_settle:
+        validation["agreement"] = round(agreed / would_settle, 4)
+    validation["passed"] = bool(would_settle) and agreed / would_settle >= confidence
+    if not validation["passed"]:
+        return {}, validation
+
+    resolved: dict[str, tuple[int, float]] = {}
+    for sample_id in sorted(disagreement_sample_ids - set(calibration_rows_by_sample)):
+        unit = units.get(sample_id)
+        if unit is None or None in unit[:2]:
+            continue
+        score, probability, _ = fit.consensus(unit)
+        if score is not None and probability is not None and probability >= confidence:
+            resolved[sample_id] = (score, probability)
+    return resolved, validation
+
+
+def _cascade_score_confidence(row: Mapping[str, Any] | None) -> float | None:
+    if _valid_judge_score(row) is None:
+        return None
+    confidence = row.get("judge_score_confidence")  # type: ignore[union-attr]
+    return float(confidence) if isinstance(confidence, (int, float)) else None
+
+
+def _cascade_calibration_rows(aggregate_file: pathlib.Path) -> list[dict[str, Any]]:
+    """Response rows for the cascade judge rebuilt from a graded aggregate."""
+    rows: list[dict[str, Any]] = []
+    for aggregate_row in iter_jsonl(resolve_jsonl_path(aggregate_file)):
+        if not isinstance(aggregate_row.get("consensus_score"), int):
+            continue
+        if "response_text" not in aggregate_row:
+            raise ValueError(
+                f"{aggregate_file} has no response_text; --cascade-calibration-file "
+                "needs a full-layout aggregate."
+            )
+        row = {
+            key: aggregate_row[key]
+            for key in _ROW_IDENTITY_FIELDS
+            if key in aggregate_row and key not in {"error", "status"}
+        }
+        row["consensus_score"] = aggregate_row["consensus_score"]
+        rows.append(row)
+    return rows
+
+
+def calibrate_cascade_threshold(
+    pairs: Iterable[tuple[float, bool]],
+    *,
+    target_agreement: float,
+) -> dict[str, Any]:
+    """Lowest cascade confidence whose accepted rows still meet `target_agreement`.
+
+    `pairs` are (score confidence, cascade score == panel consensus). Rows at
+    or above a threshold are accepted, so the lowest qualifying threshold
+    accepts the most rows; it is None when no threshold qualifies.
+    """
+    ordered = sorted(pairs, key=lambda pair: -pair[0])
+    calibration: dict[str, Any] = {
+        "rows": len(ordered),
+        "target_agreement": target_agreement,
+        "threshold": None,
+        "accepted_rate": 0.0,
+        "agreement": None,
+    }
+    agreed = 0
+    index = 0
+    while index < len(ordered):
+        confidence = ordered[index][0]
+        while index < len(ordered) and ordered[index][0] == confidence:
+            agreed += ordered[index][1]
+            index += 1
+        if agreed / index >= target_agreement:
+            calibration["threshold"] = confidence
+            calibration["accepted_rate"] = round(index / len(ordered), 4)
+            calibration["agreement"] = round(agreed / index, 4)
+    return calibration
+
+
+def _build_cascade_primary_rows(
+    source_rows: list[dict[str, Any]],
+    *,
+    judge_model: str,
+    cascade_model: str,
+    cascade_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    accepted_sample_ids: set[str],
+    escalated_rows_by_sample: Mapping[str, Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """Full-coverage rows for a primary judge under the cascade.
+
+    Escalated samples keep the judge's own grade; accepted ones copy the
+    cascade judge's verdict and carry `judge_cascade_model`.
+    """
+    rows: list[dict[str, Any]] = []
+    for source_row in source_rows:
+        sample_id = str(source_row.get("sample_id", "")).strip()
+        if sample_id in accepted_sample_ids:
+            row = dict(cascade_rows_by_sample[sample_id])
+            row["judge_model"] = judge_model
+            row["judge_justification"] = (
+                f"Cascade row: accepted from {cascade_model} at score confidence "
+                f"{row['judge_score_confidence']:.4f}. {row.get('judge_justification', '')}"
+            ).strip()
+            row["judge_cascade_model"] = cascade_model
+        elif sample_id in escalated_rows_by_sample:
+            row = dict(escalated_rows_by_sample[sample_id])
+        else:
+            continue
+        row["status"] = "error" if row.get("error") else "ok"
+        rows.append(row)
+    return rows
+
+
 def _build_synthetic_tiebreak_rows(
     source_rows: list[dict[str, Any]],
     *,
     tiebreaker_model: str,
-    first_rows_by_sample: dict[str, dict[str, Any]],
-    second_rows_by_sample: dict[str, dict[str, Any]],
-    tiebreak_subset_rows_by_sample: dict[str, dict[str, Any]],
+    first_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    second_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    tiebreak_subset_rows_by_sample: Mapping[str, Mapping[str, Any]],
+    resolved_scores: Mapping[str, tuple[int, float]] | None = None,
 ) -> list[dict[str, Any]]:
     now = utc_now_iso()
     synthesized_rows: list[dict[str, Any]] = []
@@ -3077,6 +8127,12 @@ def _build_synthetic_tiebreak_rows(
                 synthetic_justification = (
                     "Synthetic tiebreaker row: copied because both primary judges agreed."
                 )
+            elif resolved_scores and sample_id in resolved_scores:
+                synthetic_score, probability = resolved_scores[sample_id]
+                synthetic_justification = (
+                    "Synthetic tiebreaker row: primary judges disagreed; Dawid-Skene "
+                    f"posterior {probability:.4f} for this score."
+                )
             else:
                 synthetic_error = (
                     "Synthetic tiebreaker row missing while primary judges disagreed."
@@ -3117,7 +8173,11 @@ def _build_synthetic_tiebreak_rows(
             "domain": source_row.get("domain"),
             "question": source_row.get("question"),
             "nonsensical_element": source_row.get("nonsensical_element"),
+            **sampling_fields(source_row),
             "response_text": source_row.get("response_text", ""),
+            "response_sha256": response_text_sha256(
+                source_row.get("response_text", "")
+            ),
             "source_response_error": source_row.get("error", ""),
             "judge_model": tiebreaker_model,
             "judge_score": synthetic_score,
@@ -3149,15 +8209,60 @@ def _build_synthetic_tiebreak_rows(
     return synthesized_rows
 
 
+def _synthetic_grade_meta(
+    args: argparse.Namespace,
+    *,
+    grade_id: str,
+    responses_file: pathlib.Path,
+    response_record_count: int,
+    judge_model: str,
+) -> dict[str, Any]:
+    return {
+        "phase": "grade",
+        "grade_id": grade_id,
+        "timestamp_utc": utc_now_iso(),
+        "responses_file": str(responses_file.resolve()),
+        "response_record_count": response_record_count,
+        "judge_model": judge_model,
+        "judge_system_prompt": args.judge_system_prompt,
+        "judge_user_template_file": args.judge_user_template_file or None,
+        "judge_response_format": pick_judge_response_format(judge_model),
+        "parallelism": 0,
+        "judge_temperature": args.judge_temperature,
+        "judge_max_tokens": args.judge_max_tokens,
+        "store_judge_response_raw": bool(args.store_judge_response_raw),
+        "judge_reasoning_effort": args.judge_reasoning_effort,
+        "retries": args.retries,
+        "timeout_seconds": args.timeout_seconds,
+        "dry_run": bool(args.dry_run),
+        "judge_no_hint": bool(args.judge_no_hint),
+        "fail_on_error": bool(args.fail_on_error),
+        "config_path": str(pathlib.Path(args.config).resolve()),
+        "artifact_layout": getattr(args, "artifact_layout", "full"),
+        "jsonl_compression": getattr(args, "jsonl_compression", "none"),
+    }
+
+
 def _write_tiebreak_full_grade_artifacts(
     *,
     grade_dir: pathlib.Path,
     grade_meta: dict[str, Any],
     grade_rows: list[dict[str, Any]],
+    store_db: str = "",
+    event: str = "synthetic_tiebreak_complete",
 ) -> None:
     grade_dir.mkdir(parents=True, exist_ok=False)
     write_json(grade_dir / "grade_meta.json", grade_meta)
-    write_jsonl(grade_dir / "grades.jsonl", grade_rows)
+    compression = jsonl_output_compression(argparse.Namespace(**grade_meta))
+    grades_path = final_jsonl_path(grade_dir, "grades.jsonl", compression)
+    if grade_meta.get("artifact_layout") == "normalized":
+        write_jsonl(
+            grades_path,
+            [normalize_artifact_row(row) for row in grade_rows],
+            compression=compression,
+        )
+    else:
+        write_jsonl(grades_path, grade_rows, compression=compression)
     summary = summarize_grades(grade_rows)
     summary["elapsed_seconds"] = 0.0
     write_json(grade_dir / "summary.json", summary)
@@ -3175,10 +8280,17 @@ def _write_tiebreak_full_grade_artifacts(
         {
             "timestamp_utc": utc_now_iso(),
             "phase": "grade",
-            "event": "synthetic_tiebreak_complete",
+            "event": event,
             "rows": len(grade_rows),
         },
     )
+    store_jsonl_artifact(
+        store_db,
+        "grades",
+        grade_dir,
+        rows_path=grades_path,
+        meta=grade_meta,
+    )
 
 
 def _render_grade_panel_summary_markdown(summary: dict[str, Any]) -> str:
@@ -3202,6 +8314,39 @@ def _render_grade_panel_summary_markdown(summary: dict[str, Any]) -> str:
     lines.append(f"- Tiebreaker judge: `{summary.get('tiebreaker_model') or 'none'}`")
     lines.append(f"- Disagreement rows: `{summary['disagreement_count']}`")
     lines.append(f"- Disagreement rate: `{summary['disagreement_rate']}`")
+    if summary.get("tiebreak_policy") == "dawid_skene":
+        lines.append(
+            f"- Settled by Dawid-Skene posterior: `{summary['dawid_skene_resolved_count']}`"
+        )
+        validation = summary.get("dawid_skene_validation")
+        if validation and validation.get("converged") is not None:
+            lines.append(
+                f"- Leave-one-out check: `{validation['would_settle']}` of "
+                f"`{validation['calibration_rows']}` calibration rows settled, agreement "
+                f"`{'n/a' if validation['agreement'] is None else validation['agreement']}` "
+                f"({'passed' if validation['passed'] else 'failed'}"
+                f"{'' if validation['converged'] else ', fit did not converge'})"
+            )
+        lines.append(f"- Sent to tiebreaker: `{summary['tiebreak_count']}`")
+    cascade = summary.get("cascade")
+    if cascade:
+        lines.append(f"- Cascade judge: `{cascade['judge']}`")
+        lines.append(f"- Cascade confidence threshold: `{cascade['confidence_threshold']}`")
+        lines.append(
+            f"- Accepted by cascade: `{cascade['accepted_count']}` "
+            f"(rate `{cascade['accepted_rate']}`); escalated: `{cascade['escalated_count']}`"
+        )
+        calibration = cascade.get("calibration")
+        if calibration:
+            lines.append(
+                f"- Calibrated agreement of accepted rows with panel consensus: "
+                f"`{calibration['agreement']}` on `{calibration['rows']}` rows "
+                f"(target `{calibration['target_agreement']}`)"
+            )
+        lines.append(
+            f"- Cascade agreement with panel consensus on escalated rows: "
+            f"`{cascade.get('escalated_consensus_agreement')}`"
+        )
     lines.append("")
     lines.append("## Artifacts")
     lines.append("")
@@ -3364,6 +8509,24 @@ def run_grade_panel(args: argparse.Namespace) -> int:
         )
     if tiebreaker_model and tiebreaker_model in primary_judges:
         raise ValueError("tiebreaker model must be different from primary judge models.")
+    tiebreak_policy = getattr(args, "tiebreak_policy", "disagreement")
+    if tiebreak_policy not in TIEBREAK_POLICIES:
+        raise ValueError(f"--tiebreak-policy must be one of: {', '.join(TIEBREAK_POLICIES)}")
+    tiebreak_confidence = float(getattr(args, "tiebreak_confidence", 0.9))
+    if not 0.0 < tiebreak_confidence <= 1.0:
+        raise ValueError("--tiebreak-confidence must be in (0, 1].")
+    tiebreak_calibration_fraction = float(getattr(args, "tiebreak_calibration_fraction", 0.2))
+    if not 0.0 < tiebreak_calibration_fraction <= 1.0:
+        raise ValueError("--tiebreak-calibration-fraction must be in (0, 1].")
+    cascade_judge = str(getattr(args, "cascade_judge", "") or "").strip()
+    cascade_confidence = float(getattr(args, "cascade_confidence", 0.9))
+    cascade_target_agreement = float(getattr(args, "cascade_target_agreement", 0.95))
+    if cascade_judge and cascade_judge in primary_judges:
+        raise ValueError("cascade judge must be different from primary judge models.")
+    if not 0.0 < cascade_confidence <= 1.0:
+        raise ValueError("--cascade-confidence must be in (0, 1].")
+    if not 0.0 < cascade_target_agreement <= 1.0:
+        raise ValueError("--cascade-target-agreement must be in (0, 1].")
 
     timestamp = dt.datetime.now(dt.UTC)
     panel_seed_id = args.panel_id.strip() or timestamp.strftime("%Y%m%d_%H%M%S")
@@ -3376,24 +8539,216 @@ def run_grade_panel(args: argparse.Namespace) -> int:
         resume=bool(args.resume),
     )
 
-    primary_grade_dirs = _run_primary_judges_for_panel(
-        args,
-        responses_file=responses_file,
-        panel_dir=panel_dir,
-        panel_id=panel_id,
-        primary_judges=primary_judges,
-    )
+    cascade_summary: dict[str, Any] | None = None
+    if cascade_judge:
+        cascade_calibration: dict[str, Any] | None = None
+        cascade_calibration_file = str(getattr(args, "cascade_calibration_file", "") or "").strip()
+        if cascade_calibration_file:
+            calibration_rows = _cascade_calibration_rows(pathlib.Path(cascade_calibration_file))
+            calibration_responses_file = panel_dir / "cascade_calibration_responses.jsonl"
+            write_jsonl(calibration_responses_file, calibration_rows)
+            calibration_grade_dir = _run_grade_for_panel(
+                args,
+                responses_file=calibration_responses_file,
+                judge_model=cascade_judge,
+                output_dir=panel_dir,
+                grade_id=f"{panel_id}__cascade_calibration_{to_slug(cascade_judge)}",
+                judge_logprobs=True,
+            )
+            calibration_grades = load_grade_dir(str(calibration_grade_dir))["rows_by_sample"]
+            calibration_pairs: list[tuple[float, bool]] = []
+            for row in calibration_rows:
+                grade_row = calibration_grades.get(str(row.get("sample_id", "")).strip())
+                confidence = _cascade_score_confidence(grade_row)
+                if confidence is not None:
+                    calibration_pairs.append(
+                        (confidence, grade_row["judge_score"] == row["consensus_score"])
+                    )
+            cascade_calibration = calibrate_cascade_threshold(
+                calibration_pairs, target_agreement=cascade_target_agreement
+            )
+            cascade_calibration["file"] = str(pathlib.Path(cascade_calibration_file).resolve())
+            cascade_calibration["grade_dir"] = str(calibration_grade_dir.resolve())
+            print(
+                f"Cascade calibration on {cascade_calibration['rows']} row(s): threshold "
+                f"{cascade_calibration['threshold']} accepts {cascade_calibration['accepted_rate']} "
+                f"at agreement {cascade_calibration['agreement']}.",
+                flush=True,
+            )
+            cascade_confidence = cascade_calibration["threshold"]
+
+        cascade_grade_dir = _run_grade_for_panel(
+            args,
+            responses_file=responses_file,
+            judge_model=cascade_judge,
+            output_dir=panel_dir,
+            grade_id=f"{panel_id}__cascade_{to_slug(cascade_judge)}",
+            judge_logprobs=True,
+        )
+        cascade_rows_by_sample = load_grade_dir(str(cascade_grade_dir))["rows_by_sample"]
+        accepted_sample_ids: set[str] = set()
+        if cascade_confidence is not None:
+            for sample_id, row in cascade_rows_by_sample.items():
+                confidence = _cascade_score_confidence(row)
+                if confidence is not None and confidence >= cascade_confidence:
+                    accepted_sample_ids.add(sample_id)
+        escalated_rows = [
+            row
+            for row in source_rows
+            if str(row.get("sample_id", "")).strip() not in accepted_sample_ids
+        ]
+        escalated_file = panel_dir / "cascade_escalated_responses.jsonl"
+        write_jsonl(escalated_file, escalated_rows)
+        print(
+            f"Cascade judge accepted {len(accepted_sample_ids)} of {len(source_rows)} row(s) "
+            f"at confidence >= {cascade_confidence}; {len(escalated_rows)} escalated.",
+            flush=True,
+        )
+
+        escalated_grade_dirs: list[pathlib.Path] = []
+        if escalated_rows:
+            escalated_grade_dirs = _run_primary_judges_for_panel(
+                args,
+                responses_file=escalated_file,
+                panel_dir=panel_dir,
+                panel_id=panel_id,
+                primary_judges=primary_judges,
+                grade_id_suffix="__escalated",
+            )
+        source_rows_by_sample = {
+            str(row.get("sample_id", "")).strip(): row for row in source_rows
+        }
+        primary_grade_dirs = []
+        for idx, judge in enumerate(primary_judges, start=1):
+            escalated_rows_by_sample = (
+                load_grade_dir(str(escalated_grade_dirs[idx - 1]))["rows_by_sample"]
+                if escalated_grade_dirs
+                else {}
+            )
+            judge_rows = _build_cascade_primary_rows(
+                source_rows,
+                judge_model=judge,
+                cascade_model=cascade_judge,
+                cascade_rows_by_sample=cascade_rows_by_sample,
+                accepted_sample_ids=accepted_sample_ids,
+                escalated_rows_by_sample=escalated_rows_by_sample,
+            )
+            judge_rows = [join_response_text(row, source_rows_by_sample) for row in judge_rows]
+            grade_id = f"{panel_id}__judge{idx}_{to_slug(judge)}"
+            grade_dir = panel_dir / "grades" / grade_id
+            if args.resume and grade_dir.exists():
+                shutil.rmtree(grade_dir)
+            judge_meta = _synthetic_grade_meta(
+                args,
+                grade_id=grade_id,
+                responses_file=responses_file,
+                response_record_count=len(source_rows),
+                judge_model=judge,
+            )
+            judge_meta.update({
+                "synthetic_cascade_primary": True,
+                "cascade_judge": cascade_judge,
+                "source_cascade_grade_dir": str(cascade_grade_dir.resolve()),
+                "source_escalated_grade_dir": str(escalated_grade_dirs[idx - 1].resolve())
+                if escalated_grade_dirs
+                else None,
+                "cascade_accepted_count": len(accepted_sample_ids),
+            })
+            _write_tiebreak_full_grade_artifacts(
+                grade_dir=grade_dir,
+                grade_meta=judge_meta,
+                grade_rows=judge_rows,
+                store_db=getattr(args, "store_db", ""),
+                event="synthetic_cascade_complete",
+            )
+            primary_grade_dirs.append(grade_dir)
+
+        cascade_summary = {
+            "judge": cascade_judge,
+            "grade_dir": str(cascade_grade_dir.resolve()),
+            "confidence_threshold": cascade_confidence,
+            "calibration": cascade_calibration,
+            "accepted_count": len(accepted_sample_ids),
+            "escalated_count": len(escalated_rows),
+            "accepted_rate": round(len(accepted_sample_ids) / max(1, len(source_rows)), 4),
+            "escalated_file": str(escalated_file.resolve()),
+        }
+    else:
+        primary_grade_dirs = _run_primary_judges_for_panel(
+            args,
+            responses_file=responses_file,
+            panel_dir=panel_dir,
+            panel_id=panel_id,
+            primary_judges=primary_judges,
+        )
 
     first_set = load_grade_dir(str(primary_grade_dirs[0]))
     second_set = load_grade_dir(str(primary_grade_dirs[1]))
     disagreement_sample_ids = _identify_disagreement_sample_ids(
         first_set["rows_by_sample"], second_set["rows_by_sample"]
     )
+    disagreement_count = sum(
+        1 for row in source_rows if str(row.get("sample_id", "")) in disagreement_sample_ids
+    )
+    resolved_scores: dict[str, tuple[int, float]] = {}
+    dawid_skene_validation: dict[str, Any] | None = None
+    calibration_rows_by_sample: dict[str, Mapping[str, Any]] = {}
+    tiebreak_calibration_grade_dir: pathlib.Path | None = None
+    if tiebreak_policy == "dawid_skene" and tiebreaker_model:
+        calibration_ids = _select_tiebreak_calibration_ids(
+            disagreement_sample_ids, tiebreak_calibration_fraction
+        )
+        calibration_rows = [
+            row for row in source_rows if str(row.get("sample_id", "")) in calibration_ids
+        ]
+        if calibration_rows:
+            calibration_file = panel_dir / "tiebreak_calibration_responses.jsonl"
+            write_jsonl(calibration_file, calibration_rows)
+            tiebreak_calibration_grade_dir = _run_grade_for_panel(
+                args,
+                responses_file=calibration_file,
+                judge_model=tiebreaker_model,
+                output_dir=panel_dir,
+                grade_id=f"{panel_id}__tiebreak_calibration_{to_slug(tiebreaker_model)}",
+            )
+            calibration_rows_by_sample = dict(
+                load_grade_dir(str(tiebreak_calibration_grade_dir))["rows_by_sample"]
+            )
+        resolved_scores, dawid_skene_validation = _resolve_disagreements_with_dawid_skene(
+            first_set["rows_by_sample"],
+            second_set["rows_by_sample"],
+            calibration_rows_by_sample,
+            disagreement_sample_ids,
+            confidence=tiebreak_confidence,
+        )
+        print(
+            f"Dawid-Skene settled {len(resolved_scores)} of {len(disagreement_sample_ids)} "
+            f"primary disagreement(s) at posterior >= {tiebreak_confidence} "
+            f"({len(calibration_rows_by_sample)} graded for calibration).",
+            flush=True,
+        )
+        if dawid_skene_validation["converged"] is False:
+            print(
+                "Warning: Dawid-Skene fit did not converge; every disagreement goes to "
+                "the tiebreaker.",
+                file=sys.stderr,
+            )
+        elif dawid_skene_validation["converged"] and not dawid_skene_validation["passed"]:
+            print(
+                f"Warning: leave-one-out check on the calibration grades failed "
+                f"({dawid_skene_validation['would_settle']} would settle, agreement "
+                f"{dawid_skene_validation['agreement']}); every disagreement goes to "
+                "the tiebreaker.",
+                file=sys.stderr,
+            )
 
+    # Rows still needing the tiebreaker: disagreements not calibrated or settled.
     disagreement_rows = [
         row
         for row in source_rows
         if str(row.get("sample_id", "")) in disagreement_sample_ids
+        and str(row.get("sample_id", "")) not in resolved_scores
+        and str(row.get("sample_id", "")) not in calibration_rows_by_sample
     ]
 
     disagreement_file = panel_dir / "disagreement_responses.jsonl"
@@ -3402,7 +8757,9 @@ def run_grade_panel(args: argparse.Namespace) -> int:
     tiebreaker_full_grade_dir: pathlib.Path | None = None
     grade_dirs_for_aggregate: list[pathlib.Path] = list(primary_grade_dirs)
     if tiebreaker_model:
-        tiebreak_subset_grade_rows_by_sample: dict[str, dict[str, Any]] = {}
+        tiebreak_subset_grade_rows_by_sample: dict[str, Mapping[str, Any]] = dict(
+            calibration_rows_by_sample
+        )
         tiebreak_subset_grade_dir: pathlib.Path | None = None
         if disagreement_rows:
             tiebreak_subset_grade_id = (
@@ -3416,7 +8773,7 @@ def run_grade_panel(args: argparse.Namespace) -> int:
                 grade_id=tiebreak_subset_grade_id,
             )
             tiebreak_subset_set = load_grade_dir(str(tiebreak_subset_grade_dir))
-            tiebreak_subset_grade_rows_by_sample = tiebreak_subset_set["rows_by_sample"]
+            tiebreak_subset_grade_rows_by_sample.update(tiebreak_subset_set["rows_by_sample"])
 
         tiebreak_full_grade_rows = _build_synthetic_tiebreak_rows(
             source_rows,
@@ -3424,43 +8781,46 @@ def run_grade_panel(args: argparse.Namespace) -> int:
             first_rows_by_sample=first_set["rows_by_sample"],
             second_rows_by_sample=second_set["rows_by_sample"],
             tiebreak_subset_rows_by_sample=tiebreak_subset_grade_rows_by_sample,
+            resolved_scores=resolved_scores,
         )
+        # Subset rows may be normalized; the review files still show text.
+        source_rows_by_sample = {
+            str(row.get("sample_id", "")).strip(): row for row in source_rows
+        }
+        tiebreak_full_grade_rows = [
+            join_response_text(row, source_rows_by_sample) for row in tiebreak_full_grade_rows
+        ]
         tiebreak_full_grade_id = f"{panel_id}__tiebreak_full_{to_slug(tiebreaker_model)}"
         tiebreaker_full_grade_dir = panel_dir / "grades" / tiebreak_full_grade_id
         if args.resume and tiebreaker_full_grade_dir.exists():
             shutil.rmtree(tiebreaker_full_grade_dir)
-        tiebreak_meta = {
-            "phase": "grade",
-            "grade_id": tiebreak_full_grade_id,
-            "timestamp_utc": utc_now_iso(),
-            "responses_file": str(responses_file.resolve()),
-            "response_record_count": len(source_rows),
-            "judge_model": tiebreaker_model,
-            "judge_system_prompt": args.judge_system_prompt,
-            "judge_user_template_file": args.judge_user_template_file or None,
-            "judge_response_format": pick_judge_response_format(tiebreaker_model),
-            "parallelism": 0,
-            "judge_temperature": args.judge_temperature,
-            "judge_max_tokens": args.judge_max_tokens,
-            "store_judge_response_raw": bool(args.store_judge_response_raw),
-            "judge_reasoning_effort": args.judge_reasoning_effort,
-            "retries": args.retries,
-            "timeout_seconds": args.timeout_seconds,
-            "dry_run": bool(args.dry_run),
-            "judge_no_hint": bool(args.judge_no_hint),
-            "fail_on_error": bool(args.fail_on_error),
-            "config_path": str(pathlib.Path(args.config).resolve()),
+        tiebreak_meta = _synthetic_grade_meta(
+            args,
+            grade_id=tiebreak_full_grade_id,
+            responses_file=responses_file,
+            response_record_count=len(source_rows),
+            judge_model=tiebreaker_model,
+        )
+        tiebreak_meta.update({
             "synthetic_tiebreaker_full": True,
             "source_primary_grade_dirs": [str(p.resolve()) for p in primary_grade_dirs],
             "source_tiebreak_subset_grade_dir": str(tiebreak_subset_grade_dir.resolve())
             if tiebreak_subset_grade_dir
             else None,
-            "disagreement_count": len(disagreement_rows),
-        }
+            "source_tiebreak_calibration_grade_dir": str(
+                tiebreak_calibration_grade_dir.resolve()
+            )
+            if tiebreak_calibration_grade_dir
+            else None,
+            "disagreement_count": disagreement_count,
+            "tiebreak_policy": tiebreak_policy,
+            "dawid_skene_resolved_count": len(resolved_scores),
+        })
         _write_tiebreak_full_grade_artifacts(
             grade_dir=tiebreaker_full_grade_dir,
             grade_meta=tiebreak_meta,
             grade_rows=tiebreak_full_grade_rows,
+            store_db=getattr(args, "store_db", ""),
         )
         grade_dirs_for_aggregate.append(tiebreaker_full_grade_dir)
 
@@ -3477,6 +8837,13 @@ def run_grade_panel(args: argparse.Namespace) -> int:
         aggregate_id=aggregate_id,
         config=args.config,
         fail_on_error=args.fail_on_error,
+        fsync=getattr(args, "fsync", "never"),
+        artifact_layout=getattr(args, "artifact_layout", "full"),
+        store_db=getattr(args, "store_db", ""),
+        jsonl_compression=getattr(args, "jsonl_compression", "none"),
+        bootstrap_samples=getattr(args, "bootstrap_samples", 0),
+        bootstrap_seed=getattr(args, "bootstrap_seed", 0),
+        bootstrap_workers=getattr(args, "bootstrap_workers", 1),
         _skip_config_defaults=True,
         _raw_argv=getattr(args, "_raw_argv", []),
     )
@@ -3484,6 +8851,27 @@ def run_grade_panel(args: argparse.Namespace) -> int:
     if aggregate_exit_code != 0 and args.fail_on_error:
         raise RuntimeError(f"Aggregate failed with exit code={aggregate_exit_code}")
 
+    if cascade_summary is not None:
+        # How often the cascade verdict matches the panel where the panel ran.
+        escalated_scored = 0
+        escalated_agreed = 0
+        aggregate_rows_path = resolve_jsonl_path(aggregate_dir_path / "aggregate.jsonl")
+        if aggregate_rows_path.exists():
+            for row in iter_jsonl(aggregate_rows_path):
+                sample_id = str(row.get("sample_id", "")).strip()
+                cascade_score = _valid_judge_score(cascade_rows_by_sample.get(sample_id))
+                if (
+                    sample_id in accepted_sample_ids
+                    or cascade_score is None
+                    or not isinstance(row.get("consensus_score"), int)
+                ):
+                    continue
+                escalated_scored += 1
+                escalated_agreed += cascade_score == row["consensus_score"]
+        cascade_summary["escalated_consensus_agreement"] = (
+            round(escalated_agreed / escalated_scored, 4) if escalated_scored else None
+        )
+
     disagreement_denominator = max(1, len(source_rows))
     panel_summary = {
         "panel_id": panel_id,
@@ -3502,9 +8890,16 @@ def run_grade_panel(args: argparse.Namespace) -> int:
         if tiebreaker_full_grade_dir
         else None,
         "aggregate_dir": str((panel_dir / "aggregates" / aggregate_id).resolve()),
-        "disagreement_count": len(disagreement_rows),
-        "disagreement_rate": round(len(disagreement_rows) / disagreement_denominator, 4),
+        "disagreement_count": disagreement_count,
+        "disagreement_rate": round(disagreement_count / disagreement_denominator, 4),
         "disagreement_file": str(disagreement_file.resolve()),
+        "tiebreak_policy": tiebreak_policy,
+        "tiebreak_count": len(disagreement_rows) + len(calibration_rows_by_sample)
+        if tiebreaker_model
+        else 0,
+        "dawid_skene_resolved_count": len(resolved_scores),
+        "dawid_skene_validation": dawid_skene_validation,
+        "cascade": cascade_summary,
         "consensus_method": aggregate_consensus_method,
         "fail_on_error": bool(args.fail_on_error),
     }
@@ -3523,22 +8918,28 @@ def run_grade_panel(args: argparse.Namespace) -> int:
     return 0 if aggregate_exit_code == 0 else aggregate_exit_code
 
 
-def load_grade_dir(path: str) -> dict[str, Any]:
+def load_grade_dir(path: str, *, store: ArtifactStore | None = None) -> dict[str, Any]:
     grade_dir = pathlib.Path(path).resolve()
     meta_path = grade_dir / "grade_meta.json"
-    grades_path = grade_dir / "grades.jsonl"
-    if not meta_path.exists():
-        raise FileNotFoundError(f"Missing grade_meta.json in {grade_dir}")
-    if not grades_path.exists():
-        raise FileNotFoundError(f"Missing grades.jsonl in {grade_dir}")
-
-    with meta_path.open("r", encoding="utf-8") as handle:
-        meta = json.load(handle)
+    grades_path = resolve_jsonl_path(grade_dir / "grades.jsonl")
+    rows: list[RowRecord]
+    if store is not None and store_artifact_is_current(
+        store, "grades", grade_dir, rows_path=grades_path
+    ):
+        meta = store.artifact_meta(grade_dir)
+        rows = [GradeRow.from_dict(row) for row in store.iter_rows("grades", grade_dir)]
+    else:
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Missing grade_meta.json in {grade_dir}")
+        if not grades_path.exists():
+            raise FileNotFoundError(f"Missing grades.jsonl in {grade_dir}")
+        with meta_path.open("r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+        rows = read_row_records(grades_path, GradeRow)
     if not isinstance(meta, dict):
         raise ValueError(f"grade_meta.json must be an object: {meta_path}")
 
-    rows = read_jsonl(grades_path)
-    rows_by_sample: dict[str, dict[str, Any]] = {}
+    rows_by_sample: dict[str, RowRecord] = {}
     for row in rows:
         sample_id = str(row.get("sample_id", "")).strip()
         if not sample_id:
@@ -3552,6 +8953,7 @@ def load_grade_dir(path: str) -> dict[str, Any]:
         "meta": meta,
         "rows": rows,
         "rows_by_sample": rows_by_sample,
+        "artifact_layout": str(meta.get("artifact_layout", "full")),
         "judge_model": str(meta.get("judge_model", "")),
         "grade_id": str(meta.get("grade_id", grade_dir.name)),
     }
@@ -3601,6 +9003,7 @@ def align_grade_rows(grade_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if not source_rows:
             continue
         base = source_rows[0]
+        base_hash = row_response_sha256(base)
         row_errors: list[str] = []
         row_identity_mismatch = False
         for candidate in source_rows[1:]:
@@ -3613,7 +9016,6 @@ def align_grade_rows(grade_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
                 "model_row",
                 "run_index",
                 "question_id",
-                "response_text",
             ):
                 if candidate.get(field) != base.get(field):
                     row_identity_mismatch = True
@@ -3621,6 +9023,15 @@ def align_grade_rows(grade_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
                         f"Field mismatch across judges for {field}: "
                         f"{candidate.get(field)!r} vs {base.get(field)!r}"
                     )
+            # Compare response content by hash so normalized rows (no text)
+            # align with each other and with older full rows.
+            candidate_hash = row_response_sha256(candidate)
+            if candidate_hash != base_hash:
+                row_identity_mismatch = True
+                row_errors.append(
+                    "Field mismatch across judges for response_sha256: "
+                    f"{candidate_hash!r} vs {base_hash!r}"
+                )
 
         aligned_row: dict[str, Any] = {
             "sample_id": sample_id,
@@ -3641,10 +9052,15 @@ def align_grade_rows(grade_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
             "domain": base.get("domain"),
             "question": base.get("question"),
             "nonsensical_element": base.get("nonsensical_element"),
+            **sampling_fields(base),
             "response_text": base.get("response_text", ""),
+            "response_sha256": base_hash,
             "row_identity_mismatch": row_identity_mismatch,
             "row_errors": row_errors,
         }
+        if "response_text" not in base:
+            # Normalized grade rows: text is joined (or left out) by the caller.
+            aligned_row = normalize_artifact_row(aligned_row)
 
         for idx, grade_set in enumerate(grade_sets, start=1):
             judge_row = grade_set["rows_by_sample"].get(sample_id)
@@ -3667,6 +9083,15 @@ def align_grade_rows(grade_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
                 aligned_row[f"{prefix}_status"] = (
                     "error" if judge_row.get("error") else "ok"
                 )
+                if judge_row.get("judge_cascade_model"):
+                    aligned_row[f"{prefix}_cascade_model"] = judge_row["judge_cascade_model"]
+                elif judge_row.get("judge_parse_mode") == "local_prejudge":
+                    aligned_row[f"{prefix}_local_prejudge"] = True
+                elif judge_row.get("judge_params_hash") and not judge_row.get(
+                    "synthetic_tiebreaker_row"
+                ):
+                    # Lets --reuse-from take grades from published aggregates.
+                    aligned_row[f"{prefix}_params_hash"] = judge_row["judge_params_hash"]
                 if judge_row.get("error"):
                     row_errors.append(
                         f"Judge row error from {grade_set['path']}: {judge_row.get('error')}"
@@ -3735,6 +9160,231 @@ def compute_primary_tiebreak_consensus(
     return None, "no_valid_scores"
 
 
+def consensus_judge_scores(row: Mapping[str, Any], num_judges: int) -> tuple[int | None, ...]:
+    """Per-judge valid scores for model-based consensus (None = missing/errored).
+
+    Cascade-copied cells (`judge_N_cascade_model`) count as missing: they
+    repeat the cascade judge's one verdict, not independent primary grades.
+    """
+    if row.get("row_identity_mismatch"):
+        return (None,) * num_judges
+    scores: list[int | None] = []
+    for idx in range(1, num_judges + 1):
+        score = row.get(f"judge_{idx}_score")
+        error = row.get(f"judge_{idx}_error")
+        cascade = row.get(f"judge_{idx}_cascade_model")
+        scores.append(score if not error and not cascade and isinstance(score, int) else None)
+    return tuple(scores)
+
+
+def cascade_copy_score(row: Mapping[str, Any], num_judges: int) -> int | None:
+    """The cascade judge's accepted score carried by this row, if any."""
+    if row.get("row_identity_mismatch"):
+        return None
+    for idx in range(1, num_judges + 1):
+        score = row.get(f"judge_{idx}_score")
+        if (
+            row.get(f"judge_{idx}_cascade_model")
+            and not row.get(f"judge_{idx}_error")
+            and isinstance(score, int)
+        ):
+            return score
+    return None
+
+
+@dataclasses.dataclass(slots=True)
+class DawidSkeneFit:
+    """Fitted Dawid-Skene model over a fixed set of judges.
+
+    `confusions[j][k][l]` is the probability that judge j reports class
+    `classes[l]` when the true class is `classes[k]`.
+    """
+
+    classes: list[int]
+    priors: list[float]
+    confusions: list[list[list[float]]]
+    iterations: int
+    converged: bool
+    log_likelihood: float
+    posteriors: dict[tuple[int | None, ...], list[float]]
+
+    def posterior(self, scores: tuple[int | None, ...]) -> list[float] | None:
+        return self.posteriors.get(scores)
+
+    def consensus(self, scores: tuple[int | None, ...]) -> tuple[int | None, float | None, str | None]:
+        """(MAP score among the scores the judges gave, its posterior probability, error).
+
+        The consensus never invents a score no judge reported, which an
+        unidentified fit (e.g. two judges) would otherwise do.
+        """
+        posterior = self.posterior(scores)
+        if posterior is None:
+            return None, None, "no_valid_scores"
+        observed = {score for score in scores if score is not None}
+        candidates = [k for k, value in enumerate(self.classes) if value in observed]
+        best = max(candidates, key=lambda k: (posterior[k], -k))
+        return self.classes[best], posterior[best], None
+
+    def judge_accuracies(self) -> list[float]:
+        return [
+            sum(self.priors[k] * confusion[k][k] for k in range(len(self.classes)))
+            for confusion in self.confusions
+        ]
+
+    def summary(self, judge_models: list[str] | None = None) -> dict[str, Any]:
+        judges: list[dict[str, Any]] = []
+        for idx, (confusion, accuracy) in enumerate(
+            zip(self.confusions, self.judge_accuracies()), start=1
+        ):
+            judges.append(
+                {
+                    "judge": idx,
+                    "judge_model": judge_models[idx - 1] if judge_models else None,
+                    "accuracy": round(accuracy, 4),
+                    "confusion": {
+                        str(true_class): {
+                            str(observed): round(probability, 4)
+                            for observed, probability in zip(self.classes, confusion[k])
+                        }
+                        for k, true_class in enumerate(self.classes)
+                    },
+                }
+            )
+        return {
+            "classes": self.classes,
+            "class_priors": {
+                str(value): round(prior, 4) for value, prior in zip(self.classes, self.priors)
+            },
+            "judges": judges,
+            "iterations": self.iterations,
+            "converged": self.converged,
+            "log_likelihood": round(self.log_likelihood, 4),
+        }
+
+
+def fit_dawid_skene(
+    units: Iterable[tuple[int | None, ...]],
+    *,
+    max_iterations: int = 1000,
+    tolerance: float = 1e-8,
+    smoothing: float = 1.0,
+    prior_smoothing: float = 1.0,
+) -> DawidSkeneFit | None:
+    """Fit per-judge confusion matrices and class priors by EM.
+
+    Units are per-judge score tuples. EM runs over the distinct tuples
+    weighted by frequency, which is the same likelihood as iterating the
+    rows, so its cost does not grow with the number of rows. Initialised
+    from per-unit vote shares; `smoothing` is a pseudo-count that keeps
+    unseen (judge, class, score) cells away from zero, and `prior_smoothing`
+    is the Dirichlet pseudo-count that stops a class prior collapsing to 0
+    or 1. Returns None when no unit has a score.
+    """
+    patterns: dict[tuple[int | None, ...], int] = defaultdict(int)
+    for unit in units:
+        if any(score is not None for score in unit):
+            patterns[tuple(unit)] += 1
+    if not patterns:
+        return None
+    keys = list(patterns)
+    frequencies = [float(patterns[key]) for key in keys]
+    num_judges = len(keys[0])
+    classes = sorted({score for key in keys for score in key if score is not None})
+    position = {value: idx for idx, value in enumerate(classes)}
+    num_classes = len(classes)
+    codes = [[-1 if score is None else position[score] for score in key] for key in keys]
+
+    if _np is not None:
+        np = _np
+        weights = np.asarray(frequencies)
+        onehot = np.zeros((len(keys), num_judges, num_classes))
+        for p, row in enumerate(codes):
+            for j, code in enumerate(row):
+                if code >= 0:
+                    onehot[p, j, code] = 1.0
+        votes = onehot.sum(axis=1)
+        posterior = votes / votes.sum(axis=1, keepdims=True)
+        previous = -math.inf
+        log_likelihood = -math.inf
+        converged = False
+        iterations = 0
+        for iterations in range(1, max_iterations + 1):
+            weighted = posterior * weights[:, None]
+            priors = (weighted.sum(axis=0) + prior_smoothing) / (
+                weights.sum() + prior_smoothing * num_classes
+            )
+            counts = np.einsum("pk,pjl->jkl", weighted, onehot) + smoothing
+            confusions = counts / counts.sum(axis=2, keepdims=True)
+            log_joint = np.log(priors)[None, :] + np.einsum(
+                "pjl,jkl->pk", onehot, np.log(confusions)
+            )
+            peak = log_joint.max(axis=1, keepdims=True)
+            log_norm = peak[:, 0] + np.log(np.exp(log_joint - peak).sum(axis=1))
+            posterior = np.exp(log_joint - log_norm[:, None])
+            log_likelihood = float(weights @ log_norm)
+            if abs(log_likelihood - previous) <= tolerance * (1.0 + abs(log_likelihood)):
+                converged = True
+                break
+            previous = log_likelihood
+        priors_out = priors.tolist()
+        confusions_out = confusions.tolist()
+        posterior_rows = posterior.tolist()
+    else:
+        posterior_rows = []
+        for row in codes:
+            votes = [0.0] * num_classes
+            for code in row:
+                if code >= 0:
+                    votes[code] += 1.0
+            total_votes = sum(votes)
+            posterior_rows.append([vote / total_votes for vote in votes])
+        total_weight = sum(frequencies)
+        previous = -math.inf
+        log_likelihood = -math.inf
+        converged = False
+        iterations = 0
+        for iterations in range(1, max_iterations + 1):
+            priors_out = [
+                (sum(f * post[k] for f, post in zip(frequencies, posterior_rows)) + prior_smoothing)
+                / (total_weight + prior_smoothing * num_classes)
+                for k in range(num_classes)
+            ]
+            confusions_out = []
+            for j in range(num_judges):
+                counts = [[smoothing] * num_classes for _ in range(num_classes)]
+                for f, post, row in zip(frequencies, posterior_rows, codes):
+                    if row[j] >= 0:
+                        for k in range(num_classes):
+                            counts[k][row[j]] += f * post[k]
+                confusions_out.append([[c / sum(counts_k) for c in counts_k] for counts_k in counts])
+            log_likelihood = 0.0
+            posterior_rows = []
+            for f, row in zip(frequencies, codes):
+                log_joint = [math.log(priors_out[k]) for k in range(num_classes)]
+                for j, code in enumerate(row):
+                    if code >= 0:
+                        for k in range(num_classes):
+                            log_joint[k] += math.log(confusions_out[j][k][code])
+                peak = max(log_joint)
+                log_norm = peak + math.log(sum(math.exp(value - peak) for value in log_joint))
+                posterior_rows.append([math.exp(value - log_norm) for value in log_joint])
+                log_likelihood += f * log_norm
+            if abs(log_likelihood - previous) <= tolerance * (1.0 + abs(log_likelihood)):
+                converged = True
+                break
+            previous = log_likelihood
+
+    return DawidSkeneFit(
+        classes=classes,
+        priors=priors_out,
+        confusions=confusions_out,
+        iterations=iterations,
+        converged=converged,
+        log_likelihood=log_likelihood,
+        posteriors=dict(zip(keys, posterior_rows)),
+    )
+
+
 def is_valid_numeric_score(value: Any) -> bool:
     return isinstance(value, (int, float)) and not isinstance(value, bool)
 
@@ -3751,65 +9401,83 @@ def bucket_consensus_score(value: Any) -> int | None:
     return int(numeric + 0.5)
 
 
-def krippendorff_alpha_ordinal(units: list[list[int]]) -> float | None:
-    filtered_units = [unit for unit in units if len(unit) >= 2]
-    if not filtered_units:
-        return None
+def _rating_pattern_counts(
+    units: Iterable[list[int]],
+) -> tuple[list[int], dict[tuple[int, ...], int]]:
+    """Sorted categories and the frequency of each distinct unit pattern.
+
+    A pattern is a unit's sorted values. Only units with at least two values
+    are pairable, and with few judges and a 0-3 scale there are only a few
+    dozen distinct patterns, so alpha and its bootstrap work on pattern
+    frequencies rather than on individual rows.
+    """
+    patterns: dict[tuple[int, ...], int] = defaultdict(int)
+    for unit in units:
+        if len(unit) >= 2:
+            patterns[tuple(sorted(unit))] += 1
+    categories = sorted({value for pattern in patterns for value in pattern})
+    return categories, patterns
+
+
+def _pattern_coincidences(
+    patterns: Iterable[tuple[int, ...]], categories: list[int]
+) -> list[list[float]]:
+    """Flattened categories x categories coincidence contribution per pattern.
+
+    For a unit with n values and per-category counts v this is
+    (v v^T - diag(v)) / (n - 1), as in Krippendorff's coincidence matrix.
+    """
+    position = {value: idx for idx, value in enumerate(categories)}
+    cat_count = len(categories)
+    contributions: list[list[float]] = []
+    for pattern in patterns:
+        counts = [0] * cat_count
+        for value in pattern:
+            counts[position[value]] += 1
+        n = len(pattern)
+        contributions.append(
+            [
+                (counts[c] * (counts[c] - 1) if c == k else counts[c] * counts[k]) / (n - 1)
+                for c in range(cat_count)
+                for k in range(cat_count)
+            ]
+        )
+    return contributions
 
-    categories = sorted({value for unit in filtered_units for value in unit})
-    if len(categories) <= 1:
-        return 1.0
 
-    rank = {value: idx for idx, value in enumerate(categories)}
-    cat_count = len(categories)
-    denom = float(cat_count - 1)
+def _alpha_from_coincidence(coincidence: list[float], categories: list[int]) -> float | None:
+    """Ordinal alpha from a flattened coincidence matrix over `categories`.
 
-    coincidence: dict[int, dict[int, float]] = {
-        c: {k: 0.0 for k in categories} for c in categories
-    }
-    for unit in filtered_units:
-        unit_counts: dict[int, int] = defaultdict(int)
-        for value in unit:
-            unit_counts[value] += 1
-        n = sum(unit_counts.values())
-        if n < 2:
-            continue
-        for c in categories:
-            n_c = unit_counts.get(c, 0)
-            if n_c == 0:
-                continue
-            for k in categories:
-                n_k = unit_counts.get(k, 0)
-                if n_k == 0:
-                    continue
-                if c == k:
-                    coincidence[c][k] += (n_c * (n_c - 1)) / (n - 1)
-                else:
-                    coincidence[c][k] += (n_c * n_k) / (n - 1)
+    Categories with no pairable values are dropped first, so the ordinal
+    distances match those of the values actually present.
+    """
+    cat_count = len(categories)
+    matrix = [coincidence[c * cat_count : (c + 1) * cat_count] for c in range(cat_count)]
+    present = [c for c in range(cat_count) if any(matrix[c])]
+    if not present:
+        return None
+    if len(present) <= 1:
+        return 1.0
+    denom = float(len(present) - 1)
 
-    total_coincidence = sum(
-        coincidence[c][k] for c in categories for k in categories
-    )
+    total_coincidence = sum(matrix[c][k] for c in present for k in present)
     if total_coincidence <= 0:
         return None
-
-    marginals = {
-        c: sum(coincidence[c][k] for k in categories) for c in categories
-    }
+    marginals = {c: sum(matrix[c][k] for k in present) for c in present}
     if total_coincidence <= 1:
         return None
 
+    rank = {c: idx for idx, c in enumerate(present)}
+
     def dist(c: int, k: int) -> float:
         return ((rank[c] - rank[k]) / denom) ** 2
 
-    do_num = sum(
-        coincidence[c][k] * dist(c, k) for c in categories for k in categories
-    )
+    do_num = sum(matrix[c][k] * dist(c, k) for c in present for k in present)
     do = do_num / total_coincidence
 
     de_num = 0.0
-    for c in categories:
-        for k in categories:
+    for c in present:
+        for k in present:
             expected = (marginals[c] * marginals[k]) / (total_coincidence - 1)
             de_num += expected * dist(c, k)
     de = de_num / total_coincidence
@@ -3820,179 +9488,589 @@ def krippendorff_alpha_ordinal(units: list[list[int]]) -> float | None:
     return round(alpha, 6)
 
 
-def compute_inter_rater_reliability(rows: list[dict[str, Any]], num_judges: int) -> dict[str, Any]:
-    pairwise: list[dict[str, Any]] = []
-    for i in range(1, num_judges + 1):
-        for j in range(i + 1, num_judges + 1):
-            agreements = 0
-            total = 0
-            for row in rows:
-                score_i = row.get(f"judge_{i}_score")
-                score_j = row.get(f"judge_{j}_score")
-                err_i = row.get(f"judge_{i}_error")
-                err_j = row.get(f"judge_{j}_error")
-                if err_i or err_j:
-                    continue
-                if not isinstance(score_i, int) or not isinstance(score_j, int):
-                    continue
-                total += 1
-                if score_i == score_j:
-                    agreements += 1
-            rate = round(agreements / total, 6) if total > 0 else None
-            pairwise.append(
-                {
-                    "judge_i": i,
-                    "judge_j": j,
-                    "compared_rows": total,
-                    "agreements": agreements,
-                    "agreement_rate": rate,
-                }
-            )
+def _sum_coincidences(
+    frequencies: list[int], contributions: list[list[float]], size: int
+) -> list[float]:
+    """frequencies @ contributions (one matrix product on the NumPy engine)."""
+    if _np is not None and frequencies:
+        return (
+            _np.asarray(frequencies, dtype=_np.float64)
+            @ _np.asarray(contributions, dtype=_np.float64).reshape(len(frequencies), size)
+        ).tolist()
+    total = [0.0] * size
+    for frequency, contribution in zip(frequencies, contributions):
+        for cell, value in enumerate(contribution):
+            total[cell] += frequency * value
+    return total
+
+
+def krippendorff_alpha_ordinal(units: list[list[int]]) -> float | None:
+    categories, patterns = _rating_pattern_counts(units)
+    if not patterns:
+        return None
+    if len(categories) <= 1:
+        return 1.0
+    contributions = _pattern_coincidences(patterns, categories)
+    coincidence = _sum_coincidences(
+        list(patterns.values()), contributions, len(categories) ** 2
+    )
+    return _alpha_from_coincidence(coincidence, categories)
 
-    valid_rates = [entry["agreement_rate"] for entry in pairwise if entry["agreement_rate"] is not None]
-    average_pairwise = round(sum(valid_rates) / len(valid_rates), 6) if valid_rates else None
 
+def bootstrap_alpha_interval(
+    units: list[list[int]], *, samples: int, seed: int = 0
+) -> dict[str, Any] | None:
+    """95% bootstrap interval for ordinal alpha, resampling units.
+
+    Every replicate is a multinomial draw over the distinct unit patterns,
+    so all replicates' coincidence matrices come from one matrix product.
+    Replicates keep the full data's category set for ordinal distances.
+    """
+    if samples <= 0:
+        return None
+    if _np is None:
+        raise RuntimeError(
+            "Bootstrap confidence intervals need numpy "
+            "(not installed, or BENCHMARK_NUMERIC_ENGINE=python)."
+        )
+    np = _np
+    categories, patterns = _rating_pattern_counts(units)
+    if len(categories) <= 1:
+        return None
+    cat_count = len(categories)
+    contributions = np.asarray(
+        _pattern_coincidences(patterns, categories), dtype=np.float64
+    )
+    frequencies = np.asarray(list(patterns.values()), dtype=np.float64)
+    unit_count = int(frequencies.sum())
+    rng = np.random.default_rng(seed)
+    weights = rng.multinomial(unit_count, frequencies / unit_count, size=samples)
+    coincidences = (weights @ contributions).reshape(samples, cat_count, cat_count)
+    ranks = np.arange(cat_count, dtype=np.float64)
+    distances = ((ranks[:, None] - ranks[None, :]) / (cat_count - 1)) ** 2
+    totals = coincidences.sum(axis=(1, 2))
+    marginals = coincidences.sum(axis=2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        observed = (coincidences * distances).sum(axis=(1, 2)) / totals
+        expected = (
+            np.einsum("bc,bk,ck->b", marginals, marginals, distances) / (totals - 1)
+        ) / totals
+        alphas = 1.0 - observed / expected
+    alphas = alphas[np.isfinite(alphas)]
+    if not len(alphas):
+        return None
+    low, high = np.percentile(alphas, [2.5, 97.5])
+    return {
+        "ci95_low": round(float(low), 6),
+        "ci95_high": round(float(high), 6),
+        "samples": samples,
+        "seed": seed,
+    }
+
+
+def _pair_kappas(
+    confusion: dict[tuple[int, int], int], categories: list[int]
+) -> tuple[float | None, float | None]:
+    """Cohen's kappa and quadratic-weighted kappa from one pair's confusion counts."""
+    total = sum(confusion.values())
+    if total == 0 or not categories:
+        return None, None
+    row_totals: dict[int, int] = defaultdict(int)
+    col_totals: dict[int, int] = defaultdict(int)
+    for (score_i, score_j), count in confusion.items():
+        row_totals[score_i] += count
+        col_totals[score_j] += count
+    observed_agreement = sum(confusion.get((c, c), 0) for c in categories) / total
+    expected_agreement = sum(row_totals[c] * col_totals[c] for c in categories) / (total * total)
+    kappa = (
+        round((observed_agreement - expected_agreement) / (1 - expected_agreement), 6)
+        if expected_agreement < 1
+        else None
+    )
+    weighted: float | None = None
+    if len(categories) >= 2:
+        rank = {value: idx for idx, value in enumerate(categories)}
+        denom = float(len(categories) - 1)
+
+        def weight(c: int, k: int) -> float:
+            return ((rank[c] - rank[k]) / denom) ** 2
+
+        observed = sum(
+            count * weight(score_i, score_j) for (score_i, score_j), count in confusion.items()
+        ) / total
+        expected = sum(
+            row_totals[c] * col_totals[k] * weight(c, k) for c in categories for k in categories
+        ) / (total * total)
+        if expected > 0:
+            weighted = round(1 - observed / expected, 6)
+    return kappa, weighted
+
+
+def compute_inter_rater_reliability(
+    rows: list[Mapping[str, Any]],
+    num_judges: int,
+    *,
+    bootstrap_samples: int = 0,
+    bootstrap_seed: int = 0,
+) -> dict[str, Any]:
+    # One pass over the rows collects every judge pair's confusion counts and
+    # the per-row units; alpha breakdowns reuse the units by model/technique.
+    pairs = [(i, j) for i in range(1, num_judges + 1) for j in range(i + 1, num_judges + 1)]
+    confusions: dict[tuple[int, int], dict[tuple[int, int], int]] = {
+        pair: defaultdict(int) for pair in pairs
+    }
     units: list[list[int]] = []
+    units_by_model: dict[str, list[list[int]]] = defaultdict(list)
+    units_by_technique: dict[str, list[list[int]]] = defaultdict(list)
+    # Cascade-copied cells repeat the cascade judge's verdict under each
+    # primary judge, and local pre-judge cells are the local model's, so
+    # both are left out rather than counted as that judge's grades.
+    score_keys = [f"judge_{i}_score" for i in range(1, num_judges + 1)]
+    error_keys = [f"judge_{i}_error" for i in range(1, num_judges + 1)]
+    cascade_keys = [f"judge_{i}_cascade_model" for i in range(1, num_judges + 1)]
+    local_keys = [f"judge_{i}_local_prejudge" for i in range(1, num_judges + 1)]
     for row in rows:
-        scores: list[int] = []
-        for i in range(1, num_judges + 1):
-            err = row.get(f"judge_{i}_error")
-            value = row.get(f"judge_{i}_score")
-            if err:
-                continue
-            if isinstance(value, int):
-                scores.append(value)
+        get = row.get
+        valid: list[int | None] = []
+        for score_key, error_key, cascade_key, local_key in zip(
+            score_keys, error_keys, cascade_keys, local_keys
+        ):
+            value = get(score_key)
+            valid.append(
+                value
+                if not get(error_key)
+                and not get(cascade_key)
+                and not get(local_key)
+                and isinstance(value, int)
+                else None
+            )
+        for i, j in pairs:
+            score_i = valid[i - 1]
+            score_j = valid[j - 1]
+            if score_i is not None and score_j is not None:
+                confusions[(i, j)][(score_i, score_j)] += 1
+        scores = [value for value in valid if value is not None]
         units.append(scores)
+        if len(scores) >= 2:
+            units_by_model[str(get("model", ""))].append(scores)
+            units_by_technique[str(get("technique", ""))].append(scores)
+
+    categories = sorted(
+        {value for confusion in confusions.values() for pair in confusion for value in pair}
+    )
+    pairwise: list[dict[str, Any]] = []
+    for i, j in pairs:
+        confusion = confusions[(i, j)]
+        total = sum(confusion.values())
+        agreements = sum(count for (score_i, score_j), count in confusion.items() if score_i == score_j)
+        rate = round(agreements / total, 6) if total > 0 else None
+        kappa, weighted_kappa = _pair_kappas(confusion, categories)
+        pairwise.append(
+            {
+                "judge_i": i,
+                "judge_j": j,
+                "compared_rows": total,
+                "agreements": agreements,
+                "agreement_rate": rate,
+                "cohen_kappa": kappa,
+                "weighted_kappa_quadratic": weighted_kappa,
+            }
+        )
+
+    valid_rates = [entry["agreement_rate"] for entry in pairwise if entry["agreement_rate"] is not None]
+    average_pairwise = round(sum(valid_rates) / len(valid_rates), 6) if valid_rates else None
 
     alpha = krippendorff_alpha_ordinal(units)
-    return {
+    reliability: dict[str, Any] = {
         "pairwise": pairwise,
         "average_pairwise_agreement": average_pairwise,
         "krippendorff_alpha_ordinal": alpha,
     }
+    if bootstrap_samples > 0:
+        reliability["krippendorff_alpha_ordinal_ci95"] = bootstrap_alpha_interval(
+            units, samples=bootstrap_samples, seed=bootstrap_seed
+        )
+    reliability["krippendorff_alpha_ordinal_by_model"] = {
+        model: {"units": len(model_units), "alpha": krippendorff_alpha_ordinal(model_units)}
+        for model, model_units in sorted(units_by_model.items())
+    }
+    reliability["krippendorff_alpha_ordinal_by_technique"] = {
+        technique: {
+            "units": len(technique_units),
+            "alpha": krippendorff_alpha_ordinal(technique_units),
+        }
+        for technique, technique_units in sorted(units_by_technique.items())
+    }
+    return reliability
+
+
+def compute_stratified_estimate(
+    strata: dict[str, dict[str, list[float]]],
+    stratum_sizes: dict[str, int],
+) -> dict[str, Any] | None:
+    """Stratified mean over questions with a finite-population-corrected stderr.
+
+    `strata` maps stratum -> question_id -> per-run values; each question is one
+    sampling unit, so repeated runs are averaged before estimating variance.
+    A stratum sampled with a single question has no variance of its own and
+    borrows the pooled within-stratum variance of the others (counted in
+    `strata_without_variance`); when no stratum has two questions, stderr and
+    the interval are None rather than a zero-width CI.
+    """
+    unit_means_by_stratum: dict[str, list[float]] = {}
+    for stratum, units in strata.items():
+        unit_means = [sum(values) / len(values) for values in units.values() if values]
+        if unit_means:
+            unit_means_by_stratum[stratum] = unit_means
+    if not unit_means_by_stratum:
+        return None
 
+    population_total = sum(
+        max(int(stratum_sizes.get(stratum, 0) or 0), len(unit_means))
+        for stratum, unit_means in unit_means_by_stratum.items()
+    )
+    within_variances = [
+        (len(unit_means) - 1, statistics.variance(unit_means))
+        for unit_means in unit_means_by_stratum.values()
+        if len(unit_means) >= 2
+    ]
+    pooled_degrees = sum(degrees for degrees, _ in within_variances)
+    pooled_variance = (
+        sum(degrees * value for degrees, value in within_variances) / pooled_degrees
+        if pooled_degrees
+        else None
+    )
+    estimate = 0.0
+    variance: float | None = 0.0
+    strata_without_variance = 0
+    for stratum, unit_means in unit_means_by_stratum.items():
+        sampled = len(unit_means)
+        population = max(int(stratum_sizes.get(stratum, 0) or 0), sampled)
+        weight = population / population_total
+        estimate += weight * (sum(unit_means) / sampled)
+        if population <= sampled:
+            continue  # fully enumerated: no sampling variance
+        if sampled >= 2:
+            stratum_variance = statistics.variance(unit_means)
+        else:
+            strata_without_variance += 1
+            stratum_variance = pooled_variance
+        if stratum_variance is None or variance is None:
+            variance = None
+            continue
+        fpc = 1.0 - sampled / population
+        variance += weight * weight * fpc * stratum_variance / sampled
 
-def summarize_aggregate_rows(
-    rows: list[dict[str, Any]],
-    consensus_method: str,
-    num_judges: int,
-) -> dict[str, Any]:
-    by_model: dict[str, dict[str, Any]] = {}
-    by_model_technique: dict[str, dict[str, list[float]]] = defaultdict(
-        lambda: defaultdict(list)
+    stderr = math.sqrt(variance) if variance is not None else None
+    return {
+        "estimate": round(estimate, 4),
+        "stderr": round(stderr, 4) if stderr is not None else None,
+        "ci95_low": round(estimate - 1.96 * stderr, 4) if stderr is not None else None,
+        "ci95_high": round(estimate + 1.96 * stderr, 4) if stderr is not None else None,
+        "strata": len(unit_means_by_stratum),
+        "sampled_questions": sum(len(values) for values in unit_means_by_stratum.values()),
+        "population_questions": population_total,
+        "strata_without_variance": strata_without_variance,
+    }
+
+
+BOOTSTRAP_CHUNK_SIZE = 1000
+
+
+def _bootstrap_chunk(
+    sums: Any,
+    counts: Any,
+    detections: Any,
+    seed: int,
+    chunk_index: int,
+    size: int,
+) -> tuple[Any, Any]:
+    """avg_score and detection-rate replicates for one chunk of resamples.
+
+    A replicate draws len(questions) questions with replacement, expressed
+    as multinomial weights, so every model's metric for the whole chunk is
+    one matrix product. Module-level so process pools can pickle it.
+    """
+    np = _np
+    rng = np.random.default_rng([seed, chunk_index])
+    num_questions = sums.shape[0]
+    weights = rng.multinomial(
+        num_questions, np.full(num_questions, 1.0 / num_questions), size=size
+    ).astype(np.float64)
+    row_counts = weights @ counts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (weights @ sums) / row_counts, (weights @ detections) / row_counts
+
+
+def compute_bootstrap_uncertainty(
+    columns: SummaryColumns,
+    models: list[str],
+    *,
+    samples: int,
+    seed: int = 0,
+    workers: int = 1,
+) -> dict[str, Any] | None:
+    """Question-clustered bootstrap CIs, rank and pairwise probabilities.
+
+    Questions are the resampling unit: all runs of a question move together,
+    and every model is scored on the same resampled questions, so rank and
+    "A beats B" (strictly higher avg_score) probabilities are paired
+    comparisons. `models` is the leaderboard order used for the output.
+    Stratified quick estimates are resampled as plain question samples.
+    Results depend only on `seed`, not on `workers`.
+    """
+    if samples <= 0:
+        return None
+    if _np is None:
+        raise RuntimeError(
+            "Bootstrap confidence intervals need numpy "
+            "(not installed, or BENCHMARK_NUMERIC_ENGINE=python)."
+        )
+    np = _np
+    model_codes = {model: code for code, model in enumerate(columns.models)}
+    model = np.frombuffer(columns.model, dtype=np.int64)
+    question = np.frombuffer(columns.question, dtype=np.int64)
+    score = np.frombuffer(columns.score, dtype=np.float64)
+    bucket = np.frombuffer(columns.bucket, dtype=np.int8)
+    is_control = np.frombuffer(columns.is_control, dtype=np.int8) != 0
+    nonsense = (bucket >= 0) & ~is_control
+    present = set(np.unique(model[nonsense]).tolist())
+    ranked_models = [name for name in models if model_codes.get(name) in present]
+    if not ranked_models:
+        return None
+
+    # Per (question, model) sufficient statistics over nonsense rows.
+    model_position = np.full(len(columns.models), -1, dtype=np.int64)
+    for position, name in enumerate(ranked_models):
+        model_position[model_codes[name]] = position
+    question_codes, question_position = np.unique(question[nonsense], return_inverse=True)
+    num_questions = len(question_codes)
+    num_models = len(ranked_models)
+    keys = question_position * num_models + model_position[model[nonsense]]
+    cells = num_questions * num_models
+    sums = np.bincount(keys, weights=score[nonsense], minlength=cells).reshape(
+        num_questions, num_models
     )
-    by_model_run: dict[str, dict[int, list[float]]] = defaultdict(
-        lambda: defaultdict(list)
+    counts = np.bincount(keys, minlength=cells).reshape(num_questions, num_models).astype(
+        np.float64
     )
+    detections = np.bincount(
+        keys, weights=(bucket[nonsense] == 2).astype(np.float64), minlength=cells
+    ).reshape(num_questions, num_models)
 
-    for row in rows:
-        model = str(row.get("model", ""))
-        if model not in by_model:
-            by_model[model] = {
-                "model": model,
-                "count": 0,
-                "scored_count": 0,
-                "nonsense_count": 0,
-                "control_count": 0,
-                "score_0": 0,
-                "score_1": 0,
-                "score_2": 0,
-                "score_3": 0,
-                "avg_score": None,
-                "detection_rate_score_2": None,
-                "full_engagement_rate_score_0": None,
-                "control_correct_rate_score_3": None,
-                "error_count": 0,
-                "_nonsense_scores": [],
+    chunk_sizes = [
+        min(BOOTSTRAP_CHUNK_SIZE, samples - start)
+        for start in range(0, samples, BOOTSTRAP_CHUNK_SIZE)
+    ]
+    chunk_args = [
+        (sums, counts, detections, seed, chunk_index, size)
+        for chunk_index, size in enumerate(chunk_sizes)
+    ]
+    if workers > 1 and len(chunk_args) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(chunk_args))
+        ) as pool:
+            chunks = list(pool.map(_bootstrap_chunk, *zip(*chunk_args)))
+    else:
+        chunks = [_bootstrap_chunk(*chunk) for chunk in chunk_args]
+    avg_scores = np.concatenate([chunk[0] for chunk in chunks])
+    detection_rates = np.concatenate([chunk[1] for chunk in chunks])
+
+    # Rank 1 is the highest avg_score; a model absent from a resample ranks
+    # last, and tied models are ordered at random.
+    ranked = np.where(np.isnan(avg_scores), -np.inf, avg_scores)
+    tiebreak = np.random.default_rng([seed, len(chunk_sizes)]).random(ranked.shape)
+    order = np.lexsort((tiebreak, -ranked), axis=1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(
+        ranks, order, np.broadcast_to(np.arange(num_models), order.shape), axis=1
+    )
+    rank_counts = np.bincount(
+        (ranks + np.arange(num_models) * num_models).ravel(), minlength=num_models * num_models
+    ).reshape(num_models, num_models)
+    beat_counts = np.zeros((num_models, num_models), dtype=np.int64)
+    for start in range(0, samples, BOOTSTRAP_CHUNK_SIZE):
+        block = ranked[start : start + BOOTSTRAP_CHUNK_SIZE]
+        beat_counts += (block[:, :, None] > block[:, None, :]).sum(axis=0)
+
+    def interval(values: Any) -> list[dict[str, float | None]]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            low, high = np.nanpercentile(values, [2.5, 97.5], axis=0)
+            stderr = np.nanstd(values, axis=0, ddof=1)
+        return [
+            {
+                "ci95_low": round(float(low[position]), 4),
+                "ci95_high": round(float(high[position]), 4),
+                "stderr": round(float(stderr[position]), 4),
+            }
+            for position in range(num_models)
+        ]
+
+    avg_intervals = interval(avg_scores)
+    detection_intervals = interval(detection_rates)
+    rank_values = np.arange(1, num_models + 1)
+    by_model: dict[str, Any] = {}
+    for position, name in enumerate(ranked_models):
+        rank_probabilities = rank_counts[position] / samples
+        by_model[name] = {
+            "avg_score": avg_intervals[position],
+            "detection_rate_score_2": detection_intervals[position],
+            "rank_probabilities": [round(float(p), 4) for p in rank_probabilities],
+            "expected_rank": round(float(rank_probabilities @ rank_values), 4),
+        }
+    return {
+        "method": "question_cluster",
+        "samples": samples,
+        "seed": seed,
+        "questions": num_questions,
+        "rank_metric": "avg_score",
+        "models": by_model,
+        "pairwise_beat_probability": {
+            name: {
+                other: round(float(beat_counts[position, other_position]) / samples, 4)
+                for other_position, other in enumerate(ranked_models)
+                if other_position != position
             }
-        stats = by_model[model]
-        stats["count"] += 1
+            for position, name in enumerate(ranked_models)
+        },
+    }
 
-        if row.get("status") == "error":
-            stats["error_count"] += 1
 
-        score = row.get("consensus_score")
-        if is_valid_numeric_score(score):
-            score_value = float(score)
-            stats["scored_count"] += 1
-            technique = str(row.get("technique", ""))
-            by_model_technique[model][technique].append(score_value)
-            run_index = row.get("run_index")
-            if isinstance(run_index, int) and not row.get("is_control"):
-                by_model_run[model][run_index].append(score_value)
-            score_bucket = bucket_consensus_score(score_value)
-
-            if row.get("is_control"):
-                stats["control_count"] += 1
-                if score_bucket == 3:
-                    stats["score_3"] += 1
-            else:
-                stats["nonsense_count"] += 1
-                stats["_nonsense_scores"].append(score_value)
-                if score_bucket == 0:
-                    stats["score_0"] += 1
-                elif score_bucket == 1:
-                    stats["score_1"] += 1
-                elif score_bucket == 2:
-                    stats["score_2"] += 1
-                elif score_bucket == 3:
-                    stats["score_3"] += 1
+def bootstrap_options(args: argparse.Namespace) -> dict[str, int]:
+    samples = int(getattr(args, "bootstrap_samples", 0) or 0)
+    workers = int(getattr(args, "bootstrap_workers", 1) or 1)
+    if samples < 0:
+        raise ValueError("--bootstrap-samples must be >= 0.")
+    if workers < 1:
+        raise ValueError("--bootstrap-workers must be >= 1.")
+    return {
+        "bootstrap_samples": samples,
+        "bootstrap_seed": int(getattr(args, "bootstrap_seed", 0) or 0),
+        "bootstrap_workers": workers,
+    }
+
+
+def summarize_aggregate_rows(
+    rows: list[Mapping[str, Any]],
+    consensus_method: str,
+    num_judges: int,
+    *,
+    bootstrap_samples: int = 0,
+    bootstrap_seed: int = 0,
+    bootstrap_workers: int = 1,
+) -> dict[str, Any]:
+    columns = aggregate_summary_columns(rows)
+    totals = summary_totals(columns)
+
+    # model -> stratum -> question_id -> consensus scores, for sampled runs only.
+    by_model_strata: dict[int, dict[str, dict[str, list[float]]]] = defaultdict(
+        lambda: defaultdict(lambda: defaultdict(list))
+    )
+    if columns.strata:
+        for model, question, stratum, score, bucket, is_control in zip(
+            columns.model,
+            columns.question,
+            columns.stratum,
+            columns.score,
+            columns.bucket,
+            columns.is_control,
+        ):
+            if stratum >= 0 and bucket >= 0 and not is_control:
+                by_model_strata[model][columns.strata[stratum]][
+                    columns.questions[question]
+                ].append(score)
 
     leaderboard: list[dict[str, Any]] = []
-    for model, stats in by_model.items():
-        nonsense_scores = stats["_nonsense_scores"]
-        nonsense_rows = len(nonsense_scores)
+    for code, model in enumerate(columns.models):
+        nonsense_buckets = totals["nonsense_buckets"][code]
+        stats: dict[str, Any] = {
+            "model": model,
+            "count": totals["count"][code],
+            "scored_count": totals["scored_count"][code],
+            "nonsense_count": totals["nonsense_count"][code],
+            "control_count": totals["control_count"][code],
+            "score_0": nonsense_buckets[0],
+            "score_1": nonsense_buckets[1],
+            "score_2": nonsense_buckets[2],
+            "score_3": nonsense_buckets[3] + totals["control_buckets"][code][3],
+            "avg_score": None,
+            "detection_rate_score_2": None,
+            "full_engagement_rate_score_0": None,
+            "control_correct_rate_score_3": None,
+            "error_count": totals["error_count"][code],
+        }
+        nonsense_rows = stats["nonsense_count"]
         if nonsense_rows > 0:
-            stats["avg_score"] = round(sum(nonsense_scores) / nonsense_rows, 4)
+            stats["avg_score"] = round(totals["nonsense_sum"][code] / nonsense_rows, 4)
             stats["detection_rate_score_2"] = round(stats["score_2"] / nonsense_rows, 4)
             stats["full_engagement_rate_score_0"] = round(stats["score_0"] / nonsense_rows, 4)
         if stats["control_count"] > 0:
             stats["control_correct_rate_score_3"] = round(
                 stats["score_3"] / stats["control_count"], 4
             )
+        stats.update(_summary_breakdowns(columns, totals, code))
+
+        model_strata = by_model_strata.get(code)
+        if model_strata:
+            # Quick-estimate runs: replace the plain sample means with
+            # stratification-weighted estimates so the ranking reflects the
+            # full question set rather than the per-technique sample sizes.
+            estimates: dict[str, Any] = {}
+            for metric, transform in (
+                ("avg_score", lambda value: value),
+                ("detection_rate_score_2", lambda value: float(bucket_consensus_score(value) == 2)),
+                ("full_engagement_rate_score_0", lambda value: float(bucket_consensus_score(value) == 0)),
+            ):
+                metric_strata = {
+                    stratum: {
+                        question_id: [transform(value) for value in values]
+                        for question_id, values in units.items()
+                    }
+                    for stratum, units in model_strata.items()
+                }
+                estimate = compute_stratified_estimate(metric_strata, columns.stratum_sizes)
+                if estimate is None:
+                    continue
+                estimates[metric] = estimate
+                stats[metric] = estimate["estimate"]
+            stats["is_estimate"] = True
+            stats["estimate_method"] = "stratified"
+            stats["estimates"] = estimates
 
-        stats["technique_breakdown"] = {
-            technique: round(sum(values) / len(values), 4)
-            for technique, values in sorted(by_model_technique[model].items())
-            if values
-        }
-        run_averages: dict[str, float] = {}
-        for run_index, values in sorted(by_model_run[model].items()):
-            if values:
-                run_averages[str(run_index)] = round(sum(values) / len(values), 4)
-        stats["run_average_scores"] = run_averages
-        if len(run_averages) >= 2:
-            stats["run_average_stddev"] = round(
-                statistics.pstdev(list(run_averages.values())), 4
-            )
-        else:
-            stats["run_average_stddev"] = None
-
-        stats.pop("_nonsense_scores", None)
         leaderboard.append(stats)
 
-    leaderboard.sort(
-        key=lambda item: (
-            item["avg_score"] if isinstance(item["avg_score"], (int, float)) else -1,
-            item["detection_rate_score_2"]
-            if isinstance(item["detection_rate_score_2"], (int, float))
-            else -1,
-        ),
-        reverse=True,
-    )
+    sort_leaderboard(leaderboard)
 
-    reliability = compute_inter_rater_reliability(rows, num_judges)
-    return {
+    reliability = compute_inter_rater_reliability(
+        rows, num_judges, bootstrap_samples=bootstrap_samples, bootstrap_seed=bootstrap_seed
+    )
+    summary = {
         "consensus_method": consensus_method,
         "num_judges": num_judges,
         "leaderboard": leaderboard,
         "reliability": reliability,
-        "total_records": len(rows),
-        "total_error_records": sum(1 for row in rows if row.get("status") == "error"),
-        "total_scored_records": sum(
-            1 for row in rows if is_valid_numeric_score(row.get("consensus_score"))
-        ),
+        "total_records": len(columns),
+        "total_error_records": sum(totals["error_count"]),
+        "total_scored_records": sum(totals["scored_count"]),
     }
+    if any(item.get("is_estimate") for item in leaderboard):
+        summary["is_estimate"] = True
+    if consensus_method == "dawid_skene" and rows:
+        fit = fit_dawid_skene(consensus_judge_scores(row, num_judges) for row in rows)
+        if fit is not None:
+            summary["dawid_skene"] = fit.summary(
+                [str(rows[0].get(f"judge_{idx}_model", "")) for idx in range(1, num_judges + 1)]
+            )
+    if bootstrap_samples > 0:
+        summary["bootstrap"] = compute_bootstrap_uncertainty(
+            columns,
+            [item["model"] for item in leaderboard],
+            samples=bootstrap_samples,
+            seed=bootstrap_seed,
+            workers=bootstrap_workers,
+        )
+    return summary
 
 
 def render_aggregate_summary_markdown(meta: dict[str, Any], summary: dict[str, Any]) -> str:
@@ -4025,25 +10103,122 @@ def render_aggregate_summary_markdown(meta: dict[str, Any], summary: dict[str, A
             f"{counts} | {row['error_count']} |"
         )
     lines.append("")
+    estimated_rows = [row for row in summary["leaderboard"] if row.get("is_estimate")]
+    if estimated_rows:
+        lines.append("## Stratified Estimates")
+        lines.append("")
+        lines.append(
+            "Rows below come from a stratified question sample; scores are "
+            "stratification-weighted estimates with 95% confidence intervals."
+        )
+        lines.append("")
+        lines.append("| Model | Avg Score (95% CI) | Detected (2) (95% CI) | Questions |")
+        lines.append("|---|---|---|---:|")
+        for row in estimated_rows:
+            estimates = row.get("estimates", {})
+            cells: list[str] = []
+            for metric in ("avg_score", "detection_rate_score_2"):
+                entry = estimates.get(metric)
+                if not entry:
+                    cells.append("n/a")
+                    continue
+                cells.append(
+                    f"{fmt_num(entry['estimate'])} "
+                    f"[{fmt_num(entry['ci95_low'])}, {fmt_num(entry['ci95_high'])}]"
+                )
+            avg_entry = estimates.get("avg_score") or {}
+            question_text = (
+                f"{avg_entry.get('sampled_questions', 0)}/{avg_entry.get('population_questions', 0)}"
+            )
+            lines.append(f"| `{row['model']}` | {cells[0]} | {cells[1]} | {question_text} |")
+        lines.append("")
+        if any(
+            (row.get("estimates", {}).get("avg_score") or {}).get("strata_without_variance")
+            for row in estimated_rows
+        ):
+            lines.append(
+                "Techniques sampled with a single question borrow the pooled within-technique "
+                "variance; with none sampled twice the interval is `n/a`. Sample at least 2 "
+                "questions per technique for intervals of their own."
+            )
+            lines.append("")
+    bootstrap = summary.get("bootstrap")
+    if bootstrap:
+        lines.append("## Bootstrap Uncertainty")
+        lines.append("")
+        lines.append(
+            f"{bootstrap['samples']} resamples of {bootstrap['questions']} questions "
+            "(all runs of a question resampled together); ranks by avg score."
+        )
+        lines.append("")
+        lines.append(
+            "| Model | Avg Score 95% CI | Detected (2) 95% CI | P(rank 1) | Expected Rank |"
+        )
+        lines.append("|---|---|---|---:|---:|")
+        for model, entry in bootstrap["models"].items():
+            avg_entry = entry["avg_score"]
+            detection_entry = entry["detection_rate_score_2"]
+            lines.append(
+                f"| `{model}` | [{fmt_num(avg_entry['ci95_low'])}, {fmt_num(avg_entry['ci95_high'])}] | "
+                f"[{fmt_num(detection_entry['ci95_low'])}, {fmt_num(detection_entry['ci95_high'])}] | "
+                f"{fmt_num(entry['rank_probabilities'][0])} | {fmt_num(entry['expected_rank'])} |"
+            )
+        lines.append("")
+    dawid_skene = summary.get("dawid_skene")
+    if dawid_skene:
+        lines.append("## Dawid-Skene Judge Accuracy")
+        lines.append("")
+        lines.append(
+            f"EM {'converged' if dawid_skene['converged'] else 'stopped'} after "
+            f"{dawid_skene['iterations']} iterations."
+        )
+        lines.append("")
+        lines.append("| Judge | Model | Accuracy |")
+        lines.append("|---|---|---:|")
+        for entry in dawid_skene["judges"]:
+            lines.append(
+                f"| {entry['judge']} | `{entry['judge_model']}` | {fmt_num(entry['accuracy'])} |"
+            )
+        lines.append("")
     lines.append("## Inter-Rater Reliability")
     lines.append("")
     reliability = summary["reliability"]
     lines.append(
         f"- Average pairwise agreement: {fmt_num(reliability.get('average_pairwise_agreement'))}"
     )
-    lines.append(
+    alpha_line = (
         f"- Krippendorff alpha (ordinal): {fmt_num(reliability.get('krippendorff_alpha_ordinal'))}"
     )
+    alpha_interval = reliability.get("krippendorff_alpha_ordinal_ci95")
+    if alpha_interval:
+        alpha_line += (
+            f" (95% CI [{fmt_num(alpha_interval['ci95_low'])}, "
+            f"{fmt_num(alpha_interval['ci95_high'])}])"
+        )
+    lines.append(alpha_line)
     lines.append("")
-    lines.append("| Judge Pair | Compared Rows | Agreements | Rate |")
-    lines.append("|---|---:|---:|---:|")
+    lines.append("| Judge Pair | Compared Rows | Agreements | Rate | Cohen's Kappa | Weighted Kappa |")
+    lines.append("|---|---:|---:|---:|---:|---:|")
     for entry in reliability.get("pairwise", []):
         label = f"{entry['judge_i']} vs {entry['judge_j']}"
         lines.append(
             f"| {label} | {entry['compared_rows']} | {entry['agreements']} | "
-            f"{fmt_num(entry['agreement_rate'])} |"
+            f"{fmt_num(entry['agreement_rate'])} | {fmt_num(entry.get('cohen_kappa'))} | "
+            f"{fmt_num(entry.get('weighted_kappa_quadratic'))} |"
         )
     lines.append("")
+    for key, heading in (
+        ("krippendorff_alpha_ordinal_by_model", "Model"),
+        ("krippendorff_alpha_ordinal_by_technique", "Technique"),
+    ):
+        breakdown = reliability.get(key) or {}
+        if not breakdown:
+            continue
+        lines.append(f"| {heading} | Rated Rows | Alpha |")
+        lines.append("|---|---:|---:|")
+        for label, entry in breakdown.items():
+            lines.append(f"| `{label}` | {entry['units']} | {fmt_num(entry['alpha'])} |")
+        lines.append("")
     return "\n".join(lines) + "\n"
 
 
@@ -4058,11 +10233,31 @@ def run_aggregate(args: argparse.Namespace) -> int:
     grade_dirs = split_csv(args.grade_dirs)
     if len(grade_dirs) < 2:
         raise ValueError("Provide at least two grade dirs via --grade-dirs.")
+    if args.consensus_method == "dawid_skene" and len(grade_dirs) < 3:
+        raise ValueError(
+            "--consensus-method dawid_skene needs at least three grade dirs; "
+            "with two judges the model is not identified."
+        )
+
+    artifact_layout = getattr(args, "artifact_layout", "full")
+    if artifact_layout not in ARTIFACT_LAYOUTS:
+        raise ValueError(f"--artifact-layout must be one of: {', '.join(ARTIFACT_LAYOUTS)}")
+    output_compression = jsonl_output_compression(args)
 
-    grade_sets = [load_grade_dir(path) for path in grade_dirs]
+    store = open_artifact_store(args)
+    try:
+        grade_sets = [load_grade_dir(path, store=store) for path in grade_dirs]
+    finally:
+        if store is not None:
+            store.close()
     source_responses_file = assert_single_source_responses_file(grade_sets)
     aligned = align_grade_rows(grade_sets)
     num_judges = len(grade_sets)
+    if artifact_layout == "normalized":
+        aligned = [normalize_artifact_row(row) for row in aligned]
+    elif any("response_text" not in row for row in aligned):
+        response_text_index = load_response_text_index(pathlib.Path(source_responses_file))
+        aligned = [join_response_text(row, response_text_index) for row in aligned]
 
     timestamp = dt.datetime.now(dt.UTC)
     default_parent = pathlib.Path(grade_dirs[0]).resolve().parents[1]
@@ -4084,6 +10279,8 @@ def run_aggregate(args: argparse.Namespace) -> int:
         "num_judges": num_judges,
         "judge_models": [grade_set["judge_model"] for grade_set in grade_sets],
         "responses_file": source_responses_file,
+        "artifact_layout": artifact_layout,
+        "jsonl_compression": output_compression or "none",
         "fail_on_error": bool(args.fail_on_error),
         "config_path": str(pathlib.Path(args.config).resolve()),
     }
@@ -4091,58 +10288,93 @@ def run_aggregate(args: argparse.Namespace) -> int:
     aggregate_events = aggregate_dir / "aggregate_events.jsonl"
     aggregate_events.write_text("", encoding="utf-8")
 
-    aggregate_rows: list[dict[str, Any]] = []
-    for row in aligned:
-        row_errors = list(row.get("row_errors", []))
-        judge_scores: list[int] = []
-        if row.get("row_identity_mismatch"):
-            row_errors.append(
-                "Identity mismatch across judge rows; consensus skipped for this sample."
-            )
-        else:
-            for idx in range(1, num_judges + 1):
-                score = row.get(f"judge_{idx}_score")
-                error = row.get(f"judge_{idx}_error")
-                if error:
-                    continue
-                if isinstance(score, int):
-                    judge_scores.append(score)
-                elif score is not None:
-                    row_errors.append(
-                        f"judge_{idx}_score has invalid type: {type(score).__name__}"
-                    )
+    dawid_skene_fit: DawidSkeneFit | None = None
+    if args.consensus_method == "dawid_skene":
+        dawid_skene_fit = fit_dawid_skene(
+            consensus_judge_scores(row, num_judges) for row in aligned
+        )
 
-        if args.consensus_method == "primary_tiebreak":
-            consensus_score, consensus_error = compute_primary_tiebreak_consensus(
-                row, num_judges=num_judges
-            )
-        else:
-            consensus_score, consensus_error = compute_consensus(
-                judge_scores, args.consensus_method
+    writer = JsonlAppendWriter(fsync=getattr(args, "fsync", "never"))
+    try:
+        aggregate_rows: list[dict[str, Any]] = []
+        for row in aligned:
+            row_errors = list(row.get("row_errors", []))
+            judge_scores: list[int] = []
+            if row.get("row_identity_mismatch"):
+                row_errors.append(
+                    "Identity mismatch across judge rows; consensus skipped for this sample."
+                )
+            else:
+                for idx in range(1, num_judges + 1):
+                    score = row.get(f"judge_{idx}_score")
+                    error = row.get(f"judge_{idx}_error")
+                    if error:
+                        continue
+                    if isinstance(score, int):
+                        judge_scores.append(score)
+                    elif score is not None:
+                        row_errors.append(
+                            f"judge_{idx}_score has invalid type: {type(score).__name__}"
+                        )
+
+            posterior: list[float] | None = None
+            confidence: float | None = None
+            if args.consensus_method == "primary_tiebreak":
+                consensus_score, consensus_error = compute_primary_tiebreak_consensus(
+                    row, num_judges=num_judges
+                )
+            elif args.consensus_method == "dawid_skene":
+                unit = consensus_judge_scores(row, num_judges)
+                cascade_score = cascade_copy_score(row, num_judges)
+                if cascade_score is not None and all(score is None for score in unit):
+                    # Accepted by the cascade: its verdict stands, once.
+                    consensus_score, consensus_error = cascade_score, None
+                elif dawid_skene_fit is None:
+                    consensus_score, consensus_error = None, "no_valid_scores"
+                else:
+                    consensus_score, confidence, consensus_error = dawid_skene_fit.consensus(unit)
+                    posterior = dawid_skene_fit.posterior(unit)
+            else:
+                consensus_score, consensus_error = compute_consensus(
+                    judge_scores, args.consensus_method
+                )
+            if consensus_error:
+                row_errors.append(consensus_error)
+            row["consensus_score"] = consensus_score
+            row["consensus_method"] = args.consensus_method
+            row["consensus_error"] = consensus_error
+            if args.consensus_method == "dawid_skene":
+                row["consensus_posterior"] = (
+                    {
+                        str(value): round(probability, 4)
+                        for value, probability in zip(dawid_skene_fit.classes, posterior)
+                    }
+                    if dawid_skene_fit is not None and posterior is not None
+                    else None
+                )
+                row["consensus_confidence"] = (
+                    round(confidence, 4) if confidence is not None else None
+                )
+            row["judge_valid_scores"] = judge_scores
+            row["status"] = "error" if row_errors else "ok"
+            row["error"] = " | ".join(row_errors)
+            aggregate_rows.append(row)
+
+            writer.append(
+                aggregate_events,
+                {
+                    "timestamp_utc": utc_now_iso(),
+                    "phase": "aggregate",
+                    "event": "row_complete",
+                    "status": row["status"],
+                    "sample_id": row.get("sample_id"),
+                    "model": row.get("model"),
+                    "question_id": row.get("question_id"),
+                    "error": row.get("error", ""),
+                },
             )
-        if consensus_error:
-            row_errors.append(consensus_error)
-        row["consensus_score"] = consensus_score
-        row["consensus_method"] = args.consensus_method
-        row["consensus_error"] = consensus_error
-        row["judge_valid_scores"] = judge_scores
-        row["status"] = "error" if row_errors else "ok"
-        row["error"] = " | ".join(row_errors)
-        aggregate_rows.append(row)
-
-        append_jsonl(
-            aggregate_events,
-            {
-                "timestamp_utc": utc_now_iso(),
-                "phase": "aggregate",
-                "event": "row_complete",
-                "status": row["status"],
-                "sample_id": row.get("sample_id"),
-                "model": row.get("model"),
-                "question_id": row.get("question_id"),
-                "error": row.get("error", ""),
-            },
-        )
+    finally:
+        writer.close()
 
     aggregate_rows.sort(
         key=lambda row: (
@@ -4151,19 +10383,27 @@ def run_aggregate(args: argparse.Namespace) -> int:
             str(row.get("question_id", "")),
         )
     )
-    write_jsonl(aggregate_dir / "aggregate.jsonl", aggregate_rows)
+    aggregate_rows_path = final_jsonl_path(aggregate_dir, "aggregate.jsonl", output_compression)
+    write_jsonl(aggregate_rows_path, aggregate_rows, compression=output_compression)
 
     summary = summarize_aggregate_rows(
-        aggregate_rows, args.consensus_method, num_judges
+        aggregate_rows, args.consensus_method, num_judges, **bootstrap_options(args)
     )
     write_json(aggregate_dir / "aggregate_summary.json", summary)
     summary_md = render_aggregate_summary_markdown(aggregate_meta, summary)
     (aggregate_dir / "aggregate_summary.md").write_text(summary_md, encoding="utf-8")
+    store_jsonl_artifact(
+        str(getattr(args, "store_db", "") or ""),
+        "aggregates",
+        aggregate_dir,
+        rows_path=aggregate_rows_path,
+        meta=aggregate_meta,
+    )
 
     print("", flush=True)
     print(f"Aggregate complete. Artifacts: {aggregate_dir}", flush=True)
     print(f"- {aggregate_dir / 'aggregate_meta.json'}", flush=True)
-    print(f"- {aggregate_dir / 'aggregate.jsonl'}", flush=True)
+    print(f"- {aggregate_rows_path}", flush=True)
     print(f"- {aggregate_dir / 'aggregate_summary.json'}", flush=True)
     print(f"- {aggregate_dir / 'aggregate_summary.md'}", flush=True)
     print(f"- {aggregate_events}", flush=True)
@@ -4180,6 +10420,8 @@ def run_aggregate(args: argparse.Namespace) -> int:
 
 
 def _render_report_html(data: dict[str, Any]) -> str:
+    # Stdlib json on purpose: the embedded payload must not depend on which
+    # codec is installed (orjson would turn NaN into null).
     payload = json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
     template_path = pathlib.Path(__file__).with_name("report_template.html")
     if not template_path.exists():
@@ -4203,79 +10445,101 @@ def run_report(args: argparse.Namespace) -> int:
     if not args.responses_file:
         raise ValueError("--responses-file is required (or set report.responses_file in config).")
     responses_file = pathlib.Path(args.responses_file)
-    if not responses_file.exists():
-        raise FileNotFoundError(f"responses file not found: {responses_file}")
     responses_file_resolved = _normalize_path_text(str(responses_file))
-
-    responses = read_jsonl(responses_file)
-    responses_by_sample = {str(row.get("sample_id")): row for row in responses}
-
-    grade_dirs = split_csv(args.grade_dirs)
-    if not grade_dirs:
-        raise ValueError("--grade-dirs is required for report generation.")
-    grade_sets = [load_grade_dir(path) for path in grade_dirs]
-    grade_source_responses_file = assert_single_source_responses_file(grade_sets)
-    if grade_source_responses_file != responses_file_resolved:
-        raise ValueError(
-            "Report input mismatch: --responses-file does not match grade metadata "
-            f"responses_file. expected={grade_source_responses_file} got={responses_file_resolved}"
+    store = open_artifact_store(args)
+    try:
+        if not responses_file.exists() and not (
+            store is not None and store.has_artifact("responses", responses_file)
+        ):
+            raise FileNotFoundError(f"responses file not found: {responses_file}")
+        responses = read_artifact_rows(
+            store,
+            "responses",
+            responses_file,
+            rows_path=responses_file,
+            record_type=ResponseRow,
         )
+        responses_by_sample = {str(row.get("sample_id")): row for row in responses}
+
+        grade_dirs = split_csv(args.grade_dirs)
+        if not grade_dirs:
+            raise ValueError("--grade-dirs is required for report generation.")
+        grade_sets = [load_grade_dir(path, store=store) for path in grade_dirs]
+        grade_source_responses_file = assert_single_source_responses_file(grade_sets)
+        if grade_source_responses_file != responses_file_resolved:
+            raise ValueError(
+                "Report input mismatch: --responses-file does not match grade metadata "
+                f"responses_file. expected={grade_source_responses_file} "
+                f"got={responses_file_resolved}"
+            )
 
-    aggregate_rows_by_sample: dict[str, dict[str, Any]] = {}
-    aggregate_summary: dict[str, Any] | None = None
-    if args.aggregate_dir:
-        aggregate_dir = pathlib.Path(args.aggregate_dir)
-        aggregate_rows_path = aggregate_dir / "aggregate.jsonl"
-        aggregate_summary_path = aggregate_dir / "aggregate_summary.json"
-        aggregate_meta_path = aggregate_dir / "aggregate_meta.json"
-        provided_grade_dirs_resolved = {
-            _normalize_path_text(str(pathlib.Path(path))) for path in grade_dirs
-        }
-        if aggregate_meta_path.exists():
-            with aggregate_meta_path.open("r", encoding="utf-8") as handle:
-                aggregate_meta = json.load(handle)
-            if isinstance(aggregate_meta, dict):
-                aggregate_source_responses = str(
-                    aggregate_meta.get("responses_file", "")
-                ).strip()
-                if aggregate_source_responses:
-                    normalized_aggregate_source = _normalize_path_text(
-                        aggregate_source_responses
-                    )
-                    if normalized_aggregate_source != responses_file_resolved:
-                        raise ValueError(
-                            "Report input mismatch: aggregate responses_file does not match "
-                            f"--responses-file. aggregate={normalized_aggregate_source} "
-                            f"responses={responses_file_resolved}"
-                        )
-                aggregate_grade_dirs = aggregate_meta.get("grade_dirs")
-                if isinstance(aggregate_grade_dirs, list) and aggregate_grade_dirs:
-                    aggregate_grade_dirs_resolved = {
-                        _normalize_path_text(str(path)) for path in aggregate_grade_dirs
-                    }
-                    if not provided_grade_dirs_resolved.issubset(
-                        aggregate_grade_dirs_resolved
-                    ):
-                        raise ValueError(
-                            "Report input mismatch: --grade-dirs are not contained in "
-                            "aggregate_meta grade_dirs."
+        aggregate_rows_by_sample: dict[str, RowRecord] = {}
+        aggregate_summary: dict[str, Any] | None = None
+        if args.aggregate_dir:
+            aggregate_dir = pathlib.Path(args.aggregate_dir)
+            aggregate_rows_path = resolve_jsonl_path(aggregate_dir / "aggregate.jsonl")
+            aggregate_summary_path = aggregate_dir / "aggregate_summary.json"
+            aggregate_meta_path = aggregate_dir / "aggregate_meta.json"
+            provided_grade_dirs_resolved = {
+                _normalize_path_text(str(pathlib.Path(path))) for path in grade_dirs
+            }
+            if aggregate_meta_path.exists():
+                with aggregate_meta_path.open("r", encoding="utf-8") as handle:
+                    aggregate_meta = json.load(handle)
+                if isinstance(aggregate_meta, dict):
+                    aggregate_source_responses = str(
+                        aggregate_meta.get("responses_file", "")
+                    ).strip()
+                    if aggregate_source_responses:
+                        normalized_aggregate_source = _normalize_path_text(
+                            aggregate_source_responses
                         )
-        if aggregate_rows_path.exists():
-            for row in read_jsonl(aggregate_rows_path):
-                sample_id = str(row.get("sample_id", ""))
-                if sample_id:
-                    aggregate_rows_by_sample[sample_id] = row
-            aggregate_sample_ids = set(aggregate_rows_by_sample.keys())
-            response_sample_ids = set(responses_by_sample.keys())
-            unexpected = aggregate_sample_ids - response_sample_ids
-            if unexpected:
-                raise ValueError(
-                    "Aggregate rows contain sample_ids not present in responses file. "
-                    f"count={len(unexpected)} sample={_sample_ids_summary(unexpected)}"
-                )
-        if aggregate_summary_path.exists():
-            with aggregate_summary_path.open("r", encoding="utf-8") as handle:
-                aggregate_summary = json.load(handle)
+                        if normalized_aggregate_source != responses_file_resolved:
+                            raise ValueError(
+                                "Report input mismatch: aggregate responses_file does not "
+                                f"match --responses-file. aggregate={normalized_aggregate_source} "
+                                f"responses={responses_file_resolved}"
+                            )
+                    aggregate_grade_dirs = aggregate_meta.get("grade_dirs")
+                    if isinstance(aggregate_grade_dirs, list) and aggregate_grade_dirs:
+                        aggregate_grade_dirs_resolved = {
+                            _normalize_path_text(str(path)) for path in aggregate_grade_dirs
+                        }
+                        if not provided_grade_dirs_resolved.issubset(
+                            aggregate_grade_dirs_resolved
+                        ):
+                            raise ValueError(
+                                "Report input mismatch: --grade-dirs are not contained in "
+                                "aggregate_meta grade_dirs."
+                            )
+            aggregate_in_store = store is not None and store.has_artifact(
+                "aggregates", aggregate_dir
+            )
+            if aggregate_in_store or aggregate_rows_path.exists():
+                for row in read_artifact_rows(
+                    store,
+                    "aggregates",
+                    aggregate_dir,
+                    rows_path=aggregate_rows_path,
+                    record_type=AggregateRow,
+                ):
+                    sample_id = str(row.get("sample_id", ""))
+                    if sample_id:
+                        aggregate_rows_by_sample[sample_id] = row
+                aggregate_sample_ids = set(aggregate_rows_by_sample.keys())
+                response_sample_ids = set(responses_by_sample.keys())
+                unexpected = aggregate_sample_ids - response_sample_ids
+                if unexpected:
+                    raise ValueError(
+                        "Aggregate rows contain sample_ids not present in responses file. "
+                        f"count={len(unexpected)} sample={_sample_ids_summary(unexpected)}"
+                    )
+            if aggregate_summary_path.exists():
+                with aggregate_summary_path.open("r", encoding="utf-8") as handle:
+                    aggregate_summary = json.load(handle)
+    finally:
+        if store is not None:
+            store.close()
 
     rows: list[dict[str, Any]] = []
     errors: list[dict[str, Any]] = []
@@ -4437,7 +10701,7 @@ def run_regenerate_summary(args: argparse.Namespace) -> int:
     aggregate_path = pathlib.Path(args.aggregate_file)
     if not aggregate_path.exists():
         raise FileNotFoundError(f"Aggregate file not found: {aggregate_path}")
-    rows = read_jsonl(aggregate_path)
+    rows = read_row_records(aggregate_path, AggregateRow)
     if not rows:
         raise ValueError(f"No rows in {aggregate_path}")
     num_judges = 0
@@ -4445,27 +10709,810 @@ def run_regenerate_summary(args: argparse.Namespace) -> int:
     while f"judge_{num_judges + 1}_model" in sample:
         num_judges += 1
     consensus_method = sample.get("consensus_method", "primary_tiebreak")
-    summary = summarize_aggregate_rows(rows, consensus_method, num_judges)
+    summary = summarize_aggregate_rows(
+        rows, consensus_method, num_judges, **bootstrap_options(args)
+    )
     output_path = pathlib.Path(args.output_file)
     write_json(output_path, summary)
     print(f"Regenerated summary: {output_path.resolve()}", flush=True)
     return 0
 
 
+REGRADE_OFFLINE_CHUNK_SIZE = 2000
+
+
+def regrade_row_offline(row: dict[str, Any], *, judge_no_hint: bool) -> dict[str, Any]:
+    """Re-run parsing and score validation on a grade row's stored judge output.
+
+    Rows without raw judge text (API failures, source errors) and locally
+    pre-judged rows come back unchanged.
+    """
+    if (
+        not str(row.get("judge_raw_text", "")).strip()
+        or row.get("source_response_error")
+        or row.get("judge_parse_mode") == "local_prejudge"
+    ):
+        return row
+    regraded = dict(row)
+    regraded["judge_warnings"] = [
+        warning
+        for warning in row.get("judge_warnings") or []
+        if not str(warning).startswith("judge_output_parse_recovered_via=")
+    ]
+    regraded["judge_parse_mode"] = ""
+    try:
+        score, justification = score_judge_text(regraded, judge_no_hint=judge_no_hint)
+    except Exception as exc:  # pylint: disable=broad-except
+        regraded["judge_score"] = None
+        regraded["judge_justification"] = ""
+        regraded["error"] = judge_error_text(exc, regraded)
+    else:
+        regraded["judge_score"] = score
+        regraded["judge_justification"] = justification
+        regraded["error"] = ""
+    if "status" in regraded:
+        regraded["status"] = "error" if regraded["error"] else "ok"
+    return regraded
+
+
+def _regrade_offline_chunk(rows: list[dict[str, Any]], judge_no_hint: bool) -> list[dict[str, Any]]:
+    return [regrade_row_offline(row, judge_no_hint=judge_no_hint) for row in rows]
+
+
+def run_regrade_offline(args: argparse.Namespace) -> int:
+    grade_dir = pathlib.Path(args.grade_dir)
+    meta_path = grade_dir / "grade_meta.json"
+    grades_path = resolve_jsonl_path(grade_dir / "grades.jsonl")
+    if not meta_path.exists() or not grades_path.exists():
+        raise FileNotFoundError(f"Missing grade_meta.json or grades.jsonl in {grade_dir}")
+    if args.workers < 1:
+        raise ValueError("--workers must be >= 1")
+    with meta_path.open("r", encoding="utf-8") as handle:
+        meta = json.load(handle)
+    if meta.get("synthetic_tiebreaker_full") or meta.get("synthetic_cascade_primary"):
+        raise ValueError(
+            f"{grade_dir} is assembled by grade-panel; regrade its source grade dirs and "
+            "rerun the panel with --resume instead."
+        )
+    judge_no_hint = bool(meta.get("judge_no_hint", False))
+
+    started = time.perf_counter()
+    rows = list(iter_jsonl(grades_path))
+    chunks = [
+        rows[start : start + REGRADE_OFFLINE_CHUNK_SIZE]
+        for start in range(0, len(rows), REGRADE_OFFLINE_CHUNK_SIZE)
+    ]
+    if args.workers > 1 and len(chunks) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(args.workers, len(chunks))
+        ) as pool:
+            regraded_chunks = list(
+                pool.map(_regrade_offline_chunk, chunks, [judge_no_hint] * len(chunks))
+            )
+    else:
+        regraded_chunks = [_regrade_offline_chunk(chunk, judge_no_hint) for chunk in chunks]
+    regraded_rows = [row for chunk in regraded_chunks for row in chunk]
+
+    report = {
+        "rows": len(rows),
+        "rescored_rows": 0,
+        "changed_rows": 0,
+        "recovered_rows": 0,
+        "newly_failed_rows": 0,
+        "score_changed_rows": 0,
+    }
+    for before, after in zip(rows, regraded_rows):
+        if after is before:
+            continue
+        report["rescored_rows"] += 1
+        if after == before:
+            continue
+        report["changed_rows"] += 1
+        if before.get("error") and not after.get("error"):
+            report["recovered_rows"] += 1
+        elif after.get("error") and not before.get("error"):
+            report["newly_failed_rows"] += 1
+        elif before.get("judge_score") != after.get("judge_score"):
+            report["score_changed_rows"] += 1
+    report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    print(f"Offline regrade of {grade_dir}: {json.dumps(report)}", flush=True)
+    if args.dry_run or not report["changed_rows"]:
+        return 0
+
+    # Review files need the text that normalized rows leave in responses.jsonl.
+    source_rows_by_sample: dict[str, dict[str, Any]] = {}
+    responses_file = pathlib.Path(str(meta.get("responses_file", "")))
+    if any("response_text" not in row for row in regraded_rows) and responses_file.is_file():
+        source_rows_by_sample = {
+            str(row.get("sample_id", "")).strip(): row for row in iter_jsonl(responses_file)
+        }
+    review_rows = [join_response_text(row, source_rows_by_sample) for row in regraded_rows]
+
+    summary_path = grade_dir / "summary.json"
+    summary: dict[str, Any] = {}
+    if summary_path.exists():
+        with summary_path.open("r", encoding="utf-8") as handle:
+            summary = json.load(handle)
+    summary.update(summarize_grades(regraded_rows))
+    summary["regrade_offline"] = {"timestamp_utc": utc_now_iso(), **report}
+
+    # Write everything next to the originals, then swap in one go.
+    output_paths = [
+        grades_path,
+        summary_path,
+        grade_dir / "summary.md",
+        grade_dir / "review.csv",
+        grade_dir / "review.md",
+    ]
+    tmp_paths = [path.with_name(path.name + ".tmp") for path in output_paths]
+    write_jsonl(tmp_paths[0], regraded_rows, compression=jsonl_compression(grades_path))
+    write_json(tmp_paths[1], summary)
+    tmp_paths[2].write_text(render_markdown_summary(meta, summary), encoding="utf-8")
+    write_grade_review_csv(tmp_paths[3], review_rows)
+    tmp_paths[4].write_text(render_grade_review_markdown(review_rows), encoding="utf-8")
+    for tmp_path, path in zip(tmp_paths, output_paths):
+        os.replace(tmp_path, path)
+    # Keep the checkpoint in step, or a later `grade --resume` would restore
+    # the old rows when it re-finalises.
+    partial_path = grade_dir / "grades.partial.jsonl"
+    if partial_path.exists():
+        regraded_by_sample = {
+            str(row.get("sample_id", "")).strip(): row for row in regraded_rows
+        }
+        write_jsonl_atomic(
+            partial_path,
+            [
+                regraded_by_sample.get(str(row.get("sample_id", "")).strip(), row)
+                for row in iter_jsonl(partial_path)
+            ],
+        )
+        rebuild_checkpoint_index(partial_path)
+    append_jsonl(
+        grade_dir / "grade_events.jsonl",
+        {
+            "timestamp_utc": utc_now_iso(),
+            "phase": "grade",
+            "event": "regrade_offline",
+            **report,
+        },
+    )
+    store_jsonl_artifact(
+        str(getattr(args, "store_db", "") or ""),
+        "grades",
+        grade_dir,
+        rows_path=grades_path,
+        meta=meta,
+    )
+    return 0
+
+
+def _time_judge_parser(texts: list[str], *, fast_path: bool, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            try:
+                parse_judge_output(text, fast_path=fast_path)
+            except ValueError:
+                pass
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_bench_judge_parser(args: argparse.Namespace) -> int:
+    if args.repeat < 1:
+        raise ValueError("--repeat must be >= 1")
+    texts: list[str] = []
+    for raw_path in split_csv(args.grades_files):
+        path = pathlib.Path(raw_path)
+        if path.is_dir():
+            path = path / "grades.jsonl"
+        path = resolve_jsonl_path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Grades file not found: {path}")
+        texts.extend(
+            str(row["judge_raw_text"]) for row in iter_jsonl(path) if row.get("judge_raw_text")
+        )
+    if not texts:
+        raise ValueError("No judge_raw_text found in --grades-files.")
+
+    # Both parsers must agree on every output before their timings mean anything.
+    parse_modes: dict[str, int] = defaultdict(int)
+    mismatches = 0
+    for text in texts:
+        outcomes = []
+        for fast_path in (True, False):
+            try:
+                outcomes.append(parse_judge_output(text, fast_path=fast_path))
+            except ValueError as exc:
+                outcomes.append(("error", str(exc)))
+        if outcomes[0] != outcomes[1]:
+            mismatches += 1
+        stripped = text.strip()
+        fast = _parse_judge_output_fast(stripped) if stripped else None
+        parse_modes[fast[1] if fast else "fallback"] += 1
+
+    chain_seconds = _time_judge_parser(texts, fast_path=False, repeat=args.repeat)
+    fast_seconds = _time_judge_parser(texts, fast_path=True, repeat=args.repeat)
+    report = {
+        "rows": len(texts),
+        "mismatches": mismatches,
+        "fast_path_modes": dict(sorted(parse_modes.items())),
+        "chain_us_per_row": round(chain_seconds / len(texts) * 1e6, 3),
+        "fast_us_per_row": round(fast_seconds / len(texts) * 1e6, 3),
+        "speedup": round(chain_seconds / fast_seconds, 2) if fast_seconds > 0 else None,
+    }
+    print(json.dumps(report, indent=2), flush=True)
+    return 1 if mismatches else 0
+
+
+def run_train_local_judge(args: argparse.Namespace) -> int:
+    if not 0.0 <= args.validation_fraction < 1.0:
+        raise ValueError("--validation-fraction must be in [0, 1).")
+    if args.epochs < 1:
+        raise ValueError("--epochs must be >= 1")
+    rows: list[dict[str, Any]] = []
+    for aggregate_file in split_csv(args.aggregate_files):
+        path = resolve_jsonl_path(pathlib.Path(aggregate_file))
+        if not path.exists():
+            raise FileNotFoundError(f"aggregate file not found: {aggregate_file}")
+        rows.extend(iter_jsonl(path))
+    started = time.perf_counter()
+    model = train_local_judge(
+        rows,
+        num_features=args.num_features,
+        max_words=args.max_words,
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        l2=args.l2,
+        validation_fraction=args.validation_fraction,
+    )
+    output_file = pathlib.Path(args.output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output_file, model)
+    training = model["training"]
+    validation = training.get("validation") or {}
+    calibrated = validation.get("calibrated") or {}
+    print(
+        f"Trained local judge on {training['train_rows']} row(s) in "
+        f"{time.perf_counter() - started:.1f}s; validation accuracy "
+        f"{calibrated.get('accuracy', 'n/a')}, log loss {calibrated.get('log_loss', 'n/a')} "
+        f"on {calibrated.get('rows', 0)} row(s). Model: {output_file}",
+        flush=True,
+    )
+    return 0
+
+
+def run_fetch_raw(args: argparse.Namespace) -> int:
+    payload = fetch_raw_payload(pathlib.Path(args.rows_file), args.sample_id)
+    print(json.dumps(payload, ensure_ascii=False, indent=2), flush=True)
+    return 0
+
+
+def run_export_store(args: argparse.Namespace) -> int:
+    store_path = pathlib.Path(args.store_db)
+    if not store_path.exists():
+        raise FileNotFoundError(f"Artifact store not found: {store_path}")
+    filters: dict[str, str] = {}
+    for clause in split_csv(args.where):
+        column, sep, value = clause.partition("=")
+        if not sep:
+            raise ValueError(f"--where clause must be column=value: {clause}")
+        filters[column.strip()] = value.strip()
+
+    with ArtifactStore(store_path) as store:
+        artifact: str | None = None
+        kind = args.kind
+        if args.artifact:
+            artifact = args.artifact
+            stored_kind = store.artifact_kind(artifact)
+            if stored_kind is None:
+                raise ValueError(f"Artifact not in store: {ArtifactStore.artifact_key(artifact)}")
+            kind = kind or stored_kind
+        elif not filters:
+            for entry in store.list_artifacts():
+                print(json.dumps(entry, ensure_ascii=False), flush=True)
+            return 0
+        elif not kind:
+            raise ValueError("--kind is required when querying without --artifact.")
+
+        rows = store.iter_rows(kind, artifact, **filters)
+        if args.output_file:
+            output_path = pathlib.Path(args.output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            row_count = 0
+
+            def counted() -> Iterator[dict[str, Any]]:
+                nonlocal row_count
+                for row in rows:
+                    row_count += 1
+                    yield row
+
+            write_jsonl_atomic(output_path, counted())
+            print(f"Exported {row_count} {kind} row(s): {output_path.resolve()}", flush=True)
+        else:
+            for row in rows:
+                sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    return 0
+
+
+def _mock_completion_text(body: Mapping[str, Any], choice_index: int) -> str:
+    """Deterministic reply for a chat body: judge JSON when a judge format is asked for."""
+    messages = body.get("messages") or []
+    prompt = "\n".join(
+        str(message.get("content", "")) for message in messages if isinstance(message, dict)
+    )
+    seed = zlib.crc32(f"{body.get('model', '')}\n{choice_index}\n{prompt}".encode("utf-8"))
+    response_format = body.get("response_format")
+    if isinstance(response_format, dict):
+        schema = (response_format.get("json_schema") or {}).get("schema") or {}
+        enum = ((schema.get("properties") or {}).get("score") or {}).get("enum")
+        if isinstance(enum, list) and 3 in enum:
+            # Control rows: 0 and 3 are valid with and without --judge-no-hint.
+            scores = [0, 3]
+        elif isinstance(enum, list) and enum:
+            scores = [int(value) for value in enum]
+        else:
+            scores = [0]
+        return json.dumps(
+            {"justification": "Mock judge verdict.", "score": scores[seed % len(scores)]}
+        )
+    user_text = next(
+        (
+            str(message.get("content", ""))
+            for message in reversed(messages)
+            if isinstance(message, dict) and message.get("role") == "user"
+        ),
+        "",
+    )
+    return f"Mock response {seed % 1000:03d} to: {user_text[:120]}"
+
+
+_MOCK_TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+def _mock_logprobs(text: str) -> dict[str, Any]:
+    """OpenAI-style `logprobs.content` for `text`, one token per word or symbol.
+
+    Digits get a deterministic probability in [0.5, 1.0) so a judge score's
+    confidence varies across rows; every other token is certain.
+    """
+    content: list[dict[str, Any]] = []
+    for token in _MOCK_TOKEN_RE.findall(text):
+        logprob = 0.0
+        if token.isdigit():
+            seed = zlib.crc32(text.encode("utf-8"))
+            logprob = math.log(0.5 + (seed % 500) / 1000)
+        content.append({"token": token, "logprob": logprob, "top_logprobs": []})
+    return {"content": content}
+
+
+def mock_chat_completion(body: Mapping[str, Any]) -> dict[str, Any]:
+    """OpenAI-style chat completion for `body`, honouring `n` and `logprobs`."""
+    choice_count = max(1, int(body.get("n", 1) or 1))
+    choices = [
+        {
+            "index": index,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": _mock_completion_text(body, index)},
+        }
+        for index in range(choice_count)
+    ]
+    if body.get("logprobs"):
+        for choice in choices:
+            choice["logprobs"] = _mock_logprobs(choice["message"]["content"])
+    prompt_chars = sum(
+        len(str(message.get("content", "")))
+        for message in body.get("messages") or []
+        if isinstance(message, dict)
+    )
+    completion_chars = sum(len(choice["message"]["content"]) for choice in choices)
+    return {
+        "id": f"mock-{uuid.uuid4().hex[:16]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", ""),
+        "choices": choices,
+        "usage": {
+            "prompt_tokens": prompt_chars // 4,
+            "completion_tokens": completion_chars // 4,
+            "total_tokens": (prompt_chars + completion_chars) // 4,
+        },
+    }
+
+
+@dataclasses.dataclass(slots=True)
+class MockModelProfile:
+    """Behaviour of one model behind `mock-server`'s /chat/completions.
+
+    Latency is log-normal around `latency_ms` (the median). Each request is
+    independently an error (`error_rate`, status drawn from
+    `error_statuses`, sent with `Retry-After`), a stall (`stall_rate`,
+    answered only after `stall_seconds`) or a truncated answer
+    (`truncation_rate`, half the text with finish_reason=length).
+    """
+
+    latency_ms: float = 200.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (429, 500, 502, 503)
+    retry_after_seconds: float = 1.0
+    stall_rate: float = 0.0
+    stall_seconds: float = 300.0
+    truncation_rate: float = 0.0
+
+    def validate(self, label: str) -> None:
+        for name in ("error_rate", "stall_rate", "truncation_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{label}: {name} must be in [0, 1].")
+        for name in ("latency_ms", "latency_sigma", "retry_after_seconds", "stall_seconds"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{label}: {name} must be >= 0.")
+        if not self.error_statuses or any(
+            not 400 <= status <= 599 for status in self.error_statuses
+        ):
+            raise ValueError(f"{label}: error_statuses must be HTTP 4xx/5xx codes.")
+
+
+def parse_mock_model_profiles(
+    raw_value: str, default: MockModelProfile
+) -> dict[str, MockModelProfile]:
+    """Per-model overrides of `default` from a JSON object of model id -> fields."""
+    if not raw_value.strip():
+        return {}
+    try:
+        parsed = json.loads(raw_value)
+    except json.JSONDecodeError as exc:
+        raise ValueError("--model-profiles must be a JSON object string.") from exc
+    if not isinstance(parsed, dict):
+        raise ValueError("--model-profiles must decode to a JSON object.")
+    field_names = {field.name for field in dataclasses.fields(MockModelProfile)}
+    profiles: dict[str, MockModelProfile] = {}
+    for model, overrides in parsed.items():
+        if not isinstance(overrides, dict):
+            raise ValueError(f"--model-profiles[{model!r}] must be an object.")
+        unknown = set(overrides) - field_names
+        if unknown:
+            raise ValueError(
+                f"--model-profiles[{model!r}] has unknown field(s): {', '.join(sorted(unknown))}"
+            )
+        if "error_statuses" in overrides:
+            overrides = {
+                **overrides,
+                "error_statuses": tuple(int(status) for status in overrides["error_statuses"]),
+            }
+        profile = dataclasses.replace(default, **overrides)
+        profile.validate(f"--model-profiles[{model!r}]")
+        profiles[str(model)] = profile
+    return profiles
+
+
+def _multipart_file_content(body: bytes, content_type: str) -> bytes:
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if match is None:
+        raise ValueError("multipart body without boundary")
+    for part in body.split(b"--" + match.group(1).encode("utf-8")):
+        headers, separator, content = part.partition(b"\r\n\r\n")
+        if separator and b'name="file"' in headers:
+            return content[:-2] if content.endswith(b"\r\n") else content
+    raise ValueError("multipart body has no `file` part")
+
+
+class MockProvider:
+    """In-memory state behind `mock-server`.
+
+    /chat/completions answers per the requesting model's MockModelProfile
+    (outcomes drawn from one seeded RNG) and counts outcomes per model. A
+    batch is `validating` on creation, `in_progress` after a tenth of
+    `batch_seconds` and `completed` once `batch_seconds` have passed, at
+    which point its output file is built from `mock_chat_completion`.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_seconds: float,
+        default_profile: MockModelProfile | None = None,
+        model_profiles: dict[str, MockModelProfile] | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.batch_seconds = batch_seconds
+        self.default_profile = default_profile or MockModelProfile()
+        self.model_profiles = model_profiles or {}
+        self.rng = random.Random(seed)
+        self.files: dict[str, bytes] = {}
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.lock = threading.Lock()
+
+    def chat_outcome(self, body: Mapping[str, Any]) -> tuple[float, int, dict[str, Any], dict[str, str]]:
+        """Decide a chat request's fate: (delay seconds, status, payload, headers)."""
+        model = str(body.get("model", ""))
+        profile = self.model_profiles.get(model, self.default_profile)
+        with self.lock:
+            draw = self.rng.random()
+            latency = profile.latency_ms / 1000.0 * math.exp(
+                profile.latency_sigma * self.rng.gauss(0.0, 1.0)
+            )
+            error_status = self.rng.choice(profile.error_statuses)
+            if draw < profile.error_rate:
+                outcome = "error"
+            elif draw < profile.error_rate + profile.stall_rate:
+                outcome = "stall"
+            elif draw < profile.error_rate + profile.stall_rate + profile.truncation_rate:
+                outcome = "truncated"
+            else:
+                outcome = "ok"
+            self.stats[model][outcome if outcome != "error" else f"http_{error_status}"] += 1
+
+        if outcome == "error":
+            return (
+                latency,
+                error_status,
+                {
+                    "error": {
+                        "message": f"Mock {error_status} for model {model}.",
+                        "code": error_status,
+                    }
+                },
+                {"Retry-After": f"{profile.retry_after_seconds:g}"},
+            )
+        payload = mock_chat_completion(body)
+        if outcome == "truncated":
+            for choice in payload["choices"]:
+                content = choice["message"]["content"]
+                choice["message"]["content"] = content[: len(content) // 2]
+                choice["finish_reason"] = "length"
+                if "logprobs" in choice:
+                    choice["logprobs"] = _mock_logprobs(choice["message"]["content"])
+        delay = profile.stall_seconds if outcome == "stall" else latency
+        return delay, 200, payload, {}
+
+    def stats_snapshot(self) -> dict[str, dict[str, int]]:
+        with self.lock:
+            return {model: dict(counts) for model, counts in sorted(self.stats.items())}
+
+    def create_file(self, content: bytes) -> dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:24]}"
+        with self.lock:
+            self.files[file_id] = content
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "purpose": "batch",
+        }
+
+    def create_batch(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        input_file_id = str(payload.get("input_file_id", ""))
+        with self.lock:
+            if input_file_id not in self.files:
+                raise KeyError(input_file_id)
+            request_count = sum(1 for line in self.files[input_file_id].splitlines() if line.strip())
+            batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+            self.batches[batch_id] = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": payload.get("endpoint", BATCH_CHAT_COMPLETIONS_URL),
+                "input_file_id": input_file_id,
+                "completion_window": payload.get("completion_window", BATCH_COMPLETION_WINDOW),
+                "status": "validating",
+                "output_file_id": None,
+                "error_file_id": None,
+                "created_at": int(time.time()),
+                "metadata": payload.get("metadata"),
+                "request_counts": {"total": request_count, "completed": 0, "failed": 0},
+                "_created_monotonic": time.monotonic(),
+            }
+        return self.retrieve_batch(batch_id)
+
+    def retrieve_batch(self, batch_id: str) -> dict[str, Any]:
+        with self.lock:
+            batch = self.batches[batch_id]
+            age = time.monotonic() - batch["_created_monotonic"]
+            if batch["status"] == "validating" and age >= self.batch_seconds / 10:
+                batch["status"] = "in_progress"
+            if batch["status"] == "in_progress" and age >= self.batch_seconds:
+                self._complete_batch(batch)
+            return {key: value for key, value in batch.items() if not key.startswith("_")}
+
+    def _complete_batch(self, batch: dict[str, Any]) -> None:
+        output_lines: list[bytes] = []
+        error_lines: list[bytes] = []
+        for line in self.files[batch["input_file_id"]].splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            custom_id = entry.get("custom_id")
+            body = entry.get("body")
+            if entry.get("url") != batch["endpoint"] or not isinstance(body, dict):
+                error_lines.append(
+                    json_dumps_compact(
+                        {
+                            "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                            "custom_id": custom_id,
+                            "response": None,
+                            "error": {"code": "invalid_request", "message": "Unsupported request."},
+                        }
+                    )
+                )
+                continue
+            output_lines.append(
+                json_dumps_compact(
+                    {
+                        "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                        "custom_id": custom_id,
+                        "response": {
+                            "status_code": 200,
+                            "request_id": uuid.uuid4().hex,
+                            "body": mock_chat_completion(body),
+                        },
+                        "error": None,
+                    }
+                )
+            )
+        for key, lines in (("output_file_id", output_lines), ("error_file_id", error_lines)):
+            if lines:
+                file_id = f"file-{uuid.uuid4().hex[:24]}"
+                self.files[file_id] = b"".join(line + b"\n" for line in lines)
+                batch[key] = file_id
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+        batch["request_counts"]["completed"] = len(output_lines)
+        batch["request_counts"]["failed"] = len(error_lines)
+
+
+class _MockProviderHandler(http.server.BaseHTTPRequestHandler):
+    provider: MockProvider
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _route(self) -> str:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        return path[len("/v1") :] if path.startswith("/v1/") else path
+
+    def _send(
+        self,
+        status: int,
+        payload: Any,
+        *,
+        raw: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        data = raw if raw is not None else json_dumps_compact(payload)
+        try:
+            self.send_response(status)
+            self.send_header(
+                "Content-Type", "application/jsonl" if raw is not None else "application/json"
+            )
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up first (timeouts against a stall, aborted runs).
+            pass
+
+    def _not_found(self) -> None:
+        self._send(404, {"error": {"message": f"Unknown route {self.command} {self.path}"}})
+
+    def do_POST(self) -> None:  # noqa: N802
+        route = self._route()
+        body = self.rfile.read(int(self.headers.get("Content-Length", "0") or 0))
+        try:
+            if route == "/chat/completions":
+                delay, status, payload, headers = self.provider.chat_outcome(json.loads(body))
+                time.sleep(delay)
+                self._send(status, payload, headers=headers)
+            elif route == "/files":
+                content = _multipart_file_content(body, self.headers.get("Content-Type", ""))
+                self._send(200, self.provider.create_file(content))
+            elif route == "/batches":
+                self._send(200, self.provider.create_batch(json.loads(body)))
+            else:
+                self._not_found()
+        except (KeyError, ValueError) as exc:
+            self._send(400, {"error": {"message": f"Bad request: {exc}"}})
+
+    def do_GET(self) -> None:  # noqa: N802
+        parts = self._route().strip("/").split("/")
+        try:
+            if parts == ["mock", "stats"]:
+                self._send(200, self.provider.stats_snapshot())
+            elif len(parts) == 2 and parts[0] == "batches":
+                self._send(200, self.provider.retrieve_batch(parts[1]))
+            elif len(parts) == 3 and parts[0] == "files" and parts[2] == "content":
+                with self.provider.lock:
+                    content = self.provider.files[parts[1]]
+                self._send(200, None, raw=content)
+            else:
+                self._not_found()
+        except KeyError:
+            self._not_found()
+
+
+def run_mock_server(args: argparse.Namespace) -> int:
+    if args.batch_seconds < 0:
+        raise ValueError("--batch-seconds must be >= 0")
+    default_profile = MockModelProfile(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(status) for status in split_csv(args.error_statuses)),
+        retry_after_seconds=args.retry_after_seconds,
+        stall_rate=args.stall_rate,
+        stall_seconds=args.stall_seconds,
+        truncation_rate=args.truncation_rate,
+    )
+    default_profile.validate("mock-server")
+    provider = MockProvider(
+        batch_seconds=args.batch_seconds,
+        default_profile=default_profile,
+        model_profiles=parse_mock_model_profiles(args.model_profiles, default_profile),
+        seed=args.seed,
+    )
+    handler = type("MockProviderHandler", (_MockProviderHandler,), {"provider": provider})
+    server = http.server.ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    host, port = server.server_address[:2]
+    print(
+        f"Mock provider listening on http://{host}:{port}/v1 "
+        "(/v1/chat/completions, /v1/files, /v1/batches, /v1/mock/stats). Ctrl-C to stop.",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Mock request outcomes: {json.dumps(provider.stats_snapshot())}", flush=True)
+    return 0
+
+
 def main() -> int:
     args = parse_args()
-    if args.command == "collect":
-        return run_collect(args)
-    if args.command == "grade":
-        return run_grade(args)
-    if args.command == "grade-panel":
-        return run_grade_panel(args)
+    if args.command in {"collect", "grade", "grade-panel"}:
+        RUN_INTERRUPT.install()
+        try:
+            if args.command == "collect":
+                return run_collect(args)
+            if args.command == "grade":
+                return run_grade(args)
+            return run_grade_panel(args)
+        except RunInterrupted as exc:
+            print(
+                f"Stopped: {exc}; {len(exc.outstanding_sample_ids)} in-flight row(s) abandoned. "
+                "Rerun with --resume to continue.",
+                file=sys.stderr,
+                flush=True,
+            )
+            sys.stdout.flush()
+            # Skip interpreter shutdown, which would join worker threads still
+            # blocked on abandoned requests.
+            os._exit(130)
     if args.command == "aggregate":
         return run_aggregate(args)
     if args.command == "report":
         return run_report(args)
     if args.command == "regenerate-summary":
         return run_regenerate_summary(args)
+    if args.command == "regrade-offline":
+        return run_regrade_offline(args)
+    if args.command == "bench-judge-parser":
+        return run_bench_judge_parser(args)
+    if args.command == "train-local-judge":
+        return run_train_local_judge(args)
+    if args.command == "mock-server":
+        return run_mock_server(args)
+    if args.command == "fetch-raw":
+        return run_fetch_raw(args)
+    if args.command == "export-store":
+        return run_export_store(args)
     raise ValueError(f"Unsupported command: {args.command}")
 
 
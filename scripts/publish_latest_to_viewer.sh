@@ -13,6 +13,10 @@ Usage:
     [--output-dir data/latest] \
     [--merge]
 
+The responses and aggregate rows may be gzip (.jsonl.gz) or zstd
+(.jsonl.zst) compressed; the published copies are always plain JSONL so
+the viewer can fetch them directly.
+
 Copies the selected run artifacts into a stable viewer dataset directory:
   responses.jsonl
   collection_stats.json
@@ -111,6 +115,36 @@ done
 
 mkdir -p "${OUTPUT_DIR}"
 
+# Compressed inputs are expanded once into a scratch dir so every step below
+# (merge, copy, scrub) keeps working on plain JSONL.
+SCRATCH_DIR="$(mktemp -d)"
+trap 'rm -rf "${SCRATCH_DIR}"' EXIT
+
+plain_jsonl() {
+  local source_file="$1"
+  local scratch_file="$2"
+  python3 - <<'PY' "${source_file}" "${scratch_file}"
+import pathlib
+import shutil
+import sys
+
+sys.path.insert(0, "scripts")
+from openrouter_benchmark import jsonl_compression, open_jsonl
+
+source_path = pathlib.Path(sys.argv[1])
+if jsonl_compression(source_path) is None:
+    print(source_path)
+else:
+    scratch_path = pathlib.Path(sys.argv[2])
+    with open_jsonl(source_path, "rb") as src, scratch_path.open("wb") as dst:
+        shutil.copyfileobj(src, dst)
+    print(scratch_path)
+PY
+}
+
+RESPONSES_FILE="$(plain_jsonl "${RESPONSES_FILE}" "${SCRATCH_DIR}/responses.jsonl")"
+AGGREGATE_ROWS_FILE="$(plain_jsonl "${AGGREGATE_ROWS_FILE}" "${SCRATCH_DIR}/aggregate.jsonl")"
+
 copy_file() {
   local source_file="$1"
   local target_file="$2"
@@ -375,6 +409,10 @@ fieldnames = [
     "nonsense_count",
     "error_count",
 ]
+# Only quick-estimate (stratified) runs carry the column.
+has_estimates = any(row.get("is_estimate") for row in rows)
+if has_estimates:
+    fieldnames.append("is_estimate")
 
 def parse_parts(model: str) -> tuple[str, str]:
     text = str(model or "")
@@ -389,22 +427,23 @@ with csv_path.open("w", encoding="utf-8", newline="") as handle:
     for idx, row in enumerate(rows, start=1):
         model = str(row.get("model", ""))
         org, reasoning = parse_parts(model)
-        writer.writerow(
-            {
-                "rank": idx,
-                "model": model,
-                "org": org,
-                "reasoning": reasoning,
-                "avg_score": row.get("avg_score"),
-                "green_rate": row.get("detection_rate_score_2"),
-                "red_rate": row.get("full_engagement_rate_score_0"),
-                "score_2": row.get("score_2"),
-                "score_1": row.get("score_1"),
-                "score_0": row.get("score_0"),
-                "nonsense_count": row.get("nonsense_count"),
-                "error_count": row.get("error_count"),
-            }
-        )
+        csv_row = {
+            "rank": idx,
+            "model": model,
+            "org": org,
+            "reasoning": reasoning,
+            "avg_score": row.get("avg_score"),
+            "green_rate": row.get("detection_rate_score_2"),
+            "red_rate": row.get("full_engagement_rate_score_0"),
+            "score_2": row.get("score_2"),
+            "score_1": row.get("score_1"),
+            "score_0": row.get("score_0"),
+            "nonsense_count": row.get("nonsense_count"),
+            "error_count": row.get("error_count"),
+        }
+        if has_estimates:
+            csv_row["is_estimate"] = bool(row.get("is_estimate", False))
+        writer.writerow(csv_row)
 PY
 
 cat > "${OUTPUT_DIR}/manifest.json" <<EOF
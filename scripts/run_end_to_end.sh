@@ -19,7 +19,12 @@ Options:
   --models <list>              Comma-separated model list (overrides config.json)
   --collect-endpoint <url>     OpenAI-compatible endpoint for collect (default: OpenRouter)
   --collect-api-key <key>      API key for collect endpoint (not needed for Ollama)
+  --judge-endpoint <url>       OpenAI-compatible endpoint for grade-panel judges (default: OpenRouter)
+  --judge-api-key <key>        API key for the judge endpoint
   --ollama-mode                Sequential model execution with unload between models
+  --reuse-from <path>          Reuse unchanged responses/grades from a previous run dir
+                               or data/latest (grades via aggregate.jsonl judge columns)
+  --jsonl-compression <codec>  none|gzip|zstd for responses/grades/aggregate JSONL (default: none)
   --merge                      Merge new results into existing viewer data instead of replacing
   --dry-run                    Pass --dry-run to collect and grade-panel
   --serve                      Start local HTTP server after publish
@@ -38,7 +43,11 @@ PANEL_ID=""
 MODELS=""
 COLLECT_ENDPOINT=""
 COLLECT_API_KEY=""
+JUDGE_ENDPOINT=""
+JUDGE_API_KEY=""
 OLLAMA_MODE=0
+REUSE_FROM=""
+JSONL_COMPRESSION=""
 MERGE=0
 DRY_RUN=0
 SERVE=0
@@ -74,10 +83,26 @@ while [[ $# -gt 0 ]]; do
       COLLECT_API_KEY="${2:-}"
       shift 2
       ;;
+    --judge-endpoint)
+      JUDGE_ENDPOINT="${2:-}"
+      shift 2
+      ;;
+    --judge-api-key)
+      JUDGE_API_KEY="${2:-}"
+      shift 2
+      ;;
     --ollama-mode)
       OLLAMA_MODE=1
       shift
       ;;
+    --reuse-from)
+      REUSE_FROM="${2:-}"
+      shift 2
+      ;;
+    --jsonl-compression)
+      JSONL_COMPRESSION="${2:-}"
+      shift 2
+      ;;
     --merge)
       MERGE=1
       shift
@@ -113,12 +138,18 @@ fi
 
 if [[ "${DRY_RUN}" -ne 1 ]]; then
   if [[ -z "${OPENROUTER_API_KEY:-}" ]]; then
-    if [[ -z "${COLLECT_ENDPOINT}" ]]; then
-      echo "OPENROUTER_API_KEY is required unless --collect-endpoint or --dry-run is used." >&2
-      exit 1
-    else
-      echo "Warning: OPENROUTER_API_KEY not set. Collect will use ${COLLECT_ENDPOINT}." >&2
-      echo "         Grade-panel will fail unless OPENROUTER_API_KEY is set." >&2
+    if [[ -z "${COLLECT_ENDPOINT}" || -z "${JUDGE_ENDPOINT}" ]]; then
+      if [[ -z "${COLLECT_ENDPOINT}" && -z "${JUDGE_ENDPOINT}" ]]; then
+        echo "OPENROUTER_API_KEY is required unless --collect-endpoint/--judge-endpoint or --dry-run is used." >&2
+        exit 1
+      fi
+      if [[ -z "${JUDGE_ENDPOINT}" ]]; then
+        echo "Warning: OPENROUTER_API_KEY not set. Collect will use ${COLLECT_ENDPOINT}." >&2
+        echo "         Grade-panel will fail unless OPENROUTER_API_KEY is set." >&2
+      else
+        echo "Warning: OPENROUTER_API_KEY not set. Grade-panel will use ${JUDGE_ENDPOINT}." >&2
+        echo "         Collect will fail unless OPENROUTER_API_KEY is set." >&2
+      fi
     fi
   fi
 fi
@@ -130,9 +161,20 @@ if [[ -z "${PANEL_ID}" ]]; then
   PANEL_ID="${RUN_ID}_panel"
 fi
 
+# Final JSONL artifacts may be written compressed (.gz / .zst).
+resolve_jsonl() {
+  local suffix
+  for suffix in "" .gz .zst; do
+    if [[ -f "$1${suffix}" ]]; then
+      echo "$1${suffix}"
+      return
+    fi
+  done
+  echo "$1"
+}
+
 RUN_DIR="${OUTPUT_DIR}/${RUN_ID}"
 PANEL_DIR="${RUN_DIR}/grade_panels/${PANEL_ID}"
-RESPONSES_FILE="${RUN_DIR}/responses.jsonl"
 COLLECTION_STATS_FILE="${RUN_DIR}/collection_stats.json"
 PANEL_SUMMARY_FILE="${PANEL_DIR}/panel_summary.json"
 
@@ -154,12 +196,19 @@ fi
 if [[ "${OLLAMA_MODE}" -eq 1 ]]; then
   collect_cmd+=(--ollama-mode)
 fi
+if [[ -n "${REUSE_FROM}" ]]; then
+  collect_cmd+=(--reuse-from "${REUSE_FROM}")
+fi
+if [[ -n "${JSONL_COMPRESSION}" ]]; then
+  collect_cmd+=(--jsonl-compression "${JSONL_COMPRESSION}")
+fi
 if [[ "${DRY_RUN}" -eq 1 ]]; then
   collect_cmd+=(--dry-run)
 fi
 
 echo "==> Collect: ${RUN_ID}"
 "${collect_cmd[@]}"
+RESPONSES_FILE="$(resolve_jsonl "${RUN_DIR}/responses.jsonl")"
 
 panel_cmd=(
   python3 scripts/openrouter_benchmark.py grade-panel
@@ -171,6 +220,18 @@ panel_cmd=(
 if [[ "${DRY_RUN}" -eq 1 ]]; then
   panel_cmd+=(--dry-run)
 fi
+if [[ -n "${JUDGE_ENDPOINT}" ]]; then
+  panel_cmd+=(--judge-endpoint "${JUDGE_ENDPOINT}")
+fi
+if [[ -n "${JUDGE_API_KEY}" ]]; then
+  panel_cmd+=(--judge-api-key "${JUDGE_API_KEY}")
+fi
+if [[ -n "${REUSE_FROM}" ]]; then
+  panel_cmd+=(--reuse-from "${REUSE_FROM}")
+fi
+if [[ -n "${JSONL_COMPRESSION}" ]]; then
+  panel_cmd+=(--jsonl-compression "${JSONL_COMPRESSION}")
+fi
 panel_cmd+=(--no-fail-on-error)
 
 echo "==> Grade panel: ${PANEL_ID}"
@@ -200,7 +261,7 @@ if [[ -z "${AGGREGATE_DIR}" ]]; then
 fi
 
 AGGREGATE_SUMMARY_FILE="${AGGREGATE_DIR}/aggregate_summary.json"
-AGGREGATE_ROWS_FILE="${AGGREGATE_DIR}/aggregate.jsonl"
+AGGREGATE_ROWS_FILE="$(resolve_jsonl "${AGGREGATE_DIR}/aggregate.jsonl")"
 
 echo "==> Publish viewer dataset"
 publish_cmd=(